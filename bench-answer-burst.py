@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Antwort-Burst - alle Spieler antworten im selben 200 ms Fenster
+
+Prüft die Speed-Boni gegen eine Referenzrechnung und misst (mit --server-pid)
+die CPU-Zeit des Servers pro Antwort.
+
+Beispiel:
+    python3 bench-answer-burst.py --players 1000 --server-pid $(pgrep -f "node index.js")
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.answer_bench import run_burst
+from harness.buzzer_bench import save_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Speed-Bonus unter Last prüfen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--players', type=int, default=1000, help='Spieler im Raum')
+    parser.add_argument('--window', type=float, default=0.2, help='Antwort-Fenster in Sekunden')
+    parser.add_argument('--accuracy', type=float, default=0.7, help='Anteil richtiger Antworten')
+    parser.add_argument('--server-pid', type=int, help='PID des Node-Prozesses für die CPU-Messung')
+    parser.add_argument('--seed', type=int, help='Zufalls-Seed für reproduzierbare Läufe')
+    parser.add_argument('--output', default=f"test-screenshots/bench/answer-burst-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"⚡ ANTWORT-BURST: {args.players} Spieler in {int(args.window * 1000)} ms")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_burst(args.server, args.players, args.window, args.accuracy,
+                                   args.server_pid, seed=args.seed))
+
+    print(f"Beigetreten:      {report['joined']}/{report['players']}")
+    print(f"Antworten:        {report['answers']} ({report['correct']} richtig, {report['bonuses_awarded']} Boni)")
+    print(f"Burst-Dauer:      {report['burst_seconds']} s")
+    if report['server_cpu_ms'] is not None:
+        print(f"Server-CPU:       {report['server_cpu_ms']} ms ({report['server_cpu_us_per_answer']} µs/Antwort)")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if report['mismatches'] or report['inconsistent_player_results']:
+        print(f"\n❌ {len(report['mismatches'])} Boni weichen von der Referenz ab, "
+              f"{report['inconsistent_player_results']} Spieler-Ergebnisse passen nicht zum Host")
+        for mismatch in report['mismatches'][:5]:
+            print(f"   {mismatch}")
+        sys.exit(1)
+    print("✅ Alle Boni stimmen mit der Referenz überein")
+
+
+if __name__ == '__main__':
+    main()
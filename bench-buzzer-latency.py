@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Buzzer Latenz-Benchmark - p50/p95/p99/max und Reihenfolge-Fehler beim Host
+
+Beispiel:
+    python3 bench-buzzer-latency.py --server http://localhost:3001
+    python3 bench-buzzer-latency.py --levels 10,100 --compare test-screenshots/bench/buzzer-latency-alt.json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from harness.buzzer_bench import DEFAULT_LEVELS, compare_reports, run_benchmark, save_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Buzzer Fan-out Latenz messen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--levels', default=','.join(str(l) for l in DEFAULT_LEVELS),
+                        help='Gleichzeitige Drücker pro Durchgang, kommagetrennt')
+    parser.add_argument('--output', default=f"test-screenshots/bench/buzzer-latency-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    parser.add_argument('--compare', help='Früheres Ergebnis zum Vergleichen')
+    args = parser.parse_args()
+
+    levels = [int(l) for l in args.levels.split(',') if l]
+
+    print(f"\n{'='*70}")
+    print(f"🔔 BUZZER LATENZ-BENCHMARK: {levels}")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_benchmark(args.server, levels))
+
+    print(f"{'Drücker':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'Inversionen':>12} {'verloren':>9}")
+    for level, result in report['levels'].items():
+        latency = result['latency_ms']
+        print(f"{level:>8} {latency.get('p50', '-'):>9} {latency.get('p95', '-'):>9} "
+              f"{latency.get('p99', '-'):>9} {latency.get('max', '-'):>9} "
+              f"{result['inversions']:>12} {result['lost']:>9}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        report['compared_to'] = args.compare
+        report['diff_ms'] = compare_reports(previous, report)
+        print(f"\n📈 VERGLEICH mit {args.compare} (ms, + = langsamer)")
+        for level, diff in report['diff_ms'].items():
+            print(f"   {level:>6}: " + ', '.join(f"{k} {v:+}" for k, v in diff.items()))
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Cluster-Skalierung - Antwort-Durchsatz mit 1 bis N Server-Workern
+
+Startet node server/cluster.js pro Stufe selbst (Port --port) und verteilt
+Räume und Spieler auf mehrere Client-Prozesse.
+
+Beispiel:
+    python3 bench-cluster-scaling.py --workers 1,2,4,8 --rooms 400 --players 10
+"""
+
+import argparse
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.cluster_bench import DEFAULT_WORKERS, run_scaling
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Durchsatz des Cluster-Modus pro Worker-Anzahl messen')
+    parser.add_argument('--workers', default=','.join(str(w) for w in DEFAULT_WORKERS),
+                        help='Worker-Anzahlen, kommagetrennt')
+    parser.add_argument('--rooms', type=int, default=200, help='Räume insgesamt')
+    parser.add_argument('--players', type=int, default=10, help='Spieler pro Raum')
+    parser.add_argument('--duration', type=float, default=15, help='Messdauer pro Stufe in Sekunden')
+    parser.add_argument('--warmup', type=float, default=3, help='Aufwärmzeit vor der Messung in Sekunden')
+    parser.add_argument('--client-procs', type=int, help='Client-Prozesse (Standard: halbe CPU-Anzahl)')
+    parser.add_argument('--port', type=int, default=3201, help='Port für den Test-Cluster')
+    parser.add_argument('--output', default=f"test-screenshots/bench/cluster-scaling-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    worker_counts = [int(w) for w in args.workers.split(',') if w]
+
+    print(f"\n{'='*70}")
+    print(f"🧩 CLUSTER-SKALIERUNG: {worker_counts} Worker, {args.rooms} Räume × {args.players} Spieler")
+    print(f"{'='*70}\n")
+
+    report = run_scaling(worker_counts, args.rooms, args.players, args.duration, args.warmup,
+                         args.client_procs, args.port)
+
+    print(f"{'Worker':>7} {'Spieler':>8} {'/status':>8} {'Antw./s':>10} {'p50 ms':>8} {'p99 ms':>8} {'Speedup':>8} {'Effiz.':>7}")
+    for result in report['workers'].values():
+        latency = result['latency_ms']
+        print(f"{result['workers']:>7} {result['players']:>8} {result['status_players'] or '-':>8} "
+              f"{result['answers_per_second']:>10} {latency.get('p50', '-'):>8} {latency.get('p99', '-'):>8} "
+              f"{result['speedup'] or '-':>8} {result['efficiency'] or '-':>7}")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    problems = [
+        f"{r['workers']} Worker: /status meldet {r['status_players']} statt {r['players']} Spieler"
+        for r in report['workers'].values() if r['status_players'] != r['players']
+    ] + [f"{r['workers']} Worker: {error}" for r in report['workers'].values() for error in r['errors']]
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Verbindungs-Churn - tausende Connects/Disconnects pro Sekunde über viele Räume
+
+Meldet die Event-Loop-Verzögerung des Servers (über /health) im Leerlauf,
+während des Churns und danach.
+
+Beispiel:
+    python3 bench-connection-churn.py --rooms 200 --rate 2000 --duration 30
+    python3 bench-connection-churn.py --hold 0.5 --leave
+"""
+
+import argparse
+import asyncio
+import time
+
+from harness.buzzer_bench import save_report
+from harness.churn_bench import run_churn
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reconnect-Sturm auf den Server loslassen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--rooms', type=int, default=200, help='Räume mit verbundenem Host')
+    parser.add_argument('--rate', type=int, default=1000, help='Neue Verbindungen pro Sekunde')
+    parser.add_argument('--duration', type=float, default=30, help='Dauer des Churns in Sekunden')
+    parser.add_argument('--hold', type=float, default=0.0, help='Sekunden, die ein Spieler verbunden bleibt')
+    parser.add_argument('--leave', action='store_true', help='Vor dem Trennen leave-room senden')
+    parser.add_argument('--max-inflight', type=int, default=500, help='Maximal gleichzeitig offene Verbindungen')
+    parser.add_argument('--output', default=f"test-screenshots/bench/connection-churn-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"🌪️  CONNECTION CHURN: {args.rate}/s über {args.rooms} Räume für {args.duration}s")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_churn(args.server, args.rooms, args.rate, args.duration, args.hold,
+                                   args.leave, args.max_inflight))
+
+    print(f"Verbindungen:     {report['connections']} ({report['failed']} fehlgeschlagen)")
+    print(f"Rate:             {report['achieved_rate']}/s (Soll {report['target_rate']}/s)")
+    print(f"\n{'Phase':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}  (/health in ms)")
+    for phase, lag in report['lag_ms'].items():
+        print(f"{phase:>8} {lag.get('p50', '-'):>9} {lag.get('p95', '-'):>9} "
+              f"{lag.get('p99', '-'):>9} {lag.get('max', '-'):>9}")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Join-Sturm - tausende Beitritte mit kollidierenden Namen
+
+Meldet Joins pro Sekunde und prüft, dass der Server jeden Namen pro Raum
+nur einmal vergibt (auch nach Verlassen und erneutem Beitritt).
+
+Beispiel:
+    python3 bench-join-storm.py --rooms 10 --players 500
+    python3 bench-join-storm.py --rooms 1 --players 5000 --names Max
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.join_bench import DEFAULT_NAMES, run_join_storm
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Viele gleichnamige Spieler gleichzeitig beitreten lassen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--rooms', type=int, default=10, help='Anzahl Räume')
+    parser.add_argument('--players', type=int, default=500, help='Spieler pro Raum')
+    parser.add_argument('--names', default=','.join(DEFAULT_NAMES), help='Namen, reihum vergeben (kommagetrennt)')
+    parser.add_argument('--rejoin', type=float, default=0.1, help='Anteil Spieler, die verlassen und wieder beitreten')
+    parser.add_argument('--concurrency', type=int, default=500, help='Gleichzeitige Verbindungsaufbauten/Joins')
+    parser.add_argument('--output', default=f"test-screenshots/bench/join-storm-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    names = [name for name in args.names.split(',') if name]
+
+    print(f"\n{'='*70}")
+    print(f"🌊 JOIN-STURM: {args.rooms} Räume × {args.players} Spieler, Namen {sorted(set(names))}")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_join_storm(args.server, args.rooms, args.players, names, args.rejoin,
+                                        args.concurrency))
+
+    completion = report['room_completion_ms']
+    print(f"Joins:            {report['joins_processed']}/{report['joins']} ({report['rejoins']} Wiederbeitritte)")
+    print(f"Durchsatz:        {report['joins_per_second']} Joins/s in {report['seconds']}s")
+    print(f"Raum fertig nach: p50 {completion.get('p50', '-')} ms, max {completion.get('max', '-')} ms")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    problems = [f"Raum {code}: doppelte Namen {names}" for code, names in report['duplicate_names'].items()]
+    problems += [f"Raum {code}: {count} statt {args.players} Spieler"
+                 for code, count in report['wrong_player_count'].items()]
+    if report['timed_out_rooms']:
+        problems.append(f"{report['timed_out_rooms']} Räume nicht fertig geworden")
+    if problems:
+        for problem in problems[:20]:
+            print(f"❌ {problem}")
+        sys.exit(1)
+    print("✅ Alle Namen eindeutig")
+
+
+if __name__ == '__main__':
+    main()
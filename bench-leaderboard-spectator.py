@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Leaderboard-Zuschauer - Bytes/s und Updates/s bei schnellen Punkte-Anpassungen
+
+Beispiel:
+    python3 bench-leaderboard-spectator.py --players 500 --rate 50 --duration 10
+    python3 bench-leaderboard-spectator.py --compare test-screenshots/bench/leaderboard-vorher.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.leaderboard_bench import run_spectator_bench
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Leaderboard-Stream aus Zuschauer-Sicht messen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--players', type=int, default=500, help='Spieler im Raum')
+    parser.add_argument('--rate', type=float, default=50, help='Punkte-Anpassungen pro Sekunde')
+    parser.add_argument('--duration', type=float, default=10, help='Dauer in Sekunden')
+    parser.add_argument('--seed', type=int, help='Zufalls-Seed für reproduzierbare Läufe')
+    parser.add_argument('--compare', help='Früheres Ergebnis (z.B. alte Server-Version) zum Vergleichen')
+    parser.add_argument('--output', default=f"test-screenshots/bench/leaderboard-spectator-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"📺 LEADERBOARD-ZUSCHAUER: {args.players} Spieler, {args.rate} Anpassungen/s")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_spectator_bench(args.server, args.players, args.rate, args.duration, seed=args.seed))
+
+    print(f"Anpassungen:      {report['adjustments']} ({report['adjust_rate']}/s)")
+    print(f"Zuschauer:        {report['bytes_per_second']:,} Bytes/s, {report['updates_per_second']} Updates/s")
+    print(f"                  {report['snapshots']} Snapshots, {report['deltas']} Deltas, {report['resyncs']} Resyncs")
+    for event, stats in sorted(report['events'].items(), key=lambda e: -e[1]['bytes']):
+        print(f"   {event:<24} {stats['messages']:>7} Nachrichten {stats['bytes']:>12,} Bytes")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        report['compared_to'] = args.compare
+        report['ratio'] = {
+            key: round(report[key] / previous[key], 3) if previous.get(key) else None
+            for key in ('bytes_per_second', 'updates_per_second')
+        }
+        print(f"\n📈 VERGLEICH mit {args.compare} (aktuell / vorher): {report['ratio']}")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if report['mismatched_scores']:
+        print(f"❌ {report['mismatched_scores']} Punktestände beim Zuschauer weichen ab")
+        sys.exit(1)
+    print("✅ Rangliste des Zuschauers stimmt mit den erwarteten Punkteständen überein")
+
+
+if __name__ == '__main__':
+    main()
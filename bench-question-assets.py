@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Bild-Fragen - Socket-Bytes pro Frage und Zeit bis zum Rendern
+
+Vergleicht die Bytes pro Spieler und Frage mit der eingebetteten Variante
+und misst die Renderzeit mit und ohne Vorladen der nächsten Bilder.
+
+Beispiel:
+    python3 bench-question-assets.py --players 100 --image-kb 300
+    python3 bench-question-assets.py --upload --rooms 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.asset_bench import run_asset_bench
+from harness.buzzer_bench import save_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bild-Quiz spielen und Bytes/Renderzeit pro Frage messen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--rooms', type=int, default=1, help='Anzahl Räume')
+    parser.add_argument('--players', type=int, default=50, help='Spieler pro Raum')
+    parser.add_argument('--questions', type=int, default=5, help='Bild-Fragen pro Quiz')
+    parser.add_argument('--image-kb', type=int, default=200, help='Bildgröße in KB')
+    parser.add_argument('--interval', type=float, default=2.0, help='Sekunden pro Frage')
+    parser.add_argument('--upload', action='store_true', help='Bilder vorab per POST /assets hochladen (wie der Host)')
+    parser.add_argument('--output', default=f"test-screenshots/bench/question-assets-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"🖼️  BILD-FRAGEN: {args.rooms} Räume × {args.players} Spieler, {args.questions} × {args.image_kb} KB")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_asset_bench(args.server, args.rooms, args.players, args.questions,
+                                         args.image_kb, args.interval, args.upload))
+
+    print(f"create-room:          {report['create_room_bytes']:>12,} Bytes")
+    print(f"Frage eingebettet:    {report['inline_question_bytes']:>12,} Bytes pro Spieler")
+    print(f"Frage empfangen:      {report['question_bytes_per_player']:>12,} Bytes pro Spieler")
+    print(f"Alle Fragen, alle:    {report['question_bytes_total']:>12,} Bytes")
+    print(f"\n{'Anzeige':>10} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'geladen':>12}")
+    for mode, render in report['render_ms'].items():
+        print(f"{mode:>10} {render.get('p50', '-'):>9} {render.get('p95', '-'):>9} "
+              f"{render.get('max', '-'):>9} {report['display_fetched_bytes'][mode]:>12,}")
+
+    checks = report['http_checks']
+    if checks:
+        print(f"\nHTTP: ETag {checks['etag']}, 304 {'✅' if checks['not_modified'] else '❌'}, "
+              f"immutable {'✅' if checks['immutable'] else '❌'}, Range {'✅' if checks['range'] else '❌'}")
+    else:
+        print("\n⚠️  Server schickt Bilder eingebettet (kein Asset-Store)")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if checks and not all(checks[key] for key in ('immutable', 'not_modified', 'range')):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
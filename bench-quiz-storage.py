@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Quiz-Speicher - Home-Ladezeit und Speichern mit 1.000 bis 5.000 Quizzen
+
+Spielt die Quizze wie die Test-Skripte über localStorage['quizzes'] ein
+(die App migriert sie nach IndexedDB), lädt dann die Startseite mehrfach
+und dupliziert Quizze. Zum Vergleich steht im Report, was Parsen und
+Serialisieren des alten Blobs im selben Browser kostet.
+
+Benötigt: pip install selenium, laufendes Frontend (npm run dev)
+
+Beispiel:
+    python3 bench-quiz-storage.py --counts 1000 5000
+    python3 bench-quiz-storage.py --counts 2000 --image-kb 50 --headed
+"""
+
+import argparse
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.storage_bench import run_storage_bench
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Große Quiz-Bibliotheken: Home laden und Speichern messen')
+    parser.add_argument('--url', default='http://localhost:5173/Quiz', help='Frontend-URL')
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 5000], help='Bibliotheksgrößen')
+    parser.add_argument('--questions', type=int, default=5, help='Fragen pro Quiz')
+    parser.add_argument('--image-kb', type=int, default=0, help='Eingebettetes Bild pro Frage in KB')
+    parser.add_argument('--repeats', type=int, default=5, help='Messungen pro Größe')
+    parser.add_argument('--chunk', type=int, default=500, help='Quizze pro eingespieltem Blob')
+    parser.add_argument('--max-home-p95-ms', type=float, default=1500, help='Obergrenze für p95 Home-Ladezeit (ms)')
+    parser.add_argument('--headed', action='store_true', help='Browser sichtbar starten')
+    parser.add_argument('--output', default=f"test-screenshots/bench/quiz-storage-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"💾 QUIZ-SPEICHER: {', '.join(map(str, args.counts))} Quizze × {args.questions} Fragen")
+    print(f"🌐 Frontend: {args.url}")
+    print(f"{'='*70}\n")
+
+    report = run_storage_bench(args.url, args.counts, args.questions, args.image_kb * 1024,
+                               args.repeats, args.chunk, headless=not args.headed)
+
+    print(f"{'Quizze':>7} {'Home p50':>9} {'Home p95':>9} {'Long-Task':>10} {'Speichern':>10} "
+          f"{'Migration':>10} {'Alt parse':>10} {'Alt stringify':>14}")
+    failures = []
+    for row in report['results']:
+        home = row['home_load_ms']
+        print(f"{row['quizzes']:>7} {home.get('p50', '-'):>9} {home.get('p95', '-'):>9} "
+              f"{row['longest_task_ms'].get('max', '-'):>10} {row['save_ms'].get('p50', '-'):>10} "
+              f"{row['migration_ms'].get('p50', '-'):>10} {row['legacy_parse_ms']:>10} {row['legacy_serialize_ms']:>14}")
+        if home.get('p95') is not None and home['p95'] > args.max_home_p95_ms:
+            failures.append(f"{row['quizzes']} Quizze: Home p95 {home['p95']} ms über {args.max_home_p95_ms} ms")
+    report['failures'] = failures
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if failures:
+        print(f"❌ {len(failures)} Probleme")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Raum-Skalierung - Handler-Durchsatz bei 10 bis 5000 Spielern in einem Raum
+
+Beispiel:
+    python3 bench-room-scaling.py --server http://localhost:3001
+    python3 bench-room-scaling.py --sizes 10,1000,5000 --probes 50 --repeat 200
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from harness.buzzer_bench import save_report
+from harness.room_bench import DEFAULT_SIZES, ascii_chart, run_benchmark, save_plot
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Handler-Kosten pro Raumgröße messen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Spieler pro Raum, kommagetrennt')
+    parser.add_argument('--probes', type=int, default=20, help='Verbundene Spieler, die Events senden')
+    parser.add_argument('--repeat', type=int, default=100, help='Events pro Sonde und Handler')
+    parser.add_argument('--output', default=f"test-screenshots/bench/room-scaling-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON), das Diagramm landet daneben als .png')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+
+    print(f"\n{'='*70}")
+    print(f"📈 RAUM-SKALIERUNG: {sizes}")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_benchmark(args.server, sizes, args.probes, args.repeat))
+
+    print(f"{'Spieler':>8} {'Join s':>8} {'buzzer/s':>10} {'µs':>8} {'answer/s':>10} {'µs':>8}")
+    for size, result in report['sizes'].items():
+        press, answer = result['buzzer_press'], result['submit_answer']
+        print(f"{result['room_players']:>8} {result['join_seconds']:>8} "
+              f"{press['per_second'] or '-':>10} {press['us_per_event'] or '-':>8} "
+              f"{answer['per_second'] or '-':>10} {answer['us_per_event'] or '-':>8}")
+
+    print(f"\n📊 Wachstum µs/Event (größter / kleinster Raum, 1.0 = flach): {report['growth']}")
+
+    save_report(report, args.output)
+    plot = save_plot(report, os.path.splitext(args.output)[0] + '.png')
+    if plot:
+        print(f"🖼️  Diagramm: {plot}")
+    else:
+        print("\n(matplotlib nicht installiert - Textdiagramm)\n")
+        print(ascii_chart(report))
+    print(f"✅ Ergebnis gespeichert: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
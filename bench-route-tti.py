@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Route-TTI - erster Paint und bedienbares Formular auf gedrosselten Handys
+
+Lädt jede Route kalt mit CPU- und Netzdrosselung und misst first paint,
+first contentful paint und die Zeit, bis die Route bedienbar ist (für
+/join: das Beitrittsformular). Das JavaScript der Spieler-Routen (/join,
+/play) wird gegen ein Größenbudget geprüft.
+
+Benötigt: pip install selenium, Produktions-Build (npm run build && npm run preview)
+
+Beispiel:
+    python3 bench-route-tti.py --url http://localhost:4173
+    python3 bench-route-tti.py --network slow-3g --cpu-rate 6 --routes join play
+"""
+
+import argparse
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.tti_bench import NETWORK_PROFILES, PLAYER_ROUTES, ROUTES, run_tti_bench
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Erster Paint und Time-to-interactive pro Route messen')
+    parser.add_argument('--url', default='http://localhost:4173', help='Frontend-URL (vite preview)')
+    parser.add_argument('--routes', nargs='+', choices=list(ROUTES), default=list(ROUTES), help='Zu messende Routen')
+    parser.add_argument('--network', choices=list(NETWORK_PROFILES), default='slow-4g', help='Netzprofil')
+    parser.add_argument('--cpu-rate', type=float, default=4, help='CPU-Verlangsamung (4 = Mittelklasse-Handy)')
+    parser.add_argument('--repeats', type=int, default=3, help='Kalte Ladevorgänge pro Route')
+    parser.add_argument('--budget-kb', type=float, default=350, help='JavaScript-Budget der Spieler-Routen (KB)')
+    parser.add_argument('--max-join-interactive-ms', type=float, help='Obergrenze für /join bedienbar (p50, ms)')
+    parser.add_argument('--headed', action='store_true', help='Browser sichtbar starten')
+    parser.add_argument('--output', default=f"test-screenshots/bench/route-tti-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"📱 ROUTE-TTI: {args.network}, CPU ×{args.cpu_rate}, {args.repeats} Läufe pro Route")
+    print(f"🌐 Frontend: {args.url}")
+    print(f"{'='*70}\n")
+
+    report = run_tti_bench(args.url, args.routes, args.network, args.cpu_rate, args.repeats,
+                           headless=not args.headed)
+
+    print(f"{'Route':<12} {'FP':>8} {'FCP':>8} {'bereit':>8} {'bedienbar':>10} {'JS KB':>8} {'Dateien':>8}")
+    failures = list(report['errors'])
+    for route, row in report['routes'].items():
+        print(f"{route:<12} {row['first_paint'].get('p50', '-'):>8} {row['first_contentful_paint'].get('p50', '-'):>8} "
+              f"{row['ready'].get('p50', '-'):>8} {row['interactive'].get('p50', '-'):>10} "
+              f"{row['script_bytes'] / 1024:>8.1f} {row['script_files']:>8}")
+        if route in PLAYER_ROUTES and row['script_bytes'] > args.budget_kb * 1024:
+            failures.append(f"{route}: {row['script_bytes'] / 1024:.1f} KB JavaScript über dem Budget von {args.budget_kb} KB")
+    join = report['routes'].get('join')
+    if args.max_join_interactive_ms and join and join['interactive'].get('p50', 0) > args.max_join_interactive_ms:
+        failures.append(f"join: bedienbar nach {join['interactive']['p50']} ms (erlaubt {args.max_join_interactive_ms} ms)")
+    report['budget_kb'] = args.budget_kb
+    report['failures'] = failures
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if failures:
+        print(f"❌ {len(failures)} Probleme")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("✅ Spieler-Routen im Budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Wire-Format - JSON gegen MessagePack für ein komplettes Spiel
+
+Ohne --server nur der Offline-Vergleich (Bytes, Encode/Decode-CPU),
+mit --server zusätzlich ein echtes Spiel pro Format.
+
+Beispiel:
+    python3 bench-wire-format.py --players 500 --questions 20
+    python3 bench-wire-format.py --server http://localhost:3001 --players 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from harness.buzzer_bench import save_report
+from harness.wire_bench import FORMATS, codec_bench, game_messages, live_bench
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON und MessagePack auf der Leitung vergleichen')
+    parser.add_argument('--players', type=int, default=500, help='Spieler im Raum')
+    parser.add_argument('--questions', type=int, default=20, help='Fragen pro Spiel')
+    parser.add_argument('--spectators', type=int, default=1, help='Leaderboard-Zuschauer')
+    parser.add_argument('--repeat', type=int, default=3, help='Wiederholungen der Encode-Messung (bester Lauf zählt)')
+    parser.add_argument('--server', help='Zusätzlich live gegen diesen Server spielen')
+    parser.add_argument('--question-time', type=float, default=3.0, help='Sekunden pro Frage (live)')
+    parser.add_argument('--output', default=f"test-screenshots/bench/wire-format-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"📦 WIRE-FORMAT: {args.players} Spieler, {args.questions} Fragen")
+    print(f"{'='*70}\n")
+
+    messages = game_messages(args.players, args.questions, args.spectators)
+    offline = codec_bench(messages, args.repeat)
+
+    print(f"{'Format':>8} {'Nachr.':>8} {'Bytes kodiert':>14} {'Bytes Leitung':>15} {'Encode ms':>10} {'Decode ms':>10}")
+    for wire in FORMATS:
+        r = offline[wire]
+        print(f"{wire:>8} {r['messages']:>8} {r['bytes_encoded']:>14,} {r['bytes_on_wire']:>15,} "
+              f"{r['encode_ms']:>10} {r['decode_all_recipients_ms']:>10}")
+    ratio = offline['ratio']
+    print(f"\nMessagePack/JSON: Bytes {ratio['bytes_on_wire']}, Encode {ratio['encode']}, Decode {ratio['decode']}")
+
+    print(f"\n{'Event':>22} {'JSON Bytes':>14} {'MsgPack Bytes':>14}")
+    for event, stats in list(offline['json']['events'].items())[:8]:
+        print(f"{event:>22} {stats['bytes_on_wire']:>14,} {offline['msgpack']['events'][event]['bytes_on_wire']:>14,}")
+
+    report = {
+        'benchmark': 'wire-format',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'players': args.players,
+        'questions': args.questions,
+        'spectators': args.spectators,
+        'offline': offline,
+        'live': None
+    }
+
+    if args.server:
+        print(f"\n🌐 Live gegen {args.server} ...")
+        report['server'] = args.server
+        report['live'] = asyncio.run(live_bench(args.server, args.players, args.questions, args.question_time))
+        for wire, r in report['live'].items():
+            emitted = r['server_emitted'] or {}
+            print(f"{wire:>8}: {r['bytes_received']:,} Bytes empfangen, Server {emitted.get('bytes', '-')} Bytes, "
+                  f"Client-CPU {r['client_cpu_s']}s, {r['answers']} Antworten")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+"""
+Test-Harness für MyTech Quizer
+
+Virtuelle Spieler sprechen das Socket.IO-Protokoll direkt mit server/index.js,
+Selenium wird nur noch für die Darstellung der Host-Seite gebraucht.
+"""
+
+from .protocol import SocketIOClient, ProtocolError
+from .players import VirtualHost, VirtualPlayer, PlayerSwarm, build_quiz, run_load
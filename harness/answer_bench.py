@@ -0,0 +1,127 @@
+"""
+Antwort-Burst Benchmark
+
+Alle Spieler eines Raums beantworten dieselbe Frage innerhalb eines
+kurzen Fensters (Standard 200 ms). Geprüft wird, ob die Speed-Boni des
+Servers (50/30/10) einer Referenzrechnung entsprechen: für jede Antwort,
+in der Reihenfolge in der der Host sie bekommt, alle bisher richtigen
+Antworten stabil nach responseTime sortieren, wie es der alte Handler tat.
+Optional wird die CPU-Zeit des Server-Prozesses gemessen (Linux, /proc).
+"""
+
+import asyncio
+import os
+import platform
+import random
+import time
+
+from .metrics import MetricsScope
+from .players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+
+SPEED_BONUS = (50, 30, 10)
+
+
+def server_cpu_seconds(pid):
+    """user+system CPU-Zeit eines Prozesses aus /proc/<pid>/stat oder None"""
+    if not pid:
+        return None
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            # Der Prozessname (Feld 2) kann Leerzeichen enthalten, daher ab ')' zählen
+            fields = f.read().rsplit(')', 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def reference_bonuses(answers, bonuses=SPEED_BONUS):
+    """Erwarteter Bonus pro Antwort (Reihenfolge = Verarbeitung auf dem Server)"""
+    correct = []
+    expected = []
+    for answer in answers:
+        bonus = 0
+        if answer['correct']:
+            correct.append(answer)
+            ranked = sorted(correct, key=lambda a: a['responseTime'])
+            rank = next(i for i, a in enumerate(ranked) if a['playerId'] == answer['playerId'])
+            bonus = bonuses[rank] if rank < len(bonuses) else 0
+        expected.append(bonus)
+    return expected
+
+
+async def run_burst(server_url, players=1000, window=0.2, accuracy=0.7, server_pid=None,
+                    timeout=60, connect_concurrency=200, seed=None):
+    rng = random.Random(seed)
+    host = VirtualHost(server_url, build_quiz(1, 'multiple', title=f'Answer Burst {players}'))
+    await host.create_room()
+
+    clients = [
+        VirtualPlayer(server_url, host.room_code, f'Burst {i + 1}', autoplay=False)
+        for i in range(players)
+    ]
+    results = await gather_limited([p.join() for p in clients], connect_concurrency)
+    clients = [p for p, r in zip(clients, results) if not isinstance(r, Exception)]
+    await host.wait_for_players(len(clients), timeout)
+
+    started = [p.client.expect('game-started') for p in clients]
+    await host.start_game()
+    await asyncio.wait_for(asyncio.gather(*started), timeout)
+
+    # Antwortzeiten auf 10 ms gerundet, damit bei vielen Spielern Gleichstände vorkommen
+    plan = [
+        (player, rng.uniform(0, window), 0 if rng.random() < accuracy else 1, round(rng.uniform(0.5, 5.0), 2))
+        for player in clients
+    ]
+    replies = [p.client.expect('answer-result') for p in clients]
+
+    async def answer(player, delay, choice, response_time):
+        await asyncio.sleep(delay)
+        await player.submit_answer(choice, response_time)
+
+    async with MetricsScope(server_url) as metrics:
+        cpu_before = server_cpu_seconds(server_pid)
+        burst_started = time.perf_counter()
+        await asyncio.gather(*(answer(*entry) for entry in plan))
+        try:
+            await asyncio.wait_for(asyncio.gather(*replies), timeout)
+        except asyncio.TimeoutError:
+            pass
+        burst_seconds = time.perf_counter() - burst_started
+        cpu_after = server_cpu_seconds(server_pid)
+
+    # Host bekommt 'player-answered' in Verarbeitungsreihenfolge
+    await asyncio.sleep(0.2)
+    expected = reference_bonuses(host.answers)
+    mismatches = [
+        {'playerId': a['playerId'], 'responseTime': a['responseTime'], 'got': a['bonusPoints'], 'expected': e}
+        for a, e in zip(host.answers, expected) if a['bonusPoints'] != e
+    ]
+    player_results = {p.player_id: r.result() for p, r in zip(clients, replies) if r.done() and not r.cancelled()}
+    inconsistent = sum(
+        1 for a in host.answers
+        if a['playerId'] in player_results and player_results[a['playerId']]['bonusPoints'] != a['bonusPoints']
+    )
+
+    await asyncio.gather(*(p.leave() for p in clients), return_exceptions=True)
+    await host.close()
+
+    cpu = None if cpu_before is None or cpu_after is None else cpu_after - cpu_before
+    return {
+        'benchmark': 'answer-burst',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'players': players,
+        'joined': len(clients),
+        'window_ms': round(window * 1000),
+        'answers': len(host.answers),
+        'correct': sum(1 for a in host.answers if a['correct']),
+        'bonuses_awarded': sum(1 for a in host.answers if a['bonusPoints']),
+        'mismatches': mismatches,
+        'inconsistent_player_results': inconsistent,
+        'burst_seconds': round(burst_seconds, 4),
+        'replies': len(player_results),
+        'server_cpu_ms': round(cpu * 1000, 1) if cpu is not None else None,
+        'server_cpu_us_per_answer': round(cpu * 1e6 / len(host.answers), 1) if cpu is not None and host.answers else None,
+        'server_metrics': metrics.delta
+    }
@@ -0,0 +1,140 @@
+"""
+Buzzer-Arbitrierung: viele gleichzeitige Drücker, genau ein Gewinner
+
+Ein Raum mit `pressers` Spielern und einer Buzzer-Frage. Pro Runde gibt
+der Host alle Buzzer frei (ein 'buzzer-unlocked' Broadcast), dann drücken
+alle gleichzeitig. Geprüft wird pro Runde:
+
+  - genau ein 'buzzer-locked' beim Host und bei jedem Spieler
+  - alle Clients sehen denselben Gewinner, und der hat auch gedrückt
+  - jeder andere Drücker bekommt genau eine Absage ('buzzer-rejected')
+
+Gemessen wird die Zeit vom Senden des Drucks bis zum Empfang der Sperre
+(alle Spieler und der Gewinner allein), die Zeit bis die Freigabe bei
+allen angekommen ist, und auf welchem Sende-Rang der Gewinner lag.
+"""
+
+import asyncio
+import platform
+import time
+
+from .metrics import MetricsScope, hottest
+from .players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+from .stats import summarize
+
+
+class _Round:
+    """Sperren, die ein Client pro Runde gesehen hat"""
+
+    def __init__(self):
+        self.locks = {}
+
+    def __call__(self, data):
+        self.locks.setdefault(data.get('round'), []).append({**data, 'received': time.perf_counter()})
+
+
+async def _rearm(host, players, timeout):
+    """Alle Buzzer freigeben, warten bis jeder Spieler die Freigabe hat"""
+    unlocked = [p.client.expect('buzzer-unlocked') for p in players]
+    started = time.perf_counter()
+    await host.client.emit('unlock-buzzers', {'roomCode': host.room_code, 'playerIds': 'all'})
+    await asyncio.wait_for(asyncio.gather(*unlocked), timeout)
+    return time.perf_counter() - started
+
+
+async def run_arbitration(server_url, pressers=300, rounds=10, timeout=30, settle=0.5, connect_concurrency=200):
+    """`rounds` Buzzer-Runden mit `pressers` gleichzeitigen Drückern"""
+    host = VirtualHost(server_url, build_quiz(1, 'buzzer', title=f'Buzzer Arbitration {pressers}'))
+    await host.create_room()
+
+    players = [
+        VirtualPlayer(server_url, host.room_code, f'Drücker {i + 1}', autoplay=False)
+        for i in range(pressers)
+    ]
+    results = await gather_limited([p.join() for p in players], connect_concurrency)
+    players = [p for p, r in zip(players, results) if not isinstance(r, Exception)]
+    await host.wait_for_players(len(players), timeout)
+
+    seen = {p.player_id: _Round() for p in players}
+    for player in players:
+        player.client.on('buzzer-locked', seen[player.player_id])
+
+    started = [p.client.expect('game-started') for p in players]
+    await host.start_game()
+    await asyncio.wait_for(asyncio.gather(*started), timeout)
+
+    failures = []
+    press_to_lock, winner_latency, rearm_times, reaction_ms, winner_ranks = [], [], [], [], []
+
+    async with MetricsScope(server_url) as metrics:
+        for index in range(rounds):
+            if index:
+                rearm_times.append(await _rearm(host, players, timeout))
+            buzzer_round = players[0].buzzer_round
+            rejected_before = {p.player_id: p.client.event_counts['buzzer-rejected'] for p in players}
+            host_locks_before = len(host.buzzer_locks)
+
+            locked = [p.client.expect('buzzer-locked', lambda d, r=buzzer_round: d.get('round') == r) for p in players]
+            await asyncio.gather(*(p.press_buzzer() for p in players))
+            try:
+                await asyncio.wait_for(asyncio.gather(*locked), timeout)
+            except asyncio.TimeoutError:
+                failures.append(f'Runde {index + 1}: nicht alle Spieler haben eine Sperre bekommen')
+            # Nachzügler (zweite Sperre, fehlende Absagen) abwarten
+            await asyncio.sleep(settle)
+
+            host_locks = host.buzzer_locks[host_locks_before:]
+            if len(host_locks) != 1:
+                failures.append(f'Runde {index + 1}: {len(host_locks)} Sperren beim Host statt genau einer')
+                continue
+            winner = host_locks[0]['playerId']
+            pressed_at = {p.player_id: p.pressed_at for p in players}
+            if winner not in pressed_at:
+                failures.append(f'Runde {index + 1}: Gewinner {winner} hat gar nicht gedrückt')
+                continue
+
+            for player in players:
+                locks = seen[player.player_id].locks.get(buzzer_round, [])
+                if len(locks) != 1:
+                    failures.append(f'Runde {index + 1}: {player.name} hat {len(locks)} Sperren bekommen')
+                elif locks[0]['playerId'] != winner:
+                    failures.append(f'Runde {index + 1}: {player.name} sieht {locks[0]["playerName"]} als Gewinner')
+                else:
+                    press_to_lock.append(locks[0]['received'] - player.pressed_at)
+                    if player.player_id == winner:
+                        winner_latency.append(locks[0]['received'] - player.pressed_at)
+
+                rejections = player.client.event_counts['buzzer-rejected'] - rejected_before[player.player_id]
+                if rejections != (0 if player.player_id == winner else 1):
+                    failures.append(f'Runde {index + 1}: {player.name} hat {rejections} Absagen bekommen')
+
+            send_order = sorted(pressed_at, key=pressed_at.get)
+            winner_ranks.append(send_order.index(winner))
+            if host_locks[0].get('reactionMs') is not None:
+                reaction_ms.append(host_locks[0]['reactionMs'] / 1000)
+
+    await asyncio.gather(*(p.leave() for p in players), return_exceptions=True)
+    await host.close()
+
+    hot = hottest(metrics.delta)
+    return {
+        'test': 'buzzer-arbitration',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'pressers': pressers,
+        'joined': len(players),
+        'rounds': rounds,
+        'press_to_lock_ms': summarize(press_to_lock),
+        'winner_press_to_lock_ms': summarize(winner_latency),
+        'rearm_broadcast_ms': summarize(rearm_times),
+        # Server: Freigabe → Druck des Gewinners (enthält die Fan-out-Zeit der Freigabe)
+        'server_reaction_ms': summarize(reaction_ms),
+        'winner_send_rank': {
+            'first': sum(1 for rank in winner_ranks if rank == 0),
+            'max': max(winner_ranks) if winner_ranks else None
+        },
+        'hottest_handler': hot[0] if hot else None,
+        'server_metrics': metrics.delta,
+        'failures': failures
+    }
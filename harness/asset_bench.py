@@ -0,0 +1,220 @@
+"""
+Bild-Fragen Benchmark (Asset-Store)
+
+Ein Quiz mit eingebetteten Bildern (data: URLs wie aus CreateQuiz.jsx),
+ein Host, viele Spieler und zwei Anzeige-Clients pro Raum. Gemessen werden
+die Bytes, die jeder Spieler pro Frage über den Socket bekommt, und die
+Zeit bis zum Rendern bei den Anzeige-Clients: Frage empfangen → Bild
+geladen. Ein Anzeige-Client lädt die Bilder der nächsten Frage vorab
+(nextAssets), der andere erst bei Bedarf.
+
+Läuft auch gegen alte Server ohne Asset-Store: dann stecken die Bilder in
+der Frage selbst und "Rendern" heißt nur Base64 dekodieren.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import platform
+import time
+import urllib.error
+import urllib.request
+
+from .metrics import MetricsScope
+from .players import AVATARS, build_quiz, gather_limited, room_code_for
+from .protocol import SocketIOClient
+from .stats import summarize
+
+ASSET_PREFIX = 'asset:'
+QUESTION_EVENTS = ('game-started', 'next-question')
+PNG_HEADER = b'\x89PNG\r\n\x1a\n'
+
+
+def image_quiz(question_count, image_kb):
+    """Multiple-Choice-Quiz mit einem eigenen Bild (Zufallsbytes) pro Frage"""
+    quiz = build_quiz(question_count, 'multiple', title='Asset Bench')
+    for question in quiz['questions']:
+        data = PNG_HEADER + os.urandom(image_kb * 1024)
+        question['image'] = 'data:image/png;base64,' + base64.b64encode(data).decode()
+        question['imageRevealAnimation'] = 'blur'
+        question['imageRevealDuration'] = 5
+    return quiz
+
+
+def _http(server_url, path, data=None, headers=None, timeout=30):
+    request = urllib.request.Request(server_url.rstrip('/') + path, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def upload_images(server_url, quiz):
+    """Wie uploadQuizAssets() im Client: Bilder per POST /assets, im Quiz nur Referenzen"""
+    room = room_code_for(quiz)
+    for question in quiz['questions']:
+        header, _, body = question['image'].partition(',')
+        status, _, response = _http(server_url, f'/assets?room={room}', base64.b64decode(body),
+                                    {'Content-Type': header[5:].split(';')[0]})
+        if status != 201:
+            raise RuntimeError(f'Upload fehlgeschlagen: HTTP {status}')
+        question['image'] = json.loads(response)['ref']
+
+
+def check_asset_http(server_url, room_code, asset_id):
+    """ETag/304, immutable Cache-Control und Range-Anfragen eines Assets prüfen"""
+    path = f'/assets/{asset_id}?room={room_code}'
+    status, headers, body = _http(server_url, path)
+    etag = headers.get('ETag')
+    revalidate, _, _ = _http(server_url, path, headers={'If-None-Match': etag or ''})
+    partial, partial_headers, partial_body = _http(server_url, path, headers={'Range': 'bytes=0-99'})
+    return {
+        'status': status,
+        'etag': etag,
+        'immutable': 'immutable' in headers.get('Cache-Control', ''),
+        'not_modified': revalidate == 304,
+        'range': partial == 206 and partial_body == body[:100],
+        'content_range': partial_headers.get('Content-Range')
+    }
+
+
+class Display:
+    """Zeigt Fragenbilder an wie ImageReveal: erst rendern, wenn das Bild da ist"""
+
+    def __init__(self, server_url, room_code, prefetch):
+        self.server_url = server_url
+        self.room_code = room_code
+        self.prefetch = prefetch
+        self.client = SocketIOClient(server_url, room=room_code)
+        self.cache = {}
+        self.render_times = []
+        self.fetched_bytes = 0
+        self.cache_hits = 0
+        self._tasks = set()
+        for event in QUESTION_EVENTS:
+            self.client.on(event, self._on_question)
+
+    async def join(self):
+        await self.client.connect()
+        await self.client.emit('join-leaderboard', {'roomCode': self.room_code})
+
+    def _on_question(self, data):
+        task = asyncio.create_task(self._render(data, time.perf_counter()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _render(self, data, received):
+        image = (data.get('question') or {}).get('image')
+        if isinstance(image, str) and image.startswith(ASSET_PREFIX):
+            await self._load(image[len(ASSET_PREFIX):])
+        elif image:
+            base64.b64decode(image.partition(',')[2])
+        self.render_times.append(time.perf_counter() - received)
+
+        if self.prefetch:
+            for asset_id in data.get('nextAssets') or []:
+                task = asyncio.ensure_future(self._load(asset_id))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, asset_id):
+        # Browser-Cache nachbilden: laufende Downloads werden geteilt
+        if asset_id in self.cache:
+            self.cache_hits += 1
+            return await self.cache[asset_id]
+        future = asyncio.ensure_future(asyncio.to_thread(_http, self.server_url, f'/assets/{asset_id}?room={self.room_code}'))
+        self.cache[asset_id] = future
+        status, _, body = await future
+        if status == 200:
+            self.fetched_bytes += len(body)
+        return body
+
+    async def close(self):
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.client.disconnect()
+
+
+async def run_asset_bench(server_url, rooms=1, players=50, questions=5, image_kb=200, interval=2.0,
+                          upload=False, concurrency=200):
+    """Spielt ein Bild-Quiz in `rooms` Räumen und misst Bytes pro Frage und Zeit bis zum Rendern"""
+    quizzes = [image_quiz(questions, image_kb) for _ in range(rooms)]
+    inline_question_bytes = sum(
+        len(json.dumps(['next-question', {'question': q}], separators=(',', ':')))
+        for q in quizzes[0]['questions']
+    ) / questions
+    if upload:
+        await asyncio.gather(*(asyncio.to_thread(upload_images, server_url, quiz) for quiz in quizzes))
+    create_bytes = len(json.dumps({'quizId': quizzes[0]['id'], 'quizData': quizzes[0]}, separators=(',', ':')))
+
+    hosts, clients, displays = [], [], []
+    for quiz in quizzes:
+        room_code = room_code_for(quiz)
+        host = SocketIOClient(server_url, room=room_code)
+        await host.connect()
+        created = host.expect('room-created')
+        await host.emit('create-room', {'quizId': quiz['id'], 'quizData': quiz})
+        await asyncio.wait_for(created, 30)
+        hosts.append((room_code, host))
+        displays += [Display(server_url, room_code, prefetch=True), Display(server_url, room_code, prefetch=False)]
+
+    async def join(room_code, i):
+        client = SocketIOClient(server_url, room=room_code)
+        await client.connect()
+        await client.emit('join-room', {
+            'roomCode': room_code,
+            'playerName': f'Bild {i + 1}',
+            'playerAvatar': AVATARS[i % len(AVATARS)]
+        })
+        clients.append(client)
+
+    await gather_limited([join(code, i) for code, _ in hosts for i in range(players)], concurrency)
+    await asyncio.gather(*(display.join() for display in displays))
+    await asyncio.sleep(0.5)
+
+    async with MetricsScope(server_url) as metrics:
+        for index in range(questions):
+            event = 'start-game' if index == 0 else 'next-question'
+            await asyncio.gather(*(host.emit(event, {'roomCode': code}) for code, host in hosts))
+            await asyncio.sleep(interval)
+
+    # Irgendein geladenes Asset für die HTTP-Prüfungen (keins = alter Server)
+    loaded = next(((d.room_code, asset_id) for d in displays for asset_id in d.cache), None)
+    http_checks = await asyncio.to_thread(check_asset_http, server_url, *loaded) if loaded else None
+
+    per_client = [sum(c.event_bytes[e] for e in QUESTION_EVENTS) / questions for c in clients]
+    mean_per_client = sum(per_client) / len(per_client) if per_client else 0
+
+    report = {
+        'benchmark': 'question-assets',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'rooms': rooms,
+        'players_per_room': players,
+        'questions': questions,
+        'image_kb': image_kb,
+        'upload': upload,
+        'asset_refs': loaded is not None,
+        'create_room_bytes': create_bytes,
+        # Frage mit eingebettetem Bild, wie sie ohne Asset-Store pro Spieler ankommt
+        'inline_question_bytes': round(inline_question_bytes),
+        'question_bytes_per_player': round(mean_per_client),
+        'question_bytes_total': round(mean_per_client * len(clients) * questions),
+        'render_ms': {
+            'prefetch': summarize([t for d in displays if d.prefetch for t in d.render_times]),
+            'on_demand': summarize([t for d in displays if not d.prefetch for t in d.render_times])
+        },
+        'display_fetched_bytes': {
+            'prefetch': sum(d.fetched_bytes for d in displays if d.prefetch),
+            'on_demand': sum(d.fetched_bytes for d in displays if not d.prefetch)
+        },
+        'http_checks': http_checks,
+        'server_metrics': metrics.delta
+    }
+
+    await asyncio.gather(*(display.close() for display in displays), return_exceptions=True)
+    await asyncio.gather(*(c.disconnect() for c in clients), return_exceptions=True)
+    await asyncio.gather(*(host.disconnect() for _, host in hosts), return_exceptions=True)
+    return report
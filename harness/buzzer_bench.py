@@ -0,0 +1,145 @@
+"""
+Buzzer Fan-out Benchmark
+
+Alle Spieler eines Raums drücken gleichzeitig den Buzzer. Gemessen wird
+vom Senden beim Spieler bis zum Empfang des 'buzzer-pressed' Relays beim
+Host (beide im selben Prozess, also dieselbe perf_counter-Uhr), dazu die
+Reihenfolge-Vertauschungen: ein später gedrückter Buzzer kommt vor einem
+früheren beim Host an.
+
+Server mit Arbitrierung melden dem Host nur noch den Gewinner
+('buzzer-locked'). Dort wird stattdessen pro Drücker die Antwort auf den
+eigenen Druck gemessen: 'buzzer-locked' mit der eigenen ID für den
+Gewinner, 'buzzer-rejected' für alle anderen. Inversionen zählen dann, wie
+oft ein später Drücker seine Antwort vor einem früheren bekommt. Die
+Gewinner-Prüfung über viele Runden macht test-buzzer-arbitration.py.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import time
+
+from .metrics import MetricsScope
+from .players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+from .stats import count_inversions, summarize
+
+DEFAULT_LEVELS = (10, 100, 500, 1000)
+
+
+def track_replies(players):
+    """Empfangszeit der Antwort auf den eigenen Druck pro Spieler-ID"""
+    replies = {}
+    done = asyncio.Event()
+
+    def record(player):
+        if player.player_id not in replies:
+            replies[player.player_id] = time.perf_counter()
+            if len(replies) == len(players):
+                done.set()
+
+    for player in players:
+        # Absagen gehen nur an den Drücker, die Sperre an alle: nur die eigene zählt
+        player.client.on('buzzer-rejected', lambda data, p=player: record(p))
+        player.client.on('buzzer-locked', lambda data, p=player: data.get('playerId') == p.player_id and record(p))
+    return replies, done
+
+
+async def measure_fanout(server_url, pressers, timeout=30, connect_concurrency=200):
+    """Ein Raum mit `pressers` Spielern, ein gleichzeitiger Buzzer-Durchgang"""
+    host = VirtualHost(server_url, build_quiz(1, 'buzzer', title=f'Buzzer Bench {pressers}'))
+    await host.create_room()
+
+    players = [
+        VirtualPlayer(server_url, host.room_code, f'Presser {i + 1}', autoplay=False)
+        for i in range(pressers)
+    ]
+    results = await gather_limited([p.join() for p in players], connect_concurrency)
+    players = [p for p, r in zip(players, results) if not isinstance(r, Exception)]
+    await host.wait_for_players(len(players), timeout)
+
+    started = [p.client.expect('game-started') for p in players]
+    await host.start_game()
+    await asyncio.wait_for(asyncio.gather(*started), timeout)
+
+    # Alle gleichzeitig drücken
+    replies, replied = track_replies(players)
+    await asyncio.gather(*(p.press_buzzer() for p in players))
+    complete = await host.wait_for_presses(len(players), timeout)
+    arbitrated = bool(host.buzzer_locks)
+    if arbitrated:
+        try:
+            await asyncio.wait_for(replied.wait(), timeout)
+        except asyncio.TimeoutError:
+            complete = False
+
+    pressed_at = {p.player_id: p.pressed_at for p in players}
+    send_rank = {pid: rank for rank, pid in enumerate(sorted(pressed_at, key=pressed_at.get))}
+    if arbitrated:
+        # Antwort an jeden Drücker, in Empfangsreihenfolge
+        arrivals = sorted(({'playerId': pid, 'received': t} for pid, t in replies.items()), key=lambda a: a['received'])
+        winner = host.buzzer_locks[0]['playerId']
+    else:
+        # Relay jedes Drucks an den Host
+        arrivals = [a for a in host.buzzer_presses if a['playerId'] in pressed_at]
+        winner = arrivals[0]['playerId'] if arrivals else None
+
+    latencies = [a['received'] - pressed_at[a['playerId']] for a in arrivals]
+    inversions = count_inversions(send_rank[a['playerId']] for a in arrivals)
+    pairs = len(arrivals) * (len(arrivals) - 1) // 2
+
+    await asyncio.gather(*(p.leave() for p in players), return_exceptions=True)
+    await host.close()
+
+    return {
+        'pressers': pressers,
+        'joined': len(players),
+        'received': len(arrivals),
+        'arbitrated': arbitrated,
+        'lost': len(players) - len(arrivals),
+        'complete': complete,
+        'latency_ms': summarize(latencies),
+        'inversions': inversions,
+        'inversion_ratio': round(inversions / pairs, 6) if pairs else 0.0,
+        'first_press_winner_correct': winner is not None and send_rank[winner] == 0
+    }
+
+
+async def run_benchmark(server_url, levels=DEFAULT_LEVELS, timeout=30):
+    report = {
+        'benchmark': 'buzzer-fanout',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'levels': {}
+    }
+    for pressers in levels:
+        async with MetricsScope(server_url) as metrics:
+            result = await measure_fanout(server_url, pressers, timeout)
+        result['server_metrics'] = metrics.delta
+        report['levels'][str(pressers)] = result
+    return report
+
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def compare_reports(previous, current, keys=('p50', 'p95', 'p99', 'max')):
+    """Differenz pro Stufe und Perzentil (aktuell - vorher) in ms"""
+    diff = {}
+    for level, result in current['levels'].items():
+        before = previous.get('levels', {}).get(level)
+        if not before:
+            continue
+        diff[level] = {
+            key: round(result['latency_ms'][key] - before['latency_ms'][key], 3)
+            for key in keys
+            if result['latency_ms'].get(key) is not None and before['latency_ms'].get(key) is not None
+        }
+        diff[level]['inversions'] = result['inversions'] - before['inversions']
+    return diff
@@ -0,0 +1,158 @@
+"""
+Verbindungs-Churn Benchmark
+
+Hunderte Räume mit verbundenem Host, dazu tausende kurzlebige Spieler pro
+Sekunde: verbinden, beitreten, (optional kurz bleiben), trennen - wie
+Handys in einem wackeligen WLAN. Ein eigener Thread misst währenddessen
+die Antwortzeit von /health. Der Endpoint tut selbst fast nichts, seine
+Latenz ist also im Wesentlichen die Event-Loop-Verzögerung des Servers.
+"""
+
+import asyncio
+import platform
+import random
+import threading
+import time
+import urllib.request
+
+from .metrics import MetricsScope
+from .players import AVATARS, build_quiz, gather_limited, room_code_for
+from .protocol import SocketIOClient
+from .stats import summarize
+
+
+class HealthProbe:
+    """Fragt /health im festen Takt ab (eigener Thread, eigene Uhr)"""
+
+    def __init__(self, server_url, interval=0.05, timeout=5):
+        self.url = server_url.rstrip('/') + '/health'
+        self.interval = interval
+        self.timeout = timeout
+        self.samples = []
+        self.errors = 0
+        self._phase = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self, phase):
+        self._phase = phase
+        if not self._thread.is_alive():
+            self._thread.start()
+        return self
+
+    def phase(self, phase):
+        self._phase = phase
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(self.timeout + 1)
+
+    def latencies(self, phase):
+        return [latency for p, latency in self.samples if p == phase]
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+                    response.read()
+                self.samples.append((self._phase, time.perf_counter() - started))
+            except OSError:
+                self.errors += 1
+            self._stop.wait(max(0.0, self.interval - (time.perf_counter() - started)))
+
+
+async def _open_rooms(server_url, rooms, concurrency):
+    """Hosts als nackte Protokoll-Clients: ohne Handler werden die Join-Broadcasts nicht geparst"""
+    hosts = []
+
+    async def create(i):
+        quiz = build_quiz(1, 'multiple', title=f'Churn {i + 1}')
+        host = SocketIOClient(server_url, room=room_code_for(quiz))
+        await host.connect()
+        created = host.expect('room-created')
+        await host.emit('create-room', {'quizId': quiz['id'], 'quizData': quiz})
+        await asyncio.wait_for(created, 10)
+        hosts.append((room_code_for(quiz), host))
+
+    await gather_limited([create(i) for i in range(rooms)], concurrency)
+    return hosts
+
+
+async def run_churn(server_url, rooms=200, rate=1000, duration=30, hold=0.0, leave=False,
+                    max_inflight=500, baseline=3.0, probe_interval=0.05):
+    """`rate` neue Verbindungen pro Sekunde für `duration` Sekunden, verteilt auf `rooms` Räume"""
+    probe = HealthProbe(server_url, probe_interval).start('idle')
+    await asyncio.sleep(baseline)
+
+    hosts = await _open_rooms(server_url, rooms, 100)
+    room_codes = [code for code, _ in hosts]
+    stats = {'started': 0, 'completed': 0, 'failed': 0}
+    inflight = asyncio.Semaphore(max_inflight)
+
+    async def churn_one(i):
+        try:
+            room_code = random.choice(room_codes)
+            client = SocketIOClient(server_url, room=room_code)
+            await client.connect()
+            await client.emit('join-room', {
+                'roomCode': room_code,
+                'playerName': f'Churn {i}',
+                'playerAvatar': AVATARS[i % len(AVATARS)]
+            })
+            if hold:
+                await asyncio.sleep(hold)
+            if leave:
+                await client.emit('leave-room', {'roomCode': room_code})
+            await client.disconnect()
+            stats['completed'] += 1
+        except Exception:
+            stats['failed'] += 1
+        finally:
+            inflight.release()
+
+    probe.phase('churn')
+    async with MetricsScope(server_url) as metrics:
+        tasks = set()
+        started = time.perf_counter()
+        deadline = started + duration
+        # In 10 ms Takten so viele Verbindungen starten, wie der Sollrate entspricht
+        while time.perf_counter() < deadline:
+            due = int((time.perf_counter() - started) * rate)
+            while stats['started'] < due:
+                await inflight.acquire()
+                task = asyncio.create_task(churn_one(stats['started']))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                stats['started'] += 1
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        churn_seconds = time.perf_counter() - started
+    probe.phase('after')
+    await asyncio.sleep(baseline)
+    probe.stop()
+
+    await asyncio.gather(*(host.disconnect() for _, host in hosts), return_exceptions=True)
+
+    return {
+        'benchmark': 'connection-churn',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'rooms': len(hosts),
+        'target_rate': rate,
+        'achieved_rate': round(stats['completed'] / churn_seconds, 1),
+        'connections': stats['completed'],
+        'failed': stats['failed'],
+        'hold_s': hold,
+        'leave': leave,
+        'seconds': round(churn_seconds, 2),
+        'lag_ms': {
+            'idle': summarize(probe.latencies('idle')),
+            'churn': summarize(probe.latencies('churn')),
+            'after': summarize(probe.latencies('after'))
+        },
+        'probe_errors': probe.errors,
+        'server_metrics': metrics.delta
+    }
@@ -0,0 +1,191 @@
+"""
+Cluster-Skalierung Benchmark
+
+Startet den Server selbst im Cluster-Modus (node server/cluster.js) mit 1
+bis N Workern und verteilt tausende Spieler auf viele Räume. Jeder Spieler
+schickt in einer Schleife 'submit-answer' und wartet auf sein
+'answer-result' (geschlossene Last, pro Antwort zusätzlich ein
+'player-answered' an den Host). Gemessen wird der Durchsatz in Antworten
+pro Sekunde; bei sauberem Sharding wächst er fast linear mit den Workern.
+
+Die Last erzeugen mehrere Client-Prozesse, damit nicht der Python-Client
+selbst zum Flaschenhals wird. Alle Clients senden den Raum-Code im
+Handshake, der Primary routet sie damit zum zuständigen Worker.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import threading
+import time
+import urllib.request
+
+from .players import AVATARS, build_quiz, gather_limited, room_code_for
+from .protocol import SocketIOClient
+from .server import ServerProcess
+from .stats import summarize
+
+DEFAULT_WORKERS = (1, 2, 4)
+
+
+async def _drive(server_url, rooms, players_per_room, warmup, duration, barrier, sample_every):
+    """Räume und Spieler eines Client-Prozesses aufbauen, nach der Barriere Last erzeugen"""
+    hosts = []
+    players = []
+
+    async def open_room(i):
+        quiz = build_quiz(1, 'multiple', title=f'Cluster {os.getpid()}-{i}')
+        room_code = room_code_for(quiz)
+        # Host ohne Handler: 'player-answered' wird nicht geparst
+        host = SocketIOClient(server_url, room=room_code)
+        await host.connect()
+        created = host.expect('room-created')
+        await host.emit('create-room', {'quizId': quiz['id'], 'quizData': quiz})
+        await asyncio.wait_for(created, 30)
+        hosts.append(host)
+
+        for j in range(players_per_room):
+            client = SocketIOClient(server_url, room=room_code)
+            await client.connect()
+            state = client.expect('room-state')
+            await client.emit('join-room', {
+                'roomCode': room_code,
+                'playerName': f'Spieler {j + 1}',
+                'playerAvatar': AVATARS[j % len(AVATARS)]
+            })
+            await asyncio.wait_for(state, 30)
+            players.append((room_code, client))
+
+    setup = await gather_limited([open_room(i) for i in range(rooms)], 50)
+    setup_errors = sum(1 for r in setup if isinstance(r, Exception))
+    await asyncio.to_thread(barrier.wait)
+
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + duration
+    stats = {'answers': 0, 'timeouts': 0}
+    latencies = []
+
+    async def answer_loop(room_code, client):
+        payload = {'roomCode': room_code, 'answer': 1, 'responseTime': 1.0}
+        while time.perf_counter() < deadline:
+            reply = client.expect('answer-result')
+            sent = time.perf_counter()
+            await client.emit('submit-answer', payload)
+            try:
+                await asyncio.wait_for(reply, 10)
+            except asyncio.TimeoutError:
+                stats['timeouts'] += 1
+                continue
+            done = time.perf_counter()
+            if measure_from <= done < deadline:
+                stats['answers'] += 1
+                if stats['answers'] % sample_every == 0:
+                    latencies.append(done - sent)
+
+    await asyncio.gather(*(answer_loop(code, client) for code, client in players))
+    await asyncio.gather(*(c.disconnect() for _, c in players), *(h.disconnect() for h in hosts),
+                         return_exceptions=True)
+    return {
+        'rooms': len(hosts),
+        'players': len(players),
+        'setup_errors': setup_errors,
+        'answers': stats['answers'],
+        'timeouts': stats['timeouts'],
+        'latencies': latencies
+    }
+
+
+def _client_process(server_url, rooms, players_per_room, warmup, duration, barrier, results, sample_every):
+    try:
+        results.put(asyncio.run(_drive(server_url, rooms, players_per_room, warmup, duration, barrier, sample_every)))
+    except Exception as error:
+        barrier.abort()
+        results.put({'error': repr(error)})
+
+
+def _fetch_status(server_url):
+    with urllib.request.urlopen(server_url.rstrip('/') + '/status', timeout=5) as response:
+        return json.load(response)
+
+
+def measure_workers(workers, rooms=200, players_per_room=10, duration=15, warmup=3,
+                    client_procs=None, port=3201, sample_every=20):
+    """Ein Cluster mit `workers` Workern, Durchsatz über `duration` Sekunden"""
+    client_procs = client_procs or max(2, (os.cpu_count() or 2) // 2)
+    server = ServerProcess(port, env={'WORKERS': str(workers)}, log_name=f'cluster-bench-{workers}.log',
+                           script='cluster.js')
+    startup = server.start(timeout=30)
+
+    share = [rooms // client_procs + (1 if i < rooms % client_procs else 0) for i in range(client_procs)]
+    share = [n for n in share if n]
+
+    # Eine zusätzliche Partei für die Barriere: der Hauptprozess liest dann /status
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(len(share) + 1)
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_client_process,
+                    args=(server.url, n, players_per_room, warmup, duration, barrier, results, sample_every))
+        for n in share
+    ]
+
+    try:
+        for proc in procs:
+            proc.start()
+        try:
+            barrier.wait()
+            status = _fetch_status(server.url)
+        except (threading.BrokenBarrierError, OSError):
+            status = None
+        outcomes = [results.get(timeout=duration + warmup + 600) for _ in procs]
+        for proc in procs:
+            proc.join()
+    finally:
+        server.stop()
+
+    errors = [o['error'] for o in outcomes if 'error' in o]
+    outcomes = [o for o in outcomes if 'error' not in o]
+    answers = sum(o['answers'] for o in outcomes)
+    return {
+        'workers': workers,
+        'startup_seconds': round(startup, 2),
+        'client_processes': len(procs),
+        'rooms': sum(o['rooms'] for o in outcomes),
+        'players': sum(o['players'] for o in outcomes),
+        'setup_errors': sum(o['setup_errors'] for o in outcomes),
+        'status_players': status and status.get('totalPlayers'),
+        'status_rooms': status and status.get('activeRooms'),
+        'answers': answers,
+        'answers_per_second': round(answers / duration, 1),
+        'timeouts': sum(o['timeouts'] for o in outcomes),
+        'latency_ms': summarize([l for o in outcomes for l in o['latencies']]),
+        'errors': errors
+    }
+
+
+def run_scaling(worker_counts=DEFAULT_WORKERS, rooms=200, players_per_room=10, duration=15,
+                warmup=3, client_procs=None, port=3201):
+    report = {
+        'benchmark': 'cluster-scaling',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'host': platform.node(),
+        'cpus': os.cpu_count(),
+        'rooms': rooms,
+        'players_per_room': players_per_room,
+        'duration': duration,
+        'workers': {}
+    }
+    for workers in worker_counts:
+        report['workers'][str(workers)] = measure_workers(
+            workers, rooms, players_per_room, duration, warmup, client_procs, port)
+
+    # Speedup gegenüber der kleinsten Stufe und Effizienz (1.0 = perfekt linear)
+    results = list(report['workers'].values())
+    base = results[0]
+    for result in results:
+        speedup = result['answers_per_second'] / base['answers_per_second'] if base['answers_per_second'] else None
+        result['speedup'] = round(speedup, 2) if speedup else None
+        result['efficiency'] = round(speedup / (result['workers'] / base['workers']), 2) if speedup else None
+    return report
@@ -0,0 +1,233 @@
+"""
+Streaming Console-Log Collector über das DevTools-Protokoll
+
+Statt am Ende den kompletten driver.get_log('browser') Puffer zu holen,
+hängt sich der Collector per CDP an den Tab der Rolle und schreibt jeden
+console.*-Aufruf, jede Exception und jeden Log-Eintrag sofort als
+kompakte NDJSON-Zeile weg (mit Rotation). Im Speicher bleibt nur ein
+begrenzter Ring für die Live-Zusammenfassung.
+"""
+
+import asyncio
+import collections
+import json
+import os
+import threading
+import time
+import urllib.request
+
+import websockets
+
+# CDP-Level → Level wie bei driver.get_log('browser'), damit die Auswertung gleich bleibt
+LEVELS = {
+    'error': 'SEVERE',
+    'assert': 'SEVERE',
+    'warning': 'WARNING',
+    'warn': 'WARNING',
+    'verbose': 'DEBUG',
+    'debug': 'DEBUG'
+}
+
+
+class RotatingNDJSONWriter:
+    """Hängt JSON-Zeilen an und rotiert bei max_bytes (datei, datei.1, ... datei.N)"""
+
+    def __init__(self, path, max_bytes=10 * 1024 * 1024, backups=5):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.lines = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+        if self._file.tell() + len(line.encode('utf-8')) > self.max_bytes:
+            self._rotate()
+        self._file.write(line)
+        self.lines += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def _rotate(self):
+        self._file.close()
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f'{self.path}.{i}'):
+                os.replace(f'{self.path}.{i}', f'{self.path}.{i + 1}')
+        if self.backups:
+            os.replace(self.path, f'{self.path}.1')
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def close(self):
+        self._file.close()
+
+
+def _format_args(args):
+    parts = []
+    for arg in args:
+        if 'value' in arg:
+            value = arg['value']
+            parts.append(value if isinstance(value, str) else json.dumps(value, ensure_ascii=False))
+        else:
+            parts.append(arg.get('description') or arg.get('type', ''))
+    return ' '.join(parts)
+
+
+class ConsoleStream:
+    """Sammelt Console-Ausgaben eines Tabs live, solange der Test läuft"""
+
+    def __init__(self, driver, role, path, ring_size=500, error_ring_size=200,
+                 max_bytes=10 * 1024 * 1024, backups=5, flush_interval=0.5):
+        self.driver = driver
+        self.role = role
+        self.path = path
+        self.ring = collections.deque(maxlen=ring_size)
+        self.errors = collections.deque(maxlen=error_ring_size)
+        self.counts = collections.Counter()
+        self.flush_interval = flush_interval
+        self.mode = None
+        self._writer = RotatingNDJSONWriter(path, max_bytes, backups)
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._stop = None
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    @property
+    def offset(self):
+        """Anzahl bisher geschriebener Zeilen (Verweis für Screenshots o.ä.)"""
+        return self._writer.lines
+
+    def start(self):
+        """Per CDP-WebSocket anhängen; ohne DevTools-Zugang auf get_log-Polling zurückfallen"""
+        try:
+            ws_url = self._browser_ws_url()
+        except Exception:
+            self.mode = 'poll'
+            return self
+
+        self.mode = 'cdp'
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ws_url, self.driver.current_window_handle, ready),
+                                        daemon=True)
+        self._thread.start()
+        ready.wait(10)
+        return self
+
+    def poll(self):
+        """Puffer per WebDriver abholen (nur im Fallback-Modus nötig)"""
+        if self.mode != 'poll':
+            return
+        for entry in self.driver.get_log('browser'):
+            self._record(entry['level'], entry.get('source', 'console'), entry['message'], entry['timestamp'])
+        self._writer.flush()
+
+    def stop(self):
+        if self.mode == 'cdp' and self._loop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+            self._thread.join(5)
+        else:
+            self.poll()
+        with self._lock:
+            self._writer.flush()
+            self._writer.close()
+
+    def summary(self):
+        with self._lock:
+            return {
+                'role': self.role,
+                'mode': self.mode,
+                'file': self.path,
+                'total': self.total,
+                'levels': dict(self.counts),
+                'recent_errors': list(self.errors)
+            }
+
+    def _browser_ws_url(self):
+        address = self.driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        with urllib.request.urlopen(f'http://{address}/json/version', timeout=2) as response:
+            return json.load(response)['webSocketDebuggerUrl']
+
+    def _record(self, level, source, message, timestamp=None):
+        entry = {
+            't': int(timestamp or time.time() * 1000),
+            'role': self.role,
+            'level': level,
+            'source': source,
+            'message': message
+        }
+        with self._lock:
+            self.counts[level] += 1
+            self.ring.append(entry)
+            if level == 'SEVERE':
+                self.errors.append(entry)
+            self._writer.write(entry)
+
+    def _run(self, ws_url, target_id, ready):
+        asyncio.set_event_loop(self._loop)
+        self._stop = asyncio.Event()
+        try:
+            self._loop.run_until_complete(self._stream(ws_url, target_id, ready))
+        finally:
+            ready.set()
+            self._loop.close()
+
+    async def _stream(self, ws_url, target_id, ready):
+        async with websockets.connect(ws_url, max_size=None, ping_interval=None) as ws:
+            message_id = 0
+
+            async def send(method, params=None, session_id=None):
+                nonlocal message_id
+                message_id += 1
+                command = {'id': message_id, 'method': method, 'params': params or {}}
+                if session_id:
+                    command['sessionId'] = session_id
+                await ws.send(json.dumps(command))
+                return message_id
+
+            attach_id = await send('Target.attachToTarget', {'targetId': target_id, 'flatten': True})
+            session_id = None
+            stop_task = asyncio.create_task(self._stop.wait())
+            flush_at = time.monotonic() + self.flush_interval
+
+            while not self._stop.is_set():
+                receive = asyncio.create_task(ws.recv())
+                done, _ = await asyncio.wait({receive, stop_task}, timeout=self.flush_interval,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if receive not in done:
+                    receive.cancel()
+                else:
+                    message = json.loads(receive.result())
+                    if message.get('id') == attach_id:
+                        session_id = message['result']['sessionId']
+                        await send('Runtime.enable', session_id=session_id)
+                        await send('Log.enable', session_id=session_id)
+                        ready.set()
+                    elif message.get('sessionId') == session_id:
+                        self._handle_event(message.get('method'), message.get('params', {}))
+
+                if time.monotonic() >= flush_at:
+                    with self._lock:
+                        self._writer.flush()
+                    flush_at = time.monotonic() + self.flush_interval
+
+    def _handle_event(self, method, params):
+        if method == 'Runtime.consoleAPICalled':
+            level = LEVELS.get(params['type'], 'INFO')
+            self._record(level, 'console-api', _format_args(params.get('args', [])), params.get('timestamp'))
+        elif method == 'Runtime.exceptionThrown':
+            details = params['exceptionDetails']
+            description = (details.get('exception') or {}).get('description') or details.get('text', '')
+            self._record('SEVERE', 'exception', description, params.get('timestamp'))
+        elif method == 'Log.entryAdded':
+            entry = params['entry']
+            message = entry.get('text', '')
+            if entry.get('url'):
+                message = f"{entry['url']} - {message}"
+            self._record(LEVELS.get(entry.get('level'), 'INFO'), entry.get('source', 'other'), message,
+                         entry.get('timestamp'))
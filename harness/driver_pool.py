@@ -0,0 +1,163 @@
+"""
+WebDriver Pool - warme Chrome-Prozesse wiederverwenden
+
+Statt für jede Rolle in jedem Test einen neuen Chrome zu starten, hält der
+Pool fertig gestartete Browser bereit. Jede Ausleihe bekommt über das
+DevTools-Protokoll einen eigenen Browser-Context (wie ein Inkognito-Profil:
+eigener localStorage, eigene Cookies, eigener Cache), der beim Zurückgeben
+wieder verworfen wird.
+
+Benötigt: pip install selenium
+"""
+
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+# Vereinigung der Cache-Optionen aus test-buzzer-simple.py und test-buzzer-final.py
+DEFAULT_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-cache',
+    '--disk-cache-size=0',
+    '--media-cache-size=0',
+    '--disable-application-cache',
+    '--disable-gpu-shader-disk-cache',
+    '--disable-blink-features=AutomationControlled',
+)
+
+
+def chrome_options(headless=False, extra_args=()):
+    """Chrome-Optionen mit Console-Logging wie in den bisherigen Skripten"""
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    for arg in (*DEFAULT_ARGS, *extra_args):
+        options.add_argument(arg)
+    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    return options
+
+
+class DriverLease:
+    """Ein ausgeliehener Browser mit eigenem, isoliertem Context"""
+
+    def __init__(self, pool, driver, role):
+        self.pool = pool
+        self.driver = driver
+        self.role = role
+        self._base_handle = driver.current_window_handle
+        self._context_id = None
+        self._target_id = None
+        self._isolate()
+
+    def _isolate(self):
+        try:
+            self._context_id = self.driver.execute_cdp_cmd('Target.createBrowserContext', {})['browserContextId']
+            self._target_id = self.driver.execute_cdp_cmd('Target.createTarget', {
+                'url': 'about:blank',
+                'browserContextId': self._context_id
+            })['targetId']
+            # Chromedriver verwendet die CDP Target-ID als Window-Handle
+            self.driver.switch_to.window(self._target_id)
+        except Exception:
+            # Ohne CDP (z.B. Remote-Grid): frischen Zustand über Cookies/Storage herstellen
+            self._context_id = self._target_id = None
+            self.driver.delete_all_cookies()
+
+    def release(self):
+        if self.driver is None:
+            return
+        try:
+            if self._target_id:
+                self.driver.switch_to.window(self._base_handle)
+                self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': self._target_id})
+                self.driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': self._context_id})
+            # Liegengebliebene Browser-Logs gehören nicht zur nächsten Rolle
+            self.driver.get_log('browser')
+            self.pool._give_back(self.driver)
+        except Exception:
+            self.pool._discard(self.driver)
+        finally:
+            self.driver = None
+
+    def __enter__(self):
+        return self.driver
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class DriverPool:
+    """Thread-sicherer Pool warmer Chrome-Instanzen"""
+
+    def __init__(self, size=2, headless=False, extra_args=()):
+        self.size = size
+        self.headless = headless
+        self.extra_args = extra_args
+        self.created = 0
+        self._idle = []
+        self._all = []
+        self._lock = threading.Condition()
+
+    def _start_driver(self):
+        driver = webdriver.Chrome(options=chrome_options(self.headless, self.extra_args))
+        self.created += 1
+        return driver
+
+    def warm_up(self, count=None):
+        """Browser vorab starten, damit der erste Test nicht auf Chrome wartet"""
+        for _ in range((count or self.size) - len(self._all)):
+            driver = self._start_driver()
+            with self._lock:
+                self._all.append(driver)
+                self._idle.append(driver)
+                self._lock.notify()
+
+    def lease(self, role='host', timeout=120):
+        """Leihe einen Browser für eine Rolle aus (auch als Context-Manager nutzbar)"""
+        with self._lock:
+            while not self._idle and len(self._all) >= self.size:
+                if not self._lock.wait(timeout):
+                    raise TimeoutError(f'Kein freier Browser für Rolle {role}')
+            driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                # Platz reservieren, Chrome außerhalb des Locks starten
+                self._all.append(None)
+
+        if driver is None:
+            try:
+                driver = self._start_driver()
+            except Exception:
+                with self._lock:
+                    self._all.remove(None)
+                    self._lock.notify()
+                raise
+            with self._lock:
+                self._all[self._all.index(None)] = driver
+
+        return DriverLease(self, driver, role)
+
+    def _give_back(self, driver):
+        with self._lock:
+            self._idle.append(driver)
+            self._lock.notify()
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+            self._lock.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            drivers, self._all, self._idle = [d for d in self._all if d], [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,122 @@
+"""
+Join-Sturm Benchmark
+
+Viele Spieler mit wenigen, kollidierenden Namen ("Max", "Max #2", ...)
+treten gleichzeitig denselben Räumen bei, ein Teil verlässt den Raum und
+tritt mit demselben Namen wieder bei. Die Spieler sind vorher verbunden,
+gemessen werden also nur die Joins. Fertig ist ein Raum, wenn sein Host
+alle player-joined Broadcasts gesehen hat (ohne sie zu parsen). Danach
+holt ein Zuschauer pro Raum die Spielerliste und prüft, dass jeder Name
+genau einmal vergeben ist.
+"""
+
+import asyncio
+import collections
+import platform
+import random
+import time
+
+from .churn_bench import _open_rooms
+from .metrics import MetricsScope
+from .players import AVATARS, gather_limited
+from .protocol import SocketIOClient
+from .stats import summarize
+
+# Wenige Basisnamen, dazu schon nummerierte Eingaben wie "Max #2"
+DEFAULT_NAMES = ['Max', 'Max', 'Max', 'Max #2', 'Anna', 'Anna', 'Lea', 'Max #3']
+
+
+async def _room_names(server_url, room_code):
+    spectator = SocketIOClient(server_url, room=room_code)
+    await spectator.connect()
+    try:
+        snapshot = spectator.expect('leaderboard-update')
+        await spectator.emit('join-leaderboard', {'roomCode': room_code})
+        data = await asyncio.wait_for(snapshot, 30)
+        return [p['name'] for p in data['players']]
+    finally:
+        await spectator.disconnect()
+
+
+async def run_join_storm(server_url, rooms=10, players=500, names=None, rejoin=0.1,
+                         concurrency=500, timeout=120):
+    """`players` Joins pro Raum in `rooms` Räumen, Anteil `rejoin` verlässt und tritt wieder bei"""
+    names = names or DEFAULT_NAMES
+    hosts = await _open_rooms(server_url, rooms, 100)
+    clients = []
+
+    async def connect(room_code, i):
+        client = SocketIOClient(server_url, room=room_code)
+        await client.connect()
+        clients.append((room_code, i, client))
+
+    await gather_limited([connect(code, i) for code, _ in hosts for i in range(players)], concurrency)
+
+    rejoiners = set(random.sample(range(len(clients)), int(len(clients) * rejoin)))
+    expected = collections.Counter()
+    for index, (room_code, _, _) in enumerate(clients):
+        expected[room_code] += 2 if index in rejoiners else 1
+
+    async def join(index, room_code, i, client):
+        name = names[i % len(names)]
+        payload = {'roomCode': room_code, 'playerName': name, 'playerAvatar': AVATARS[i % len(AVATARS)]}
+        await client.emit('join-room', payload)
+        if index in rejoiners:
+            await client.emit('leave-room', {'roomCode': room_code})
+            await client.emit('join-room', payload)
+
+    completion = {}
+
+    async def wait_for_room(room_code, host, started):
+        while host.event_counts['player-joined'] < expected[room_code]:
+            await asyncio.sleep(0.005)
+        completion[room_code] = time.perf_counter() - started
+
+    async with MetricsScope(server_url) as metrics:
+        started = time.perf_counter()
+        waiting = asyncio.gather(*(wait_for_room(code, host, started) for code, host in hosts))
+        await gather_limited([join(index, *entry) for index, entry in enumerate(clients)], concurrency)
+        sent_seconds = time.perf_counter() - started
+        try:
+            await asyncio.wait_for(waiting, timeout)
+        except asyncio.TimeoutError:
+            pass
+        storm_seconds = time.perf_counter() - started
+
+    joins = sum(expected.values())
+    processed = sum(min(host.event_counts['player-joined'], expected[code]) for code, host in hosts)
+
+    duplicates = {}
+    wrong_count = {}
+    for room_code, _ in hosts:
+        assigned = await _room_names(server_url, room_code)
+        repeated = {name: count for name, count in collections.Counter(assigned).items() if count > 1}
+        if repeated:
+            duplicates[room_code] = repeated
+        if len(assigned) != players:
+            wrong_count[room_code] = len(assigned)
+
+    await asyncio.gather(*(client.disconnect() for _, _, client in clients), return_exceptions=True)
+    await asyncio.gather(*(host.disconnect() for _, host in hosts), return_exceptions=True)
+
+    return {
+        'benchmark': 'join-storm',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'rooms': len(hosts),
+        'players_per_room': players,
+        'names': names,
+        'rejoins': len(rejoiners),
+        'joins': joins,
+        'joins_processed': processed,
+        'send_seconds': round(sent_seconds, 3),
+        'seconds': round(storm_seconds, 3),
+        'joins_per_second': round(processed / storm_seconds, 1) if storm_seconds else None,
+        # Zeit bis zum letzten player-joined beim Host, pro Raum
+        'room_completion_ms': summarize(list(completion.values())),
+        'timed_out_rooms': len(hosts) - len(completion),
+        'duplicate_names': duplicates,
+        'wrong_player_count': wrong_count,
+        'server_metrics': metrics.delta
+    }
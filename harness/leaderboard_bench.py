@@ -0,0 +1,144 @@
+"""
+Leaderboard-Zuschauer Benchmark
+
+Ein Raum mit vielen Spielern (Ballast, siehe room_bench), ein Host, der im
+schnellen Takt Punkte per 'adjust-player-points' verteilt, und ein
+Zuschauer wie LiveLeaderboard.jsx. Der Zuschauer zählt Updates und Bytes
+pro Sekunde und baut die Rangliste aus Snapshot ('leaderboard-update') und
+Deltas ('leaderboard-delta') nach - bei einer Lücke in der Sequenznummer
+holt er sich wie der Client einen neuen Snapshot. Am Ende wird seine
+Rangliste mit den erwarteten Punkteständen verglichen.
+
+Läuft gegen alte (nur volle Updates) und neue Server-Versionen, damit
+sich vorher/nachher direkt vergleichen lässt.
+"""
+
+import asyncio
+import platform
+import random
+import time
+
+from .metrics import MetricsScope
+from .players import build_quiz, room_code_for
+from .protocol import SocketIOClient
+from .room_bench import add_ballast
+
+
+class Spectator:
+    """Zuschauer mit derselben Snapshot/Delta-Logik wie LiveLeaderboard.jsx"""
+
+    def __init__(self, server_url, room_code):
+        self.client = SocketIOClient(server_url, room=room_code)
+        self.room_code = room_code
+        self.scores = {}
+        self.seq = None
+        self.snapshots = 0
+        self.deltas = 0
+        self.resyncs = 0
+        self.update_times = []
+        self.client.on('leaderboard-update', self._on_snapshot)
+        self.client.on('leaderboard-delta', self._on_delta)
+
+    async def join(self, timeout=10):
+        await self.client.connect(timeout)
+        snapshot = self.client.expect('leaderboard-update')
+        await self.client.emit('join-leaderboard', {'roomCode': self.room_code})
+        await asyncio.wait_for(snapshot, timeout)
+
+    def _on_snapshot(self, data):
+        self.snapshots += 1
+        self.update_times.append(time.perf_counter())
+        self.seq = data.get('seq')
+        self.scores = {p['id']: p['score'] for p in data['players']}
+
+    def _on_delta(self, data):
+        if self.seq is None or data['seq'] <= self.seq:
+            return
+        if data['seq'] != self.seq + 1:
+            self.resyncs += 1
+            self.seq = None
+            asyncio.ensure_future(self.client.emit('leaderboard-resync', {'roomCode': self.room_code}))
+            return
+        self.deltas += 1
+        self.update_times.append(time.perf_counter())
+        self.seq = data['seq']
+        for player_id in data['removed']:
+            self.scores.pop(player_id, None)
+        for change in data['changes']:
+            self.scores[change['id']] = change['score']
+
+
+async def run_spectator_bench(server_url, players=500, rate=50, duration=10, settle=1.5, seed=None):
+    """`rate` Punkte-Anpassungen pro Sekunde für `duration` Sekunden bei `players` Spielern"""
+    rng = random.Random(seed)
+    quiz = build_quiz(1, 'buzzer', title=f'Leaderboard Bench {players}')
+    host = SocketIOClient(server_url, room=room_code_for(quiz))
+    roster = {}
+    host.on('player-joined', lambda data: roster.update({p['id']: p['score'] for p in data['players']}))
+    await host.connect()
+    created = host.expect('room-created')
+    await host.emit('create-room', {'quizId': quiz['id'], 'quizData': quiz})
+    room_code = (await asyncio.wait_for(created, 10))['roomCode']
+
+    await add_ballast(server_url, room_code, players)
+    await asyncio.sleep(0.5)
+
+    spectator = Spectator(server_url, room_code)
+    await spectator.join()
+    bytes_before = spectator.client.bytes_received
+    events_before = dict(spectator.client.event_bytes)
+    counts_before = dict(spectator.client.event_counts)
+
+    # Schnelle Punkte-Anpassungen, wie ein Host, der live korrigiert
+    expected = dict(roster)
+    player_ids = list(roster)
+    adjustments = int(rate * duration)
+    async with MetricsScope(server_url) as metrics:
+        started = time.perf_counter()
+        for i in range(adjustments):
+            player_id = rng.choice(player_ids)
+            points = rng.choice((10, 20, 50, 100, -10))
+            expected[player_id] = max(0, expected[player_id] + points)
+            await host.emit('adjust-player-points', {'roomCode': room_code, 'playerId': player_id, 'points': points})
+            await asyncio.sleep(max(0.0, started + (i + 1) / rate - time.perf_counter()))
+        send_seconds = time.perf_counter() - started
+
+        # Letzte Deltas abwarten (Coalescing-Fenster)
+        await asyncio.sleep(settle)
+    seconds = time.perf_counter() - started
+    received = spectator.client.bytes_received - bytes_before
+
+    per_event = {
+        event: {
+            'messages': count - counts_before.get(event, 0),
+            'bytes': spectator.client.event_bytes[event] - events_before.get(event, 0)
+        }
+        for event, count in spectator.client.event_counts.items()
+        if count - counts_before.get(event, 0)
+    }
+    updates = [t for t in spectator.update_times if t >= started]
+    mismatched = sum(1 for player_id, score in expected.items() if spectator.scores.get(player_id) != score)
+
+    await spectator.client.disconnect()
+    await host.disconnect()
+
+    return {
+        'benchmark': 'leaderboard-spectator',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'players': len(roster),
+        'adjustments': adjustments,
+        'adjust_rate': round(adjustments / send_seconds, 1),
+        'seconds': round(seconds, 2),
+        'bytes': received,
+        'bytes_per_second': round(received / seconds),
+        'updates': len(updates),
+        'updates_per_second': round(len(updates) / seconds, 1),
+        'snapshots': spectator.snapshots,
+        'deltas': spectator.deltas,
+        'resyncs': spectator.resyncs,
+        'events': per_event,
+        'mismatched_scores': mismatched,
+        'server_metrics': metrics.delta
+    }
@@ -0,0 +1,125 @@
+"""
+Server-Metriken (/metrics) vor und nach einem Szenario abfragen
+
+Der Server zählt pro Socket-Event Aufrufe und Handler-Latenzen (Histogramm)
+sowie gesendete Nachrichten und Bytes. Die Differenz zweier Abfragen zeigt,
+welches Event während eines Szenarios heiß war. Laufen mehrere Szenarien
+gleichzeitig gegen denselben Server, enthält die Differenz alle davon.
+
+    with MetricsScope(server_url) as scope:
+        ...
+    report['server_metrics'] = scope.delta
+
+    async with MetricsScope(server_url) as scope:
+        ...
+"""
+
+import asyncio
+import json
+import urllib.request
+
+GAUGES = ('rooms', 'players', 'spectators', 'connections')
+
+
+def scrape(server_url, timeout=5):
+    """GET /metrics, None wenn der Server (noch) keinen Endpoint hat oder nicht erreichbar ist"""
+    try:
+        with urllib.request.urlopen(server_url.rstrip('/') + '/metrics', timeout=timeout) as response:
+            return json.load(response)
+    except (OSError, ValueError):
+        return None
+
+
+def _bucket_percentile(buckets, count, p):
+    target = -(-count * p // 100)
+    seen = 0
+    for bound, n in buckets:
+        seen += n
+        if seen >= target:
+            return bound
+    return None
+
+
+def metrics_delta(before, after, top=None):
+    """Differenz zweier /metrics Abfragen, Events nach Anzahl sortiert"""
+    if not before or not after:
+        return None
+    # Im Cluster-Modus antwortet jeder Worker mit seinen eigenen Zählern
+    if before.get('worker') != after.get('worker'):
+        return None
+
+    events = {}
+    for name, stats in after.get('events', {}).items():
+        previous = before.get('events', {}).get(name)
+        latency, previous_latency = stats['latencyMs'], (previous or {}).get('latencyMs')
+        count = stats['count'] - (previous['count'] if previous else 0)
+        if count <= 0:
+            continue
+
+        if previous_latency:
+            buckets = [(bound, n - m) for (bound, n), (_, m) in zip(latency['buckets'], previous_latency['buckets'])]
+            total_ms = latency['sum'] - previous_latency['sum']
+        else:
+            buckets = [tuple(b) for b in latency['buckets']]
+            total_ms = latency['sum']
+
+        events[name] = {
+            'count': count,
+            'errors': stats['errors'] - (previous['errors'] if previous else 0),
+            'total_ms': round(total_ms, 3),
+            'mean_ms': round(total_ms / count, 4),
+            'p50_ms': _bucket_percentile(buckets, count, 50),
+            'p95_ms': _bucket_percentile(buckets, count, 95),
+            'p99_ms': _bucket_percentile(buckets, count, 99)
+        }
+
+    ordered = sorted(events.items(), key=lambda item: -item[1]['count'])
+    return {
+        'seconds': round(after['uptime'] - before['uptime'], 3),
+        'events': dict(ordered[:top] if top else ordered),
+        'emitted': {
+            key: after['emitted'][key] - before['emitted'][key]
+            for key in ('messages', 'bytes')
+        },
+        'gauges': {
+            key: {'before': before.get(key), 'after': after.get(key)}
+            for key in GAUGES
+        }
+    }
+
+
+def hottest(delta, key='total_ms'):
+    """Event mit der meisten Handler-Zeit (oder None)"""
+    if not delta or not delta['events']:
+        return None
+    name, stats = max(delta['events'].items(), key=lambda item: item[1][key])
+    return name, stats
+
+
+class MetricsScope:
+    """Kontextmanager (sync und async): Abfrage davor und danach, Differenz in .delta"""
+
+    def __init__(self, server_url, top=None):
+        self.server_url = server_url
+        self.top = top
+        self.before = None
+        self.after = None
+        self.delta = None
+
+    def __enter__(self):
+        self.before = scrape(self.server_url)
+        return self
+
+    def __exit__(self, *exc):
+        self.after = scrape(self.server_url)
+        self.delta = metrics_delta(self.before, self.after, self.top)
+        return False
+
+    async def __aenter__(self):
+        self.before = await asyncio.to_thread(scrape, self.server_url)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.after = await asyncio.to_thread(scrape, self.server_url)
+        self.delta = metrics_delta(self.before, self.after, self.top)
+        return False
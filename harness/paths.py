@@ -0,0 +1,43 @@
+"""
+Ablageorte für Test-Artefakte (Logs, Screenshots, Reports)
+
+Standard ist test-screenshots/ im Repository, überschreibbar mit
+QUIZER_ARTIFACT_DIR=/pfad/zum/ordner. Screenshots eines Laufs landen in
+einem eigenen Lauf-Ordner (run_dir), fest vorgeben mit QUIZER_RUN_DIR.
+"""
+
+import os
+import re
+import shutil
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def artifact_dir():
+    path = os.environ.get('QUIZER_ARTIFACT_DIR') or os.path.join(REPO_ROOT, 'test-screenshots')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def artifact_path(filename):
+    return os.path.join(artifact_dir(), filename)
+
+
+def run_dir(name, keep=20):
+    """Ordner für einen Testlauf: QUIZER_RUN_DIR oder <artefakte>/runs/<zeit>-<name>
+
+    Von den automatisch angelegten Läufen bleiben nur die letzten `keep`
+    erhalten, damit wiederholte Läufe die Platte nicht füllen.
+    """
+    path = os.environ.get('QUIZER_RUN_DIR')
+    if not path:
+        root = os.path.join(artifact_dir(), 'runs')
+        os.makedirs(root, exist_ok=True)
+        runs = sorted(entry.path for entry in os.scandir(root) if entry.is_dir())
+        for old in runs[:max(0, len(runs) - keep + 1)]:
+            shutil.rmtree(old, ignore_errors=True)
+        slug = re.sub(r'[^A-Za-z0-9_-]+', '-', name).strip('-')
+        path = os.path.join(root, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{slug}")
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -0,0 +1,427 @@
+"""
+Virtuelle Hosts und Spieler auf Basis des Protokoll-Clients
+
+Jeder Teilnehmer ist nur ein SocketIOClient plus etwas Spiel-Logik.
+run_load() verteilt beliebig viele Spieler auf beliebig viele Räume
+und spielt das komplette Quiz bis 'game-over' durch.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import uuid
+
+from .protocol import SocketIOClient
+
+AVATARS = ['🦊', '🐼', '🐸', '🦁', '🐙', '🐵', '🐨', '🐯']
+
+
+def build_quiz(question_count=1, question_type='buzzer', title='Python Load Test'):
+    """Erzeuge ein Test-Quiz im Format von CreateQuiz.jsx"""
+    questions = []
+    for i in range(question_count):
+        if question_type == 'buzzer':
+            questions.append({
+                'type': 'buzzer',
+                'question': f'Buzzer-Frage {i + 1}: Was ist die Hauptstadt von Deutschland?',
+                'points': 100,
+                'timeLimit': 30
+            })
+        else:
+            questions.append({
+                'type': 'multiple',
+                'question': f'Frage {i + 1}: Was ist 2 + {i}?',
+                'answers': [str(2 + i), str(3 + i), str(4 + i), str(5 + i)],
+                'correctAnswer': 0,
+                'correctAnswers': [0],
+                'points': 100,
+                'timeLimit': 20
+            })
+
+    # Der Server leitet den Raum-Code aus den letzten 6 Zeichen der Quiz-ID ab
+    return {
+        'id': f'load-{uuid.uuid4().hex}',
+        'title': title,
+        'questions': questions,
+        'createdAt': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+
+def room_code_for(quiz):
+    return quiz['id'][-6:].upper()
+
+
+class VirtualHost:
+    """Host ohne Browser: erstellt den Raum und steuert den Spielablauf"""
+
+    def __init__(self, server_url, quiz, wire='json'):
+        self.client = SocketIOClient(server_url, room=room_code_for(quiz), wire=wire)
+        self.quiz = quiz
+        self.room_code = None
+        self.players = []
+        self.question_index = -1
+        self.buzzer_presses = []
+        self.buzzer_locks = []
+        self.answers = []
+        self.final_players = None
+
+        self.client.on('player-joined', self._on_player_joined)
+        self.client.on('player-left', lambda data: setattr(self, 'players', data['players']))
+        self.client.on('buzzer-pressed', self._on_buzzer_pressed)
+        self.client.on('buzzer-locked', self._on_buzzer_locked)
+        self.client.on('player-answered', lambda data: self.answers.append(data))
+        self.client.on('game-over', lambda data: setattr(self, 'final_players', data['players']))
+
+    def _on_player_joined(self, data):
+        self.players = data['players']
+
+    def _on_buzzer_pressed(self, data):
+        self.buzzer_presses.append({**data, 'question': self.question_index, 'received': time.perf_counter()})
+
+    def _on_buzzer_locked(self, data):
+        # Server mit Arbitrierung: nur der Gewinner der Runde wird gemeldet
+        self._on_buzzer_pressed(data)
+        self.buzzer_locks.append(self.buzzer_presses[-1])
+
+    @property
+    def buzzer_locked(self):
+        return any(lock['question'] == self.question_index for lock in self.buzzer_locks)
+
+    async def create_room(self, timeout=10):
+        await self.client.connect(timeout)
+        created = self.client.expect('room-created')
+        await self.client.emit('create-room', {'quizId': self.quiz['id'], 'quizData': self.quiz})
+        data = await asyncio.wait_for(created, timeout)
+        self.room_code = data['roomCode']
+        return self.room_code
+
+    async def wait_for_players(self, count, timeout=30):
+        deadline = time.monotonic() + timeout
+        while len(self.players) < count:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f'Nur {len(self.players)}/{count} Spieler in Raum {self.room_code}')
+            try:
+                await self.client.wait_for('player-joined', remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def wait_for_presses(self, count, timeout=30):
+        """Warte auf `count` Buzzer-Meldungen, bei Arbitrierung nur auf den Gewinner"""
+        deadline = time.monotonic() + timeout
+        while len(self.buzzer_presses) < count and not self.buzzer_locked:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            waiters = [self.client.expect('buzzer-pressed'), self.client.expect('buzzer-locked')]
+            await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for waiter in waiters:
+                waiter.cancel()
+        return True
+
+    async def start_game(self):
+        self.question_index = 0
+        await self.client.emit('unlock-buzzers', {'roomCode': self.room_code, 'playerIds': 'all'})
+        await self.client.emit('start-game', {'roomCode': self.room_code})
+
+    async def next_question(self):
+        self.question_index += 1
+        await self.client.emit('unlock-buzzers', {'roomCode': self.room_code, 'playerIds': 'all'})
+        await self.client.emit('next-question', {'roomCode': self.room_code})
+
+    async def award_points(self, player_id, points):
+        await self.client.emit('award-buzzer-points', {
+            'roomCode': self.room_code,
+            'playerId': player_id,
+            'points': points
+        })
+
+    async def close(self):
+        await self.client.disconnect()
+
+
+class VirtualPlayer:
+    """Spieler ohne Browser, verhält sich wie PlayQuiz.jsx"""
+
+    def __init__(self, server_url, room_code, name, avatar=None,
+                 autoplay=True, think_time=(0.2, 2.0), accuracy=0.7, wire='json'):
+        self.client = SocketIOClient(server_url, room=room_code, wire=wire)
+        self.room_code = room_code
+        self.name = name
+        self.avatar = avatar or random.choice(AVATARS)
+        self.autoplay = autoplay
+        self.think_time = think_time
+        self.accuracy = accuracy
+        self.score = 0
+        self.question = None
+        self.question_started = None
+        self.pressed_at = None
+        self.buzzer_round = None
+        self.buzzer_result = None
+        self.session_token = None
+        self.results = None
+        self.game_over = False
+        self._tasks = set()
+        self._bind()
+
+    def _bind(self):
+        self.client.on('player-joined', self._on_player_joined)
+        self.client.on('game-started', self._on_question)
+        self.client.on('next-question', self._on_question)
+        self.client.on('answer-result', lambda data: setattr(self, 'score', data['newScore']))
+        self.client.on('buzzer-points-awarded', lambda data: setattr(self, 'score', data['newScore']))
+        self.client.on('buzzer-unlocked', self._on_buzzer_unlocked)
+        self.client.on('buzzer-locked', self._on_buzzer_result)
+        self.client.on('buzzer-rejected', self._on_buzzer_result)
+        self.client.on('show-results', lambda data: setattr(self, 'results', data))
+        self.client.on('game-over', self._on_game_over)
+
+    def _on_game_over(self, data):
+        self.results = data
+        self.game_over = True
+
+    @property
+    def player_id(self):
+        return self.client.sid
+
+    def _on_player_joined(self, data):
+        # Der Server vergibt bei Namensgleichheit Suffixe wie "Max #2"
+        if data['player']['id'] == self.client.sid:
+            self.name = data['player']['name']
+            # Spätere Joins (volle Spielerliste) nicht mehr parsen
+            self.client.off('player-joined')
+
+    def _on_question(self, data):
+        self.question = data['question']
+        self.question_started = time.perf_counter()
+        self.buzzer_round = data.get('buzzerRound')
+        self.buzzer_result = None
+        if self.autoplay:
+            task = asyncio.create_task(self._play(self.question))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _on_buzzer_unlocked(self, data):
+        # Wie PlayQuiz.jsx: eine Nachricht für den ganzen Raum, gesperrte Gewinner bleiben gesperrt
+        if data.get('playerIds') == 'all' or self.client.sid not in (data.get('lockedOut') or ()):
+            self.buzzer_round = data.get('round')
+            self.buzzer_result = None
+
+    def _on_buzzer_result(self, data):
+        # 'buzzer-locked' (an alle) oder 'buzzer-rejected' (nur an den Drücker)
+        if self.buzzer_result is None:
+            self.buzzer_result = {**data, 'received': time.perf_counter()}
+
+    def _join_payload(self):
+        payload = {'roomCode': self.room_code, 'playerName': self.name, 'playerAvatar': self.avatar}
+        if self.session_token:
+            payload['sessionToken'] = self.session_token
+        return payload
+
+    async def join(self, timeout=10):
+        await self.client.connect(timeout)
+        state = self.client.expect('room-state')
+        await self.client.emit('join-room', self._join_payload())
+        data = await asyncio.wait_for(state, timeout)
+        self.session_token = data.get('sessionToken') or self.session_token
+        return data
+
+    def drop(self):
+        """Verbindung abreißen lassen, ohne den Raum zu verlassen"""
+        for task in list(self._tasks):
+            task.cancel()
+        self.client.drop()
+
+    async def resume(self, timeout=10):
+        """Neuer Socket nach einem Abbruch, übernimmt den Spieler per Sitzungs-Token.
+
+        Gibt (event, data) zurück: 'session-resumed' mit dem kompakten Stand,
+        oder 'room-state' bei Servern ohne Sitzungen (= neuer Spieler).
+        """
+        previous = self.client
+        self.client = SocketIOClient(previous.server_url, room=self.room_code, wire=previous.wire)
+        self._bind()
+        self.client.off('player-joined')  # Name ist bekannt
+        await self.client.connect(timeout)
+
+        replies = {event: self.client.expect(event) for event in ('session-resumed', 'room-state')}
+        await self.client.emit('join-room', self._join_payload())
+        done, pending = await asyncio.wait(replies.values(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for future in pending:
+            future.cancel()
+        if not done:
+            raise asyncio.TimeoutError(f'{self.name}: keine Antwort auf join-room')
+
+        event = next(name for name, future in replies.items() if future in done)
+        data = replies[event].result()
+        if event == 'session-resumed':
+            self.score = data['score']
+            self.name = data['name']
+            # Nach einem Server-Neustart läuft eine neue Buzzer-Runde
+            self.buzzer_round = (data.get('buzzer') or {}).get('round')
+        self.session_token = data.get('sessionToken') or self.session_token
+        return event, data
+
+    async def press_buzzer(self):
+        self.pressed_at = time.perf_counter()
+        payload = {'roomCode': self.room_code}
+        if self.buzzer_round is not None:
+            payload['round'] = self.buzzer_round
+        await self.client.emit('buzzer-press', payload)
+
+    async def submit_answer(self, answer, response_time=None):
+        if response_time is None:
+            response_time = time.perf_counter() - (self.question_started or time.perf_counter())
+        await self.client.emit('submit-answer', {
+            'roomCode': self.room_code,
+            'answer': answer,
+            'responseTime': round(response_time, 3)
+        })
+
+    async def _play(self, question):
+        await asyncio.sleep(random.uniform(*self.think_time))
+        if question is not self.question:
+            return
+
+        if question.get('type') == 'buzzer':
+            await self.press_buzzer()
+        elif 'answers' in question or question.get('type') == 'truefalse':
+            answer_count = len(question.get('answers') or [0, 1])
+            if random.random() < self.accuracy:
+                # Spieler sehen correctAnswer nicht, der Server schickt aber die ganze Frage
+                answer = question.get('correctAnswer', 0)
+            else:
+                answer = random.randrange(answer_count)
+            await self.submit_answer(answer)
+
+    async def leave(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await self.client.disconnect()
+
+
+async def gather_limited(coros, concurrency):
+    """Starte Coroutinen mit begrenzter Parallelität (Verbindungsaufbau drosseln)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=True)
+
+
+async def run_load(server_url, rooms=1, players_per_room=10, question_count=3,
+                   question_type='multiple', question_time=3.0, connect_concurrency=200,
+                   think_time=(0.2, 2.0), wire='json'):
+    """Spiele `rooms` Quizze mit je `players_per_room` virtuellen Spielern durch"""
+    stats = {
+        'rooms': rooms,
+        'players_per_room': players_per_room,
+        'questions': question_count,
+        'wire': wire,
+        'join_errors': 0,
+        'joined': 0,
+        'buzzer_presses': 0,
+        'answers': 0,
+        'finished_rooms': 0
+    }
+
+    hosts = [VirtualHost(server_url, build_quiz(question_count, question_type), wire) for _ in range(rooms)]
+    started = time.perf_counter()
+    await asyncio.gather(*(host.create_room() for host in hosts))
+
+    players = []
+    for host in hosts:
+        for i in range(players_per_room):
+            players.append(VirtualPlayer(server_url, host.room_code, f'Bot {i + 1}', think_time=think_time, wire=wire))
+
+    results = await gather_limited([p.join() for p in players], connect_concurrency)
+    joined_per_room = {}
+    for player, result in zip(players, results):
+        if isinstance(result, Exception):
+            stats['join_errors'] += 1
+        else:
+            joined_per_room[player.room_code] = joined_per_room.get(player.room_code, 0) + 1
+    stats['joined'] = len(players) - stats['join_errors']
+    stats['join_seconds'] = round(time.perf_counter() - started, 3)
+
+    async def play_room(host):
+        await host.wait_for_players(joined_per_room.get(host.room_code, 0))
+        await host.start_game()
+        for _ in range(question_count):
+            await asyncio.sleep(question_time)
+            await host.next_question()
+
+    game_started = time.perf_counter()
+    await asyncio.gather(*(play_room(host) for host in hosts))
+    await asyncio.sleep(0.5)
+    stats['game_seconds'] = round(time.perf_counter() - game_started, 3)
+
+    for host in hosts:
+        stats['buzzer_presses'] += len(host.buzzer_presses)
+        stats['answers'] += len(host.answers)
+        if host.final_players is not None:
+            stats['finished_rooms'] += 1
+    stats['bytes_received'] = sum(c.client.bytes_received for c in [*players, *hosts])
+
+    await asyncio.gather(*(p.leave() for p in players), return_exceptions=True)
+    await asyncio.gather(*(h.close() for h in hosts), return_exceptions=True)
+    return stats
+
+
+class PlayerSwarm:
+    """Virtuelle Spieler in einem Hintergrund-Thread für synchrone Selenium-Skripte"""
+
+    def __init__(self, server_url):
+        self.server_url = server_url
+        self.players = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def _run(self, coro, timeout=None):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def join(self, room_code, count, name_prefix='Bot', timeout=30, **player_options):
+        """Lasse `count` Spieler beitreten und gib die Anzahl erfolgreicher Joins zurück"""
+        async def join_all():
+            new_players = [
+                VirtualPlayer(self.server_url, room_code, f'{name_prefix} {i + 1}', **player_options)
+                for i in range(count)
+            ]
+            results = await gather_limited([p.join() for p in new_players], 200)
+            joined = [p for p, r in zip(new_players, results) if not isinstance(r, Exception)]
+            self.players.extend(joined)
+            return len(joined)
+
+        return self._run(join_all(), timeout)
+
+    def expect_all(self, event):
+        """Futures für das nächste `event` bei allen Spielern registrieren (vor der Aktion)"""
+        async def register():
+            return [p.client.expect(event) for p in self.players]
+
+        return self._run(register(), 5)
+
+    def wait_all(self, futures, timeout=30):
+        """Warte bis alle Futures aus expect_all() erfüllt sind"""
+        async def wait():
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout)
+
+        return self._run(wait())
+
+    def call(self, coro_factory, timeout=30):
+        """Führe coro_factory(players) im Swarm-Loop aus (z.B. gleichzeitiges Buzzern)"""
+        return self._run(coro_factory(self.players), timeout)
+
+    def close(self):
+        async def leave_all():
+            await asyncio.gather(*(p.leave() for p in self.players), return_exceptions=True)
+
+        try:
+            self._run(leave_all(), 10)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
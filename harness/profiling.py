@@ -0,0 +1,148 @@
+"""
+CPU-Profil und Event-Loop-Lag eines Laufs über /diagnostics des Servers
+
+Der Server misst ständig die Event-Loop-Verzögerung (Ringpuffer) und kann
+auf Anfrage ein CPU-Profil und einen Heap-Snapshot aufnehmen (nur von
+localhost erreichbar). ProfileRun startet das Profil vor einem Szenario,
+stoppt es danach und legt alles im Lauf-Ordner ab, neben Logs und
+Screenshots:
+
+    cpu.cpuprofile       in Chrome DevTools (Performance) oder speedscope öffnen
+    heap.heapsnapshot    optional, DevTools (Memory)
+    lag.json             Event-Loop-Verzögerung pro Intervall
+    profile-summary.json heißeste Funktionen (Self-Time) und größter Lag
+
+    with ProfileRun(server_url, 'join-storm') as run:
+        ...
+    print(run.summary['hot_functions'][:5])
+
+    async with ProfileRun(server_url, 'join-storm') as run:
+        ...
+"""
+
+import asyncio
+import collections
+import json
+import os
+import shutil
+import urllib.request
+
+from .paths import run_dir
+
+# Keine Arbeit des Servers, nur Wartezeit
+IDLE_FRAMES = ('(idle)', '(program)')
+
+
+def _request(server_url, path, method='GET', timeout=30):
+    request = urllib.request.Request(server_url.rstrip('/') + path, method=method,
+                                     data=b'' if method == 'POST' else None)
+    return urllib.request.urlopen(request, timeout=timeout)
+
+
+def diagnostics(server_url, timeout=5):
+    """GET /diagnostics, None wenn der Server keinen Endpoint hat oder nicht lokal ist"""
+    try:
+        with _request(server_url, '/diagnostics', timeout=timeout) as response:
+            return json.load(response)
+    except (OSError, ValueError):
+        return None
+
+
+def start_profile(server_url, interval_us=1000):
+    with _request(server_url, f'/diagnostics/profile/start?interval={interval_us}', 'POST') as response:
+        return json.load(response)
+
+
+def stop_profile(server_url, path, timeout=120):
+    """Profil stoppen und unverändert als .cpuprofile speichern"""
+    with _request(server_url, '/diagnostics/profile/stop', 'POST', timeout) as response:
+        data = response.read()
+    with open(path, 'wb') as f:
+        f.write(data)
+    return json.loads(data)
+
+
+def heap_snapshot(server_url, path, timeout=300):
+    """Heap-Snapshot direkt in die Datei streamen, Bytes"""
+    with _request(server_url, '/diagnostics/heap-snapshot', 'POST', timeout) as response, open(path, 'wb') as f:
+        shutil.copyfileobj(response, f)
+    return os.path.getsize(path)
+
+
+def hot_functions(profile, top=15):
+    """Funktionen nach Self-Time (ms), Ort als datei:zeile - Socket-Handler sind index.js:<zeile>"""
+    nodes = {node['id']: node for node in profile['nodes']}
+    self_us = collections.Counter()
+    for node_id, delta in zip(profile.get('samples', []), profile.get('timeDeltas', [])):
+        self_us[node_id] += delta
+
+    by_function = collections.Counter()
+    for node_id, us in self_us.items():
+        frame = nodes[node_id]['callFrame']
+        name = frame['functionName'] or '(anonymous)'
+        if name in IDLE_FRAMES:
+            continue
+        location = f"{os.path.basename(frame['url']) or '-'}:{frame['lineNumber'] + 1}"
+        by_function[(name, location)] += us
+
+    busy = sum(by_function.values()) or 1
+    return [
+        {'function': name, 'location': location, 'self_ms': round(us / 1000, 1), 'share': round(us / busy, 3)}
+        for (name, location), us in by_function.most_common(top)
+    ]
+
+
+class ProfileRun:
+    """Kontextmanager (sync und async): CPU-Profil, optional Heap-Snapshot, Lag eines Laufs"""
+
+    def __init__(self, server_url, name='profile', heap=False, interval_us=1000, directory=None, top=15):
+        self.server_url = server_url
+        self.name = name
+        self.heap = heap
+        self.interval_us = interval_us
+        self.directory = directory
+        self.top = top
+        self.summary = None
+
+    def start(self):
+        self.directory = self.directory or run_dir(self.name)
+        start_profile(self.server_url, self.interval_us)
+        return self
+
+    def finish(self):
+        profile = stop_profile(self.server_url, os.path.join(self.directory, 'cpu.cpuprofile'))
+        heap_bytes = heap_snapshot(self.server_url, os.path.join(self.directory, 'heap.heapsnapshot')) if self.heap else None
+
+        state = diagnostics(self.server_url) or {}
+        event_loop = state.get('eventLoop') or {}
+        with open(os.path.join(self.directory, 'lag.json'), 'w') as f:
+            json.dump(event_loop, f, indent=2)
+
+        self.summary = {
+            'name': self.name,
+            'directory': self.directory,
+            'pid': state.get('pid'),
+            'profile_ms': round((profile['endTime'] - profile['startTime']) / 1000, 1),
+            'samples': len(profile.get('samples', [])),
+            'worst_lag': event_loop.get('worst'),
+            'logging': state.get('logging'),
+            'heap_snapshot_bytes': heap_bytes,
+            'hot_functions': hot_functions(profile, self.top)
+        }
+        with open(os.path.join(self.directory, 'profile-summary.json'), 'w') as f:
+            json.dump(self.summary, f, indent=2, ensure_ascii=False)
+        return self.summary
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.finish()
+        return False
+
+    async def __aenter__(self):
+        return await asyncio.to_thread(self.start)
+
+    async def __aexit__(self, *exc):
+        await asyncio.to_thread(self.finish)
+        return False
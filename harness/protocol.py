@@ -0,0 +1,248 @@
+"""
+Socket.IO Protokoll-Client (Engine.IO v4, nur WebSocket-Transport)
+
+Spricht das Wire-Protokoll von server/index.js direkt, ohne Browser.
+Ein Client kostet nur eine WebSocket-Verbindung und ein paar Callbacks,
+dadurch passen tausende virtuelle Spieler in einen einzigen Prozess.
+
+Wire-Format JSON (Standard) oder MessagePack (wire='msgpack', wie
+src/socket.js mit VITE_WIRE=msgpack): dann sind die Socket.IO-Pakete binäre
+WebSocket-Frames, Engine.IO Ping/Pong bleibt Text.
+
+Benötigt: pip install websockets (für wire='msgpack' zusätzlich msgpack)
+"""
+
+import asyncio
+import collections
+import json
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+import websockets
+
+# Engine.IO Paket-Typen
+EIO_OPEN = '0'
+EIO_CLOSE = '1'
+EIO_PING = '2'
+EIO_PONG = '3'
+EIO_MESSAGE = '4'
+
+# Socket.IO Paket-Typen (innerhalb von EIO_MESSAGE)
+SIO_CONNECT = '0'
+SIO_DISCONNECT = '1'
+SIO_EVENT = '2'
+SIO_ACK = '3'
+SIO_CONNECT_ERROR = '4'
+SIO_BINARY_EVENT = '5'
+
+
+class ProtocolError(Exception):
+    """Server hat die Socket.IO-Verbindung abgelehnt oder ungültig geantwortet"""
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ProtocolError("wire='msgpack' benötigt: pip install msgpack") from None
+    return msgpack
+
+
+def build_ws_url(server_url, path='/socket.io/', room=None, wire='json'):
+    """Wandelt http(s)://host:port in die Engine.IO WebSocket-URL um
+
+    `room` landet wie beim Browser-Client (connectToRoom) in der Query,
+    damit der Cluster-Modus die Verbindung zum richtigen Worker routet.
+    `wire` != 'json' fordert das Wire-Format im Handshake an.
+    """
+    parts = urlsplit(server_url)
+    scheme = 'wss' if parts.scheme in ('https', 'wss') else 'ws'
+    query = {'EIO': 4, 'transport': 'websocket'}
+    if room:
+        query['room'] = room.upper()
+    if wire != 'json':
+        query['wire'] = wire
+    return urlunsplit((scheme, parts.netloc, path, urlencode(query), ''))
+
+
+class SocketIOClient:
+    """Minimaler asyncio Socket.IO Client für den Namespace '/'"""
+
+    def __init__(self, server_url, path='/socket.io/', room=None, wire='json'):
+        self.server_url = server_url
+        self.wire = wire
+        self.url = build_ws_url(server_url, path, room, wire)
+        self._msgpack = _msgpack() if wire == 'msgpack' else None
+        self.sid = None
+        self.connected = False
+        self._ws = None
+        self._reader = None
+        self._handlers = {}
+        self._waiters = []
+        self._connected = None
+        # Empfangene Bytes gesamt und pro Event (für Bandbreiten-Messungen)
+        self.bytes_received = 0
+        self.event_bytes = collections.Counter()
+        self.event_counts = collections.Counter()
+
+    def on(self, event, handler):
+        """Registriere einen Handler handler(data) für ein Server-Event"""
+        self._handlers.setdefault(event, []).append(handler)
+
+    def off(self, event):
+        self._handlers.pop(event, None)
+
+    async def connect(self, timeout=10):
+        """Öffne die Verbindung und warte auf das Socket.IO CONNECT-Paket"""
+        loop = asyncio.get_running_loop()
+        self._connected = loop.create_future()
+        self._ws = await asyncio.wait_for(
+            websockets.connect(self.url, compression=None, ping_interval=None, max_size=None),
+            timeout
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+        await asyncio.wait_for(self._connected, timeout)
+        return self
+
+    async def emit(self, event, data=None):
+        """Sende ein Event an den Server (ohne Ack)"""
+        payload = [event] if data is None else [event, data]
+        if self._msgpack:
+            await self._send(self._msgpack.packb({'type': 2, 'data': payload, 'nsp': '/'}))
+        else:
+            await self._send(EIO_MESSAGE + SIO_EVENT + json.dumps(payload, separators=(',', ':')))
+
+    def expect(self, event, predicate=None):
+        """Registriere sofort ein Future für das nächste passende Event.
+
+        Vor dem emit() aufrufen, damit eine schnelle Antwort nicht verloren geht.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((event, predicate, future))
+        return future
+
+    async def wait_for(self, event, timeout=10, predicate=None):
+        """Warte auf das nächste Event (optional mit Filter) und gib dessen Daten zurück"""
+        return await asyncio.wait_for(self.expect(event, predicate), timeout)
+
+    async def disconnect(self):
+        """Sauberes Trennen: Socket.IO DISCONNECT, dann WebSocket schließen"""
+        if self._ws is None:
+            return
+        try:
+            if self.connected:
+                await self._send(self._msgpack.packb({'type': 1, 'nsp': '/'}) if self._msgpack
+                                 else EIO_MESSAGE + SIO_DISCONNECT)
+            await self._ws.close()
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.connected = False
+            if self._reader:
+                self._reader.cancel()
+            self._ws = None
+
+    def drop(self):
+        """Verbindung hart abbrechen wie bei einem WLAN-Aussetzer: kein DISCONNECT, TCP wird verworfen"""
+        if self._ws is None:
+            return
+        self._ws.transport.abort()
+        self.connected = False
+        if self._reader:
+            self._reader.cancel()
+        self._ws = None
+
+    async def _send(self, text):
+        await self._ws.send(text)
+
+    async def _read_loop(self):
+        try:
+            async for message in self._ws:
+                await self._handle_frame(message)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.connected = False
+            if self._connected and not self._connected.done():
+                self._connected.set_exception(ProtocolError('Verbindung vor CONNECT geschlossen'))
+            self._dispatch('disconnect', None)
+
+    async def _handle_frame(self, message):
+        self.bytes_received += len(message)
+        if isinstance(message, bytes):
+            # Binärer Frame = ein komplettes MessagePack Socket.IO-Paket
+            self._handle_binary_packet(message)
+            return
+        kind, body = message[0], message[1:]
+
+        if kind == EIO_PING:
+            await self._send(EIO_PONG)
+        elif kind == EIO_OPEN:
+            await self._send(self._msgpack.packb({'type': 0, 'nsp': '/'}) if self._msgpack
+                             else EIO_MESSAGE + SIO_CONNECT)
+        elif kind == EIO_MESSAGE:
+            self._handle_packet(body)
+        elif kind == EIO_CLOSE:
+            await self._ws.close()
+
+    def _handle_packet(self, packet):
+        kind, body = packet[0], packet[1:]
+
+        if kind == SIO_CONNECT:
+            self._on_connect(json.loads(body)['sid'] if body else None)
+        elif kind == SIO_CONNECT_ERROR:
+            self._on_connect_error(body)
+        elif kind == SIO_EVENT:
+            # Optionale Ack-ID überspringen: 42<id>[...]
+            start = body.find('[')
+            # Eventnamen vorab lesen: ohne Handler oder Wartende das (evtl. große)
+            # JSON gar nicht erst parsen, z.B. volle Spielerlisten bei jedem Join
+            event = body[start + 2:body.find('"', start + 2)]
+            self.event_counts[event] += 1
+            self.event_bytes[event] += len(packet) + 1
+            if event not in self._handlers and not any(name == event for name, _, _ in self._waiters):
+                return
+            args = json.loads(body[start:])
+            self._dispatch(args[0], args[1] if len(args) > 1 else None)
+        elif kind == SIO_DISCONNECT:
+            self.connected = False
+
+    def _handle_binary_packet(self, message):
+        packet = self._msgpack.unpackb(message, raw=False)
+        kind = str(packet.get('type'))
+
+        if kind == SIO_CONNECT:
+            self._on_connect((packet.get('data') or {}).get('sid'))
+        elif kind == SIO_CONNECT_ERROR:
+            self._on_connect_error(packet.get('data'))
+        elif kind in (SIO_EVENT, SIO_BINARY_EVENT):
+            # MessagePack lässt sich nicht teilweise lesen - immer komplett dekodiert
+            args = packet.get('data') or []
+            event = args[0]
+            self.event_counts[event] += 1
+            self.event_bytes[event] += len(message)
+            self._dispatch(event, args[1] if len(args) > 1 else None)
+        elif kind == SIO_DISCONNECT:
+            self.connected = False
+
+    def _on_connect(self, sid):
+        self.sid = sid
+        self.connected = True
+        if not self._connected.done():
+            self._connected.set_result(self.sid)
+
+    def _on_connect_error(self, body):
+        if not self._connected.done():
+            self._connected.set_exception(ProtocolError(body))
+
+    def _dispatch(self, event, data):
+        for handler in self._handlers.get(event, ()):
+            handler(data)
+
+        for waiter in list(self._waiters):
+            name, predicate, future = waiter
+            if future.done():
+                # Abgelaufene oder abgebrochene Wartende aufräumen
+                self._waiters.remove(waiter)
+            elif name == event and (predicate is None or predicate(data)):
+                future.set_result(data)
+                self._waiters.remove(waiter)
@@ -0,0 +1,140 @@
+"""
+Reconnect-Sturm: alle Spieler verlieren gleichzeitig die Verbindung
+
+Nachgestellt wird ein WLAN-Aussetzer in der Location: `players` Spieler
+sind mitten im Spiel (Frage beantwortet, Punkte vergeben), dann reißen
+alle Verbindungen gleichzeitig ab (TCP verworfen, kein DISCONNECT) und
+alle verbinden sich sofort mit neuem Socket wieder und legen ihr
+Sitzungs-Token vor.
+
+Geprüft wird, dass danach jeder Spieler genau einmal im Raum ist, mit
+seinem Namen (keine " #2"-Suffixe) und seinem Punktestand, und dass der
+Host keine 'player-joined' Broadcasts bekommt. Gemessen wird die Zeit
+vom 'join-room' bis zum Catch-up ('session-resumed') und dessen Größe im
+Vergleich zum vollen 'room-state'.
+"""
+
+import asyncio
+import collections
+import platform
+import random
+import time
+
+from .metrics import MetricsScope, hottest
+from .players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+from .protocol import SocketIOClient
+from .stats import summarize
+
+
+async def _resume_timed(player, timeout):
+    started = time.perf_counter()
+    event, data = await player.resume(timeout)
+    return event, data, time.perf_counter() - started
+
+
+async def _room_players(server_url, room_code, timeout):
+    """Spielerliste wie sie ein Zuschauer sieht (voller Snapshot)"""
+    spectator = SocketIOClient(server_url, room=room_code)
+    await spectator.connect(timeout)
+    snapshot = spectator.expect('leaderboard-update')
+    await spectator.emit('join-leaderboard', {'roomCode': room_code})
+    data = await asyncio.wait_for(snapshot, timeout)
+    await spectator.disconnect()
+    return data['players']
+
+
+async def run_reconnect_storm(server_url, players=1000, concurrency=1000, outage=1.0, settle=1.0,
+                              timeout=60, connect_concurrency=200, seed=1):
+    """`players` Spieler trennen gleichzeitig und übernehmen ihre Sitzung wieder"""
+    rng = random.Random(seed)
+    host = VirtualHost(server_url, build_quiz(2, 'multiple', title=f'Reconnect Storm {players}'))
+    await host.create_room()
+
+    clients = [VirtualPlayer(server_url, host.room_code, f'Gast {i + 1}', autoplay=False) for i in range(players)]
+    results = await gather_limited([p.join() for p in clients], connect_concurrency)
+    clients = [p for p, r in zip(clients, results) if not isinstance(r, Exception)]
+    await host.wait_for_players(len(clients), timeout)
+    room_state_bytes = [p.client.event_bytes['room-state'] for p in clients]
+
+    # Mitten im Spiel: erste Frage beantwortet, Punkte verteilt
+    started = [p.client.expect('game-started') for p in clients]
+    await host.start_game()
+    await asyncio.wait_for(asyncio.gather(*started), timeout)
+    replies = [p.client.expect('answer-result') for p in clients]
+    for player in clients:
+        await player.submit_answer(0 if rng.random() < 0.7 else 1, round(rng.uniform(0.5, 10), 2))
+    await asyncio.wait_for(asyncio.gather(*replies), timeout)
+    expected = {p.name: p.score for p in clients}
+
+    joined_before = host.client.event_counts['player-joined']
+    reconnected_before = host.client.event_counts['player-reconnected']
+
+    async with MetricsScope(server_url) as metrics:
+        for player in clients:
+            player.drop()
+        await asyncio.sleep(outage)
+
+        storm_started = time.perf_counter()
+        outcomes = await gather_limited([_resume_timed(p, timeout) for p in clients], concurrency)
+        storm_seconds = time.perf_counter() - storm_started
+        await asyncio.sleep(settle)
+
+    failures = []
+    events = collections.Counter()
+    resume_times, catchup_bytes = [], []
+    for player, outcome in zip(clients, outcomes):
+        if isinstance(outcome, Exception):
+            failures.append(f'{player.name}: Wiederverbinden fehlgeschlagen ({outcome!r})')
+            continue
+        event, data, seconds = outcome
+        events[event] += 1
+        if event != 'session-resumed':
+            failures.append(f'{player.name}: als neuer Spieler behandelt ({event})')
+            continue
+        resume_times.append(seconds)
+        catchup_bytes.append(player.client.event_bytes['session-resumed'])
+        if data.get('answered') is None:
+            failures.append(f'{player.name}: Antwort fehlt im Catch-up')
+
+    room_players = await _room_players(server_url, host.room_code, timeout)
+    names = collections.Counter(p['name'] for p in room_players)
+    duplicates = {name: count for name, count in names.items() if count > 1}
+    extra = [name for name in names if name not in expected]
+    if len(room_players) != len(expected):
+        failures.append(f'{len(room_players)} Spieler im Raum statt {len(expected)}')
+    if duplicates:
+        failures.append(f'{len(duplicates)} doppelte Namen, z.B. {next(iter(duplicates))}')
+    if extra:
+        failures.append(f'{len(extra)} unbekannte Namen (Suffix vergeben?), z.B. {extra[0]}')
+    lost_scores = [p['name'] for p in room_players if p['name'] in expected and p['score'] != expected[p['name']]]
+    if lost_scores:
+        failures.append(f'{len(lost_scores)} Punktestände verändert, z.B. {lost_scores[0]}')
+    host_joins = host.client.event_counts['player-joined'] - joined_before
+    if host_joins:
+        failures.append(f"Host hat {host_joins} 'player-joined' Broadcasts bekommen")
+
+    await asyncio.gather(*(p.leave() for p in clients), return_exceptions=True)
+    await host.close()
+
+    hot = hottest(metrics.delta)
+    return {
+        'test': 'reconnect-storm',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'players': players,
+        'joined': len(clients),
+        'outage_s': outage,
+        'replies': dict(events),
+        'storm_seconds': round(storm_seconds, 3),
+        # connect + join-room bis zum Catch-up
+        'resume_ms': summarize(resume_times),
+        'catchup_bytes': round(sum(catchup_bytes) / len(catchup_bytes)) if catchup_bytes else None,
+        'room_state_bytes': round(sum(room_state_bytes) / len(room_state_bytes)) if room_state_bytes else None,
+        'room_players_after': len(room_players),
+        'host_player_joined': host_joins,
+        'host_player_reconnected': host.client.event_counts['player-reconnected'] - reconnected_before,
+        'hottest_handler': hot[0] if hot else None,
+        'server_metrics': metrics.delta,
+        'failures': failures
+    }
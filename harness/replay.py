@@ -0,0 +1,235 @@
+"""
+Socket-Traces abspielen (aufgezeichnet mit TRACE_FILE, siehe server/trace.js)
+
+Jede Kopie eines Traces bekommt eigene Räume: der Raum-Code wird aus der
+Quiz-ID abgeleitet, also hängt der Replayer an jede Quiz-ID einen neuen
+6-stelligen Code an und ersetzt alle roomCode-Felder entsprechend. Alte
+Socket-IDs in Payloads (playerId, playerIds) werden durch die IDs der
+Replay-Clients ersetzt. Die Events laufen mit 1x, 10x oder ohne Pausen
+(speed=0) und pro Socket in der aufgezeichneten Reihenfolge.
+
+Abweichung: pro aufgezeichnetem Socket werden die ausgehenden Events des
+Servers (Namen und Anzahl) mit der Aufnahme verglichen.
+"""
+
+import asyncio
+import collections
+import gzip
+import json
+import time
+
+from .protocol import SocketIOClient
+from .stats import summarize
+
+BASE36 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def load_trace(path):
+    """Header, Sockets (Nummer → Infos) und zeitlich sortierte Eingangs-Aktionen"""
+    opener = gzip.open if path.endswith('.gz') else open
+    header = None
+    sockets = {}
+    actions = []
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Abgeschnittene letzte Zeile (Server wurde hart beendet)
+                continue
+            if 'v' in record:
+                header = record
+                continue
+
+            kind, alias = record['k'], record['s']
+            if kind == 'c':
+                sockets[alias] = {'id': record['id'], 'role': None, 'outbound': collections.Counter()}
+            elif alias not in sockets:
+                continue
+            if kind == 'o':
+                sockets[alias]['outbound'][record['e']] += 1
+            elif kind in ('c', 'i', 'x'):
+                if kind == 'i' and record.get('r'):
+                    sockets[alias]['role'] = sockets[alias]['role'] or record['r']
+                actions.append(record)
+
+    actions.sort(key=lambda r: r['t'])
+    return {'header': header, 'sockets': sockets, 'actions': actions,
+            'duration_ms': actions[-1]['t'] if actions else 0}
+
+
+def _room_code(copy, index):
+    value = copy * 4096 + index
+    digits = ''
+    for _ in range(6):
+        value, digit = divmod(value, 36)
+        digits = BASE36[digit] + digits
+    return digits
+
+
+class _Copy:
+    """Eine laufende Kopie des Traces mit eigenen Clients und Räumen"""
+
+    def __init__(self, trace, server_url, copy):
+        self.trace = trace
+        self.server_url = server_url
+        self.copy = copy
+        self.clients = {}
+        self.rooms = {}
+        self.socket_ids = {}
+        self.sent = 0
+        self.lag = []
+        self.errors = collections.Counter()
+
+    def room(self, code):
+        if code not in self.rooms:
+            self.rooms[code] = _room_code(self.copy, len(self.rooms))
+        return self.rooms[code]
+
+    def remap(self, value):
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if key == 'roomCode' and isinstance(item, str):
+                    result[key] = self.room(item.upper())
+                else:
+                    result[key] = self.remap(item)
+            return result
+        if isinstance(value, list):
+            return [self.remap(item) for item in value]
+        if isinstance(value, str):
+            return self.socket_ids.get(value, value)
+        return value
+
+    def payload(self, event, data):
+        if event == 'create-room' and isinstance(data, dict) and data.get('quizId'):
+            # Raum-Code = letzte 6 Zeichen der Quiz-ID → neuen Code anhängen
+            code = self.room(data['quizId'][-6:].upper())
+            quiz_id = f"{data['quizId']}-{code}"
+            quiz = dict(data.get('quizData') or {}, id=quiz_id)
+            return {**self.remap({k: v for k, v in data.items() if k not in ('quizId', 'quizData')}),
+                    'quizId': quiz_id, 'quizData': quiz}
+        return self.remap(data)
+
+    async def apply(self, action):
+        alias = action['s']
+        kind = action['k']
+        if kind == 'c':
+            client = SocketIOClient(self.server_url)
+            self.clients[alias] = client
+            await client.connect()
+            self.socket_ids[self.trace['sockets'][alias]['id']] = client.sid
+        elif kind == 'x':
+            client = self.clients.get(alias)
+            if client:
+                await client.disconnect()
+        else:
+            client = self.clients.get(alias)
+            if not client or not client.connected:
+                self.errors['not_connected'] += 1
+                return
+            await client.emit(action['e'], self.payload(action['e'], action.get('d')))
+            self.sent += 1
+
+    async def run(self, speed, started):
+        # Pro Socket eine Queue, damit ein langsamer Connect die anderen nicht aufhält
+        queues = collections.defaultdict(asyncio.Queue)
+        workers = {}
+
+        async def socket_worker(alias):
+            queue = queues[alias]
+            while True:
+                action = await queue.get()
+                if action is None:
+                    return
+                try:
+                    await self.apply(action)
+                except Exception as e:
+                    self.errors[type(e).__name__] += 1
+
+        for action in self.trace['actions']:
+            if speed:
+                due = started + action['t'] / 1000 / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self.lag.append(max(0.0, time.perf_counter() - due))
+            else:
+                await asyncio.sleep(0)
+            alias = action['s']
+            if alias not in workers:
+                workers[alias] = asyncio.create_task(socket_worker(alias))
+            queues[alias].put_nowait(action)
+
+        for alias in workers:
+            queues[alias].put_nowait(None)
+        await asyncio.gather(*workers.values())
+
+    def outbound(self):
+        return {alias: client.event_counts for alias, client in self.clients.items()}
+
+    async def close(self):
+        await asyncio.gather(*(c.disconnect() for c in self.clients.values()), return_exceptions=True)
+
+
+def divergence(trace, copies):
+    """Ausgehende Events pro Socket: Aufnahme gegen jede Kopie"""
+    per_event = collections.Counter()
+    mismatched = 0
+    compared = 0
+    for copy in copies:
+        replayed = copy.outbound()
+        for alias, info in trace['sockets'].items():
+            if alias not in replayed:
+                continue
+            compared += 1
+            expected, actual = info['outbound'], replayed[alias]
+            if expected != actual:
+                mismatched += 1
+            for event in set(expected) | set(actual):
+                per_event[event] += actual.get(event, 0) - expected.get(event, 0)
+    return {
+        'sockets_compared': compared,
+        'sockets_diverged': mismatched,
+        'ratio': round(mismatched / compared, 4) if compared else None,
+        # Replay minus Aufnahme, summiert über alle Kopien (nur Abweichungen)
+        'events': {event: diff for event, diff in sorted(per_event.items()) if diff}
+    }
+
+
+async def replay(trace, server_url, speed=1.0, copies=1, settle=2.0, stagger=0.0):
+    """Trace `copies`-mal parallel abspielen; speed=0 heißt so schnell wie möglich"""
+    runs = [_Copy(trace, server_url, i) for i in range(copies)]
+    started = time.perf_counter()
+
+    async def run_copy(i, run):
+        await asyncio.sleep(i * stagger)
+        await run.run(speed, time.perf_counter())
+
+    await asyncio.gather(*(run_copy(i, run) for i, run in enumerate(runs)))
+    replay_seconds = time.perf_counter() - started
+    await asyncio.sleep(settle)
+
+    received = sum(sum(counts.values()) for run in runs for counts in run.outbound().values())
+    sent = sum(run.sent for run in runs)
+    recorded_inbound = sum(1 for a in trace['actions'] if a['k'] == 'i')
+    report = {
+        'speed': speed or 'max',
+        'copies': copies,
+        'recorded_seconds': round(trace['duration_ms'] / 1000, 2),
+        'replay_seconds': round(replay_seconds, 2),
+        'sockets': len(trace['sockets']) * copies,
+        'inbound_recorded': recorded_inbound * copies,
+        'inbound_sent': sent,
+        'inbound_per_second': round(sent / replay_seconds, 1) if replay_seconds else None,
+        'outbound_received': received,
+        'outbound_per_second': round(received / (replay_seconds + settle), 1),
+        'schedule_lag_ms': summarize([lag for run in runs for lag in run.lag]),
+        'errors': dict(sum((run.errors for run in runs), collections.Counter())),
+        'divergence': divergence(trace, runs)
+    }
+    for run in runs:
+        await run.close()
+    return report
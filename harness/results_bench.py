@@ -0,0 +1,164 @@
+"""
+Ergebnis-Broadcast: Top-K plus eigener Rang statt voll sortierter Liste
+
+Ein Raum mit `players` Spielern beantwortet eine Frage, der Host verteilt
+zusätzlich `adjustments` Korrekturen per 'adjust-player-points' (auch
+negative, viele Gleichstände). Danach zeigt der Host mehrfach die
+Ergebnisse ('show-results') und beendet das Spiel ('game-over').
+
+Geprüft wird gegen eine volle Sortierung der Spielerliste, wie sie ein
+Zuschauer bekommt (Beitrittsreihenfolge, bei Gleichstand stabil):
+  - jeder Spieler bekommt seinen Rang, seine Punkte und die Gesamtzahl
+  - alle (auch der Host) bekommen dieselben Top-K in dieser Reihenfolge
+
+Gemessen wird die Zeit vom 'show-results' des Hosts bis der letzte
+Spieler die Ergebnisse hat, und die Bytes pro Empfänger im Vergleich zur
+vollen Liste.
+"""
+
+import asyncio
+import json
+import platform
+import random
+import time
+
+from .metrics import MetricsScope, hottest
+from .players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+from .protocol import SocketIOClient
+from .stats import summarize
+
+
+async def _room_players(server_url, room_code, timeout):
+    """Spielerliste in Beitrittsreihenfolge, wie sie ein Zuschauer sieht"""
+    spectator = SocketIOClient(server_url, room=room_code)
+    await spectator.connect(timeout)
+    snapshot = spectator.expect('leaderboard-update')
+    await spectator.emit('join-leaderboard', {'roomCode': room_code})
+    data = await asyncio.wait_for(snapshot, timeout)
+    await spectator.disconnect()
+    return data['players']
+
+
+async def _broadcast(host, clients, event, trigger, timeout):
+    """`trigger` auslösen, Sekunden bis zum letzten Empfänger, Daten pro Spieler und Host"""
+    received = []
+    futures = [p.client.expect(event) for p in clients]
+    for future in futures:
+        future.add_done_callback(lambda _: received.append(time.perf_counter()))
+    host_future = host.client.expect(event)
+
+    started = time.perf_counter()
+    await trigger()
+    datas = await asyncio.wait_for(asyncio.gather(*futures), timeout)
+    host_data = await asyncio.wait_for(host_future, timeout)
+    return max(received) - started, datas, host_data
+
+
+def _check(event, clients, datas, host_data, ranked, top_k):
+    """Ergebnisse gegen die volle Sortierung prüfen, Liste der Abweichungen"""
+    failures = []
+    rank_of = {p['id']: (index + 1, p['score']) for index, p in enumerate(ranked)}
+    top_ids = [p['id'] for p in ranked[:top_k]]
+
+    for player, data in zip(clients, datas):
+        rank, score = rank_of.get(player.player_id, (None, None))
+        if data.get('rank') != rank or data.get('score') != score:
+            failures.append(f"{event} {player.name}: Rang {data.get('rank')}/{data.get('score')} Punkte, "
+                            f"erwartet {rank}/{score}")
+        if data.get('total') != len(ranked):
+            failures.append(f"{event} {player.name}: total {data.get('total')} statt {len(ranked)}")
+        if [p['id'] for p in data['players']] != top_ids:
+            failures.append(f'{event} {player.name}: Top-{top_k} weicht von der vollen Sortierung ab')
+    if [p['id'] for p in host_data['players']] != top_ids:
+        failures.append(f'{event} Host: Top-{top_k} weicht von der vollen Sortierung ab')
+    return failures
+
+
+def _event_bytes(clients, event):
+    return sum(p.client.event_bytes[event] for p in clients)
+
+
+async def run_results_bench(server_url, players=5000, top_k=10, repeats=5, adjustments=500,
+                            timeout=120, connect_concurrency=200, seed=1):
+    """`players` Spieler, Ergebnisse `repeats`-mal zeigen, dann Spielende"""
+    rng = random.Random(seed)
+    host = VirtualHost(server_url, build_quiz(1, 'multiple', title=f'Results {players}'))
+    await host.create_room()
+
+    clients = [VirtualPlayer(server_url, host.room_code, f'Spieler {i + 1}', autoplay=False) for i in range(players)]
+    results = await gather_limited([p.join() for p in clients], connect_concurrency)
+    clients = [p for p, r in zip(clients, results) if not isinstance(r, Exception)]
+    await host.wait_for_players(len(clients), timeout)
+
+    # Eine Frage: richtig/falsch und Speed-Bonus ergeben viele Gleichstände
+    started = [p.client.expect('game-started') for p in clients]
+    await host.start_game()
+    await asyncio.wait_for(asyncio.gather(*started), timeout)
+    replies = [p.client.expect('answer-result') for p in clients]
+    for player in clients:
+        await player.submit_answer(0 if rng.random() < 0.6 else 1, round(rng.uniform(0.5, 10), 2))
+    await asyncio.wait_for(asyncio.gather(*replies), timeout)
+
+    # Korrekturen durch den Host, auch nach unten (Punkte bleiben >= 0)
+    updates_before = host.client.event_counts['player-score-updated']
+    for player in rng.choices(clients, k=adjustments):
+        await host.client.emit('adjust-player-points', {
+            'roomCode': host.room_code, 'playerId': player.player_id, 'points': rng.choice([-150, -10, 10, 50, 100])
+        })
+    deadline = time.monotonic() + timeout
+    while host.client.event_counts['player-score-updated'] - updates_before < adjustments:
+        if time.monotonic() > deadline:
+            raise TimeoutError('Host hat nicht alle player-score-updated bekommen')
+        await asyncio.sleep(0.05)
+
+    roster = await _room_players(server_url, host.room_code, timeout)
+    ranked = sorted(roster, key=lambda p: -p['score'])
+    # So groß wäre die alte Nachricht mit der vollen sortierten Liste für jeden Empfänger
+    full_list_bytes = len(json.dumps(['show-results', {'players': ranked}], separators=(',', ':'), ensure_ascii=False).encode())
+
+    failures = []
+    broadcast, player_bytes = [], []
+    host_bytes = 0
+    async with MetricsScope(server_url) as metrics:
+        for _ in range(repeats):
+            bytes_before = _event_bytes(clients, 'show-results')
+            host_before = host.client.event_bytes['show-results']
+            seconds, datas, host_data = await _broadcast(
+                host, clients, 'show-results',
+                lambda: host.client.emit('show-results', {'roomCode': host.room_code}), timeout
+            )
+            broadcast.append(seconds)
+            player_bytes.append((_event_bytes(clients, 'show-results') - bytes_before) / len(clients))
+            host_bytes = host.client.event_bytes['show-results'] - host_before
+            failures.extend(_check('show-results', clients, datas, host_data, ranked, top_k))
+
+        game_over_seconds, datas, host_data = await _broadcast(host, clients, 'game-over', host.next_question, timeout)
+        failures.extend(_check('game-over', clients, datas, host_data, ranked, top_k))
+
+    await asyncio.gather(*(p.leave() for p in clients), return_exceptions=True)
+    await host.close()
+
+    hot = hottest(metrics.delta)
+    mean_player_bytes = round(sum(player_bytes) / len(player_bytes)) if player_bytes else None
+    return {
+        'test': 'results-ranking',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'players': players,
+        'joined': len(clients),
+        'top_k': top_k,
+        'adjustments': adjustments,
+        'distinct_scores': len({p['score'] for p in roster}),
+        # 'show-results' des Hosts bis zum letzten Spieler
+        'broadcast_ms': summarize(broadcast),
+        'game_over_ms': round(game_over_seconds * 1000, 1),
+        'player_bytes': mean_player_bytes,
+        'host_bytes': host_bytes,
+        'broadcast_bytes': round(mean_player_bytes * len(clients) + host_bytes) if mean_player_bytes else None,
+        'full_list_bytes': full_list_bytes,
+        'full_list_broadcast_bytes': full_list_bytes * (len(clients) + 1),
+        'hottest_handler': hot[0] if hot else None,
+        'server_metrics': metrics.delta,
+        'failures': failures
+    }
@@ -0,0 +1,193 @@
+"""
+Raum-Skalierungs-Benchmark
+
+Ein einzelner Raum wird stufenweise auf 10 … 5000 Spieler gebracht. Die
+meisten davon sind "Ballast": sie treten bei und trennen sofort wieder.
+Der Server behält sie (als disconnected) in room.players, schickt ihnen
+aber keine Broadcasts mehr. Ein paar verbundene "Sonden" treten als
+letzte bei und feuern dann Bursts von 'buzzer-press' und 'submit-answer'.
+Gemessen wird der Durchsatz bis zur letzten Antwort. Bleibt die Zeit pro
+Event über alle Raumgrößen flach, hängt der Handler nicht von n ab.
+"""
+
+import asyncio
+import platform
+import time
+
+from .metrics import MetricsScope
+from .players import AVATARS, build_quiz, gather_limited, room_code_for
+from .protocol import SocketIOClient
+
+DEFAULT_SIZES = (10, 100, 500, 1000, 2000, 5000)
+
+
+async def add_ballast(server_url, room_code, count, concurrency=200, prefix='Ballast'):
+    """Spieler beitreten lassen und sofort trennen (Join wird vor dem Disconnect verarbeitet)"""
+    async def join_and_drop(i):
+        client = SocketIOClient(server_url, room=room_code)
+        await client.connect()
+        await client.emit('join-room', {
+            'roomCode': room_code,
+            'playerName': f'{prefix} {i + 1}',
+            'playerAvatar': AVATARS[i % len(AVATARS)]
+        })
+        await client.disconnect()
+
+    results = await gather_limited([join_and_drop(i) for i in range(count)], concurrency)
+    return sum(1 for r in results if not isinstance(r, Exception))
+
+
+class _Counter:
+    """Zählt eingehende Events und löst ein Future aus, sobald `target` erreicht ist"""
+
+    def __init__(self):
+        self.count = 0
+        self.target = None
+        self.done = None
+
+    def arm(self, target):
+        self.count = 0
+        self.target = target
+        self.done = asyncio.get_running_loop().create_future()
+        return self.done
+
+    def __call__(self, data):
+        self.count += 1
+        if self.done and not self.done.done() and self.count >= self.target:
+            self.done.set_result(time.perf_counter())
+
+
+async def _burst(counter, senders, timeout):
+    """Alle Sender gleichzeitig loslassen, Events pro Sekunde bis zur letzten Antwort"""
+    done = counter.arm(len(senders))
+    started = time.perf_counter()
+    await asyncio.gather(*senders)
+    try:
+        finished = await asyncio.wait_for(done, timeout)
+    except asyncio.TimeoutError:
+        finished = time.perf_counter()
+    seconds = finished - started
+    return {
+        'events': len(senders),
+        'received': counter.count,
+        'seconds': round(seconds, 4),
+        'per_second': round(counter.count / seconds, 1) if seconds else None,
+        'us_per_event': round(seconds / counter.count * 1e6, 1) if counter.count else None
+    }
+
+
+async def measure_room(server_url, size, probes=20, repeat=100, timeout=60, connect_concurrency=200):
+    """Ein frischer Raum mit `size` Spielern, davon `probes` verbundene Sonden am Listenende"""
+    quiz = build_quiz(1, 'multiple', title=f'Room Scaling {size}')
+    host = SocketIOClient(server_url, room=room_code_for(quiz))
+    presses = _Counter()
+    host.on('buzzer-pressed', presses)
+    await host.connect()
+    created = host.expect('room-created')
+    await host.emit('create-room', {'quizId': quiz['id'], 'quizData': quiz})
+    room_code = (await asyncio.wait_for(created, timeout))['roomCode']
+
+    probes = min(probes, size)
+    started = time.perf_counter()
+    ballast = await add_ballast(server_url, room_code, size - probes, connect_concurrency)
+
+    # Sonden treten als letzte bei: bei linearer Suche der ungünstigste Fall
+    answers = _Counter()
+    clients = []
+    room_size = 0
+    for i in range(probes):
+        client = SocketIOClient(server_url, room=room_code)
+        client.on('answer-result', answers)
+        # Arbitrierende Server melden beim Host nur Gewinner, Verlierer bekommen eine Absage
+        client.on('buzzer-rejected', presses)
+        await client.connect()
+        state = client.expect('room-state')
+        await client.emit('join-room', {'roomCode': room_code, 'playerName': f'Sonde {i + 1}', 'playerAvatar': '🛰️'})
+        room_size = len((await asyncio.wait_for(state, timeout))['players'])
+        clients.append(client)
+    join_seconds = time.perf_counter() - started
+
+    game_started = [c.expect('game-started') for c in clients]
+    await host.emit('start-game', {'roomCode': room_code})
+    await asyncio.wait_for(asyncio.gather(*game_started), timeout)
+
+    # Falsche Antwort (correctAnswer ist 0): kein Speed-Bonus, nur Lookup und Antwort
+    payload = {'roomCode': room_code}
+    result = {
+        'size': size,
+        'room_players': room_size,
+        'ballast': ballast,
+        'probes': len(clients),
+        'join_seconds': round(join_seconds, 2),
+        'buzzer_press': await _burst(
+            presses, [c.emit('buzzer-press', payload) for _ in range(repeat) for c in clients], timeout),
+        'submit_answer': await _burst(
+            answers, [c.emit('submit-answer', {**payload, 'answer': 1, 'responseTime': 1.0})
+                      for _ in range(repeat) for c in clients], timeout)
+    }
+
+    await asyncio.gather(*(c.disconnect() for c in clients), return_exceptions=True)
+    await host.disconnect()
+    return result
+
+
+async def run_benchmark(server_url, sizes=DEFAULT_SIZES, probes=20, repeat=100, timeout=60):
+    report = {
+        'benchmark': 'room-scaling',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'host': platform.node(),
+        'probes': probes,
+        'repeat': repeat,
+        'sizes': {}
+    }
+    for size in sizes:
+        async with MetricsScope(server_url) as metrics:
+            result = await measure_room(server_url, size, probes, repeat, timeout)
+        result['server_metrics'] = metrics.delta
+        report['sizes'][str(size)] = result
+
+    # Wachstum der Kosten pro Event von der kleinsten zur größten Stufe (1.0 = flach)
+    report['growth'] = {}
+    for handler in ('buzzer_press', 'submit_answer'):
+        costs = [r[handler]['us_per_event'] for r in report['sizes'].values() if r[handler]['us_per_event']]
+        report['growth'][handler] = round(costs[-1] / costs[0], 2) if len(costs) > 1 else None
+    return report
+
+
+def ascii_chart(report, width=50):
+    """µs pro Event als Balken, falls matplotlib fehlt"""
+    lines = []
+    for handler in ('buzzer_press', 'submit_answer'):
+        values = {size: r[handler]['us_per_event'] or 0 for size, r in report['sizes'].items()}
+        top = max(values.values(), default=0) or 1
+        lines.append(f'{handler} (µs/Event)')
+        for size, value in values.items():
+            lines.append(f"{size:>6} | {'█' * max(1, round(value / top * width))} {value}")
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def save_plot(report, path):
+    """Durchsatz über Raumgröße als PNG (benötigt matplotlib, sonst None)"""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return None
+
+    sizes = [int(s) for s in report['sizes']]
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    for handler in ('buzzer_press', 'submit_answer'):
+        ax.plot(sizes, [r[handler]['per_second'] for r in report['sizes'].values()], marker='o', label=handler)
+    ax.set_xscale('log')
+    ax.set_xlabel('Spieler im Raum')
+    ax.set_ylabel('Events / s')
+    ax.set_title('Handler-Durchsatz pro Raumgröße')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+    return path
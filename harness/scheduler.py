@@ -0,0 +1,111 @@
+"""
+Paralleler Scheduler für die Buzzer-Szenario-Matrix (Szenario × Ziel)
+
+Jeder Worker-Prozess hält einen eigenen DriverPool, der über alle
+Szenarien dieses Workers hinweg warm bleibt. Die Ausgabe jedes Szenarios
+wird gepuffert und erst am Stück gedruckt, damit sich parallele Läufe
+nicht vermischen.
+"""
+
+import atexit
+import contextlib
+import importlib.util
+import io
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .driver_pool import DriverPool
+from .metrics import MetricsScope
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'LOCAL': {
+        'base_url': 'http://localhost:5173/Quiz',
+        'server_url': 'http://localhost:3001'
+    },
+    'ONLINE': {
+        'base_url': 'http://if0-39705173.infinityfreeapp.com/Quiz',
+        'server_url': 'https://quizer-backend-9v9a.onrender.com'
+    }
+}
+
+# Szenario-Name → (Skript, Funktion, Parameter aus dem Ziel)
+SCENARIOS = {
+    'buzzer': ('test-buzzer.py', 'test_buzzer_question', ('base_url', 'server_url')),
+    'host-only': ('test-buzzer-simple.py', 'test_host_only', ('base_url', 'server_url')),
+    'final': ('test-buzzer-final.py', 'test_buzzer', ('base_url', 'server_url')),
+}
+
+_worker_pool = None
+_modules = {}
+
+
+def _init_worker(pool_size, headless):
+    global _worker_pool
+    _worker_pool = DriverPool(size=pool_size, headless=headless)
+    atexit.register(_worker_pool.close)
+
+
+def _load_script(filename):
+    # Die Skripte heißen test-buzzer*.py und sind daher nicht direkt importierbar
+    if filename not in _modules:
+        path = os.path.join(REPO_ROOT, filename)
+        spec = importlib.util.spec_from_file_location(filename.replace('-', '_')[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[filename] = module
+    return _modules[filename]
+
+
+def run_scenario(scenario, target):
+    """Führt ein Szenario in diesem Worker aus, gibt Status, Dauer und Ausgabe zurück"""
+    filename, function_name, params = SCENARIOS[scenario]
+    kwargs = {name: TARGETS[target][name] for name in params}
+    output = io.StringIO()
+    started = time.perf_counter()
+    ok = False
+
+    # Parallele Szenarien gegen denselben Server landen in derselben Differenz
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output), \
+            MetricsScope(TARGETS[target]['server_url']) as metrics:
+        try:
+            test = getattr(_load_script(filename), function_name)
+            ok = bool(test(test_name=target, pool=_worker_pool, keep_open=0, **kwargs))
+        except Exception:
+            traceback.print_exc()
+
+    return {
+        'scenario': scenario,
+        'target': target,
+        'ok': ok,
+        'seconds': round(time.perf_counter() - started, 2),
+        'output': output.getvalue(),
+        'server_metrics': metrics.delta
+    }
+
+
+def run_matrix(scenarios, targets, workers=4, headless=True, on_result=None):
+    """Alle Kombinationen parallel auf `workers` Prozessen ausführen"""
+    jobs = [(s, t) for s in scenarios for t in targets]
+    results = []
+    started = time.perf_counter()
+
+    # Ein Szenario braucht höchstens einen Browser gleichzeitig
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(1, headless)) as executor:
+        futures = [executor.submit(run_scenario, s, t) for s, t in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    return {
+        'wall_seconds': round(time.perf_counter() - started, 2),
+        'scenario_seconds': round(sum(r['seconds'] for r in results), 2),
+        'slowest_seconds': max((r['seconds'] for r in results), default=0),
+        'workers': workers,
+        'results': results
+    }
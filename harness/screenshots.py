@@ -0,0 +1,215 @@
+"""
+Screenshots im Hintergrund: aufnehmen, deduplizieren, komprimieren
+
+Der Test-Thread holt nur das Bild vom Browser (per CDP direkt als JPEG,
+ohne CDP als PNG) und legt es in eine Queue. Ein Worker-Thread berechnet
+einen Wahrnehmungs-Hash (dHash) und verwirft Aufnahmen, die sich von der
+letzten Aufnahme derselben Rolle kaum unterscheiden. Den Rest verkleinert
+und komprimiert er (WebP) und schreibt ihn in den Lauf-Ordner.
+manifest.ndjson verknüpft jedes Bild mit Rolle, Schritt und Offset im
+Console-Log (ConsoleStream.offset).
+
+Pillow ist optional: ohne Pillow wird nur bei byte-gleichen Bildern
+dedupliziert und das Bild so gespeichert, wie der Browser es liefert.
+
+    shots = ScreenshotWorker(run_dir('buzzer-LOCAL'))
+    camera = shots.camera(driver, 'host', console=console, waits=waits)
+    camera.shot('Buzzer-Frage')
+    ...
+    shots.close()
+"""
+
+import base64
+import collections
+import hashlib
+import io
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+
+def _pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def dhash(image, size=8):
+    """Differenz-Hash: Helligkeitsgefälle benachbarter Pixel eines 9x8 Graubilds"""
+    small = image.convert('L').resize((size + 1, size))
+    pixels = list(small.getdata())
+    bits = 0
+    for row in range(size):
+        for col in range(size):
+            left = pixels[row * (size + 1) + col]
+            right = pixels[row * (size + 1) + col + 1]
+            bits = (bits << 1) | (left > right)
+    return bits
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+class Camera:
+    """Screenshots einer Rolle; ohne Label gilt der letzte WaitEngine-Schritt"""
+
+    def __init__(self, worker, driver, role, console=None, waits=None):
+        self.worker = worker
+        self.driver = driver
+        self.role = role
+        self.console = console
+        self.waits = waits
+
+    def shot(self, label=None, tag=None):
+        last_step = self.waits.timings[-1]['step'] if self.waits and self.waits.timings else None
+        return self.worker.capture(self.driver, self.role, label or last_step, self.console, tag, last_step)
+
+
+class ScreenshotWorker:
+    """Nimmt Screenshots entgegen und verarbeitet sie in einem eigenen Thread"""
+
+    def __init__(self, directory, image_format='webp', quality=70, max_width=1280, threshold=4,
+                 capture_quality=85, queue_size=32):
+        self.directory = directory
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self.threshold = threshold
+        self.capture_quality = capture_quality
+        self.manifest_path = os.path.join(directory, 'manifest.ndjson')
+        self.stats = collections.Counter()
+        self._queue = queue.Queue(queue_size)
+        self._last = {}
+        self._seq = 0
+        self._cdp = True
+        self._image = _pillow()
+        os.makedirs(directory, exist_ok=True)
+        self._manifest = open(self.manifest_path, 'a', encoding='utf-8')
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def camera(self, driver, role, console=None, waits=None):
+        return Camera(self, driver, role, console, waits)
+
+    def capture(self, driver, role, step=None, console=None, tag=None, after_step=None):
+        """Im Test-Thread: nur das Bild abholen und einreihen, None wenn der Browser nicht antwortet"""
+        started = time.perf_counter()
+        try:
+            payload, source_format = self._grab(driver)
+        except Exception as e:
+            self.stats['failed'] += 1
+            print(f"⚠️  Screenshot ({role}, {step}) fehlgeschlagen: {type(e).__name__}")
+            return None
+
+        self._seq += 1
+        entry = {
+            'seq': self._seq,
+            'role': role,
+            'step': step,
+            'after_step': after_step,
+            'tag': tag,
+            't': int(time.time() * 1000),
+            'console_file': console.path if console else None,
+            'console_offset': console.offset if console else None,
+            'capture_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+        self.stats['captured'] += 1
+        # Blockiert nur, wenn der Worker weit zurückliegt (begrenzter Speicher)
+        self._queue.put((entry, payload, source_format))
+        return entry['seq']
+
+    def _grab(self, driver):
+        if self._cdp:
+            try:
+                result = driver.execute_cdp_cmd('Page.captureScreenshot',
+                                                {'format': 'jpeg', 'quality': self.capture_quality})
+                return result['data'], 'jpeg'
+            except Exception:
+                # Kein Chromium/CDP: für den Rest des Laufs WebDriver-PNG
+                self._cdp = False
+        return driver.get_screenshot_as_png(), 'png'
+
+    def close(self, timeout=30):
+        """Queue abarbeiten, Manifest schließen, Zusammenfassung zurückgeben"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._manifest.close()
+        return self.summary()
+
+    def summary(self):
+        return {
+            'dir': self.directory,
+            'manifest': self.manifest_path,
+            'pillow': self._image is not None,
+            **{key: self.stats[key] for key in ('captured', 'written', 'duplicates', 'failed',
+                                                'bytes_in', 'bytes_out')}
+        }
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            entry, payload, source_format = item
+            try:
+                self._process(entry, payload, source_format)
+            except Exception as e:
+                entry['error'] = f'{type(e).__name__}: {e}'
+                self.stats['failed'] += 1
+            self._manifest.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._manifest.flush()
+
+    def _process(self, entry, payload, source_format):
+        data = base64.b64decode(payload) if isinstance(payload, str) else payload
+        self.stats['bytes_in'] += len(data)
+
+        image = None
+        if self._image:
+            image = self._image.open(io.BytesIO(data))
+            image.load()
+            fingerprint = dhash(image)
+            entry['hash'] = f'{fingerprint:016x}'
+        else:
+            fingerprint = hashlib.sha1(data).hexdigest()
+
+        last = self._last.get(entry['role'])
+        if last and (hamming(last[0], fingerprint) <= self.threshold if image else last[0] == fingerprint):
+            entry['duplicate_of'] = last[1]
+            self.stats['duplicates'] += 1
+            return
+
+        slug = re.sub(r'[^A-Za-z0-9_-]+', '-', entry['step'] or entry['tag'] or 'shot').strip('-')[:60]
+        name = f"{entry['seq']:04d}-{entry['role']}-{slug}"
+        if image:
+            output, extension = self._compress(image)
+        else:
+            output, extension = data, source_format
+        name = f'{name}.{extension}'
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            f.write(output)
+
+        entry['file'] = name
+        entry['bytes'] = len(output)
+        self.stats['written'] += 1
+        self.stats['bytes_out'] += len(output)
+        self._last[entry['role']] = (fingerprint, name)
+
+    def _compress(self, image):
+        if image.width > self.max_width:
+            image = image.resize((self.max_width, round(image.height * self.max_width / image.width)))
+        image = image.convert('RGB')
+        buffer = io.BytesIO()
+        try:
+            image.save(buffer, self.image_format.upper(), quality=self.quality)
+            return buffer.getvalue(), self.image_format.lower()
+        except (KeyError, OSError):
+            # Pillow ohne WebP-Unterstützung
+            buffer = io.BytesIO()
+            image.save(buffer, 'JPEG', quality=self.quality, optimize=True)
+            return buffer.getvalue(), 'jpg'
@@ -0,0 +1,83 @@
+"""
+Backend als Kindprozess (node server/index.js)
+
+Für Tests, die den Server selbst starten, abschießen und neu starten
+müssen. Die Server-Ausgabe landet in einer Log-Datei im Artefakt-Ordner.
+"""
+
+import os
+import signal
+import subprocess
+import time
+import urllib.request
+
+from .paths import REPO_ROOT, artifact_path
+
+SERVER_DIR = os.path.join(REPO_ROOT, 'server')
+
+
+class ServerProcess:
+    """Startet server/index.js auf `port` mit zusätzlichen Umgebungsvariablen"""
+
+    def __init__(self, port=3101, env=None, log_name=None, node='node', script='index.js'):
+        self.port = port
+        self.env = {**os.environ, 'PORT': str(port), **(env or {})}
+        self.log_path = artifact_path(log_name or f'server-{port}.log')
+        self.command = [node, script]
+        self.process = None
+        self._log = None
+
+    @property
+    def url(self):
+        return f'http://localhost:{self.port}'
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    def start(self, timeout=15):
+        """Prozess starten, Sekunden bis /health antwortet"""
+        self._log = open(self.log_path, 'a')
+        started = time.perf_counter()
+        self.process = subprocess.Popen(self.command, cwd=SERVER_DIR, env=self.env,
+                                        stdout=self._log, stderr=subprocess.STDOUT)
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f'Server beendet mit Code {self.process.returncode}, siehe {self.log_path}')
+            try:
+                with urllib.request.urlopen(self.url + '/health', timeout=1) as response:
+                    response.read()
+                return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+        self.kill()
+        raise TimeoutError(f'Server auf Port {self.port} nicht bereit nach {timeout}s')
+
+    def kill(self):
+        """SIGKILL - wie ein Absturz, kein Aufräumen im Server"""
+        self._signal(signal.SIGKILL)
+
+    def stop(self, timeout=5):
+        """SIGTERM - wie ein Deploy auf Render"""
+        self._signal(signal.SIGTERM, timeout)
+
+    def _signal(self, signum, timeout=5):
+        if self.process and self.process.poll() is None:
+            self.process.send_signal(signum)
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
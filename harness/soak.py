@@ -0,0 +1,160 @@
+"""
+Soak-Test: tausende kurze Spiele über Stunden, RSS und Raumzahl beobachten
+
+Ständig laufen `parallel` Spiele mit wenigen Spielern. Jedes Spiel endet
+anders, damit alle Eviction-Pfade des Servers dran kommen:
+
+  - abandoned: Spiel zu Ende, Host trennt sofort (Host-Grace-Period)
+  - finished:  Spiel zu Ende, Host bleibt noch `linger` Sekunden
+  - idle:      Spiel startet nie, Host wartet `linger` Sekunden in der Lobby
+
+Spieler trennen am Ende ohne 'leave-room', bleiben also als "disconnected"
+im Raum, bis der Server sie nach PLAYER_TTL_MS entfernt.
+
+Nebenher wird /metrics abgetastet (Räume, Spieler, RSS). Nach dem Aufwärmen
+müssen RSS und Raumzahl ein Plateau erreichen; nach dem Ende und einer
+Wartezeit müssen alle Zähler wieder bei 0 sein.
+"""
+
+import asyncio
+import time
+
+from .metrics import scrape
+from .players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+
+GAME_KINDS = ('abandoned', 'finished', 'idle')
+
+
+def process_rss(pid):
+    """RSS eines lokalen Prozesses in Bytes (Linux /proc), None wenn nicht lesbar"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def sample(server_url, pid=None):
+    """Ein Messpunkt: Räume, Spieler, Verbindungen, RSS, Evictions"""
+    metrics = scrape(server_url) or {}
+    rss = (metrics.get('memory') or {}).get('rss')
+    if rss is None and pid:
+        rss = process_rss(pid)
+    eviction = metrics.get('eviction') or {}
+    return {
+        't': time.time(),
+        'rooms': metrics.get('rooms'),
+        'players': metrics.get('players'),
+        'spectators': metrics.get('spectators'),
+        'connections': metrics.get('connections'),
+        'rss': rss,
+        'pending_evictions': eviction.get('pending'),
+        'evicted': eviction.get('evicted')
+    }
+
+
+async def play_game(server_url, index, players=8, questions=2, question_time=0.5, linger=5.0):
+    """Ein kurzes Spiel, Art nach `index` reihum aus GAME_KINDS"""
+    kind = GAME_KINDS[index % len(GAME_KINDS)]
+    host = VirtualHost(server_url, build_quiz(questions, 'multiple', title=f'Soak {index}'))
+    await host.create_room()
+
+    bots = [
+        VirtualPlayer(server_url, host.room_code, f'Soak {i + 1}', think_time=(0.05, question_time / 2))
+        for i in range(players)
+    ]
+    results = await gather_limited([bot.join() for bot in bots], players)
+    joined = sum(1 for r in results if not isinstance(r, Exception))
+
+    if kind != 'idle':
+        await host.wait_for_players(joined, 10)
+        await host.start_game()
+        for _ in range(questions):
+            await asyncio.sleep(question_time)
+            await host.next_question()
+
+    # Ohne 'leave-room': die Spieler bleiben als "disconnected" im Raum
+    await asyncio.gather(*(bot.leave() for bot in bots), return_exceptions=True)
+    if kind != 'abandoned':
+        await asyncio.sleep(linger)
+    await host.close()
+    return kind
+
+
+def _window_mean(samples, key, start, end):
+    values = [s[key] for s in samples if start <= s['t'] < end and s[key] is not None]
+    return sum(values) / len(values) if values else None
+
+
+def steady_state(samples, started, ended, warmup=0.25):
+    """RSS und Räume im zweiten Viertel nach dem Aufwärmen gegen das letzte Viertel"""
+    measured = started + (ended - started) * warmup
+    span = (ended - measured) / 3
+    early = (measured, measured + span)
+    late = (ended - span, ended + 1)
+
+    result = {}
+    for key in ('rss', 'rooms', 'players'):
+        before = _window_mean(samples, key, *early)
+        after = _window_mean(samples, key, *late)
+        result[key] = {
+            'early_mean': round(before, 1) if before is not None else None,
+            'late_mean': round(after, 1) if after is not None else None,
+            'growth': round(after / before, 3) if before and after is not None else None
+        }
+    return result
+
+
+async def run_soak(server_url, duration=7200, parallel=20, players=8, questions=2, question_time=0.5,
+                   linger=5.0, sample_interval=10, drain=30, pid=None, progress=None):
+    """Spiele für `duration` Sekunden, danach `drain` Sekunden auf leere Zähler warten"""
+    started = time.time()
+    deadline = time.monotonic() + duration
+    games = {kind: 0 for kind in GAME_KINDS}
+    errors = []
+    samples = [sample(server_url, pid)]
+
+    async def worker(slot):
+        index = slot
+        while time.monotonic() < deadline:
+            try:
+                kind = await play_game(server_url, index, players, questions, question_time, linger)
+                games[kind] += 1
+            except Exception as e:
+                errors.append(f'Spiel {index}: {e!r}')
+            index += parallel
+
+    async def sampler():
+        while time.monotonic() < deadline:
+            await asyncio.sleep(sample_interval)
+            samples.append(await asyncio.to_thread(sample, server_url, pid))
+            if progress:
+                progress(samples[-1], sum(games.values()))
+
+    await asyncio.gather(sampler(), *(worker(slot) for slot in range(parallel)))
+    ended = time.time()
+
+    # Alle Clients sind weg: nach Ablauf der TTLs muss der Server leer sein
+    drain_deadline = time.monotonic() + drain
+    final = await asyncio.to_thread(sample, server_url, pid)
+    while time.monotonic() < drain_deadline and (final['rooms'] or final['players']):
+        await asyncio.sleep(1)
+        final = await asyncio.to_thread(sample, server_url, pid)
+
+    return {
+        'games': games,
+        'games_total': sum(games.values()),
+        'errors': errors,
+        'seconds': round(ended - started, 1),
+        'steady_state': steady_state(samples, started, ended),
+        'peak': {
+            key: max((s[key] for s in samples if s[key] is not None), default=None)
+            for key in ('rss', 'rooms', 'players')
+        },
+        'final': final,
+        'samples': samples,
+        'pid': pid
+    }
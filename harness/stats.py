@@ -0,0 +1,57 @@
+"""
+Kleine Statistik-Helfer für Benchmarks (ohne numpy)
+"""
+
+
+def percentile(values, p):
+    """Perzentil nach Nearest-Rank-Methode, values muss sortiert sein"""
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * p // 100))  # ceil
+    return values[int(rank) - 1]
+
+
+def summarize(values, scale=1000.0, digits=3):
+    """p50/p95/p99/max/mean einer Messreihe, standardmäßig Sekunden → Millisekunden"""
+    ordered = sorted(values)
+    if not ordered:
+        return {'count': 0}
+
+    def fmt(v):
+        return round(v * scale, digits)
+
+    return {
+        'count': len(ordered),
+        'min': fmt(ordered[0]),
+        'p50': fmt(percentile(ordered, 50)),
+        'p95': fmt(percentile(ordered, 95)),
+        'p99': fmt(percentile(ordered, 99)),
+        'max': fmt(ordered[-1]),
+        'mean': fmt(sum(ordered) / len(ordered))
+    }
+
+
+def count_inversions(sequence):
+    """Anzahl Paare i < j mit sequence[i] > sequence[j] (Merge-Sort, O(n log n))"""
+    def sort_count(items):
+        if len(items) <= 1:
+            return items, 0
+        middle = len(items) // 2
+        left, left_count = sort_count(items[:middle])
+        right, right_count = sort_count(items[middle:])
+        merged = []
+        count = left_count + right_count
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] <= right[j]:
+                merged.append(left[i])
+                i += 1
+            else:
+                merged.append(right[j])
+                count += len(left) - i
+                j += 1
+        merged.extend(left[i:])
+        merged.extend(right[j:])
+        return merged, count
+
+    return sort_count(list(sequence))[1]
@@ -0,0 +1,188 @@
+"""
+Quiz-Speicher im Browser: Home-Ladezeit und Speichern bei großen Bibliotheken
+
+Die Startseite bekommt `count` Quizze untergeschoben, so wie die bisherigen
+Skripte Test-Quizze einspielen: als localStorage['quizzes'] Blob. Die App
+übernimmt den Blob beim nächsten Laden nach IndexedDB und entfernt ihn,
+deshalb wird in Häppchen von `chunk` Quizzen eingespielt (Quota), jedes
+Häppchen ist gleichzeitig eine Messung der einmaligen Migration.
+
+Gemessen wird danach:
+  - Home laden: Navigation bis alle Quiz-Karten im DOM sind, plus längster
+    Long-Task (Einfrieren des Main-Threads)
+  - Speichern: Klick auf "Duplizieren" bis zur Bestätigung (Quiz laden,
+    speichern, Liste neu laden)
+  - Zum Vergleich die alte Variante im selben Browser: JSON.parse und
+    JSON.stringify aller Quizze, was früher bei jedem Laden und Speichern
+    anfiel
+"""
+
+import platform
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .driver_pool import DriverPool
+from .stats import summarize
+
+# Long-Tasks ab Dokumentbeginn mitschreiben
+LONGTASK_JS = """
+window.__quizerLongTasks = [];
+try {
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) window.__quizerLongTasks.push(entry.duration);
+  }).observe({ type: 'longtask', buffered: true });
+} catch (e) {}
+"""
+
+# Erzeugt Quizze im Format von CreateQuiz.jsx direkt im Browser (spart WebDriver-Transfer)
+MAKE_QUIZZES_JS = """
+const makeQuizzes = (start, count, questions, imageBytes) => {
+  const image = imageBytes ? 'data:image/png;base64,' + 'A'.repeat(imageBytes) : undefined;
+  const quizzes = [];
+  for (let i = start; i < start + count; i++) {
+    quizzes.push({
+      id: String(1700000000000 + i),
+      title: `Bench Quiz ${i + 1}`,
+      createdAt: new Date(1700000000000 + i * 1000).toISOString(),
+      questions: Array.from({ length: questions }, (_, q) => ({
+        id: q,
+        type: 'multiple',
+        question: `Frage ${q + 1}: Was ist 2 + ${q}?`,
+        answers: [String(2 + q), String(3 + q), String(4 + q), String(5 + q)],
+        correctAnswer: 0,
+        correctAnswers: [0],
+        points: 100,
+        timeLimit: 20,
+        ...(image ? { image } : {})
+      }))
+    });
+  }
+  return quizzes;
+};
+"""
+
+SEED_BLOB_JS = MAKE_QUIZZES_JS + """
+const [start, count, questions, imageBytes] = arguments;
+localStorage.setItem('quizzes', JSON.stringify(makeQuizzes(start, count, questions, imageBytes)));
+"""
+
+# Wartet per requestAnimationFrame, bis `target` Karten gerendert sind
+WAIT_CARDS_JS = """
+const [target, timeoutMs, done] = arguments;
+const started = performance.now();
+const check = () => {
+  const cards = document.querySelectorAll('.saved-quizzes .quiz-card').length;
+  if (cards >= target) {
+    const tasks = window.__quizerLongTasks || [];
+    return done({ ok: true, cards, ms: performance.now(), longest_task_ms: Math.max(0, ...tasks) });
+  }
+  if (performance.now() - started > timeoutMs) return done({ ok: false, cards });
+  requestAnimationFrame(check);
+};
+check();
+"""
+
+# Was die alte Blob-Variante bei jedem Aufruf tat, ohne localStorage-Quota
+LEGACY_COST_JS = MAKE_QUIZZES_JS + """
+const [count, questions, imageBytes] = arguments;
+const blob = JSON.stringify(makeQuizzes(0, count, questions, imageBytes));
+let started = performance.now();
+const parsed = JSON.parse(blob);
+const parseMs = performance.now() - started;
+started = performance.now();
+JSON.stringify(parsed);
+return { parse_ms: parseMs, serialize_ms: performance.now() - started, blob_bytes: blob.length };
+"""
+
+
+def _wait_cards(driver, target, timeout):
+    driver.set_script_timeout(timeout + 5)
+    result = driver.execute_async_script(WAIT_CARDS_JS, target, timeout * 1000)
+    if not result['ok']:
+        raise TimeoutError(f"Nur {result['cards']} von {target} Quiz-Karten nach {timeout}s")
+    return result
+
+
+def seed(driver, home_url, count, questions=5, image_bytes=0, chunk=500, timeout=120):
+    """`count` Quizze über den Legacy-Blob einspielen, Sekunden pro Häppchen-Migration"""
+    migrations = []
+    driver.get(home_url)
+    for start in range(0, count, chunk):
+        size = min(chunk, count - start)
+        driver.execute_script(SEED_BLOB_JS, start, size, questions, image_bytes)
+        started = time.perf_counter()
+        driver.get(home_url)
+        _wait_cards(driver, start + size, timeout)
+        migrations.append(time.perf_counter() - started)
+    return migrations
+
+
+def measure_home(driver, home_url, count, repeats=5, timeout=120):
+    """Home neu laden bis alle `count` Karten stehen: ms ab Navigation und längster Long-Task"""
+    loads, long_tasks = [], []
+    for _ in range(repeats):
+        driver.get(home_url)
+        result = _wait_cards(driver, count, timeout)
+        loads.append(result['ms'] / 1000)
+        long_tasks.append(result['longest_task_ms'] / 1000)
+    return loads, long_tasks
+
+
+def measure_save(driver, count, repeats=5, timeout=120):
+    """'Duplizieren' klicken bis zum Bestätigungs-Alert; jede Kopie ist ein neues Quiz"""
+    saves = []
+    for i in range(repeats):
+        button = driver.find_element(By.CSS_SELECTOR, '.saved-quizzes .quiz-card button[title="Duplizieren"]')
+        started = time.perf_counter()
+        button.click()
+        WebDriverWait(driver, timeout, poll_frequency=0.01).until(EC.alert_is_present())
+        saves.append(time.perf_counter() - started)
+        driver.switch_to.alert.accept()
+        _wait_cards(driver, count + i + 1, timeout)
+    return saves
+
+
+def run_storage_bench(base_url, counts=(1000, 5000), questions=5, image_bytes=0, repeats=5,
+                      chunk=500, headless=True, timeout=120):
+    """Für jede Bibliotheksgröße ein frischer Browser-Context: einspielen, laden, speichern"""
+    home_url = base_url.rstrip('/') + '/'
+    pool = DriverPool(size=1, headless=headless)
+    results = []
+    try:
+        for count in counts:
+            with pool.lease(f'storage-{count}') as driver:
+                driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': LONGTASK_JS})
+                migrations = seed(driver, home_url, count, questions, image_bytes, chunk, timeout)
+                loads, long_tasks = measure_home(driver, home_url, count, repeats, timeout)
+                saves = measure_save(driver, count, repeats, timeout)
+                legacy = driver.execute_script(LEGACY_COST_JS, count, questions, image_bytes)
+                storage = driver.execute_async_script(
+                    'navigator.storage.estimate().then(arguments[0], () => arguments[0](null))'
+                )
+            results.append({
+                'quizzes': count,
+                'migration_ms': summarize(migrations),
+                'home_load_ms': summarize(loads),
+                'longest_task_ms': summarize(long_tasks),
+                'save_ms': summarize(saves),
+                'legacy_parse_ms': round(legacy['parse_ms'], 1),
+                'legacy_serialize_ms': round(legacy['serialize_ms'], 1),
+                'legacy_blob_bytes': legacy['blob_bytes'],
+                'storage_usage_bytes': (storage or {}).get('usage')
+            })
+    finally:
+        pool.close()
+
+    return {
+        'test': 'quiz-storage',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'base_url': base_url,
+        'host': platform.node(),
+        'questions_per_quiz': questions,
+        'image_bytes': image_bytes,
+        'repeats': repeats,
+        'results': results
+    }
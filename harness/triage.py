@@ -0,0 +1,290 @@
+"""
+Log-Klassifizierung und archivweiter Triage-Report
+
+Die Regeln sind deklarativ (RULES) und werden pro Log-Level zu EINEM
+regulären Ausdruck kompiliert, so dass jede Meldung nur einmal durchlaufen
+wird. Jeder Treffer wird über einen Index (Treffer-Text → Regel) seiner
+Regel zugeordnet, von allen Treffern gewinnt die höchste Priorität. Gleiche Meldungen mit anderen IDs
+oder Zahlen landen über eine normalisierte Signatur in derselben Gruppe.
+"""
+
+import collections
+import functools
+import glob
+import json
+import os
+import re
+from datetime import datetime
+
+# Reihenfolge = Priorität. 'levels' schränkt eine Regel auf Browser-Log-Level ein,
+# ein leeres Muster passt auf jede Meldung dieser Level. Muster mit 'ignorecase'
+# laufen gegen die kleingeschriebene Meldung und müssen daher klein geschrieben sein.
+RULES = [
+    {'name': 'type-error', 'category': 'critical', 'pattern': r'TypeError|Cannot read'},
+    {'name': 'undefined-access', 'category': 'critical', 'pattern': r'undefined|null', 'levels': ('SEVERE',)},
+    {'name': 'network-failure', 'category': 'error', 'pattern': r'net::ERR_|Failed to load resource|xhr poll error'},
+    {'name': 'socket-error', 'category': 'error', 'pattern': r'socket error|websocket error|room not found',
+     'ignorecase': True},
+    {'name': 'severe', 'category': 'error', 'pattern': r'', 'levels': ('SEVERE',)},
+    {'name': 'error-keyword', 'category': 'error', 'pattern': r'error', 'ignorecase': True},
+    # Wie die alten Skripte: React-Router-Hinweise nur als Warnung ignorieren, nie SEVERE/'error'
+    {'name': 'react-router-warning', 'category': 'ignore', 'pattern': r'React Router'},
+    {'name': 'warning-level', 'category': 'warning', 'pattern': r'', 'levels': ('WARNING',)},
+    {'name': 'warning-keyword', 'category': 'warning', 'pattern': r'warn', 'ignorecase': True},
+]
+
+SEVERITY = {'critical': 0, 'error': 1, 'warning': 2, 'info': 3, 'ignore': 4}
+
+# Normalisierung: alle variablen Teile (IDs, Ports, Zeiten, UUIDs) enthalten
+# Ziffern, also nur Tokens mit Ziffern anfassen und durch Platzhalter ersetzen
+_TOKEN = re.compile(r'[^\s"\'()<>,;]*\d[^\s"\'()<>,;]*')
+_UUID = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+_ID = re.compile(r'(?=.*[A-Za-z])[A-Za-z0-9_-]{8,}')
+_HEX = re.compile(r'0[xX][0-9a-fA-F]+')
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _placeholder(match):
+    token = match.group(0)
+    if token.startswith(('http://', 'https://')):
+        # Query-String und Fragment weg, Ports/Pfad-Zahlen vereinheitlichen
+        return _NUMBER.sub('<n>', re.split(r'[?#]', token, 1)[0])
+    if _UUID.fullmatch(token):
+        return '<uuid>'
+    if _ID.fullmatch(token):
+        return '<id>'
+    if _HEX.fullmatch(token):
+        return '<hex>'
+    return _NUMBER.sub('<n>', token)
+
+
+Classification = collections.namedtuple('Classification', 'category rule')
+
+
+class _LevelMatcher:
+    """Kombinierter Matcher für alle Regeln eines Levels"""
+
+    def __init__(self, rules, level):
+        self.fallback = None
+        self.rules = {False: [], True: []}
+        for i, rule in enumerate(rules):
+            if rule.get('levels') and level not in rule['levels']:
+                continue
+            if not rule['pattern']:
+                self.fallback = i if self.fallback is None else self.fallback
+                continue
+            self.rules[bool(rule.get('ignorecase'))].append((i, re.compile(rule['pattern'])))
+        # Ohne Gruppen kann re die Literal-Präfixe nutzen, das ist um ein Vielfaches schneller
+        self.patterns = {
+            ignorecase: re.compile('|'.join(f'(?:{p.pattern})' for _, p in entries)) if entries else None
+            for ignorecase, entries in self.rules.items()
+        }
+        self._hits = {False: {}, True: {}}
+
+    def _rule_for(self, ignorecase, hit):
+        index = self._hits[ignorecase].get(hit)
+        if index is None:
+            index = next(i for i, pattern in self.rules[ignorecase] if pattern.fullmatch(hit))
+            self._hits[ignorecase][hit] = index
+        return index
+
+    def match(self, message):
+        """Index der Regel mit der höchsten Priorität oder None"""
+        best = self.fallback
+        for ignorecase, text in ((False, message), (True, message.lower())):
+            pattern = self.patterns[ignorecase]
+            if pattern is None:
+                continue
+            for hit in pattern.findall(text):
+                index = self._rule_for(ignorecase, hit)
+                if best is None or index < best:
+                    best = index
+        return best
+
+
+def normalize(message, limit=200):
+    return ' '.join(_TOKEN.sub(_placeholder, message).split())[:limit]
+
+
+class LogClassifier:
+    """Ordnet (level, message) einer Kategorie und Regel zu, Meldungen einer Signatur"""
+
+    def __init__(self, rules=RULES):
+        self.rules = rules
+        self._matchers = {}
+        # Viele Meldungen wiederholen sich wörtlich
+        self.classify = functools.lru_cache(maxsize=100_000)(self._classify)
+        self.signature = functools.lru_cache(maxsize=100_000)(normalize)
+
+    def _classify(self, level, message):
+        matcher = self._matchers.get(level)
+        if matcher is None:
+            matcher = self._matchers[level] = _LevelMatcher(self.rules, level)
+        index = matcher.match(message)
+        if index is None:
+            return Classification('info', None)
+        rule = self.rules[index]
+        return Classification(rule['category'], rule['name'])
+
+    def triage(self, entries):
+        """Teilt Log-Einträge in errors/warnings/critical wie bisher in den Skripten"""
+        result = {'critical': [], 'errors': [], 'warnings': []}
+        for entry in entries:
+            category = self.classify(entry['level'], entry['message']).category
+            if category in ('critical', 'error'):
+                result['errors'].append(entry)
+                if category == 'critical':
+                    result['critical'].append(entry)
+            elif category == 'warning':
+                result['warnings'].append(entry)
+        return result
+
+
+class TriageReport:
+    """Aggregation nach Signatur über beliebig viele Log-Dateien"""
+
+    def __init__(self, classifier=None, include=('critical', 'error', 'warning')):
+        self.classifier = classifier or LogClassifier()
+        self.include = set(include)
+        self.groups = {}
+        self.entries = 0
+        self.files = 0
+
+    def add(self, level, message, timestamp, target, source):
+        self.entries += 1
+        result = self.classifier.classify(level, message)
+        if result.category not in self.include:
+            return
+
+        # Signatur nur für Einträge berechnen, die im Report landen
+        signature = self.classifier.signature(message)
+        group = self.groups.get(signature)
+        if group is None:
+            group = self.groups[signature] = {
+                'signature': signature,
+                'category': result.category,
+                'rule': result.rule,
+                'count': 0,
+                'first_seen': timestamp,
+                'last_seen': timestamp,
+                'targets': collections.Counter(),
+                'files': set(),
+                'example': message[:500]
+            }
+        group['count'] += 1
+        group['targets'][target] += 1
+        group['files'].add(source)
+        if timestamp is not None:
+            if group['first_seen'] is None or timestamp < group['first_seen']:
+                group['first_seen'] = timestamp
+            if group['last_seen'] is None or timestamp > group['last_seen']:
+                group['last_seen'] = timestamp
+
+    def top(self, limit=20):
+        groups = sorted(self.groups.values(), key=lambda g: (SEVERITY[g['category']], -g['count']))
+        return groups[:limit]
+
+    def to_dict(self, limit=100):
+        return {
+            'files': self.files,
+            'entries': self.entries,
+            'signatures': len(self.groups),
+            'top': [
+                {**g, 'targets': dict(g['targets']), 'files': sorted(g['files'])}
+                for g in self.top(limit)
+            ]
+        }
+
+
+def target_from_name(path, default='UNKNOWN'):
+    name = os.path.basename(path).upper()
+    for target in ('LOCAL', 'ONLINE'):
+        if target in name:
+            return target
+    return default
+
+
+# Schlüssel der alten logs-*.json Dateien, die vollständige Log-Listen enthalten
+_LOG_KEYS = ('host_logs', 'user_logs', 'all_logs', 'logs')
+# Playwright-Format: {'type': 'error', 'text': ..., 'timestamp': ISO}
+_TYPE_LEVELS = {'error': 'SEVERE', 'warning': 'WARNING', 'warn': 'WARNING', 'debug': 'DEBUG'}
+
+
+def _to_millis(timestamp):
+    if isinstance(timestamp, str):
+        try:
+            return int(datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp() * 1000)
+        except ValueError:
+            return None
+    return timestamp
+
+
+def _normalize_entry(entry):
+    if not isinstance(entry, dict):
+        return None
+    if 'message' in entry:
+        level, message = entry.get('level', 'INFO'), entry['message']
+    elif 'text' in entry:
+        level, message = _TYPE_LEVELS.get(entry.get('type'), 'INFO'), entry['text']
+    else:
+        return None
+    return level, str(message), _to_millis(entry.get('t', entry.get('timestamp')))
+
+
+def _log_lists(data):
+    keys = [k for k in _LOG_KEYS if isinstance(data.get(k), list)]
+    # Fehlerlisten sind Teilmengen der Log-Listen, nur ohne Log-Listen verwenden
+    for key in keys or [k for k in ('errors', 'host_errors', 'user_errors') if isinstance(data.get(k), list)]:
+        yield data[key]
+    for role in ('host', 'user'):
+        if isinstance(data.get(role), dict):
+            yield from _log_lists(data[role])
+
+
+def _iter_json_file(path):
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except ValueError:
+            return
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        for entries in _log_lists(data):
+            yield from entries
+
+
+def _iter_ndjson_file(path):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def iter_archive(paths):
+    """Alle Log-Dateien (JSON und NDJSON inkl. Rotation) unter den Pfaden finden"""
+    for path in paths:
+        if os.path.isdir(path):
+            patterns = ('*LOGS*.json', '*logs*.json', '*.ndjson', '*.ndjson.*')
+            found = set()
+            for pattern in patterns:
+                found.update(glob.glob(os.path.join(path, '**', pattern), recursive=True))
+            yield from sorted(found)
+        else:
+            yield path
+
+
+def scan_archive(paths, report=None):
+    report = report or TriageReport()
+    for path in iter_archive(paths):
+        reader = _iter_ndjson_file if '.ndjson' in os.path.basename(path) else _iter_json_file
+        target = target_from_name(path)
+        report.files += 1
+        for entry in reader(path):
+            normalized = _normalize_entry(entry)
+            if normalized:
+                report.add(*normalized, target, os.path.basename(path))
+    return report
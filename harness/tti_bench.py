@@ -0,0 +1,157 @@
+"""
+Time-to-interactive pro Route unter Handy-Bedingungen
+
+Lädt jede Route kalt (Cache aus) in Headless-Chrome mit gedrosselter CPU
+und gedrosseltem Netz (DevTools-Protokoll) und misst:
+
+  - first paint / first contentful paint
+  - ready: das Element, mit dem die Route bedienbar ist, steht im DOM
+    (für /join das Eingabefeld des Formulars)
+  - interactive: der erste Task nach ready läuft, d.h. der Main-Thread ist
+    wieder frei für Eingaben
+  - geladenes JavaScript (Bytes und Anzahl Dateien) für das Größenbudget
+
+Gedacht für den Produktions-Build (npm run build && npm run preview),
+der Dev-Server liefert jedes Modul einzeln aus.
+"""
+
+import json
+import platform
+import time
+
+from .driver_pool import DriverPool
+from .stats import summarize
+
+# Route → (Pfad, Selektor, ab dem die Route bedienbar ist)
+ROUTES = {
+    'join': ('/join?code=ABC123', '.join-form input'),
+    'play': ('/play/ABC123', '.play-quiz .player-bar'),
+    'home': ('/', '.home'),
+    'create': ('/create', '.create-quiz'),
+    'leaderboard': ('/leaderboard/ABC123', '.live-leaderboard'),
+}
+
+# Nur diese Routen laden Handys im Saal, für sie gilt das Budget
+PLAYER_ROUTES = ('join', 'play')
+
+# Wie Lighthouse/DevTools: Latenz in ms, Durchsatz in Bytes/s
+NETWORK_PROFILES = {
+    'none': None,
+    'slow-4g': {'latency': 562.5, 'downloadThroughput': 1.6 * 1024 * 1024 / 8 * 0.9,
+                'uploadThroughput': 750 * 1024 / 8 * 0.9},
+    'fast-3g': {'latency': 562.5, 'downloadThroughput': 1.44 * 1024 * 1024 / 8,
+                'uploadThroughput': 675 * 1024 / 8},
+    'slow-3g': {'latency': 2000, 'downloadThroughput': 400 * 1024 / 8, 'uploadThroughput': 400 * 1024 / 8},
+}
+
+# Läuft vor der App: merkt sich, wann welcher Selektor zuerst im DOM steht
+# und wann danach der erste Task läuft. playerInfo, damit /play nicht auf
+# /join umleitet.
+READY_HOOK_JS = """
+(() => {
+  const selectors = %s;
+  const ready = window.__quizerReady = {};
+  const interactive = window.__quizerInteractive = {};
+  try {
+    if (!localStorage.getItem('playerInfo')) {
+      localStorage.setItem('playerInfo', JSON.stringify({ name: 'TTI', avatar: '🤖', joinCode: 'ABC123' }));
+    }
+  } catch (e) {}
+  const check = () => {
+    for (const selector of selectors) {
+      if (selector in ready || !document.querySelector(selector)) continue;
+      ready[selector] = performance.now();
+      setTimeout(() => { interactive[selector] = performance.now(); }, 0);
+    }
+  };
+  new MutationObserver(check).observe(document, { childList: true, subtree: true });
+})();
+"""
+
+# Wartet auf interactive für den Selektor, dann Paint- und Script-Einträge
+COLLECT_JS = """
+const [selector, timeoutMs, done] = arguments;
+const started = performance.now();
+const poll = () => {
+  const interactive = (window.__quizerInteractive || {})[selector];
+  if (interactive === undefined && performance.now() - started < timeoutMs) return setTimeout(poll, 20);
+  const paints = {};
+  for (const entry of performance.getEntriesByType('paint')) paints[entry.name] = entry.startTime;
+  const scripts = performance.getEntriesByType('resource')
+    .filter(entry => entry.initiatorType === 'script' || /\\.m?js(\\?|$)/.test(entry.name));
+  done({
+    ready: (window.__quizerReady || {})[selector] ?? null,
+    interactive: interactive ?? null,
+    first_paint: paints['first-paint'] ?? null,
+    first_contentful_paint: paints['first-contentful-paint'] ?? null,
+    script_bytes: scripts.reduce((sum, entry) => sum + (entry.transferSize || entry.encodedBodySize || 0), 0),
+    script_files: scripts.length
+  });
+};
+poll();
+"""
+
+
+def throttle(driver, network='slow-4g', cpu_rate=4):
+    """CPU- und Netzdrosselung für den aktuellen Tab, Cache aus"""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': True})
+    conditions = NETWORK_PROFILES[network]
+    if conditions:
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', {'offline': False, **conditions})
+    driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': cpu_rate})
+
+
+def measure_route(driver, base_url, route, timeout=60):
+    """Eine Route kalt laden, Messwerte in ms ab Navigationsbeginn"""
+    path, selector = ROUTES[route]
+    driver.get(base_url.rstrip('/') + path)
+    driver.set_script_timeout(timeout + 5)
+    result = driver.execute_async_script(COLLECT_JS, selector, timeout * 1000)
+    if result['interactive'] is None:
+        raise TimeoutError(f"{route}: '{selector}' nach {timeout}s nicht bedienbar")
+    return result
+
+
+def run_tti_bench(base_url, routes=tuple(ROUTES), network='slow-4g', cpu_rate=4, repeats=3,
+                  headless=True, timeout=60):
+    """Jede Route `repeats`-mal kalt laden, Median/Max pro Messwert"""
+    hook = READY_HOOK_JS % json.dumps([selector for _, selector in ROUTES.values()])
+    pool = DriverPool(size=1, headless=headless)
+    results = {}
+    errors = []
+    try:
+        with pool.lease('tti') as driver:
+            driver.set_page_load_timeout(timeout)
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': hook})
+            throttle(driver, network, cpu_rate)
+            for route in routes:
+                runs = []
+                for _ in range(repeats):
+                    try:
+                        runs.append(measure_route(driver, base_url, route, timeout))
+                    except Exception as e:
+                        errors.append(f'{route}: {e}')
+                if not runs:
+                    continue
+                results[route] = {
+                    'path': ROUTES[route][0],
+                    **{key: summarize([run[key] for run in runs if run[key] is not None], scale=1, digits=1)
+                       for key in ('first_paint', 'first_contentful_paint', 'ready', 'interactive')},
+                    'script_bytes': max(run['script_bytes'] for run in runs),
+                    'script_files': max(run['script_files'] for run in runs)
+                }
+    finally:
+        pool.close()
+
+    return {
+        'test': 'route-tti',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'base_url': base_url,
+        'host': platform.node(),
+        'network': network,
+        'cpu_rate': cpu_rate,
+        'repeats': repeats,
+        'routes': results,
+        'errors': errors
+    }
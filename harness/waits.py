@@ -0,0 +1,139 @@
+"""
+Event-getriebene Waits statt time.sleep()
+
+src/socket.js veröffentlicht jedes eingehende Socket-Event als DOM-Event
+'quizer:socket'. Der hier injizierte Hook zählt diese Events pro Name mit,
+bevor die App lädt. Jeder Schritt läuft weiter, sobald die echte Bedingung
+erfüllt ist, und die Dauer jedes Schritts wird protokolliert.
+"""
+
+import contextlib
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+HOOK_JS = """
+(() => {
+  if (window.__quizerHarness) return;
+  const harness = window.__quizerHarness = { counts: {}, recent: [], listeners: [] };
+  window.addEventListener('quizer:socket', (e) => {
+    const name = e.detail.event;
+    harness.counts[name] = (harness.counts[name] || 0) + 1;
+    harness.recent.push({ event: name, t: Math.round(performance.now()) });
+    if (harness.recent.length > 200) harness.recent.shift();
+    harness.listeners = harness.listeners.filter(listener => !listener(name));
+  });
+})();
+"""
+
+# Löst auf, sobald counts[name] >= target, oder nach timeoutMs mit dem aktuellen Stand
+WAIT_EVENT_JS = """
+const [name, target, timeoutMs, done] = arguments;
+const harness = window.__quizerHarness;
+if (!harness) return done({ ok: false, count: 0, reason: 'hook missing' });
+const count = () => harness.counts[name] || 0;
+if (count() >= target) return done({ ok: true, count: count() });
+let finished = false;
+const timer = setTimeout(() => { finished = true; done({ ok: false, count: count(), reason: 'timeout' }) }, timeoutMs);
+harness.listeners.push((event) => {
+  if (finished) return true;
+  if (event !== name || count() < target) return false;
+  clearTimeout(timer);
+  done({ ok: true, count: count() });
+  return true;
+});
+"""
+
+
+class StepTimeout(AssertionError):
+    """Ein Schritt hat seine Bedingung nicht innerhalb des Timeouts erreicht"""
+
+
+class WaitEngine:
+    """Wartet auf Socket-Events und DOM-Zustände und misst jeden Schritt"""
+
+    def __init__(self, driver, role='host', default_timeout=15):
+        self.driver = driver
+        self.role = role
+        self.default_timeout = default_timeout
+        self.timings = []
+        self._installed = False
+
+    def install(self):
+        """Hook vor jedem neuen Dokument injizieren (vor der ersten Navigation aufrufen)"""
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': HOOK_JS})
+            self._installed = True
+        except Exception:
+            # Ohne CDP: nach jeder Navigation nachziehen (frühe Events können fehlen)
+            self._installed = False
+        return self
+
+    @contextlib.contextmanager
+    def step(self, name):
+        """Misst einen Schritt; Fehler werden mit Schrittname und Dauer protokolliert"""
+        started = time.perf_counter()
+        entry = {'step': name, 'role': self.role}
+        try:
+            yield entry
+            entry['ok'] = True
+        except Exception as e:
+            entry['ok'] = False
+            entry['error'] = str(e).splitlines()[0] if str(e) else type(e).__name__
+            raise
+        finally:
+            entry['ms'] = round((time.perf_counter() - started) * 1000, 1)
+            self.timings.append(entry)
+            status = '⏱️ ' if entry['ok'] else '❌'
+            print(f"   {status} {name}: {entry['ms']} ms")
+
+    def _ensure_hook(self):
+        if not self._installed:
+            self.driver.execute_script(HOOK_JS)
+
+    def event_count(self, name):
+        self._ensure_hook()
+        return self.driver.execute_script(
+            'return (window.__quizerHarness && window.__quizerHarness.counts[arguments[0]]) || 0', name)
+
+    def socket_event(self, name, count=1, timeout=None):
+        """Warte bis das Socket-Event `name` mindestens `count`-mal eingegangen ist"""
+        timeout = timeout or self.default_timeout
+        self._ensure_hook()
+        self.driver.set_script_timeout(timeout + 5)
+        result = self.driver.execute_async_script(WAIT_EVENT_JS, name, count, int(timeout * 1000))
+        if not result['ok']:
+            raise StepTimeout(f"Socket-Event '{name}' {result['count']}/{count} nach {timeout}s ({result.get('reason')})")
+        return result['count']
+
+    def next_socket_event(self, name, timeout=None):
+        """Warte auf das nächste Vorkommen von `name` nach dem aktuellen Stand"""
+        return self.socket_event(name, self.event_count(name) + 1, timeout)
+
+    def dom_ready(self, timeout=None):
+        self._wait(lambda d: d.execute_script('return document.readyState') == 'complete',
+                   timeout, 'document.readyState != complete')
+        self._ensure_hook()
+
+    def element(self, by, selector, timeout=None, clickable=False):
+        condition = EC.element_to_be_clickable if clickable else EC.visibility_of_element_located
+        return self._wait(condition((by, selector)), timeout, f'Element {selector} nicht gefunden')
+
+    def text(self, text, timeout=None):
+        """Warte bis `text` im sichtbaren Body steht"""
+        return self._wait(lambda d: text in d.execute_script('return document.body ? document.body.innerText : ""'),
+                          timeout, f"Text '{text[:40]}' nicht sichtbar")
+
+    def _wait(self, condition, timeout, message):
+        try:
+            return WebDriverWait(self.driver, timeout or self.default_timeout, poll_frequency=0.05).until(condition)
+        except TimeoutException:
+            raise StepTimeout(message) from None
+
+    def summary(self):
+        return {
+            'total_ms': round(sum(t['ms'] for t in self.timings), 1),
+            'steps': self.timings
+        }
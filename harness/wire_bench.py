@@ -0,0 +1,180 @@
+"""
+Wire-Format Benchmark: JSON gegen MessagePack
+
+Offline: erzeugt den Nachrichtenstrom eines kompletten Spiels (Joins,
+Fragen, Antworten, Leaderboard-Deltas, Ergebnisse) mit denselben Payloads
+wie server/index.js und misst pro Format die Bytes auf der Leitung
+(Paket × Empfänger), die Encode-Zeit (einmal pro Nachricht, wie beim
+Broadcast) und die Decode-Zeit über alle Empfänger. Python-Codecs statt
+V8/notepack - die Verhältnisse zählen, nicht die absoluten Zeiten.
+
+Live (optional): dasselbe Spiel mit virtuellen Spielern gegen einen
+laufenden Server, je einmal pro Format.
+"""
+
+import collections
+import json
+import random
+import time
+
+from .metrics import MetricsScope
+from .players import AVATARS, run_load
+from .protocol import _msgpack
+
+FORMATS = ('json', 'msgpack')
+
+
+def game_messages(players=500, questions=20, spectators=1, delta_batch=50, adjustments=5, results_top_k=10, seed=1):
+    """Nachrichten eines Spiels als (event, payload, empfänger) in Sende-Reihenfolge"""
+    rng = random.Random(seed)
+    roster = []
+    messages = []
+
+    for i in range(players):
+        player = {'id': f'{rng.getrandbits(80):020x}', 'name': f'Spieler {i + 1}',
+                  'avatar': AVATARS[i % len(AVATARS)], 'score': 0}
+        roster.append(player)
+        room = 1 + len(roster) + spectators
+        messages.append(('player-joined', {'player': player, 'players': list(roster)}, room))
+        messages.append(('room-state', {'state': 'lobby', 'players': list(roster), 'lateJoin': False}, 1))
+
+    everyone = 1 + players + spectators
+    for q in range(questions):
+        question = {
+            'type': 'multiple',
+            'question': f'Frage {q + 1}: Was ist 2 + {q}?',
+            'answers': [str(2 + q), str(3 + q), str(4 + q), str(5 + q)],
+            'correctAnswer': 0,
+            'correctAnswers': [0],
+            'points': 100,
+            'timeLimit': 20
+        }
+        messages.append(('game-started' if q == 0 else 'next-question', {'question': question, 'nextAssets': []}, everyone))
+
+        fastest = 0
+        for player in rng.sample(roster, len(roster)):
+            correct = rng.random() < 0.7
+            response_time = round(rng.uniform(0.5, 15), 3)
+            bonus = [50, 30, 10][fastest] if correct and fastest < 3 else 0
+            fastest += correct
+            points = 100 + bonus if correct else 0
+            player['score'] += points
+            messages.append(('answer-result', {
+                'correct': correct, 'correctAnswer': 0, 'points': 100 if correct else 0,
+                'bonusPoints': bonus, 'totalPoints': points, 'newScore': player['score'],
+                'responseTime': response_time
+            }, 1))
+            messages.append(('player-answered', {
+                'playerId': player['id'], 'playerName': player['name'], 'playerAvatar': player['avatar'],
+                'correct': correct, 'responseTime': response_time, 'bonusPoints': bonus,
+                'newScore': player['score']
+            }, 1))
+
+        for player in rng.sample(roster, min(adjustments, len(roster))):
+            player['score'] += 10
+            messages.append(('player-score-updated', {
+                'playerId': player['id'], 'playerName': player['name'], 'newScore': player['score']
+            }, everyone))
+
+        # Koaleszierte Leaderboard-Deltas (LEADERBOARD_RATE), je `delta_batch` Änderungen, nur an Zuschauer
+        ranked = sorted(roster, key=lambda p: -p['score'])
+        changes = [{'id': p['id'], 'score': p['score'], 'rank': rank + 1} for rank, p in enumerate(ranked)]
+        for start in range(0, len(changes), delta_batch):
+            messages.append(('leaderboard-delta', {
+                'seq': q * 1000 + start, 'total': players, 'changes': changes[start:start + delta_batch], 'removed': []
+            }, spectators))
+
+    # Ergebnisse: Top-K (RESULTS_TOP_K) für alle, Spieler zusätzlich mit eigenem Rang
+    final = sorted(roster, key=lambda p: -p['score'])
+    top = final[:results_top_k]
+    for event in ('show-results', 'game-over'):
+        for rank, player in enumerate(final, 1):
+            messages.append((event, {'players': top, 'total': players, 'rank': rank, 'score': player['score']}, 1))
+        messages.append((event, {'players': top, 'total': players}, 1 + spectators))
+    return messages
+
+
+def codecs():
+    """(encode, decode) pro Format, jeweils für das komplette Socket.IO-Paket"""
+    msgpack = _msgpack()
+    return {
+        # '42' = Engine.IO MESSAGE + Socket.IO EVENT, wie auf der Leitung
+        'json': (
+            lambda event, data: '42' + json.dumps([event, data], separators=(',', ':'), ensure_ascii=False),
+            lambda frame: json.loads(frame[2:])
+        ),
+        'msgpack': (
+            lambda event, data: msgpack.packb({'type': 2, 'data': [event, data], 'nsp': '/'}),
+            lambda frame: msgpack.unpackb(frame, raw=False)
+        )
+    }
+
+
+def _best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def codec_bench(messages, repeat=3):
+    """Bytes, Encode- und Decode-Zeit pro Format, gesamt und pro Event"""
+    results = {}
+    for name, (encode, decode) in codecs().items():
+        frames = [encode(event, data) for event, data, _ in messages]
+        sizes = [len(f.encode() if isinstance(f, str) else f) for f in frames]
+
+        encode_s = _best_of(lambda: [encode(event, data) for event, data, _ in messages], repeat)
+        decode_once_s = {}
+        for (event, _, recipients), frame in zip(messages, frames):
+            # Jeder Empfänger dekodiert selbst: einmal messen, mit der Empfängerzahl hochrechnen
+            started = time.perf_counter()
+            decode(frame)
+            decode_once_s[event] = decode_once_s.get(event, 0) + (time.perf_counter() - started) * recipients
+
+        per_event = collections.defaultdict(lambda: {'messages': 0, 'bytes_on_wire': 0})
+        for (event, _, recipients), size in zip(messages, sizes):
+            per_event[event]['messages'] += 1
+            per_event[event]['bytes_on_wire'] += size * recipients
+
+        results[name] = {
+            'messages': len(messages),
+            'bytes_encoded': sum(sizes),
+            'bytes_on_wire': sum(size * recipients for size, (_, _, recipients) in zip(sizes, messages)),
+            'encode_ms': round(encode_s * 1000, 1),
+            'decode_all_recipients_ms': round(sum(decode_once_s.values()) * 1000, 1),
+            'events': dict(sorted(per_event.items(), key=lambda item: -item[1]['bytes_on_wire']))
+        }
+
+    json_result, msgpack_result = results['json'], results['msgpack']
+    results['ratio'] = {
+        'bytes_on_wire': round(msgpack_result['bytes_on_wire'] / json_result['bytes_on_wire'], 3),
+        'encode': round(msgpack_result['encode_ms'] / json_result['encode_ms'], 3) if json_result['encode_ms'] else None,
+        'decode': round(msgpack_result['decode_all_recipients_ms'] / json_result['decode_all_recipients_ms'], 3)
+        if json_result['decode_all_recipients_ms'] else None
+    }
+    return results
+
+
+async def live_bench(server_url, players=500, questions=20, question_time=3.0):
+    """Dasselbe Spiel gegen den Server, einmal pro Format: empfangene Bytes und Client-CPU"""
+    results = {}
+    for wire in FORMATS:
+        cpu = time.process_time()
+        started = time.perf_counter()
+        async with MetricsScope(server_url) as metrics:
+            stats = await run_load(server_url, 1, players, questions, 'multiple', question_time, wire=wire)
+        results[wire] = {
+            'bytes_received': stats['bytes_received'],
+            'server_emitted': metrics.delta['emitted'] if metrics.delta else None,
+            'client_cpu_s': round(time.process_time() - cpu, 2),
+            'seconds': round(time.perf_counter() - started, 2),
+            'joined': stats['joined'],
+            'answers': stats['answers'],
+            'finished_rooms': stats['finished_rooms'],
+            'server_metrics': metrics.delta
+        }
+    return results
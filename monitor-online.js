@@ -3,6 +3,10 @@
  * Prüft kontinuierlich ob die Online-Version verfügbar ist und die Fixes enthält
  */
 const { chromium } = require('playwright');
+const path = require('path');
+
+// Ablage für Screenshots und Logs (wie harness/paths.py: QUIZER_ARTIFACT_DIR überschreibt)
+const ARTIFACT_DIR = process.env.QUIZER_ARTIFACT_DIR || path.join(__dirname, 'test-screenshots');
 
 const ONLINE_URL = 'http://if0-39705173.infinityfreeapp.com/Quiz/';
 const RENDER_API = 'https://quizer-backend-9v9a.onrender.com';
@@ -109,7 +113,7 @@ async function checkOnlineVersion() {
     }
 
     await page.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/monitor-screenshot.png'
+      path: path.join(ARTIFACT_DIR, 'monitor-screenshot.png')
     });
 
   } catch (error) {
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Profile-Run - beliebiges Szenario mit CPU-Profil und Event-Loop-Lag aufzeichnen
+
+Startet das CPU-Profil im Server, führt den Befehl nach `--` aus, stoppt
+das Profil und legt Profil, Lag-Verlauf, optional Heap-Snapshot und
+Server-Log im Lauf-Ordner ab. Der Befehl bekommt QUIZER_RUN_DIR gesetzt,
+seine Screenshots landen also im selben Ordner.
+
+Mit --spawn startet das Skript den Server selbst (optional mit
+LOG_MODE=async/sampled), sonst muss --server lokal laufen.
+
+Beispiel:
+    python3 profile-run.py --server http://localhost:3001 -- python3 bench-join-storm.py --players 2000
+    python3 profile-run.py --spawn --port 3103 --log-mode sampled --heap -- \\
+        python3 test-reconnect-storm.py --server http://localhost:3103
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from harness.paths import run_dir
+from harness.profiling import ProfileRun, diagnostics
+from harness.server import ServerProcess
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Szenario mit CPU-Profil des Servers ausführen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Lokales Backend (ohne --spawn)')
+    parser.add_argument('--spawn', action='store_true', help='Server selbst starten')
+    parser.add_argument('--port', type=int, default=3103, help='Port für den gestarteten Server')
+    parser.add_argument('--log-mode', choices=['sync', 'async', 'sampled'], help='LOG_MODE des gestarteten Servers')
+    parser.add_argument('--interval-us', type=int, default=1000, help='Abtastintervall des Profilers (µs)')
+    parser.add_argument('--heap', action='store_true', help='Nach dem Lauf zusätzlich einen Heap-Snapshot aufnehmen')
+    parser.add_argument('--name', help='Name des Lauf-Ordners (Standard: Skriptname des Befehls)')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='Befehl nach --')
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error('Befehl nach -- fehlt')
+
+    script = next((part for part in command if part.endswith('.py')), command[0])
+    name = args.name or os.path.splitext(os.path.basename(script))[0]
+    directory = run_dir(f'profile-{name}')
+
+    server = None
+    server_url = args.server
+    if args.spawn:
+        server = ServerProcess(args.port, env={'LOG_MODE': args.log_mode} if args.log_mode else None)
+        server.log_path = os.path.join(directory, 'server.log')
+        server_url = server.url
+        server.start()
+
+    print(f"\n{'='*70}")
+    print(f"🔬 PROFILE-RUN: {' '.join(command)}")
+    print(f"🌐 Server: {server_url}" + (' (eigener Prozess)' if server else ''))
+    print(f"📁 Ordner: {directory}")
+    print(f"{'='*70}\n")
+
+    try:
+        if diagnostics(server_url) is None:
+            print('❌ /diagnostics nicht erreichbar (Server zu alt oder nicht lokal)')
+            sys.exit(2)
+
+        with ProfileRun(server_url, name, heap=args.heap, interval_us=args.interval_us, directory=directory) as run:
+            result = subprocess.run(command, env={**os.environ, 'QUIZER_RUN_DIR': directory})
+    finally:
+        if server:
+            server.stop()
+
+    summary = run.summary
+    worst = summary['worst_lag'] or {}
+    print(f"\n⏱️  Profil {summary['profile_ms']} ms, {summary['samples']} Samples")
+    print(f"🐢 Größter Event-Loop-Lag: max {worst.get('maxMs', '-')} ms, p99 {worst.get('p99Ms', '-')} ms")
+    print(f"\n{'Self ms':>9} {'Anteil':>7}  Funktion")
+    for entry in summary['hot_functions'][:10]:
+        print(f"{entry['self_ms']:>9} {entry['share']:>7.1%}  {entry['function']} ({entry['location']})")
+    print(f"\n✅ Profil gespeichert: {os.path.join(directory, 'cpu.cpuprofile')}")
+
+    sys.exit(result.returncode)
+
+
+if __name__ == '__main__':
+    main()
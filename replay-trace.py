@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Aufgezeichnete Socket-Traces gegen den Server abspielen
+
+Aufnahme: Server mit TRACE_FILE=trace.ndjson.gz starten, echte Session
+spielen, Server beenden (SIGTERM schreibt den Trace vollständig).
+
+Beispiel:
+    python3 replay-trace.py trace.ndjson.gz --speed 10 --copies 20
+    python3 replay-trace.py trace.ndjson.gz --speed max --copies 100
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.metrics import MetricsScope, hottest
+from harness.replay import load_trace, replay
+
+
+def parse_speed(value):
+    if value == 'max':
+        return 0.0
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError('Geschwindigkeit muss > 0 oder "max" sein')
+    return speed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Socket-Trace (server/trace.js) beschleunigt abspielen')
+    parser.add_argument('trace', help='Trace-Datei (.ndjson.gz)')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--speed', type=parse_speed, default=1.0, help='Faktor (1, 10, ...) oder "max"')
+    parser.add_argument('--copies', type=int, default=1, help='Parallele Kopien des Traces (eigene Räume)')
+    parser.add_argument('--stagger', type=float, default=0.0, help='Versatz zwischen den Kopien in Sekunden')
+    parser.add_argument('--settle', type=float, default=2.0, help='Wartezeit auf letzte Server-Events in Sekunden')
+    parser.add_argument('--max-divergence', type=float, default=0.05,
+                        help='Erlaubter Anteil abweichender Sockets (Exit-Code 1 darüber)')
+    parser.add_argument('--output', default=f"test-screenshots/bench/trace-replay-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    trace = load_trace(args.trace)
+    header = trace['header'] or {}
+    print(f"\n{'='*70}")
+    print(f"🎞️  TRACE-REPLAY: {args.trace} (Server {header.get('version', '?')}, {header.get('started', '?')})")
+    print(f"   {len(trace['sockets'])} Sockets, {trace['duration_ms'] / 1000:.1f}s, "
+          f"Tempo {'max' if not args.speed else f'{args.speed:g}x'}, {args.copies} Kopien")
+    print(f"{'='*70}\n")
+
+    with MetricsScope(args.server) as metrics:
+        report = asyncio.run(replay(trace, args.server, args.speed, args.copies, args.settle, args.stagger))
+    report['trace'] = {'file': args.trace, **header}
+    report['server_metrics'] = metrics.delta
+
+    lag = report['schedule_lag_ms']
+    print(f"📤 Eingehend: {report['inbound_sent']}/{report['inbound_recorded']} Events "
+          f"({report['inbound_per_second']}/s), Verzug p99 {lag.get('p99', '-')} ms")
+    print(f"📥 Ausgehend: {report['outbound_received']} Events ({report['outbound_per_second']}/s)")
+    hot = hottest(metrics.delta)
+    if hot:
+        name, stats = hot
+        print(f"🔥 Teuerstes Event: {name} ({stats['total_ms']} ms gesamt)")
+
+    divergence = report['divergence']
+    print(f"🔍 Abweichung: {divergence['sockets_diverged']}/{divergence['sockets_compared']} Sockets")
+    for event, diff in divergence['events'].items():
+        print(f"   {event}: {diff:+d}")
+    if report['errors']:
+        print(f"⚠️  Fehler: {report['errors']}")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if (divergence['ratio'] or 0) > args.max_divergence:
+        print(f"❌ Abweichung {divergence['ratio']:.1%} über {args.max_divergence:.1%}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
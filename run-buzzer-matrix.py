@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Startet die Buzzer-Szenarien (test-buzzer*.py) × Ziele parallel
+
+Beispiel:
+    python3 run-buzzer-matrix.py --workers 4
+    python3 run-buzzer-matrix.py --scenarios buzzer,final --targets LOCAL --headful
+"""
+
+import argparse
+import sys
+
+from harness.metrics import hottest
+from harness.scheduler import SCENARIOS, TARGETS, run_matrix
+
+
+def print_result(result):
+    status = '✅' if result['ok'] else '❌'
+    print(f"\n{'='*70}")
+    print(f"{status} {result['scenario']} @ {result['target']} ({result['seconds']}s)")
+    print(f"{'='*70}")
+    print(result['output'])
+    hot = hottest(result.get('server_metrics'))
+    if hot:
+        name, stats = hot
+        print(f"🔥 Server: {name} {stats['count']}x, {stats['total_ms']} ms Handler-Zeit (p95 ≤ {stats['p95_ms']} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Buzzer-Szenario-Matrix parallel ausführen')
+    parser.add_argument('--workers', type=int, default=4, help='Anzahl Worker-Prozesse')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Kommagetrennt: ' + ', '.join(SCENARIOS))
+    parser.add_argument('--targets', default=','.join(TARGETS), help='Kommagetrennt: ' + ', '.join(TARGETS))
+    parser.add_argument('--headful', action='store_true', help='Browser sichtbar starten')
+    args = parser.parse_args()
+
+    scenarios = [s for s in args.scenarios.split(',') if s]
+    targets = [t for t in args.targets.split(',') if t]
+
+    summary = run_matrix(scenarios, targets, workers=args.workers,
+                         headless=not args.headful, on_result=print_result)
+
+    print(f"\n{'='*70}")
+    print("📊 ZUSAMMENFASSUNG")
+    print(f"{'='*70}")
+    for result in sorted(summary['results'], key=lambda r: (r['scenario'], r['target'])):
+        print(f"   {'✅' if result['ok'] else '❌'} {result['scenario']:<10} {result['target']:<7} {result['seconds']:>7}s")
+    print(f"\n⏱️  Wall-Clock: {summary['wall_seconds']}s "
+          f"(Summe Szenarien: {summary['scenario_seconds']}s, langsamstes: {summary['slowest_seconds']}s)")
+
+    sys.exit(0 if all(r['ok'] for r in summary['results']) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,309 @@
+// Content-addressed asset store for quiz images.
+// Quizzes embed uploaded images as data: URLs. Instead of sending them through
+// the socket with every question, they are stored once under the hash of
+// their bytes and referenced as "asset:<id>" in the quiz. Clients load them
+// via GET /assets/<id> (ETag = id, cached forever, Range supported) and can
+// prefetch the next question's assets while the current one is running.
+//
+// Assets are reference counted per room. Without a directory they only live
+// in memory and are dropped with their last room; with ASSET_DIR (or
+// JOURNAL_DIR) they are also written to disk, so restored rooms keep their
+// images. Dropping an asset deletes its file too. Uploads no room ever
+// references are swept after `orphanMs`, files left over from an earlier
+// run that no restored room references are swept the same way.
+//
+// POST /assets needs no login, so uploads are capped: `clientBytes` per
+// client and `orphanMs` window, `pendingBytes` for all uploads not (yet)
+// referenced by a room.
+
+import crypto from 'crypto'
+import fs from 'fs'
+import path from 'path'
+
+const PREFIX = 'asset:'
+const ID_PATTERN = /^[0-9a-f]{32}$/
+const DATA_URL = /^data:([^;,]+)(;base64)?,/
+
+export function assetId(buffer) {
+  return crypto.createHash('sha256').update(buffer).digest('hex').slice(0, 32)
+}
+
+function parseDataUrl(value) {
+  const match = DATA_URL.exec(value)
+  if (!match) return null
+  const body = value.slice(match[0].length)
+  const buffer = match[2] ? Buffer.from(body, 'base64') : Buffer.from(decodeURIComponent(body))
+  return { buffer, type: match[1] }
+}
+
+// Single "bytes=start-end" range → [start, end] (inclusive), null = whole body, false = unsatisfiable
+function parseRange(header, size) {
+  const match = /^bytes=(\d*)-(\d*)$/.exec(header || '')
+  if (!match || (!match[1] && !match[2])) return null
+
+  let start, end
+  if (!match[1]) {
+    start = Math.max(0, size - Number(match[2]))
+    end = size - 1
+  } else {
+    start = Number(match[1])
+    end = match[2] ? Math.min(Number(match[2]), size - 1) : size - 1
+  }
+  return start <= end && start < size ? [start, end] : false
+}
+
+// Upload quota key: the address the proxy saw (last X-Forwarded-For entry), else the peer
+function clientKey(req) {
+  const forwarded = req.headers['x-forwarded-for']
+  return forwarded ? forwarded.split(',').pop().trim() : req.socket.remoteAddress
+}
+
+export function createAssetStore({
+  dir = null,
+  orphanMs = 10 * 60 * 1000,
+  clientBytes = 50 * 1024 * 1024,
+  pendingBytes = 200 * 1024 * 1024
+} = {}) {
+  // id → { buffer, type, refs, created }
+  const assets = new Map()
+  // client → bytes uploaded in the current orphanMs window
+  const uploads = new Map()
+  const stats = {
+    stored: 0, bytes: 0, pendingBytes: 0, deleted: 0,
+    served: 0, notModified: 0, ranges: 0, extracted: 0, rejected: 0
+  }
+  const startedAt = Date.now()
+  let leftovers = new Set()
+
+  if (dir) {
+    fs.mkdirSync(dir, { recursive: true })
+    leftovers = new Set(fs.readdirSync(dir).filter(name => ID_PATTERN.test(name)))
+  }
+
+  function diskPath(id) {
+    return path.join(dir, id)
+  }
+
+  function unlink(id) {
+    for (const file of [diskPath(id), `${diskPath(id)}.type`]) {
+      try {
+        fs.unlinkSync(file)
+      } catch (error) {
+        if (error.code !== 'ENOENT') console.error(`❌ Could not delete asset ${id}:`, error.message)
+      }
+    }
+    stats.deleted++
+  }
+
+  function put(buffer, type) {
+    const id = assetId(buffer)
+    if (!assets.has(id)) {
+      assets.set(id, { buffer, type, refs: 0, created: Date.now() })
+      stats.stored++
+      stats.bytes += buffer.length
+      stats.pendingBytes += buffer.length
+      if (dir && !fs.existsSync(diskPath(id))) {
+        // Write + rename: a crash never leaves half a file behind
+        const temp = `${diskPath(id)}.${process.pid}.tmp`
+        fs.writeFileSync(temp, buffer)
+        fs.writeFileSync(`${temp}.type`, type)
+        fs.renameSync(`${temp}.type`, `${diskPath(id)}.type`)
+        fs.renameSync(temp, diskPath(id))
+      }
+    }
+    return id
+  }
+
+  function get(id) {
+    let asset = assets.get(id)
+    if (!asset && dir && ID_PATTERN.test(id) && fs.existsSync(diskPath(id))) {
+      // Asset of a restored room
+      asset = {
+        buffer: fs.readFileSync(diskPath(id)),
+        type: fs.readFileSync(`${diskPath(id)}.type`, 'utf8'),
+        refs: 0,
+        created: Date.now()
+      }
+      assets.set(id, asset)
+      stats.bytes += asset.buffer.length
+      stats.pendingBytes += asset.buffer.length
+    }
+    return asset || null
+  }
+
+  function drop(id, asset) {
+    assets.delete(id)
+    stats.bytes -= asset.buffer.length
+    stats.pendingBytes -= asset.buffer.length
+    if (dir) unlink(id)
+  }
+
+  function retain(ids) {
+    for (const id of ids) {
+      const asset = get(id)
+      if (asset && asset.refs++ === 0) stats.pendingBytes -= asset.buffer.length
+    }
+  }
+
+  function release(ids) {
+    for (const id of ids) {
+      const asset = assets.get(id)
+      if (!asset || --asset.refs > 0) continue
+      stats.pendingBytes += asset.buffer.length
+      drop(id, asset)
+    }
+  }
+
+  // Replace every data: URL in the quiz by an asset reference.
+  // Returns the rewritten quiz and the ids it references (deduplicated).
+  function internQuiz(quiz) {
+    const ids = new Set()
+
+    const visit = (value) => {
+      if (typeof value === 'string') {
+        if (value.startsWith(PREFIX)) {
+          ids.add(value.slice(PREFIX.length))
+          return value
+        }
+        const data = value.startsWith('data:') ? parseDataUrl(value) : null
+        if (!data) return value
+        const id = put(data.buffer, data.type)
+        ids.add(id)
+        stats.extracted++
+        return PREFIX + id
+      }
+      if (Array.isArray(value)) return value.map(visit)
+      if (value && typeof value === 'object') {
+        const result = {}
+        for (const key in value) result[key] = visit(value[key])
+        return result
+      }
+      return value
+    }
+
+    return { quiz: visit(quiz), ids: [...ids] }
+  }
+
+  // GET/HEAD /assets/:id
+  function serve(req, res) {
+    const { id } = req.params
+    const asset = ID_PATTERN.test(id) ? get(id) : null
+    if (!asset) {
+      res.status(404).json({ error: 'Asset not found' })
+      return
+    }
+
+    const etag = `"${id}"`
+    res.set({
+      'ETag': etag,
+      'Cache-Control': 'public, max-age=31536000, immutable',
+      'Accept-Ranges': 'bytes',
+      'Content-Type': asset.type
+    })
+    if (req.headers['if-none-match'] === etag) {
+      stats.notModified++
+      res.status(304).end()
+      return
+    }
+
+    const size = asset.buffer.length
+    const range = req.headers['if-range'] && req.headers['if-range'] !== etag
+      ? null
+      : parseRange(req.headers.range, size)
+    if (range === false) {
+      res.status(416).set('Content-Range', `bytes */${size}`).end()
+      return
+    }
+
+    stats.served++
+    if (range) {
+      const [start, end] = range
+      stats.ranges++
+      res.status(206).set('Content-Range', `bytes ${start}-${end}/${size}`)
+      res.end(req.method === 'HEAD' ? undefined : asset.buffer.subarray(start, end + 1))
+    } else {
+      res.set('Content-Length', String(size))
+      res.end(req.method === 'HEAD' ? undefined : asset.buffer)
+    }
+  }
+
+  // POST /assets with the raw image as body (express.raw)
+  function upload(req, res) {
+    const type = req.headers['content-type'] || 'application/octet-stream'
+    if (!Buffer.isBuffer(req.body) || req.body.length === 0 || !type.startsWith('image/')) {
+      res.status(400).json({ error: 'Expected an image body' })
+      return
+    }
+
+    // Already stored content costs nothing
+    const size = req.body.length
+    if (!assets.has(assetId(req.body))) {
+      const client = clientKey(req)
+      const used = uploads.get(client) || 0
+      if (used + size > clientBytes) {
+        stats.rejected++
+        res.status(429).json({ error: 'Upload quota exceeded, try again later' })
+        return
+      }
+      if (stats.pendingBytes + size > pendingBytes) {
+        stats.rejected++
+        res.status(507).json({ error: 'Asset store is full' })
+        return
+      }
+      uploads.set(client, used + size)
+    }
+
+    const id = put(req.body, type)
+    res.status(201).json({ id, ref: PREFIX + id, size: req.body.length })
+  }
+
+  // Uploads whose room was never created, files of an earlier run no room
+  // was restored with, and the per-client quota window
+  let windowStart = startedAt
+  const sweepTimer = setInterval(() => {
+    const now = Date.now()
+    const cutoff = now - orphanMs
+    for (const [id, asset] of assets) {
+      if (asset.refs <= 0 && asset.created < cutoff) drop(id, asset)
+    }
+    if (leftovers.size > 0 && startedAt < cutoff) {
+      for (const id of leftovers) {
+        if (!assets.has(id)) unlink(id)
+      }
+      leftovers = new Set()
+    }
+    if (windowStart < cutoff) {
+      uploads.clear()
+      windowStart = now
+    }
+  }, Math.min(orphanMs, 60 * 1000))
+  sweepTimer.unref()
+
+  return {
+    put,
+    get,
+    retain,
+    release,
+    internQuiz,
+    serve,
+    upload,
+    stats: () => ({ dir, assets: assets.size, clients: uploads.size, ...stats })
+  }
+}
+
+// Asset ids referenced by a question (for prefetch hints)
+export function questionAssets(question) {
+  if (!question) return []
+  const ids = []
+  const visit = (value) => {
+    if (typeof value === 'string') {
+      if (value.startsWith(PREFIX)) ids.push(value.slice(PREFIX.length))
+    } else if (Array.isArray(value)) {
+      value.forEach(visit)
+    } else if (value && typeof value === 'object') {
+      Object.values(value).forEach(visit)
+    }
+  }
+  visit(question)
+  return ids
+}
@@ -0,0 +1,104 @@
+// Worker side of cluster mode (see cluster.js). index.js calls setupWorker()
+// when started by the cluster primary (CLUSTER_WORKER=<slot>).
+
+import crypto from 'crypto'
+import { workerForRoom } from './cluster.js'
+
+// Room codes are 6 characters (quiz id suffix), socket ids 20
+const ROOM_TARGET = /^(?:leaderboard:)?([A-Z0-9]{6})$/
+
+// Broadcasts go to local sockets first. Since rooms are sharded by room
+// code their members are normally all local, so only room codes (and their
+// leaderboard channel) that the primary routes to another worker are
+// relayed through the primary - the local stand-in for a Redis-style
+// message bus - plus io.emit to everyone. Socket ids are never relayed: a
+// socket always lives on its room's worker, so per-socket sends
+// (emitResults, io.to(host) for a disconnected host, ...) stay local even
+// when the socket is gone.
+function createClusterAdapter(io, slot, workerCount) {
+  const Adapter = io.of('/').adapter.constructor
+
+  const remote = (room) => {
+    const match = ROOM_TARGET.exec(room)
+    return match !== null && workerForRoom(match[1], workerCount) !== slot
+  }
+
+  return class ClusterAdapter extends Adapter {
+    broadcast(packet, opts) {
+      super.broadcast(packet, opts)
+      if (opts.flags?.local) return
+
+      const rooms = [...opts.rooms].filter(room => !this.rooms.has(room) && remote(room))
+      if (opts.rooms.size > 0 && rooms.length === 0) return
+
+      process.send({
+        type: 'cluster:broadcast',
+        nsp: this.nsp.name,
+        packet,
+        rooms,
+        except: [...opts.except],
+        flags: opts.flags
+      })
+    }
+  }
+}
+
+export function setupWorker({ httpServer, io, localStats }) {
+  const slot = Number(process.env.CLUSTER_WORKER)
+  const workerCount = Number(process.env.CLUSTER_WORKERS) || 1
+  const pendingStats = new Map()
+  let requestId = 0
+
+  io.adapter(createClusterAdapter(io, slot, workerCount))
+
+  // The worker number in the session id lets the primary route polling requests
+  io.engine.generateId = () => `w${slot}_${crypto.randomBytes(15).toString('base64url')}`
+
+  // The primary routes a connection once, by its first request. A keep-alive
+  // connection reused for a later request (a handshake after GET /, a poll of
+  // another room's session) would stay on this worker, so every plain HTTP
+  // response closes it and the next request gets routed on its own.
+  // WebSocket upgrades take over the connection and are not affected.
+  httpServer.prependListener('request', (req, res) => res.setHeader('Connection', 'close'))
+
+  process.on('message', (message, connection) => {
+    switch (message?.type) {
+      case 'cluster:connection':
+        // Connection handed over by the primary, replay the bytes it already read
+        if (!connection) return
+        httpServer.emit('connection', connection)
+        connection.emit('data', Buffer.from(message.data, 'base64'))
+        connection.resume()
+        break
+      case 'cluster:broadcast':
+        io.of(message.nsp).adapter.broadcast(message.packet, {
+          rooms: new Set(message.rooms),
+          except: new Set(message.except),
+          flags: { ...message.flags, local: true }
+        })
+        break
+      case 'cluster:stats-collect':
+        process.send({ type: 'cluster:stats-reply', id: message.id, stats: localStats() })
+        break
+      case 'cluster:stats': {
+        const resolve = pendingStats.get(message.requestId)
+        pendingStats.delete(message.requestId)
+        resolve?.(message.workers)
+        break
+      }
+    }
+  })
+
+  process.send({ type: 'cluster:ready' })
+  console.log(`🧩 Worker ${slot} ready (pid ${process.pid})`)
+
+  return {
+    slot,
+    // Per-worker stats from all workers, collected by the primary
+    stats() {
+      const id = ++requestId
+      process.send({ type: 'cluster:stats-request', requestId: id })
+      return new Promise(resolve => pendingStats.set(id, resolve))
+    }
+  }
+}
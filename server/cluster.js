@@ -0,0 +1,154 @@
+// Cluster mode: `node cluster.js` forks WORKERS processes running index.js
+// and owns the public port. Rooms are sharded by room code: the primary reads
+// the first request line of every TCP connection and hands the connection to
+//   1. the worker that issued the Engine.IO session id (sid=w<slot>_...),
+//   2. the worker owning the room (room=<code> query, hash of the code),
+//   3. otherwise round robin (health checks, clients without a room).
+// Workers answer every plain HTTP request with `Connection: close`, so each
+// request arrives on a fresh connection and is routed by its own first line.
+// All sockets of a room therefore live on one worker together with its
+// state. The primary also relays cross-worker broadcasts and aggregates
+// /status (see cluster-worker.js).
+
+import cluster from 'cluster'
+import net from 'net'
+import os from 'os'
+import path from 'path'
+import { fileURLToPath } from 'url'
+
+const PORT = process.env.PORT || 3001
+const WORKERS = Number(process.env.WORKERS) || os.availableParallelism?.() || os.cpus().length
+const STATS_TIMEOUT_MS = 500
+
+const SID_PATTERN = /[?&]sid=w(\d+)_/
+const ROOM_PATTERN = /[?&]room=([A-Za-z0-9]+)/
+
+// FNV-1a, stable across restarts so a room code always maps to the same slot
+function hashRoom(roomCode) {
+  let hash = 0x811c9dc5
+  for (let i = 0; i < roomCode.length; i++) {
+    hash ^= roomCode.charCodeAt(i)
+    hash = Math.imul(hash, 0x01000193)
+  }
+  return hash >>> 0
+}
+
+export function workerForRoom(roomCode, workerCount) {
+  return hashRoom(roomCode.toUpperCase()) % workerCount
+}
+
+export function workerForRequest(requestLine, workerCount, next) {
+  const sid = SID_PATTERN.exec(requestLine)
+  if (sid && Number(sid[1]) < workerCount) return Number(sid[1])
+
+  const room = ROOM_PATTERN.exec(requestLine)
+  if (room) return workerForRoom(room[1], workerCount)
+
+  return next() % workerCount
+}
+
+function startPrimary() {
+  const serverDir = path.dirname(fileURLToPath(import.meta.url))
+  cluster.setupPrimary({ exec: path.join(serverDir, 'index.js'), serialization: 'advanced' })
+
+  const slots = new Array(WORKERS).fill(null)
+  const ready = new Set()
+  const pendingStats = new Map()
+  let roundRobin = 0
+  let statsId = 0
+  let listening = false
+
+  function fork(slot) {
+    const env = { CLUSTER_WORKER: String(slot), CLUSTER_WORKERS: String(WORKERS) }
+    // Every worker keeps its own journal (rooms are sharded anyway)
+    if (process.env.JOURNAL_DIR) env.JOURNAL_DIR = path.join(process.env.JOURNAL_DIR, `worker-${slot}`)
+    // Same for assets: a worker deletes files once its rooms no longer need them
+    if (process.env.ASSET_DIR) env.ASSET_DIR = path.join(process.env.ASSET_DIR, `worker-${slot}`)
+    if (process.env.TRACE_FILE) {
+      const trace = process.env.TRACE_FILE
+      env.TRACE_FILE = path.join(path.dirname(trace), `worker-${slot}-${path.basename(trace)}`)
+    }
+
+    const worker = cluster.fork(env)
+    slots[slot] = worker
+    worker.on('message', (message) => onWorkerMessage(slot, message))
+    worker.on('exit', (code, signal) => {
+      ready.delete(slot)
+      console.log(`⚠️  Worker ${slot} exited (${signal || code}) - restarting`)
+      fork(slot)
+    })
+  }
+
+  function broadcastToWorkers(message, exceptSlot) {
+    slots.forEach((worker, slot) => {
+      if (worker && slot !== exceptSlot && ready.has(slot)) worker.send(message)
+    })
+  }
+
+  function onWorkerMessage(slot, message) {
+    switch (message?.type) {
+      case 'cluster:ready':
+        ready.add(slot)
+        if (!listening && ready.size === WORKERS) listen()
+        break
+      case 'cluster:broadcast':
+        broadcastToWorkers(message, slot)
+        break
+      case 'cluster:stats-request': {
+        const id = ++statsId
+        const request = { slot, requestId: message.requestId, replies: [], timer: null }
+        request.timer = setTimeout(() => finishStats(id), STATS_TIMEOUT_MS)
+        pendingStats.set(id, request)
+        broadcastToWorkers({ type: 'cluster:stats-collect', id })
+        break
+      }
+      case 'cluster:stats-reply': {
+        const request = pendingStats.get(message.id)
+        if (!request) return
+        request.replies.push({ worker: slot, ...message.stats })
+        if (request.replies.length >= ready.size) finishStats(message.id)
+        break
+      }
+    }
+  }
+
+  function finishStats(id) {
+    const request = pendingStats.get(id)
+    if (!request) return
+    pendingStats.delete(id)
+    clearTimeout(request.timer)
+
+    const workers = request.replies.sort((a, b) => a.worker - b.worker)
+    slots[request.slot]?.send({ type: 'cluster:stats', requestId: request.requestId, workers })
+  }
+
+  function listen() {
+    listening = true
+    const server = net.createServer({ pauseOnConnect: true }, (connection) => {
+      connection.once('data', (buffer) => {
+        connection.pause()
+        const requestLine = buffer.toString('latin1', 0, buffer.indexOf('\r\n'))
+        const slot = workerForRequest(requestLine, WORKERS, () => roundRobin++)
+        const worker = slots[slot]
+        if (!worker || !ready.has(slot)) {
+          connection.destroy()
+          return
+        }
+        worker.send({ type: 'cluster:connection', data: buffer.toString('base64') }, connection)
+      })
+      connection.on('error', () => connection.destroy())
+      connection.resume()
+    })
+
+    server.listen(PORT, () => {
+      console.log(`🚀 Cluster primary on port ${PORT} with ${WORKERS} workers`)
+    })
+  }
+
+  console.log(`🧩 Starting ${WORKERS} workers`)
+  for (let slot = 0; slot < WORKERS; slot++) fork(slot)
+}
+
+if (cluster.isPrimary && process.argv[1] === fileURLToPath(import.meta.url)) {
+  startPrimary()
+}
@@ -0,0 +1,213 @@
+// Runtime diagnostics for lag spikes in big games:
+//
+// - Event-loop delay: a perf_hooks histogram is read and reset every
+//   `intervalMs`, the last `samples` readings stay in a ring buffer
+//   (mean/p99/max delay and event-loop utilization per interval).
+// - Logging: with LOG_MODE=async the per-event console.log lines are
+//   buffered and written with one stdout write per tick, LOG_MODE=sampled
+//   additionally keeps only a LOG_SAMPLE fraction of them. console.error and
+//   console.warn stay synchronous.
+// - Capture: CPU profile (start/stop) and heap snapshot through the
+//   inspector, served on local-only /diagnostics endpoints as
+//   .cpuprofile / .heapsnapshot files (open in Chrome DevTools).
+
+import { monitorEventLoopDelay, performance } from 'perf_hooks'
+import inspector from 'inspector'
+import util from 'util'
+
+const LOOPBACK = new Set(['127.0.0.1', '::1', '::ffff:127.0.0.1'])
+
+export function installLogging({ mode = 'sync', sample = 1 } = {}) {
+  const stats = { mode, sample, written: 0, dropped: 0, flushes: 0 }
+  if (mode !== 'async' && mode !== 'sampled') {
+    stats.mode = 'sync'
+    return { stats: () => ({ ...stats }), flush: () => {} }
+  }
+
+  let buffer = []
+  let scheduled = false
+
+  function flush() {
+    scheduled = false
+    if (buffer.length === 0) return
+    const lines = buffer.join('')
+    buffer = []
+    process.stdout.write(lines)
+    stats.flushes++
+  }
+
+  console.log = (...args) => {
+    if (mode === 'sampled' && Math.random() >= sample) {
+      stats.dropped++
+      return
+    }
+    buffer.push(util.format(...args) + '\n')
+    stats.written++
+    if (!scheduled) {
+      scheduled = true
+      setImmediate(flush)
+    }
+  }
+
+  return { stats: () => ({ ...stats, buffered: buffer.length }), flush }
+}
+
+export function createDiagnostics({ intervalMs = 1000, samples = 300, resolutionMs = 10, logging = null } = {}) {
+  const ms = (ns) => Number.isFinite(ns) ? Number((ns / 1e6).toFixed(2)) : null
+
+  // Event-loop delay ring buffer
+  const histogram = monitorEventLoopDelay({ resolution: resolutionMs })
+  histogram.enable()
+  const ring = new Array(samples)
+  let next = 0
+  let filled = 0
+  let lastUtilization = performance.eventLoopUtilization()
+
+  const timer = setInterval(() => {
+    const utilization = performance.eventLoopUtilization(lastUtilization)
+    lastUtilization = performance.eventLoopUtilization()
+    ring[next] = {
+      t: Date.now(),
+      meanMs: ms(histogram.mean),
+      p99Ms: ms(histogram.percentile(99)),
+      maxMs: ms(histogram.max),
+      utilization: Number(utilization.utilization.toFixed(3))
+    }
+    next = (next + 1) % samples
+    filled = Math.min(filled + 1, samples)
+    histogram.reset()
+  }, intervalMs)
+  timer.unref()
+
+  // Oldest first
+  function lagSamples() {
+    const start = filled < samples ? 0 : next
+    return Array.from({ length: filled }, (_, i) => ring[(start + i) % samples])
+  }
+
+  function lagSummary() {
+    const recent = lagSamples()
+    if (recent.length === 0) return { intervalMs, samples: 0, last: null, worst: null }
+    return {
+      intervalMs,
+      samples: recent.length,
+      last: recent[recent.length - 1],
+      worst: recent.reduce((worst, s) => (s.maxMs > worst.maxMs ? s : worst))
+    }
+  }
+
+  // Inspector session, opened on first capture
+  let session = null
+  let profile = null
+
+  function post(method, params = {}) {
+    if (!session) {
+      session = new inspector.Session()
+      session.connect()
+    }
+    return new Promise((resolve, reject) => {
+      session.post(method, params, (error, result) => (error ? reject(error) : resolve(result)))
+    })
+  }
+
+  async function startProfile(samplingIntervalUs = 1000) {
+    if (profile) throw new Error('CPU profile already running')
+    profile = { started: Date.now(), samplingIntervalUs }
+    try {
+      await post('Profiler.enable')
+      await post('Profiler.setSamplingInterval', { interval: samplingIntervalUs })
+      await post('Profiler.start')
+    } catch (error) {
+      profile = null
+      throw error
+    }
+    return profile
+  }
+
+  async function stopProfile() {
+    if (!profile) throw new Error('No CPU profile running')
+    const { profile: result } = await post('Profiler.stop')
+    await post('Profiler.disable')
+    profile = null
+    return result
+  }
+
+  // Streams the snapshot in chunks instead of building one huge string
+  async function captureHeapSnapshot(write) {
+    await post('HeapProfiler.enable')
+    const onChunk = (message) => write(message.params.chunk)
+    session.on('HeapProfiler.addHeapSnapshotChunk', onChunk)
+    try {
+      await post('HeapProfiler.takeHeapSnapshot', { reportProgress: false })
+    } finally {
+      session.off('HeapProfiler.addHeapSnapshotChunk', onChunk)
+      await post('HeapProfiler.disable')
+    }
+  }
+
+  // HTTP handlers (mounted under /diagnostics in index.js)
+
+  // Only requests from this machine, and none forwarded by a proxy
+  function localOnly(req, res, next) {
+    if (!LOOPBACK.has(req.socket.remoteAddress) || req.headers['x-forwarded-for']) {
+      res.status(403).json({ error: 'Diagnostics are only available locally' })
+      return
+    }
+    next()
+  }
+
+  function status(req, res) {
+    res.json({
+      pid: process.pid,
+      eventLoop: { ...lagSummary(), recent: lagSamples() },
+      logging: logging ? logging.stats() : { mode: 'sync' },
+      profiling: profile,
+      timestamp: new Date().toISOString()
+    })
+  }
+
+  async function profileStart(req, res) {
+    try {
+      res.json(await startProfile(Number(req.query.interval) || 1000))
+    } catch (error) {
+      res.status(409).json({ error: error.message })
+    }
+  }
+
+  async function profileStop(req, res) {
+    try {
+      const result = await stopProfile()
+      res.set('Content-Disposition', `attachment; filename="cpu-${process.pid}-${Date.now()}.cpuprofile"`)
+      res.json(result)
+    } catch (error) {
+      res.status(409).json({ error: error.message })
+    }
+  }
+
+  async function heapSnapshotHandler(req, res) {
+    res.set('Content-Type', 'application/json')
+    res.set('Content-Disposition', `attachment; filename="heap-${process.pid}-${Date.now()}.heapsnapshot"`)
+    try {
+      await captureHeapSnapshot(chunk => res.write(chunk))
+      res.end()
+    } catch (error) {
+      if (!res.headersSent) res.status(500).json({ error: error.message })
+      else res.destroy(error)
+    }
+  }
+
+  return {
+    lagSummary,
+    lagSamples,
+    localOnly,
+    status,
+    profileStart,
+    profileStop,
+    heapSnapshot: heapSnapshotHandler,
+    close() {
+      clearInterval(timer)
+      histogram.disable()
+      session?.disconnect()
+    }
+  }
+}
@@ -0,0 +1,78 @@
+// Timer wheel for TTL-based eviction (stale players, finished rooms, idle
+// lobbies, rooms whose host never came back).
+// Instead of one setTimeout per room or player, deadlines are hashed into
+// `slots` buckets of `tickMs` each and a single unref'd interval walks the
+// wheel. Scheduling and cancelling are O(1) Map operations, a tick only
+// looks at one bucket. Entries further away than one lap stay in their
+// bucket until their deadline has actually passed.
+//
+// Every entry has a key ("room:ABC123", "player:ABC123:<socket id>");
+// scheduling an existing key replaces its deadline.
+
+export function createTimerWheel({ tickMs = 1000, slots = 512 } = {}) {
+  const wheel = Array.from({ length: slots }, () => new Map())
+  // key → { deadline, fn, slot }
+  const entries = new Map()
+  const stats = { scheduled: 0, cancelled: 0, fired: 0, errors: 0, lateMs: 0 }
+  let cursor = 0
+  let lastTick = Date.now()
+
+  function cancel(key) {
+    const entry = entries.get(key)
+    if (!entry) return false
+    wheel[entry.slot].delete(key)
+    entries.delete(key)
+    stats.cancelled++
+    return true
+  }
+
+  function schedule(key, delayMs, fn) {
+    const existing = entries.get(key)
+    if (existing) wheel[existing.slot].delete(key)
+
+    // Count ticks from the last processed tick, not from now: the bucket
+    // `ticks` ahead of the cursor is walked at lastTick + ticks * tickMs,
+    // which must not be before the deadline or the entry waits a full lap
+    const deadline = Date.now() + delayMs
+    const ticks = Math.max(1, Math.ceil((deadline - lastTick) / tickMs))
+    const entry = { deadline, fn, slot: (cursor + ticks) % slots }
+    wheel[entry.slot].set(key, entry)
+    entries.set(key, entry)
+    stats.scheduled++
+  }
+
+  function tick() {
+    const now = Date.now()
+    // Catch up on ticks missed while the event loop was blocked
+    while (lastTick + tickMs <= now) {
+      lastTick += tickMs
+      cursor = (cursor + 1) % slots
+
+      const bucket = wheel[cursor]
+      for (const [key, entry] of bucket) {
+        if (entry.deadline > now) continue // due in a later lap
+        bucket.delete(key)
+        entries.delete(key)
+        stats.fired++
+        stats.lateMs = Math.max(stats.lateMs, now - entry.deadline)
+        try {
+          entry.fn()
+        } catch (error) {
+          stats.errors++
+          console.error(`❌ Eviction of ${key} failed:`, error)
+        }
+      }
+    }
+  }
+
+  const timer = setInterval(tick, tickMs)
+  timer.unref()
+
+  return {
+    schedule,
+    cancel,
+    has: (key) => entries.has(key),
+    stats: () => ({ tickMs, slots, pending: entries.size, ...stats }),
+    stop: () => clearInterval(timer)
+  }
+}
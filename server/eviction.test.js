@@ -0,0 +1,61 @@
+// Timing tests for the eviction timer wheel: run with `npm test` in server/
+import { test } from 'node:test'
+import assert from 'node:assert/strict'
+import { createTimerWheel } from './eviction.js'
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms))
+
+// Schedules `delays` at random offsets between ticks and returns how late
+// each entry fired (ms after its deadline)
+async function lateness({ tickMs, slots, delays }) {
+  const wheel = createTimerWheel({ tickMs, slots })
+  const late = new Map()
+  try {
+    for (const [i, delayMs] of delays.entries()) {
+      await sleep(Math.random() * tickMs)
+      const deadline = Date.now() + delayMs
+      wheel.schedule(`entry:${i}`, delayMs, () => late.set(i, Date.now() - deadline))
+    }
+    while (wheel.stats().pending > 0) await sleep(tickMs)
+    return delays.map((_, i) => late.get(i))
+  } finally {
+    wheel.stop()
+  }
+}
+
+test('entries scheduled between ticks fire within a tick of their deadline', async () => {
+  const tickMs = 50
+  const late = await lateness({ tickMs, slots: 16, delays: [10, 120, 250, 400, 500, 640] })
+  for (const ms of late) {
+    assert.ok(ms !== undefined && ms >= 0, `fired before deadline: ${ms}`)
+    assert.ok(ms < tickMs * 2.5, `fired ${ms} ms late, expected < ${tickMs * 2.5}`)
+  }
+})
+
+test('entries further away than one lap fire on time', async () => {
+  const tickMs = 20
+  // One lap is 8 × 20 ms = 160 ms
+  const late = await lateness({ tickMs, slots: 8, delays: [170, 330, 415] })
+  for (const ms of late) {
+    assert.ok(ms !== undefined && ms >= 0, `fired before deadline: ${ms}`)
+    assert.ok(ms < tickMs * 2.5, `fired ${ms} ms late, expected < ${tickMs * 2.5}`)
+  }
+})
+
+test('rescheduling replaces the deadline and cancel removes the entry', async () => {
+  const wheel = createTimerWheel({ tickMs: 20, slots: 8 })
+  const fired = []
+  try {
+    wheel.schedule('a', 40, () => fired.push('a-old'))
+    wheel.schedule('a', 120, () => fired.push('a'))
+    wheel.schedule('b', 40, () => fired.push('b'))
+    assert.equal(wheel.cancel('b'), true)
+    await sleep(80)
+    assert.deepEqual(fired, [])
+    await sleep(120)
+    assert.deepEqual(fired, ['a'])
+    assert.equal(wheel.has('a'), false)
+  } finally {
+    wheel.stop()
+  }
+})
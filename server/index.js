@@ -2,6 +2,17 @@ import express from 'express'
 import { createServer } from 'http'
 import { Server } from 'socket.io'
 import cors from 'cors'
+import { createMetrics } from './metrics.js'
+import { createJournal } from './journal.js'
+import { setupWorker } from './cluster-worker.js'
+import { createTraceRecorder } from './trace.js'
+import { createAssetStore, questionAssets } from './assets.js'
+import { wireParser, negotiateWire, createWireAdapter, wireFormat } from './wire.js'
+import { createTimerWheel } from './eviction.js'
+import { createScoreIndex } from './ranking.js'
+import { createDiagnostics, installLogging } from './diagnostics.js'
+import path from 'path'
+import crypto from 'crypto'
 
 const app = express()
 const httpServer = createServer(app)
@@ -47,11 +58,38 @@ const io = new Server(httpServer, {
     credentials: true,
     methods: ["GET", "POST"]
   },
-  transports: ['websocket', 'polling']
+  transports: ['websocket', 'polling'],
+  // JSON for everyone, MessagePack for clients that ask for it (see wire.js)
+  parser: wireParser
+})
+io.adapter(createWireAdapter(io.of('/').adapter.constructor))
+io.use(negotiateWire)
+
+const metrics = createMetrics()
+metrics.instrumentEngine(io.engine)
+
+// Event-loop lag ring buffer, optional async/sampled console.log and
+// CPU profile / heap snapshot capture on /diagnostics (see diagnostics.js)
+const logging = installLogging({ mode: process.env.LOG_MODE, sample: Number(process.env.LOG_SAMPLE) || 0.1 })
+const diagnostics = createDiagnostics({
+  intervalMs: Number(process.env.LAG_INTERVAL_MS) || 1000,
+  samples: Number(process.env.LAG_SAMPLES) || 300,
+  logging
 })
 
 const PORT = process.env.PORT || 3001
 
+// Quiz images, referenced as asset:<id> in socket messages (see assets.js)
+const ASSET_DIR = process.env.ASSET_DIR || (process.env.JOURNAL_DIR && path.join(process.env.JOURNAL_DIR, 'assets'))
+const ASSET_UPLOAD_LIMIT = process.env.ASSET_UPLOAD_LIMIT || '20mb'
+const MB = 1024 * 1024
+const assets = createAssetStore({
+  dir: ASSET_DIR || null,
+  // Upload quotas: per client and 10 minute window, and for all uploads no room references yet
+  clientBytes: (Number(process.env.ASSET_CLIENT_QUOTA_MB) || 50) * MB,
+  pendingBytes: (Number(process.env.ASSET_PENDING_QUOTA_MB) || 200) * MB
+})
+
 // Health check endpoint
 app.get('/', (req, res) => {
   res.json({
@@ -60,7 +98,7 @@ app.get('/', (req, res) => {
     version: '1.2.0',
     timestamp: new Date().toISOString(),
     activeRooms: gameRooms.size,
-    totalPlayers: Array.from(gameRooms.values()).reduce((sum, room) => sum + room.players.length, 0)
+    totalPlayers: counters.players
   })
 })
 
@@ -68,28 +106,545 @@ app.get('/health', (req, res) => {
   res.json({ status: 'ok', uptime: process.uptime() })
 })
 
-// Status endpoint for CompactBadges
-app.get('/status', (req, res) => {
+// Status endpoint for CompactBadges (summed over all workers in cluster mode)
+app.get('/status', async (req, res) => {
   const uptime = process.uptime()
   const hours = Math.floor(uptime / 3600)
   const minutes = Math.floor((uptime % 3600) / 60)
   const seconds = Math.floor(uptime % 60)
 
+  const workers = clusterWorker ? await clusterWorker.stats() : null
+
   res.json({
     status: 'OK',
     version: '1.2.0',
     uptime: `${hours}h ${minutes}m ${seconds}s`,
-    activeRooms: gameRooms.size,
-    totalPlayers: Array.from(gameRooms.values()).reduce((sum, room) => sum + room.players.length, 0),
+    activeRooms: workers ? workers.reduce((sum, w) => sum + w.rooms, 0) : gameRooms.size,
+    totalPlayers: workers ? workers.reduce((sum, w) => sum + w.players, 0) : counters.players,
+    evictions: workers ? sumEvictions(workers.map(w => w.evictions)) : evictions,
+    ...(workers && { workers }),
     timestamp: new Date().toISOString()
   })
 })
 
+app.post('/assets', express.raw({ type: () => true, limit: ASSET_UPLOAD_LIMIT }), assets.upload)
+app.get('/assets/:id', assets.serve)
+
+// Metrics: live counters, per-event counts and handler latency histograms
+app.get('/metrics', (req, res) => {
+  res.json({
+    uptime: process.uptime(),
+    worker: clusterWorker ? clusterWorker.slot : null,
+    rooms: gameRooms.size,
+    players: counters.players,
+    spectators: counters.spectators,
+    connections: counters.connections,
+    msgpackConnections: counters.msgpackConnections,
+    ...metrics.toJSON(),
+    journal: journal ? journal.stats() : null,
+    trace: trace ? trace.stats() : null,
+    assets: assets.stats(),
+    eviction: { ...expiry.stats(), evicted: evictions },
+    memory: { rss: process.memoryUsage.rss(), heapUsed: process.memoryUsage().heapUsed },
+    eventLoop: diagnostics.lagSummary(),
+    timestamp: new Date().toISOString()
+  })
+})
+
+// Diagnostics, only reachable from this machine (profile-run.py)
+app.get('/diagnostics', diagnostics.localOnly, diagnostics.status)
+app.post('/diagnostics/profile/start', diagnostics.localOnly, diagnostics.profileStart)
+app.post('/diagnostics/profile/stop', diagnostics.localOnly, diagnostics.profileStop)
+app.post('/diagnostics/heap-snapshot', diagnostics.localOnly, diagnostics.heapSnapshot)
+
 // Game rooms storage
 const gameRooms = new Map()
 
+// Live counters, maintained on every change so status endpoints stay O(1)
+const counters = { players: 0, spectators: 0, connections: 0, msgpackConnections: 0 }
+
+// Players live in room.players (ordered, sent to clients) and in
+// room.playerIndex (socket id → same player object) for O(1) lookups.
+// room.ranking keeps them ordered by score (see ranking.js), so scores
+// must be changed through setPlayerScore.
+// room.playerNames holds the names in use, room.nameSuffixes the next
+// free ` #N` suffix per base name (see resolvePlayerName)
+function addPlayer(room, player) {
+  room.players.push(player)
+  room.playerIndex.set(player.id, player)
+  room.ranking.add(player)
+  room.playerNames.add(player.name)
+  counters.players++
+}
+
+function getPlayer(room, playerId) {
+  return room.playerIndex.get(playerId)
+}
+
+function removePlayer(room, playerId) {
+  const player = room.playerIndex.get(playerId)
+  if (!player) return null
+
+  const session = playerSessions.get(player)
+  if (session) room.sessions.delete(session.token)
+  room.playerIndex.delete(playerId)
+  room.playerNames.delete(player.name)
+  room.players.splice(room.players.indexOf(player), 1)
+  room.ranking.remove(player)
+  counters.players--
+  return player
+}
+
+function setPlayerScore(room, player, score) {
+  player.score = score
+  room.ranking.update(player)
+}
+
+// Free names are kept as typed, taken ones get the next suffix of their base
+// name ("Max" → "Max #2", "Max #2" → "Max #3"). Suffixes only grow, so the
+// loop skips at most the names that were typed with a suffix by hand.
+// Names freed by leaving players can be taken again as typed.
+function resolvePlayerName(room, playerName) {
+  if (!room.playerNames.has(playerName)) return playerName
+
+  const baseName = playerName.replace(/ #\d+$/, '') // Remove existing number if any
+  let suffix = room.nameSuffixes.get(baseName) || 2
+  while (room.playerNames.has(`${baseName} #${suffix}`)) suffix++
+  room.nameSuffixes.set(baseName, suffix + 1)
+  return `${baseName} #${suffix}`
+}
+
+// Resumable sessions: every player gets a random token on first join (sent
+// only to that player). A reconnecting socket presents it in join-room and
+// takes over its player record in O(1) via room.sessions (token → player),
+// keeping name, score and answer state. Session data is kept beside the
+// player object so it never ends up in the player lists sent to the room.
+const playerSessions = new WeakMap()
+
+function createSession(room, player, token = crypto.randomBytes(16).toString('base64url')) {
+  // answered: { question, result } of the player's last answer, for the catch-up
+  const session = { token, answered: null }
+  playerSessions.set(player, session)
+  room.sessions.set(token, player)
+  return session
+}
+
+// Compact state for a resumed player instead of the full room payload
+function catchUpMessage(room, player) {
+  const session = playerSessions.get(player)
+  const question = room.state === 'question' ? room.quiz.questions[room.currentQuestion] : null
+  const buzzer = question?.type === 'buzzer' ? room.buzzer : null
+
+  return {
+    sessionToken: session.token,
+    playerId: player.id,
+    name: player.name,
+    score: player.score,
+    state: room.state,
+    questionIndex: room.currentQuestion,
+    question,
+    answered: session.answered?.question === room.currentQuestion ? session.answered.result : null,
+    rank: room.ranking.rank(player),
+    total: room.players.length,
+    buzzer: buzzer && {
+      round: buzzer.round,
+      locked: Boolean(buzzer.winner) || buzzer.lockedOut.has(player.id),
+      winner: buzzer.winner
+    }
+  }
+}
+
+// A player reclaimed by a new socket (resumed session or restored after a restart)
+function rekeyPlayer(room, player, playerId) {
+  room.playerIndex.delete(player.id)
+  if (room.buzzer?.lockedOut.delete(player.id)) room.buzzer.lockedOut.add(playerId)
+  if (room.buzzer?.winner?.playerId === player.id) room.buzzer.winner.playerId = playerId
+  player.id = playerId
+  room.playerIndex.set(playerId, player)
+}
+
+// Reverse index socket id → Map(roomCode → 'host' | 'player'), so
+// disconnects only touch the rooms that socket actually belongs to
+const socketRooms = new Map()
+
+function socketRole(socketId, roomCode) {
+  return socketRooms.get(socketId)?.get(roomCode)
+}
+
+function trackSocket(socketId, roomCode, role) {
+  let memberships = socketRooms.get(socketId)
+  if (!memberships) {
+    memberships = new Map()
+    socketRooms.set(socketId, memberships)
+  }
+  memberships.set(roomCode, role)
+}
+
+function untrackSocket(socketId, roomCode) {
+  const memberships = socketRooms.get(socketId)
+  if (!memberships) return
+
+  memberships.delete(roomCode)
+  if (memberships.size === 0) socketRooms.delete(socketId)
+}
+
+// Leaderboard stream: spectators get one full snapshot ('leaderboard-update')
+// on join or resync, afterwards only changed entries ('leaderboard-delta')
+// with a sequence number, coalesced to at most LEADERBOARD_RATE per second.
+// Deltas go to the room's leaderboard channel only (sockets that sent
+// join-leaderboard), players learn their rank from the results
+const LEADERBOARD_RATE = Number(process.env.LEADERBOARD_RATE) || 4
+
+function leaderboardChannel(roomCode) {
+  return `leaderboard:${roomCode}`
+}
+
+function createLeaderboard() {
+  return { seq: 0, entries: new Map(), timer: null, lastFlush: 0 }
+}
+
+function leaderboardSnapshot(room) {
+  return {
+    players: room.players,
+    quizTitle: room.quiz?.title || 'Quiz',
+    seq: room.leaderboard.seq
+  }
+}
+
+function markLeaderboardDirty(roomCode, room) {
+  const board = room.leaderboard
+  if (board.timer) return
+
+  const delay = Math.max(0, board.lastFlush + 1000 / LEADERBOARD_RATE - Date.now())
+  board.timer = setTimeout(() => flushLeaderboard(roomCode, room), delay)
+}
+
+function flushLeaderboard(roomCode, room) {
+  const board = room.leaderboard
+  board.timer = null
+  board.lastFlush = Date.now()
+  if (gameRooms.get(roomCode) !== room) return
+
+  // Same order as the clients: by score, ties in join order
+  const ranked = room.ranking.top()
+  const changes = []
+  const seen = new Set()
+
+  ranked.forEach((player, index) => {
+    const rank = index + 1
+    const previous = board.entries.get(player.id)
+    seen.add(player.id)
+    if (previous && previous.score === player.score && previous.rank === rank) return
+
+    const change = { id: player.id, score: player.score, rank, rankDelta: previous ? previous.rank - rank : 0 }
+    if (!previous) {
+      change.name = player.name
+      change.avatar = player.avatar
+    }
+    changes.push(change)
+    board.entries.set(player.id, { score: player.score, rank })
+  })
+
+  const removed = []
+  for (const playerId of board.entries.keys()) {
+    if (!seen.has(playerId)) {
+      removed.push(playerId)
+      board.entries.delete(playerId)
+    }
+  }
+
+  if (changes.length === 0 && removed.length === 0) return
+  // Nobody watching: entries stay current, a later spectator starts from a snapshot
+  // (also keeps the cluster adapter from relaying deltas for rooms without spectators)
+  if (!io.sockets.adapter.rooms.has(leaderboardChannel(roomCode))) return
+
+  board.seq++
+  io.to(leaderboardChannel(roomCode)).emit('leaderboard-delta', {
+    seq: board.seq,
+    total: room.players.length,
+    changes,
+    removed
+  })
+}
+
+// Results ('show-results', 'game-over'): everyone gets the top RESULTS_TOP_K,
+// each player additionally their own rank and score, instead of the whole
+// sorted player list for every recipient
+const RESULTS_TOP_K = Number(process.env.RESULTS_TOP_K) || 10
+
+function emitResults(roomCode, room, event) {
+  const top = room.ranking.top(RESULTS_TOP_K)
+  const total = room.players.length
+
+  room.ranking.top().forEach((player, index) => {
+    io.to(player.id).emit(event, { players: top, total, rank: index + 1, score: player.score })
+  })
+  // Host and spectators
+  io.to(roomCode).except(room.players.map(p => p.id)).emit(event, { players: top, total })
+}
+
+// Speed bonus for the fastest correct answers of a question (rank 1, 2, 3)
+const SPEED_BONUS = [50, 30, 10]
+
+// Insert a correct answer into the question's top-K list (ordered by
+// responseTime, ties keep submission order like a stable sort) via binary
+// search and return the player's rank, or 0 if they are not among the top K
+function rankCorrectAnswer(fastest, entry) {
+  let low = 0
+  let high = fastest.length
+  while (low < high) {
+    const mid = (low + high) >> 1
+    if (fastest[mid].responseTime <= entry.responseTime) low = mid + 1
+    else high = mid
+  }
+
+  if (low < SPEED_BONUS.length) {
+    fastest.splice(low, 0, entry)
+    fastest.length = Math.min(fastest.length, SPEED_BONUS.length)
+  }
+
+  return fastest.findIndex(a => a.playerId === entry.playerId) + 1
+}
+
+// Buzzer rounds are arbitrated here instead of by the host UI: the first
+// press of an armed round wins (event loop order, reaction time from the
+// monotonic clock), one room-wide 'buzzer-locked' tells everyone, later
+// presses only get a small 'buzzer-rejected' back to the sender.
+// Round winners stay locked out until the host re-arms them explicitly.
+function armBuzzer(room, playerIds = 'all') {
+  const lockedOut = playerIds === 'all' ? new Set() : new Set(room.buzzer?.lockedOut)
+  if (playerIds !== 'all') playerIds.forEach(id => lockedOut.delete(id))
+
+  room.buzzer = {
+    round: (room.buzzer?.round || 0) + 1,
+    armedAt: process.hrtime.bigint(),
+    lockedOut,
+    winner: null
+  }
+  return room.buzzer
+}
+
+function isBuzzerQuestion(room) {
+  return room.state === 'question' && room.quiz.questions[room.currentQuestion]?.type === 'buzzer'
+}
+
+// Question broadcast: asset references only, plus the next question's
+// assets so clients can prefetch them while this question is running
+function questionMessage(room, index) {
+  const question = room.quiz.questions[index]
+  return {
+    question,
+    nextAssets: questionAssets(room.quiz.questions[index + 1]),
+    ...(question?.type === 'buzzer' && { buzzerRound: armBuzzer(room).round })
+  }
+}
+
+// TTL-based eviction on one timer wheel (see eviction.js). Each room has a
+// single "room:<code>" deadline that depends on its state: the host grace
+// period while the host is gone, FINISHED_ROOM_TTL_MS after the game is
+// over, IDLE_LOBBY_TTL_MS in the lobby (refreshed by joins), none while a
+// game is running. Disconnected players are removed after PLAYER_TTL_MS.
+const HOST_GRACE_MS = Number(process.env.HOST_GRACE_MS) || 60 * 1000
+const PLAYER_TTL_MS = Number(process.env.PLAYER_TTL_MS) || 30 * 60 * 1000
+const FINISHED_ROOM_TTL_MS = Number(process.env.FINISHED_ROOM_TTL_MS) || 15 * 60 * 1000
+const IDLE_LOBBY_TTL_MS = Number(process.env.IDLE_LOBBY_TTL_MS) || 60 * 60 * 1000
+
+const expiry = createTimerWheel({ tickMs: Number(process.env.EVICTION_TICK_MS) || 1000 })
+const evictions = { players: 0, abandoned: 0, finished: 0, idle: 0 }
+
+function sumEvictions(list) {
+  const total = { players: 0, abandoned: 0, finished: 0, idle: 0 }
+  for (const counts of list) {
+    for (const key in total) total[key] += counts?.[key] || 0
+  }
+  return total
+}
+
+// Remove a room and everything pointing at it (timers, counters, socket
+// memberships and channels, assets, journal). Used when a room is closed and
+// when create-room replaces a room with the same code.
+function teardownRoom(roomCode, room) {
+  expiry.cancel(`room:${roomCode}`)
+  for (const player of room.players) {
+    if (player.disconnected) expiry.cancel(`player:${roomCode}:${player.id}`)
+  }
+  clearTimeout(room.leaderboard.timer)
+
+  for (const socketId of io.sockets.adapter.rooms.get(roomCode) || []) {
+    if (socketRole(socketId, roomCode) === 'spectator') counters.spectators--
+    untrackSocket(socketId, roomCode)
+  }
+  io.in(roomCode).socketsLeave(roomCode)
+  io.in(leaderboardChannel(roomCode)).socketsLeave(leaderboardChannel(roomCode))
+
+  counters.players -= room.players.length
+  gameRooms.delete(roomCode)
+  assets.release(room.assets)
+  journal?.append('close', roomCode)
+}
+
+function closeRoom(roomCode, room, reason) {
+  if (gameRooms.get(roomCode) !== room) return
+
+  if (reason === 'abandoned') io.to(roomCode).emit('host-disconnected')
+  teardownRoom(roomCode, room)
+  evictions[reason]++
+}
+
+// Delete the room unless its host reconnects within the grace period
+function scheduleRoomCleanup(roomCode, room, graceMs) {
+  expiry.schedule(`room:${roomCode}`, graceMs, () => {
+    closeRoom(roomCode, room, 'abandoned')
+    console.log(`🏠 Room ${roomCode} closed - host did not reconnect within ${graceMs / 1000}s`)
+  })
+}
+
+// (Re)arm the room's TTL after a state change or lobby activity
+function scheduleRoomExpiry(roomCode, room) {
+  if (room.hostDisconnectedAt) return // grace period is running
+
+  const key = `room:${roomCode}`
+  const reason = room.state === 'final' ? 'finished' : room.state === 'lobby' ? 'idle' : null
+  if (!reason) {
+    expiry.cancel(key)
+    return
+  }
+
+  const ttlMs = reason === 'finished' ? FINISHED_ROOM_TTL_MS : IDLE_LOBBY_TTL_MS
+  expiry.schedule(key, ttlMs, () => {
+    closeRoom(roomCode, room, reason)
+    console.log(`🧹 Room ${roomCode} evicted (${reason}, ${ttlMs / 1000}s)`)
+  })
+}
+
+function schedulePlayerEviction(roomCode, room, player) {
+  expiry.schedule(`player:${roomCode}:${player.id}`, PLAYER_TTL_MS, () => {
+    if (gameRooms.get(roomCode) !== room || !player.disconnected) return
+
+    removePlayer(room, player.id)
+    if (player.restored) room.restoredPlayers--
+    journal?.append('leave', roomCode, { id: player.id })
+    evictions.players++
+
+    io.to(roomCode).emit('player-left', {
+      playerName: player.name,
+      players: room.players
+    })
+    markLeaderboardDirty(roomCode, room)
+  })
+}
+
+// Work to finish before Render stops the process (SIGTERM) or on Ctrl+C.
+// The signal handlers are only installed once something registers a hook.
+const shutdownHooks = []
+
+function onShutdown(hook) {
+  if (shutdownHooks.length === 0) {
+    for (const signal of ['SIGTERM', 'SIGINT']) {
+      process.on(signal, async () => {
+        await Promise.allSettled(shutdownHooks.map(fn => fn()))
+        process.exit(0)
+      })
+    }
+  }
+  shutdownHooks.push(hook)
+}
+
+// Optional persistence: with JOURNAL_DIR set, state changes are journaled
+// (see journal.js) and rooms are restored before the server accepts
+// connections. Restored rooms wait for their host like after a host
+// disconnect, players reclaim their entry (and score) by name.
+const RESTORE_GRACE_MS = Number(process.env.JOURNAL_RESTORE_GRACE_MS) || 5 * 60 * 1000
+
+function snapshotRooms() {
+  return [...gameRooms].map(([code, room]) => ({
+    code,
+    quiz: room.quiz,
+    state: room.state,
+    currentQuestion: room.currentQuestion,
+    players: room.players.map(p => ({
+      id: p.id,
+      name: p.name,
+      avatar: p.avatar,
+      score: p.score,
+      token: playerSessions.get(p)?.token
+    }))
+  }))
+}
+
+function restoreRooms(rooms) {
+  const now = Date.now()
+  for (const [roomCode, saved] of rooms) {
+    const { quiz, ids } = assets.internQuiz(saved.quiz)
+    assets.retain(ids)
+    const room = {
+      host: null,
+      quiz,
+      assets: ids,
+      players: [],
+      playerIndex: new Map(),
+      playerNames: new Set(),
+      nameSuffixes: new Map(),
+      state: saved.state,
+      currentQuestion: saved.currentQuestion,
+      questionAnswers: {},
+      fastestAnswers: {},
+      leaderboard: createLeaderboard(),
+      ranking: createScoreIndex(),
+      buzzer: null,
+      sessions: new Map(),
+      restoredPlayers: saved.players.length,
+      hostDisconnectedAt: now
+    }
+    gameRooms.set(roomCode, room)
+    // The buzzer round is not journaled: open a fresh one, catch-ups send it
+    if (isBuzzerQuestion(room)) armBuzzer(room)
+    saved.players.forEach(({ token, ...p }) => {
+      const player = { ...p, disconnected: true, disconnectedAt: now, restored: true }
+      addPlayer(room, player)
+      if (token) createSession(room, player, token)
+      schedulePlayerEviction(roomCode, room, player)
+    })
+    scheduleRoomCleanup(roomCode, room, RESTORE_GRACE_MS)
+  }
+}
+
+const journal = process.env.JOURNAL_DIR
+  ? createJournal(process.env.JOURNAL_DIR, { snapshot: snapshotRooms })
+  : null
+
+if (journal) {
+  const { restored } = journal
+  const started = process.hrtime.bigint()
+  restoreRooms(restored.rooms)
+  const ms = restored.ms + Number(process.hrtime.bigint() - started) / 1e6
+  console.log(`💾 Journal: ${restored.rooms.size} rooms, ${counters.players} players restored from ${process.env.JOURNAL_DIR} in ${ms.toFixed(1)} ms (${restored.records} records replayed)`)
+  journal.compact()
+
+  // Write the last batch before the process exits
+  onShutdown(() => journal.close())
+}
+
+// Optional traffic recording for replay-trace.py (see trace.js)
+const trace = process.env.TRACE_FILE
+  ? createTraceRecorder(process.env.TRACE_FILE, { version: '1.2.0' })
+  : null
+
+// Buffered log lines must not get lost on a deploy
+if (logging.stats().mode !== 'sync') onShutdown(() => logging.flush())
+
+if (trace) {
+  onShutdown(() => trace.close())
+  console.log(`🎞️  Recording socket trace to ${process.env.TRACE_FILE}`)
+}
+
 io.on('connection', (socket) => {
-  console.log('🟢 Client connected:', socket.id)
+  metrics.instrumentSocket(socket)
+  trace?.attach(socket)
+  counters.connections++
+  const wire = wireFormat(socket)
+  if (wire === 'msgpack') counters.msgpackConnections++
+  console.log('🟢 Client connected:', socket.id, wire === 'msgpack' ? '(msgpack)' : '')
 
   // Host creates a room
   socket.on('create-room', (data) => {
@@ -103,35 +658,51 @@ io.on('connection', (socket) => {
       // Host is reconnecting! Reuse existing room
       console.log(`🔄 Host reconnecting to existing room: ${roomCode}`)
 
-      // Clear cleanup timer
-      if (existingRoom.cleanupTimer) {
-        clearTimeout(existingRoom.cleanupTimer)
-        delete existingRoom.cleanupTimer
-      }
-
-      // Update host socket ID and clear disconnection flag
+      // Update host socket ID and clear disconnection flag, grace period → state TTL
       existingRoom.host = socket.id
       delete existingRoom.hostDisconnectedAt
+      scheduleRoomExpiry(roomCode, existingRoom)
+      trackSocket(socket.id, roomCode, 'host')
 
       socket.join(roomCode)
       socket.emit('room-created', {
         roomCode,
         players: existingRoom.players,
-        reconnected: true
+        reconnected: true,
+        buzzerRound: isBuzzerQuestion(existingRoom) ? existingRoom.buzzer?.round : undefined
       })
 
       console.log(`✅ Host reconnected to room ${roomCode} with ${existingRoom.players.length} players`)
     } else {
-      // Create new room
+      // Create new room (replaces a room with the same code, not counted as an eviction)
+      if (existingRoom) teardownRoom(roomCode, existingRoom)
+
+      // Inline images move into the asset store, the room keeps references
+      const { quiz, ids } = assets.internQuiz(quizData)
+      assets.retain(ids)
+
       gameRooms.set(roomCode, {
         host: socket.id,
-        quiz: quizData,
+        quiz,
+        assets: ids,
         players: [],
+        playerIndex: new Map(),
+        playerNames: new Set(),
+        nameSuffixes: new Map(),
         state: 'lobby',
         currentQuestion: 0,
-        questionAnswers: {}
+        questionAnswers: {},
+        fastestAnswers: {},
+        leaderboard: createLeaderboard(),
+        ranking: createScoreIndex(),
+        buzzer: null,
+        sessions: new Map(),
+        restoredPlayers: 0
       })
+      journal?.append('create', roomCode, { quiz })
+      scheduleRoomExpiry(roomCode, gameRooms.get(roomCode))
 
+      trackSocket(socket.id, roomCode, 'host')
       socket.join(roomCode)
       socket.emit('room-created', { roomCode })
       console.log(`🏠 Room created: ${roomCode} by ${socket.id}`)
@@ -140,7 +711,7 @@ io.on('connection', (socket) => {
 
   // Player joins room
   socket.on('join-room', (data) => {
-    const { roomCode, playerName, playerAvatar } = data
+    const { roomCode, playerName, playerAvatar, sessionToken } = data
     const room = gameRooms.get(roomCode)
 
     if (!room) {
@@ -148,11 +719,46 @@ io.on('connection', (socket) => {
       return
     }
 
-    // Check if player already exists (reconnection) - only by socket.id
-    const existingPlayer = room.players.find(p => p.id === socket.id)
+    // Reconnect with a new socket id: the session token identifies the player
+    const resumedPlayer = sessionToken ? room.sessions.get(sessionToken) : null
+
+    // Check if player already exists (same socket joining twice)
+    const existingPlayer = !resumedPlayer && getPlayer(room, socket.id)
+
+    // After a server restart the restored players have stale socket ids - match by name
+    const restoredPlayer = !existingPlayer && room.restoredPlayers > 0
+      ? room.players.find(p => p.restored && p.name === playerName)
+      : null
+
+    if (resumedPlayer) {
+      const previousId = resumedPlayer.id
+      if (previousId !== socket.id) {
+        expiry.cancel(`player:${roomCode}:${previousId}`)
+        // The old socket may not have noticed the drop yet - it no longer speaks for the player
+        if (socketRole(previousId, roomCode) === 'player') untrackSocket(previousId, roomCode)
+        io.sockets.sockets.get(previousId)?.leave(roomCode)
+        rekeyPlayer(room, resumedPlayer, socket.id)
+        journal?.append('rekey', roomCode, { from: previousId, to: socket.id })
+
+        // Host only needs the new id, the room list is unchanged
+        io.to(room.host).emit('player-reconnected', { previousId, playerId: socket.id })
+        markLeaderboardDirty(roomCode, room)
+      }
+      if (resumedPlayer.restored) {
+        delete resumedPlayer.restored
+        room.restoredPlayers--
+      }
+      delete resumedPlayer.disconnected
+      delete resumedPlayer.disconnectedAt
+
+      if (socketRole(socket.id, roomCode) === 'spectator') counters.spectators--
+      trackSocket(socket.id, roomCode, 'player')
+      socket.join(roomCode)
+      socket.emit('session-resumed', catchUpMessage(room, resumedPlayer))
 
-    if (existingPlayer) {
-      // Reconnection - update socket ID but keep score
+      console.log(`🔁 Session resumed: ${resumedPlayer.name} (${previousId} → ${socket.id}) in room ${roomCode}`)
+    } else if (existingPlayer) {
+      // Same socket joining again - resend the room state
       existingPlayer.id = socket.id
       console.log(`🔄 Player reconnected: ${playerName} (${socket.id})`)
 
@@ -163,25 +769,39 @@ io.on('connection', (socket) => {
         state: room.state,
         players: room.players,
         question: room.state === 'question' ? room.quiz.questions[room.currentQuestion] : null,
-        reconnected: true
+        reconnected: true,
+        buzzerRound: isBuzzerQuestion(room) ? room.buzzer?.round : undefined,
+        sessionToken: playerSessions.get(existingPlayer)?.token
+      })
+    } else if (restoredPlayer) {
+      const previousId = restoredPlayer.id
+      expiry.cancel(`player:${roomCode}:${previousId}`)
+      rekeyPlayer(room, restoredPlayer, socket.id)
+      delete restoredPlayer.restored
+      delete restoredPlayer.disconnected
+      delete restoredPlayer.disconnectedAt
+      room.restoredPlayers--
+      journal?.append('rekey', roomCode, { from: previousId, to: socket.id })
+
+      if (socketRole(socket.id, roomCode) === 'spectator') counters.spectators--
+      trackSocket(socket.id, roomCode, 'player')
+      socket.join(roomCode)
+      markLeaderboardDirty(roomCode, room)
+
+      socket.emit('room-state', {
+        state: room.state,
+        players: room.players,
+        question: room.state === 'question' ? room.quiz.questions[room.currentQuestion] : null,
+        reconnected: true,
+        buzzerRound: isBuzzerQuestion(room) ? room.buzzer?.round : undefined,
+        sessionToken: (playerSessions.get(restoredPlayer) || createSession(room, restoredPlayer)).token
       })
+
+      console.log(`💾 Restored player reclaimed: ${playerName} (${socket.id}) in room ${roomCode}`)
     } else {
-      // New player - check for duplicate names
-      let finalPlayerName = playerName
-
-      // Check if exact name exists
-      const exactMatch = room.players.find(p => p.name === playerName)
-
-      if (exactMatch) {
-        // Find all players with this base name (including numbered versions)
-        const baseName = playerName.replace(/ #\d+$/, '') // Remove existing number if any
-        const similarNames = room.players.filter(p => {
-          return p.name === baseName || p.name.match(new RegExp(`^${baseName.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')} #\\d+$`))
-        })
-
-        // Add number suffix starting from 2
-        const nextNumber = similarNames.length + 1
-        finalPlayerName = `${baseName} #${nextNumber}`
+      // New player - duplicate names get a ` #N` suffix
+      const finalPlayerName = resolvePlayerName(room, playerName)
+      if (finalPlayerName !== playerName) {
         console.log(`⚠️  Duplicate name detected: ${playerName} → ${finalPlayerName}`)
       }
 
@@ -192,7 +812,12 @@ io.on('connection', (socket) => {
         score: 0
       }
 
-      room.players.push(player)
+      addPlayer(room, player)
+      const session = createSession(room, player)
+      journal?.append('join', roomCode, { id: player.id, name: player.name, avatar: player.avatar, token: session.token })
+      if (room.state === 'lobby') scheduleRoomExpiry(roomCode, room)
+      if (socketRole(socket.id, roomCode) === 'spectator') counters.spectators--
+      trackSocket(socket.id, roomCode, 'player')
       socket.join(roomCode)
 
       // Notify everyone
@@ -200,12 +825,14 @@ io.on('connection', (socket) => {
         player: player,
         players: room.players
       })
+      markLeaderboardDirty(roomCode, room)
 
       // Send room state to joining player
       socket.emit('room-state', {
         state: room.state,
         players: room.players,
-        lateJoin: room.state !== 'lobby'
+        lateJoin: room.state !== 'lobby',
+        sessionToken: session.token
       })
 
       console.log(`👤 Player joined: ${finalPlayerName} (${socket.id}) in room ${roomCode}`)
@@ -223,14 +850,24 @@ io.on('connection', (socket) => {
     }
 
     // Join room as spectator
-    socket.join(roomCode)
+    if (!socketRole(socket.id, roomCode)) {
+      trackSocket(socket.id, roomCode, 'spectator')
+      counters.spectators++
+    }
+    socket.join([roomCode, leaderboardChannel(roomCode)])
     console.log(`👁️  Spectator joined leaderboard: ${socket.id} in room ${roomCode}`)
 
     // Send current leaderboard state immediately
-    socket.emit('leaderboard-update', {
-      players: room.players,
-      quizTitle: room.quiz?.title || 'Quiz'
-    })
+    socket.emit('leaderboard-update', leaderboardSnapshot(room))
+  })
+
+  // Spectator missed a delta (sequence gap) - send a fresh snapshot
+  socket.on('leaderboard-resync', (data) => {
+    const { roomCode } = data
+    const room = gameRooms.get(roomCode)
+    if (!room) return
+
+    socket.emit('leaderboard-update', leaderboardSnapshot(room))
   })
 
   // Host starts game
@@ -242,12 +879,10 @@ io.on('connection', (socket) => {
 
     room.state = 'question'
     room.currentQuestion = 0
+    journal?.append('state', roomCode, { state: room.state, q: 0 })
+    scheduleRoomExpiry(roomCode, room)
 
-    const question = room.quiz.questions[0]
-
-    io.to(roomCode).emit('game-started', {
-      question: question
-    })
+    io.to(roomCode).emit('game-started', questionMessage(room, 0))
 
     console.log(`🎮 Game started in room ${roomCode}`)
   })
@@ -259,7 +894,7 @@ io.on('connection', (socket) => {
 
     if (!room) return
 
-    const player = room.players.find(p => p.id === socket.id)
+    const player = getPlayer(room, socket.id)
     if (!player) return
 
     const currentQuestion = room.quiz.questions[room.currentQuestion]
@@ -273,37 +908,37 @@ io.on('connection', (socket) => {
     }
 
     // Store answer with timestamp
-    room.questionAnswers[room.currentQuestion].push({
+    const answerEntry = {
       playerId: player.id,
       playerName: player.name,
       playerAvatar: player.avatar,
       correct: isCorrect,
       responseTime: responseTime,
       timestamp: Date.now()
-    })
+    }
+    room.questionAnswers[room.currentQuestion].push(answerEntry)
 
     // Calculate bonus points for speed (only if correct)
     let bonusPoints = 0
     if (isCorrect) {
-      const correctAnswers = room.questionAnswers[room.currentQuestion]
-        .filter(a => a.correct)
-        .sort((a, b) => a.responseTime - b.responseTime)
-
-      const rank = correctAnswers.findIndex(a => a.playerId === player.id) + 1
+      if (!room.fastestAnswers[room.currentQuestion]) {
+        room.fastestAnswers[room.currentQuestion] = []
+      }
 
-      if (rank === 1) bonusPoints = 50
-      else if (rank === 2) bonusPoints = 30
-      else if (rank === 3) bonusPoints = 10
+      const rank = rankCorrectAnswer(room.fastestAnswers[room.currentQuestion], answerEntry)
+      if (rank > 0) bonusPoints = SPEED_BONUS[rank - 1]
     }
 
     let totalPoints = 0
     if (isCorrect) {
       totalPoints = currentQuestion.points + bonusPoints
-      player.score += totalPoints
+      setPlayerScore(room, player, player.score + totalPoints)
+      journal?.append('score', roomCode, { id: player.id, s: player.score })
+      markLeaderboardDirty(roomCode, room)
     }
 
-    // Notify the player about their answer
-    socket.emit('answer-result', {
+    // Notify the player about their answer (kept for the catch-up after a reconnect)
+    const result = {
       correct: isCorrect,
       correctAnswer: currentQuestion.correctAnswer,
       points: isCorrect ? currentQuestion.points : 0,
@@ -311,7 +946,10 @@ io.on('connection', (socket) => {
       totalPoints: totalPoints,
       newScore: player.score,
       responseTime: responseTime
-    })
+    }
+    const session = playerSessions.get(player)
+    if (session) session.answered = { question: room.currentQuestion, result }
+    socket.emit('answer-result', result)
 
     // Notify host about player's answer
     io.to(room.host).emit('player-answered', {
@@ -327,23 +965,40 @@ io.on('connection', (socket) => {
 
   // Buzzer press
   socket.on('buzzer-press', (data) => {
-    const { roomCode } = data
+    const { roomCode, round } = data
     const room = gameRooms.get(roomCode)
 
     if (!room) return
 
-    const player = room.players.find(p => p.id === socket.id)
+    const player = getPlayer(room, socket.id)
     if (!player) return
 
-    // Notify host that player pressed buzzer
-    io.to(room.host).emit('buzzer-pressed', {
+    const pressedAt = process.hrtime.bigint()
+    const buzzer = room.buzzer
+
+    // Too late, locked out, or a press from an earlier round (old clients send no round)
+    if (!buzzer || buzzer.winner || !isBuzzerQuestion(room) || buzzer.lockedOut.has(player.id) ||
+        (round !== undefined && round !== buzzer.round)) {
+      socket.emit('buzzer-rejected', {
+        round: buzzer ? buzzer.round : null,
+        winnerId: buzzer?.winner ? buzzer.winner.playerId : null
+      })
+      return
+    }
+
+    buzzer.winner = {
       playerId: player.id,
       playerName: player.name,
       playerAvatar: player.avatar,
-      timestamp: Date.now()
-    })
+      timestamp: Date.now(),
+      reactionMs: Number(pressedAt - buzzer.armedAt) / 1e6
+    }
+    buzzer.lockedOut.add(player.id)
 
-    console.log(`🔔 Buzzer pressed by ${player.name} in room ${roomCode}`)
+    // One broadcast locks every buzzer and tells the host who won
+    io.to(roomCode).emit('buzzer-locked', { round: buzzer.round, ...buzzer.winner })
+
+    console.log(`🔔 Buzzer won by ${player.name} in room ${roomCode} (round ${buzzer.round}, ${buzzer.winner.reactionMs.toFixed(1)} ms)`)
   })
 
   // Award buzzer points (host only)
@@ -356,11 +1011,12 @@ io.on('connection', (socket) => {
       return
     }
 
-    const player = room.players.find(p => p.id === playerId)
+    const player = getPlayer(room, playerId)
     if (!player) return
 
     // Award points to player
-    player.score += points
+    setPlayerScore(room, player, player.score + points)
+    journal?.append('score', roomCode, { id: player.id, s: player.score })
 
     // Notify the player about their points
     io.to(playerId).emit('buzzer-points-awarded', {
@@ -375,11 +1031,8 @@ io.on('connection', (socket) => {
       newScore: player.score
     })
 
-    // Update leaderboard for spectators
-    io.to(roomCode).emit('leaderboard-update', {
-      players: room.players,
-      quizTitle: room.quiz?.title || 'Quiz'
-    })
+    // Update leaderboard for spectators (coalesced delta)
+    markLeaderboardDirty(roomCode, room)
 
     console.log(`${points} points awarded to ${player.name} in room ${roomCode}`)
   })
@@ -391,11 +1044,7 @@ io.on('connection', (socket) => {
 
     if (!room || room.host !== socket.id) return
 
-    const sortedPlayers = [...room.players].sort((a, b) => b.score - a.score)
-
-    io.to(roomCode).emit('show-results', {
-      players: sortedPlayers
-    })
+    emitResults(roomCode, room, 'show-results')
   })
 
   // Host advances to next question
@@ -409,19 +1058,13 @@ io.on('connection', (socket) => {
 
     if (room.currentQuestion < room.quiz.questions.length) {
       room.state = 'question'
-      const question = room.quiz.questions[room.currentQuestion]
-
-      io.to(roomCode).emit('next-question', {
-        question: question
-      })
+      io.to(roomCode).emit('next-question', questionMessage(room, room.currentQuestion))
     } else {
       room.state = 'final'
-      const sortedPlayers = [...room.players].sort((a, b) => b.score - a.score)
-
-      io.to(roomCode).emit('game-over', {
-        players: sortedPlayers
-      })
+      emitResults(roomCode, room, 'game-over')
+      scheduleRoomExpiry(roomCode, room)
     }
+    journal?.append('state', roomCode, { state: room.state, q: room.currentQuestion })
   })
 
   // Adjust player points (host only)
@@ -434,11 +1077,12 @@ io.on('connection', (socket) => {
       return
     }
 
-    const player = room.players.find(p => p.id === playerId)
+    const player = getPlayer(room, playerId)
     if (!player) return
 
     // Adjust points (can be negative)
-    player.score = Math.max(0, player.score + points)
+    setPlayerScore(room, player, Math.max(0, player.score + points))
+    journal?.append('score', roomCode, { id: player.id, s: player.score })
 
     // Notify everyone in the room about the score update
     io.to(roomCode).emit('player-score-updated', {
@@ -447,11 +1091,8 @@ io.on('connection', (socket) => {
       newScore: player.score
     })
 
-    // Update leaderboard for spectators
-    io.to(roomCode).emit('leaderboard-update', {
-      players: room.players,
-      quizTitle: room.quiz?.title || 'Quiz'
-    })
+    // Update leaderboard for spectators (coalesced delta)
+    markLeaderboardDirty(roomCode, room)
 
     console.log(`Points adjusted for ${player.name}: ${points > 0 ? '+' : ''}${points} (new score: ${player.score})`)
   })
@@ -466,24 +1107,18 @@ io.on('connection', (socket) => {
       return
     }
 
+    // Re-arm the round: 'all' clears every lock-out, a list only those players'
+    const buzzer = armBuzzer(room, playerIds)
+    io.to(roomCode).emit('buzzer-unlocked', {
+      round: buzzer.round,
+      playerIds,
+      lockedOut: [...buzzer.lockedOut]
+    })
+
     if (playerIds === 'all') {
-      // Unlock all players' buzzers
-      room.players.forEach(player => {
-        io.to(player.id).emit('buzzer-unlocked', {
-          playerId: player.id,
-          playerIds: 'all'
-        })
-      })
-      console.log(`🔓 All buzzers unlocked in room ${roomCode}`)
+      console.log(`🔓 All buzzers unlocked in room ${roomCode} (round ${buzzer.round})`)
     } else {
-      // Unlock specific players
-      playerIds.forEach(playerId => {
-        io.to(playerId).emit('buzzer-unlocked', {
-          playerId: playerId,
-          playerIds: playerIds
-        })
-      })
-      console.log(`🔓 Buzzers unlocked for ${playerIds.length} players in room ${roomCode}`)
+      console.log(`🔓 Buzzer round ${buzzer.round} in room ${roomCode}, ${playerIds.length} players re-armed, ${buzzer.lockedOut.size} locked out`)
     }
   })
 
@@ -501,16 +1136,23 @@ io.on('connection', (socket) => {
     room.state = 'lobby'
     room.currentQuestion = 0
     room.questionAnswers = {}
+    room.fastestAnswers = {}
+    room.buzzer = null
 
     // Reset all player scores
     room.players.forEach(player => {
-      player.score = 0
+      setPlayerScore(room, player, 0)
+      const session = playerSessions.get(player)
+      if (session) session.answered = null
     })
+    journal?.append('restart', roomCode)
+    scheduleRoomExpiry(roomCode, room)
 
     // Notify all players about restart
     io.to(roomCode).emit('game-restarted', {
       players: room.players
     })
+    markLeaderboardDirty(roomCode, room)
 
     console.log(`🔄 Game restarted in room ${roomCode}`)
   })
@@ -523,17 +1165,17 @@ io.on('connection', (socket) => {
     if (!room) return
 
     // Remove player from room
-    const playerIndex = room.players.findIndex(p => p.id === socket.id)
-    if (playerIndex !== -1) {
-      const player = room.players[playerIndex]
-      room.players.splice(playerIndex, 1)
-
+    const player = removePlayer(room, socket.id)
+    if (player) {
+      journal?.append('leave', roomCode, { id: player.id })
+      untrackSocket(socket.id, roomCode)
       socket.leave(roomCode)
 
       io.to(roomCode).emit('player-left', {
         playerName: player.name,
         players: room.players
       })
+      markLeaderboardDirty(roomCode, room)
 
       console.log(`👤 Player left: ${player.name} from room ${roomCode}`)
     }
@@ -542,35 +1184,39 @@ io.on('connection', (socket) => {
   // Disconnect
   socket.on('disconnect', () => {
     console.log('🔴 Client disconnected:', socket.id)
+    counters.connections--
+    if (wire === 'msgpack') counters.msgpackConnections--
+
+    const memberships = socketRooms.get(socket.id)
+    if (!memberships) return
+    socketRooms.delete(socket.id)
+
+    // Only the rooms this socket hosted, played in or watched
+    for (const [roomCode, role] of memberships) {
+      if (role === 'spectator') {
+        counters.spectators--
+        continue
+      }
 
-    // Check if disconnected client was a host
-    for (const [roomCode, room] of gameRooms.entries()) {
-      if (room.host === socket.id) {
+      const room = gameRooms.get(roomCode)
+      if (!room) continue
+
+      if (role === 'host' && room.host === socket.id) {
         // Host disconnected - mark for cleanup but keep room alive for reconnection
-        console.log(`⚠️  Host disconnected from room ${roomCode} - keeping room alive for 60s`)
+        console.log(`⚠️  Host disconnected from room ${roomCode} - keeping room alive for ${HOST_GRACE_MS / 1000}s`)
 
-        // Don't delete room immediately - set a cleanup timer instead
+        // Don't delete room immediately - the grace period replaces the room's TTL
         room.hostDisconnectedAt = Date.now()
+        scheduleRoomCleanup(roomCode, room, HOST_GRACE_MS)
 
-        // Set cleanup timer (60 seconds grace period for host reconnection)
-        room.cleanupTimer = setTimeout(() => {
-          // Check if host reconnected in the meantime
-          if (gameRooms.has(roomCode) && gameRooms.get(roomCode).hostDisconnectedAt) {
-            // Host never reconnected - delete room
-            io.to(roomCode).emit('host-disconnected')
-            gameRooms.delete(roomCode)
-            console.log(`🏠 Room ${roomCode} closed - host did not reconnect within 60s`)
-          }
-        }, 60000) // 60 second grace period
-
-      } else {
+      } else if (role === 'player') {
         // Player disconnected - keep them in the room for potential reconnection
-        const playerIndex = room.players.findIndex(p => p.id === socket.id)
-        if (playerIndex !== -1) {
-          const player = room.players[playerIndex]
-          // Mark player as disconnected but don't remove
+        const player = getPlayer(room, socket.id)
+        if (player) {
+          // Mark player as disconnected, removed after PLAYER_TTL_MS
           player.disconnected = true
           player.disconnectedAt = Date.now()
+          schedulePlayerEviction(roomCode, room, player)
 
           console.log(`⚠️  Player ${player.name} disconnected from room ${roomCode} - marked for reconnection`)
         }
@@ -579,8 +1225,26 @@ io.on('connection', (socket) => {
   })
 })
 
-httpServer.listen(PORT, () => {
-  console.log(`🚀 WebSocket server running on port ${PORT}`)
-  console.log(`📍 Environment: ${process.env.NODE_ENV || 'development'}`)
-  console.log(`🌐 Ready to accept connections`)
-})
+// Cluster mode (node cluster.js): the primary owns the port and hands connections over
+const clusterWorker = process.env.CLUSTER_WORKER
+  ? setupWorker({
+      httpServer,
+      io,
+      localStats: () => ({
+        pid: process.pid,
+        rooms: gameRooms.size,
+        players: counters.players,
+        spectators: counters.spectators,
+        connections: counters.connections,
+        evictions
+      })
+    })
+  : null
+
+if (!clusterWorker) {
+  httpServer.listen(PORT, () => {
+    console.log(`🚀 WebSocket server running on port ${PORT}`)
+    console.log(`📍 Environment: ${process.env.NODE_ENV || 'development'}`)
+    console.log(`🌐 Ready to accept connections`)
+  })
+}
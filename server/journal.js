@@ -0,0 +1,212 @@
+// Optional append-only room journal (enabled with JOURNAL_DIR).
+// Handlers only push a compact record into memory, a timer appends the batch
+// to journal-<gen>.ndjson. Periodic compaction writes snapshot.json (all rooms
+// at one point in time) and starts a new journal generation, so startup only
+// replays one snapshot plus the records written after it.
+//
+// Records (r = room code):
+//   create  { r, quiz }            room created or replaced
+//   join    { r, id, name, avatar, token }   token = session token for resuming
+//   leave   { r, id }
+//   rekey   { r, from, to }        player reclaimed by a new socket (resume or restore)
+//   score   { r, id, s }           absolute score, replaying twice is harmless
+//   state   { r, state, q }        game state and current question index
+//   restart { r }                  scores back to 0, lobby
+//   close   { r }                  room deleted
+//
+// Writes are not fsynced: the journal survives a crashed or killed process,
+// not a crashed machine.
+
+import fs from 'fs'
+import path from 'path'
+
+const SNAPSHOT_FILE = 'snapshot.json'
+const JOURNAL_FILE = /^journal-(\d+)\.ndjson$/
+
+function journalPath(dir, gen) {
+  return path.join(dir, `journal-${gen}.ndjson`)
+}
+
+// Apply one record to plain room states (Map room code → { quiz, state, currentQuestion, players })
+export function applyRecord(rooms, record) {
+  const { t, r } = record
+  if (t === 'create') {
+    rooms.set(r, { quiz: record.quiz, state: 'lobby', currentQuestion: 0, players: [] })
+    return
+  }
+
+  const room = rooms.get(r)
+  if (!room) return
+
+  switch (t) {
+    case 'join':
+      room.players.push({ id: record.id, name: record.name, avatar: record.avatar, score: 0, token: record.token })
+      break
+    case 'leave':
+      room.players = room.players.filter(p => p.id !== record.id)
+      break
+    case 'rekey': {
+      const player = room.players.find(p => p.id === record.from)
+      if (player) player.id = record.to
+      break
+    }
+    case 'score': {
+      const player = room.players.find(p => p.id === record.id)
+      if (player) player.score = record.s
+      break
+    }
+    case 'state':
+      room.state = record.state
+      room.currentQuestion = record.q
+      break
+    case 'restart':
+      room.state = 'lobby'
+      room.currentQuestion = 0
+      room.players.forEach(p => { p.score = 0 })
+      break
+    case 'close':
+      rooms.delete(r)
+      break
+  }
+}
+
+// Read snapshot + newer journal generations. A torn last line (process
+// killed mid-write) is skipped.
+export function loadJournal(dir) {
+  const started = process.hrtime.bigint()
+  const rooms = new Map()
+  let gen = 0
+  let records = 0
+  let skipped = 0
+
+  const snapshotPath = path.join(dir, SNAPSHOT_FILE)
+  if (fs.existsSync(snapshotPath)) {
+    const snapshot = JSON.parse(fs.readFileSync(snapshotPath, 'utf8'))
+    gen = snapshot.gen
+    for (const room of snapshot.rooms) rooms.set(room.code, room)
+  }
+
+  const generations = fs.readdirSync(dir)
+    .map(name => JOURNAL_FILE.exec(name))
+    .filter(match => match && Number(match[1]) >= gen)
+    .map(match => Number(match[1]))
+    .sort((a, b) => a - b)
+
+  for (const g of generations) {
+    for (const line of fs.readFileSync(journalPath(dir, g), 'utf8').split('\n')) {
+      if (!line) continue
+      try {
+        applyRecord(rooms, JSON.parse(line))
+        records++
+      } catch {
+        skipped++
+      }
+    }
+  }
+
+  return {
+    rooms,
+    gen: generations.length ? generations[generations.length - 1] : gen,
+    records,
+    skipped,
+    ms: Number(process.hrtime.bigint() - started) / 1e6
+  }
+}
+
+export function createJournal(dir, {
+  snapshot,
+  flushMs = 50,
+  compactMs = 30000,
+  compactRecords = 20000
+}) {
+  fs.mkdirSync(dir, { recursive: true })
+  const restored = loadJournal(dir)
+
+  let gen = restored.gen + 1
+  let fd = fs.openSync(journalPath(dir, gen), 'a')
+  let pending = []
+  let flushTimer = null
+  let sinceSnapshot = restored.records
+  let compacting = false
+  const stats = { appended: 0, flushes: 0, snapshots: 0, lastSnapshotMs: 0 }
+
+  function append(t, r, data) {
+    pending.push(JSON.stringify({ t, r, ...data }))
+    sinceSnapshot++
+    stats.appended++
+    if (!flushTimer) flushTimer = setTimeout(flush, flushMs)
+    if (sinceSnapshot >= compactRecords) setImmediate(compact)
+  }
+
+  function flush() {
+    if (flushTimer) {
+      clearTimeout(flushTimer)
+      flushTimer = null
+    }
+    if (pending.length === 0) return
+
+    fs.writeSync(fd, pending.join('\n') + '\n')
+    pending = []
+    stats.flushes++
+  }
+
+  // Everything up to this tick goes into the old generation, the snapshot
+  // reflects exactly that state, later records go into the new one
+  async function compact() {
+    if (compacting || sinceSnapshot === 0) return
+    compacting = true
+
+    try {
+      const started = process.hrtime.bigint()
+      flush()
+      fs.closeSync(fd)
+      gen++
+      fd = fs.openSync(journalPath(dir, gen), 'a')
+      sinceSnapshot = 0
+      const body = JSON.stringify({ gen, savedAt: new Date().toISOString(), rooms: snapshot() })
+
+      const target = path.join(dir, SNAPSHOT_FILE)
+      await fs.promises.writeFile(target + '.tmp', body)
+      await fs.promises.rename(target + '.tmp', target)
+
+      for (const name of await fs.promises.readdir(dir)) {
+        const match = JOURNAL_FILE.exec(name)
+        if (match && Number(match[1]) < gen) await fs.promises.unlink(path.join(dir, name))
+      }
+
+      stats.snapshots++
+      stats.lastSnapshotMs = Number(process.hrtime.bigint() - started) / 1e6
+    } catch (error) {
+      console.error('❌ Journal compaction failed:', error.message)
+    } finally {
+      compacting = false
+    }
+  }
+
+  // Sync flush for shutdown (SIGTERM on Render)
+  function close() {
+    flush()
+    fs.closeSync(fd)
+  }
+
+  const compactTimer = setInterval(compact, compactMs)
+  compactTimer.unref()
+
+  return {
+    restored,
+    append,
+    flush,
+    compact,
+    close,
+    stats: () => ({
+      ...stats,
+      gen,
+      pending: pending.length,
+      sinceSnapshot,
+      recoveryMs: Number(restored.ms.toFixed(2)),
+      restoredRooms: restored.rooms.size,
+      replayedRecords: restored.records,
+      skippedRecords: restored.skipped
+    })
+  }
+}
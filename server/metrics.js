@@ -0,0 +1,120 @@
+// Metrics for the /metrics endpoint: per-event counts and handler latency
+// histograms plus totals for emitted messages and bytes.
+// Everything is updated incrementally, reading the endpoint never scans rooms.
+
+// Upper bounds of the latency buckets in milliseconds (last bucket is +Inf)
+const BUCKETS_MS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000]
+
+class Histogram {
+  constructor(buckets = BUCKETS_MS) {
+    this.buckets = buckets
+    this.counts = new Array(buckets.length + 1).fill(0)
+    this.count = 0
+    this.sum = 0
+    this.max = 0
+  }
+
+  observe(ms) {
+    let i = 0
+    while (i < this.buckets.length && ms > this.buckets[i]) i++
+    this.counts[i]++
+    this.count++
+    this.sum += ms
+    if (ms > this.max) this.max = ms
+  }
+
+  // Percentile estimate: upper bound of the bucket that contains it
+  percentile(p) {
+    if (this.count === 0) return null
+    const target = Math.ceil(this.count * p / 100)
+    let seen = 0
+    for (let i = 0; i < this.counts.length; i++) {
+      seen += this.counts[i]
+      if (seen >= target) return i < this.buckets.length ? this.buckets[i] : this.max
+    }
+    return this.max
+  }
+
+  toJSON() {
+    // [upper bound, count] pairs - object keys like "1" would be reordered
+    const buckets = this.buckets.map((bound, i) => [bound, this.counts[i]])
+    buckets.push(['+Inf', this.counts[this.buckets.length]])
+
+    return {
+      count: this.count,
+      sum: Number(this.sum.toFixed(3)),
+      mean: this.count ? Number((this.sum / this.count).toFixed(4)) : null,
+      max: Number(this.max.toFixed(3)),
+      p50: this.percentile(50),
+      p95: this.percentile(95),
+      p99: this.percentile(99),
+      buckets
+    }
+  }
+}
+
+export function createMetrics() {
+  const events = new Map()
+  const emitted = { messages: 0, bytes: 0 }
+  // Broadcasts hand the same encoded string to every recipient - measure it once
+  let lastPacket = null
+  let lastPacketBytes = 0
+
+  function eventStats(event) {
+    let stats = events.get(event)
+    if (!stats) {
+      stats = { count: 0, errors: 0, latency: new Histogram() }
+      events.set(event, stats)
+    }
+    return stats
+  }
+
+  // Wrap a socket event handler to count calls and time them
+  function timed(event, handler) {
+    const stats = eventStats(event)
+    return function (...args) {
+      const start = process.hrtime.bigint()
+      try {
+        return handler.apply(this, args)
+      } catch (error) {
+        stats.errors++
+        throw error
+      } finally {
+        stats.count++
+        stats.latency.observe(Number(process.hrtime.bigint() - start) / 1e6)
+      }
+    }
+  }
+
+  // Time every handler registered on this socket
+  function instrumentSocket(socket) {
+    const on = socket.on.bind(socket)
+    socket.on = (event, handler) => on(event, timed(event, handler))
+  }
+
+  // Count outgoing Engine.IO message packets (one per recipient)
+  function instrumentEngine(engine) {
+    engine.on('connection', (engineSocket) => {
+      engineSocket.on('packetCreate', (packet) => {
+        if (packet.type !== 'message') return
+
+        emitted.messages++
+        if (packet.data !== lastPacket) {
+          lastPacket = packet.data
+          lastPacketBytes = typeof packet.data === 'string' ? Buffer.byteLength(packet.data) : packet.data.byteLength
+        }
+        emitted.bytes += lastPacketBytes
+      })
+    })
+  }
+
+  function toJSON() {
+    const perEvent = {}
+    for (const [event, stats] of events) {
+      perEvent[event] = { count: stats.count, errors: stats.errors, latencyMs: stats.latency.toJSON() }
+    }
+    return { events: perEvent, emitted: { ...emitted } }
+  }
+
+  return { timed, instrumentSocket, instrumentEngine, toJSON }
+}
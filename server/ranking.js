@@ -0,0 +1,136 @@
+// Score-ordered index of a room's players.
+// Order is score descending, ties in join order - the same order as the
+// stable `[...players].sort((a, b) => b.score - a.score)` it replaces.
+// Backed by a treap (binary search tree with random heap priorities) whose
+// nodes know their subtree size, so insert, remove, re-score and
+// rank-of-player are O(log n) and the top K are read in O(K + log n).
+//
+// Scores are snapshotted in the nodes: after changing player.score call
+// update(player) so the index can find the old position and move it.
+
+function size(node) {
+  return node ? node.size : 0
+}
+
+function resize(node) {
+  node.size = 1 + size(node.left) + size(node.right)
+  return node
+}
+
+// < 0 if a ranks before b
+function compare(a, b) {
+  return b.score - a.score || a.seq - b.seq
+}
+
+// Split into [nodes before key, the rest]; inclusive also moves key itself left
+function split(node, key, inclusive) {
+  if (!node) return [null, null]
+  const c = compare(node, key)
+  if (c < 0 || (inclusive && c === 0)) {
+    const [left, right] = split(node.right, key, inclusive)
+    node.right = left
+    return [resize(node), right]
+  }
+  const [left, right] = split(node.left, key, inclusive)
+  node.left = right
+  return [left, resize(node)]
+}
+
+// All keys in `left` rank before all keys in `right`
+function merge(left, right) {
+  if (!left || !right) return left || right
+  if (left.priority > right.priority) {
+    left.right = merge(left.right, right)
+    return resize(left)
+  }
+  right.left = merge(left, right.left)
+  return resize(right)
+}
+
+export function createScoreIndex() {
+  let root = null
+  let nextSeq = 0
+  // player → node { player, score, seq, priority, size, left, right }
+  const nodes = new Map()
+
+  function insert(node) {
+    const [left, right] = split(root, node, false)
+    root = merge(merge(left, resize(node)), right)
+  }
+
+  function detach(node) {
+    const [left, rest] = split(root, node, false)
+    const [, right] = split(rest, node, true)
+    root = merge(left, right)
+    node.left = node.right = null
+  }
+
+  function add(player) {
+    if (nodes.has(player)) return update(player)
+    const node = { player, score: player.score, seq: nextSeq++, priority: Math.random(), size: 1, left: null, right: null }
+    nodes.set(player, node)
+    insert(node)
+  }
+
+  function remove(player) {
+    const node = nodes.get(player)
+    if (!node) return false
+    detach(node)
+    nodes.delete(player)
+    return true
+  }
+
+  // Re-position a player whose score changed; join order is kept for ties
+  function update(player) {
+    const node = nodes.get(player)
+    if (!node || node.score === player.score) return
+    detach(node)
+    node.score = player.score
+    insert(node)
+  }
+
+  // 1-based rank, 0 if the player is not indexed
+  function rank(player) {
+    const key = nodes.get(player)
+    if (!key) return 0
+    let before = 0
+    let node = root
+    while (node) {
+      const c = compare(node, key)
+      if (c === 0) return before + size(node.left) + 1
+      if (c < 0) {
+        before += size(node.left) + 1
+        node = node.right
+      } else {
+        node = node.left
+      }
+    }
+    return 0
+  }
+
+  // First `limit` players in rank order (in-order walk, stops early)
+  function top(limit = Infinity) {
+    const result = []
+    const stack = []
+    let node = root
+    while ((node || stack.length) && result.length < limit) {
+      while (node) {
+        stack.push(node)
+        node = node.left
+      }
+      node = stack.pop()
+      result.push(node.player)
+      node = node.right
+    }
+    return result
+  }
+
+  return {
+    add,
+    remove,
+    update,
+    rank,
+    top,
+    get size() { return size(root) }
+  }
+}
@@ -0,0 +1,75 @@
+// Optional socket trace recorder (enabled with TRACE_FILE=path.ndjson.gz).
+// Writes every inbound event with payload and every outbound event name per
+// socket as gzipped NDJSON, so real sessions can be replayed against the
+// server (replay-trace.py) and the outbound stream compared.
+//
+// Lines (t = ms since recording start, s = socket number in this trace):
+//   { v, started, version }                    header
+//   { t, s, k: 'c', id }                        connect (id = socket id, for payload remapping)
+//   { t, s, k: 'i', r, e, d }                   inbound event e with payload d, sender role r
+//   { t, s, k: 'o', e }                         outbound event e to this socket
+//   { t, s, k: 'x' }                            disconnect
+
+import fs from 'fs'
+import zlib from 'zlib'
+
+// The first event that gives a socket its role
+const ROLE_BY_EVENT = {
+  'create-room': 'host',
+  'join-room': 'player',
+  'join-leaderboard': 'spectator'
+}
+
+export function createTraceRecorder(file, { version, flushMs = 1000 } = {}) {
+  const gzip = zlib.createGzip()
+  const output = fs.createWriteStream(file)
+  gzip.pipe(output)
+
+  const started = performance.now()
+  let sockets = 0
+  let records = 0
+
+  function write(record) {
+    gzip.write(JSON.stringify(record) + '\n')
+    records++
+  }
+
+  write({ v: 1, started: new Date().toISOString(), version })
+
+  // Keep the compressed tail on disk in case the process gets killed
+  const flushTimer = setInterval(() => gzip.flush(), flushMs)
+  flushTimer.unref()
+
+  function attach(socket) {
+    const s = ++sockets
+    let role = null
+    const now = () => Math.round((performance.now() - started) * 10) / 10
+
+    write({ t: now(), s, k: 'c', id: socket.id })
+
+    socket.onAny((event, data) => {
+      role = role || ROLE_BY_EVENT[event] || null
+      write({ t: now(), s, k: 'i', r: role, e: event, d: data })
+    })
+    socket.onAnyOutgoing((event) => {
+      write({ t: now(), s, k: 'o', e: event })
+    })
+    socket.on('disconnect', () => {
+      write({ t: now(), s, k: 'x' })
+    })
+  }
+
+  function close() {
+    clearInterval(flushTimer)
+    return new Promise(resolve => {
+      output.on('close', resolve)
+      gzip.end()
+    })
+  }
+
+  return {
+    attach,
+    close,
+    stats: () => ({ file, sockets, records })
+  }
+}
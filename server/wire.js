@@ -0,0 +1,104 @@
+// Opt-in MessagePack wire format, negotiated per connection.
+// Clients that connect with ?wire=msgpack (src/socket.js with VITE_WIRE=msgpack)
+// get their packets encoded with socket.io-msgpack-parser, everyone else keeps
+// socket.io's JSON encoding, so old clients keep working unchanged.
+//
+//  - Decoder: text frames are JSON, binary frames MessagePack (unless the JSON
+//    decoder is waiting for the attachments of a binary event)
+//  - negotiateWire(): io.use() middleware, swaps the encoder of the connection
+//    before the CONNECT ack goes out
+//  - createWireAdapter(): broadcasts are encoded once per format present among
+//    the recipients instead of once for everyone
+
+import * as jsonParser from 'socket.io-parser'
+import * as msgpackParser from 'socket.io-msgpack-parser'
+
+const msgpackEncoder = new msgpackParser.Encoder()
+
+class Decoder {
+  constructor() {
+    this.listeners = new Set()
+    const forward = (packet) => this.listeners.forEach(listener => listener(packet))
+    this.json = new jsonParser.Decoder()
+    this.json.on('decoded', forward)
+    this.msgpack = new msgpackParser.Decoder()
+    this.msgpack.on('decoded', forward)
+  }
+
+  on(event, listener) {
+    if (event === 'decoded') this.listeners.add(listener)
+    return this
+  }
+
+  off(event, listener) {
+    if (event === 'decoded') {
+      if (listener) this.listeners.delete(listener)
+      else this.listeners.clear()
+    }
+    return this
+  }
+
+  removeListener(event, listener) {
+    return this.off(event, listener)
+  }
+
+  add(chunk) {
+    if (typeof chunk === 'string' || this.json.reconstructor) this.json.add(chunk)
+    else this.msgpack.add(chunk)
+  }
+
+  destroy() {
+    this.json.destroy()
+    this.msgpack.destroy?.()
+    this.listeners.clear()
+  }
+}
+
+// Server option `parser`: JSON encoding by default, both formats decoded
+export const wireParser = {
+  protocol: jsonParser.protocol,
+  Encoder: jsonParser.Encoder,
+  Decoder
+}
+
+export function wireFormat(socket) {
+  return socket.data.wire || 'json'
+}
+
+export function negotiateWire(socket, next) {
+  if (socket.handshake.query.wire === 'msgpack') {
+    socket.client.encoder = msgpackEncoder
+    socket.data.wire = 'msgpack'
+  }
+  next()
+}
+
+// Same as the in-memory adapter's broadcast, but with one encoding per encoder
+export function createWireAdapter(Adapter) {
+  return class WireAdapter extends Adapter {
+    broadcast(packet, opts) {
+      const flags = opts.flags || {}
+      packet.nsp = this.nsp.name
+
+      const encodings = new Map()
+      this.apply(opts, (socket) => {
+        if (typeof socket.notifyOutgoingListeners === 'function') {
+          socket.notifyOutgoingListeners(packet)
+        }
+
+        const encoder = socket.client.encoder
+        let encoding = encodings.get(encoder)
+        if (!encoding) {
+          const packetOpts = { preEncoded: true, volatile: flags.volatile, compress: flags.compress }
+          // _encode also precomputes the WebSocket frame for JSON packets
+          const packets = encoder === this.encoder && typeof this._encode === 'function'
+            ? this._encode(packet, packetOpts)
+            : encoder.encode(packet)
+          encoding = { packets, packetOpts }
+          encodings.set(encoder, encoding)
+        }
+        socket.client.writeToEngine(encoding.packets, encoding.packetOpts)
+      })
+    }
+  }
+}
@@ -1,26 +1,42 @@
+import { lazy, Suspense } from 'react'
 import { BrowserRouter as Router, Routes, Route } from 'react-router-dom'
-import Home from './pages/Home'
-import CreateQuiz from './pages/CreateQuiz'
-import PlayQuiz from './pages/PlayQuiz'
-import JoinQuiz from './pages/JoinQuiz'
-import QuizHost from './pages/QuizHost'
-import PlayerSimulator from './pages/PlayerSimulator'
-import LiveLeaderboard from './pages/LiveLeaderboard'
 import './App.css'
 
+// Every route is its own chunk: phones only load JoinQuiz and PlayQuiz,
+// never the host, editor or simulator code
+const loadJoinQuiz = () => import('./pages/JoinQuiz')
+const loadPlayQuiz = () => import('./pages/PlayQuiz')
+
+const Home = lazy(() => import('./pages/Home'))
+const CreateQuiz = lazy(() => import('./pages/CreateQuiz'))
+const PlayQuiz = lazy(loadPlayQuiz)
+const JoinQuiz = lazy(loadJoinQuiz)
+const QuizHost = lazy(() => import('./pages/QuizHost'))
+const PlayerSimulator = lazy(() => import('./pages/PlayerSimulator'))
+const LiveLeaderboard = lazy(() => import('./pages/LiveLeaderboard'))
+
+// Player path: request both chunks right away, so the join form does not
+// wait for React to render and /join → /play needs no extra round trip
+if (/^\/(join|play)(\/|$)/.test(window.location.pathname)) {
+  loadJoinQuiz()
+  loadPlayQuiz()
+}
+
 function App() {
   return (
     <Router basename="/">
       {/* ServerStatus removed - now using CompactBadges in each page */}
-      <Routes>
-        <Route path="/" element={<Home />} />
-        <Route path="/create" element={<CreateQuiz />} />
-        <Route path="/play/:quizId" element={<PlayQuiz />} />
-        <Route path="/join" element={<JoinQuiz />} />
-        <Route path="/host/:quizId" element={<QuizHost />} />
-        <Route path="/simulator" element={<PlayerSimulator />} />
-        <Route path="/leaderboard/:roomCode" element={<LiveLeaderboard />} />
-      </Routes>
+      <Suspense fallback={<div className="route-loading" />}>
+        <Routes>
+          <Route path="/" element={<Home />} />
+          <Route path="/create" element={<CreateQuiz />} />
+          <Route path="/play/:quizId" element={<PlayQuiz />} />
+          <Route path="/join" element={<JoinQuiz />} />
+          <Route path="/host/:quizId" element={<QuizHost />} />
+          <Route path="/simulator" element={<PlayerSimulator />} />
+          <Route path="/leaderboard/:roomCode" element={<LiveLeaderboard />} />
+        </Routes>
+      </Suspense>
     </Router>
   )
 }
@@ -1,8 +1,10 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, lazy, Suspense } from 'react'
 import { Terminal } from 'lucide-react'
-import ConsoleViewer from './ConsoleViewer'
 import './ConsoleButton.css'
 
+// The viewer is only needed once someone opens it
+const ConsoleViewer = lazy(() => import('./ConsoleViewer'))
+
 function ConsoleButton() {
   const [showConsole, setShowConsole] = useState(false)
 
@@ -29,7 +31,11 @@ function ConsoleButton() {
         <Terminal size={24} />
       </button>
 
-      {showConsole && <ConsoleViewer onClose={() => setShowConsole(false)} />}
+      {showConsole && (
+        <Suspense fallback={null}>
+          <ConsoleViewer onClose={() => setShowConsole(false)} />
+        </Suspense>
+      )}
     </>
   )
 }
@@ -5,7 +5,7 @@ import ConsoleButton from '../components/ConsoleButton'
 import CompactBadges from '../components/CompactBadges'
 import ImageReveal from '../components/ImageReveal'
 import './CreateQuiz.css'
-import { getQuizzes, getQuizById, saveQuiz, importQuizzes } from '../utils/quizStorage'
+import { getQuizzes, getQuizList, getQuizById, saveQuiz, importQuizzes } from '../utils/quizStorage'
 
 function CreateQuiz() {
   const navigate = useNavigate()
@@ -33,15 +33,18 @@ function CreateQuiz() {
 
   const loadQuizzes = async () => {
     setLoading(true)
-    const data = await getQuizzes()
+    const data = await getQuizList()
     setQuizzes(data)
     setLoading(false)
   }
 
   // Lade Quiz zum Bearbeiten
   useEffect(() => {
-    if (editQuizId && quizzes.length > 0) {
-      const quizToEdit = quizzes.find(q => q.id === editQuizId)
+    if (!editQuizId) return
+    let cancelled = false
+
+    getQuizById(editQuizId).then((quizToEdit) => {
+      if (cancelled) return
       if (quizToEdit) {
         // Prüfe Passwort wenn vorhanden
         if (quizToEdit.password) {
@@ -61,11 +64,13 @@ function CreateQuiz() {
         setShowLeaderboardAfterQuestion(quizToEdit.showLeaderboardAfterQuestion || false)
         setQuestions(quizToEdit.questions || [])
       }
-    }
-  }, [editQuizId, quizzes, navigate])
+    })
+
+    return () => { cancelled = true }
+  }, [editQuizId, navigate])
 
-  const handleExportQuizzes = () => {
-    const dataStr = JSON.stringify(quizzes, null, 2)
+  const handleExportQuizzes = async () => {
+    const dataStr = JSON.stringify(await getQuizzes(), null, 2)
     const dataBlob = new Blob([dataStr], { type: 'application/json' })
     const url = URL.createObjectURL(dataBlob)
     const link = document.createElement('a')
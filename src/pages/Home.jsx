@@ -4,7 +4,7 @@ import { Sparkles, Users, Zap, Trophy, Play, Plus, Smartphone, Globe, Download,
 import ConsoleButton from '../components/ConsoleButton'
 import CompactBadges from '../components/CompactBadges'
 import './Home.css'
-import { getQuizzes, saveQuiz, deleteQuiz, importQuizzes } from '../utils/quizStorage'
+import { getQuizzes, getQuizList, getQuizById, saveQuiz, deleteQuiz, importQuizzes } from '../utils/quizStorage'
 
 function Home() {
   const navigate = useNavigate()
@@ -18,13 +18,14 @@ function Home() {
 
   const loadQuizzes = async () => {
     setLoading(true)
-    const data = await getQuizzes()
+    // Only titles and counts - full quizzes are loaded when needed
+    const data = await getQuizList()
     setQuizzes(data)
     setLoading(false)
   }
 
-  const handleExportQuizzes = () => {
-    const dataStr = JSON.stringify(quizzes, null, 2)
+  const handleExportQuizzes = async () => {
+    const dataStr = JSON.stringify(await getQuizzes(), null, 2)
     const dataBlob = new Blob([dataStr], { type: 'application/json' })
     const url = URL.createObjectURL(dataBlob)
     const link = document.createElement('a')
@@ -61,7 +62,7 @@ function Home() {
         if (result.updated > 0) {
           message += `🔄 ${result.updated} Quiz(ze) aktualisiert\n`
         }
-        message += `\n💾 Gesamt: ${(await getQuizzes()).length} Quiz(ze) gespeichert`
+        message += `\n💾 Gesamt: ${(await getQuizList()).length} Quiz(ze) gespeichert`
 
         alert(message)
 
@@ -88,7 +89,10 @@ function Home() {
     navigate(`/create?edit=${quizId}`)
   }
 
-  const handleDuplicateQuiz = async (quiz) => {
+  const handleDuplicateQuiz = async ({ id }) => {
+    const quiz = await getQuizById(id)
+    if (!quiz) return
+
     const duplicatedQuiz = {
       ...quiz,
       id: Date.now().toString(),
@@ -224,13 +228,13 @@ function Home() {
                         <Trophy size={40} />
                       </div>
                       <h3>
-                        {quiz.password && <span style={{ marginRight: '8px' }}>🔒</span>}
+                        {quiz.hasPassword && <span style={{ marginRight: '8px' }}>🔒</span>}
                         {quiz.title}
                       </h3>
-                      <p>{quiz.questions.length} Fragen • {quiz.questions.reduce((sum, q) => sum + (q.points || 0), 0)} Punkte</p>
+                      <p>{quiz.questionCount} Fragen • {quiz.totalPoints} Punkte</p>
                       <div style={{ marginTop: '10px', fontSize: '12px', color: '#64748b' }}>
                         Erstellt am {new Date(quiz.createdAt).toLocaleDateString('de-DE')}
-                        {quiz.password && <span style={{ marginLeft: '8px', color: '#6366f1' }}>• Passwortgeschützt</span>}
+                        {quiz.hasPassword && <span style={{ marginLeft: '8px', color: '#6366f1' }}>• Passwortgeschützt</span>}
                       </div>
                     </div>
                   </div>
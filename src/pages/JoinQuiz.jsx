@@ -44,6 +44,8 @@ function JoinQuiz() {
       joinCode: joinCode.toUpperCase()
     }
     localStorage.setItem('playerInfo', JSON.stringify(playerInfo))
+    // Neuer Beitritt: keine alte Sitzung in diesem Raum übernehmen
+    localStorage.removeItem(`quizer:session:${playerInfo.joinCode}`)
 
     // Navigate to play page
     navigate(`/play/${joinCode}`)
@@ -1,7 +1,7 @@
 import { useState, useEffect, useRef } from 'react'
 import { useParams } from 'react-router-dom'
 import { Trophy, TrendingUp, TrendingDown, Minus } from 'lucide-react'
-import socket from '../socket'
+import socket, { connectToRoom } from '../socket'
 import CompactBadges from '../components/CompactBadges'
 import './LiveLeaderboard.css'
 
@@ -17,17 +17,29 @@ function LiveLeaderboard() {
   const [pointsAnimations, setPointsAnimations] = useState({})
   const [isQuizEnded, setIsQuizEnded] = useState(false)
   const playerRefs = useRef({})
+  const playersRef = useRef([])
+  const lastSeqRef = useRef(null)
 
   useEffect(() => {
-    // Connect socket
-    socket.connect()
+    playersRef.current = players
+  }, [players])
+
+  useEffect(() => {
+    // Join room as spectator (again after every reconnect, the server sends a fresh snapshot)
+    const joinLeaderboard = () => socket.emit('join-leaderboard', { roomCode })
 
-    // Join room as spectator
-    socket.emit('join-leaderboard', { roomCode })
+    // Connect socket
+    if (socket.connected) {
+      setIsConnected(true)
+      joinLeaderboard()
+    } else {
+      connectToRoom(roomCode)
+    }
 
     // Listen for connection
     socket.on('connect', () => {
       setIsConnected(true)
+      joinLeaderboard()
       console.log('🔌 Connected to leaderboard')
     })
 
@@ -36,13 +48,11 @@ function LiveLeaderboard() {
       console.log('❌ Disconnected from leaderboard')
     })
 
-    // Listen for leaderboard updates
-    socket.on('leaderboard-update', (data) => {
-      console.log('📊 Leaderboard update:', data)
-
+    // Apply a new player list with score and position animations
+    const applyPlayers = (newPlayers) => {
       // Store current positions BEFORE update (FLIP technique - First)
       const prevPositions = {}
-      const sortedCurrent = [...players].sort((a, b) => (b.score || 0) - (a.score || 0))
+      const sortedCurrent = [...playersRef.current].sort((a, b) => (b.score || 0) - (a.score || 0))
       sortedCurrent.forEach((player, index) => {
         const ref = playerRefs.current[player.id]
         if (ref) {
@@ -61,7 +71,6 @@ function LiveLeaderboard() {
       setPreviousScores(prevScores)
 
       // Check for score changes and trigger animations
-      const newPlayers = data.players || []
       newPlayers.forEach((player) => {
         const oldScore = prevScores[player.id]
         const newScore = player.score || 0
@@ -84,14 +93,12 @@ function LiveLeaderboard() {
       })
 
       // Update players
+      playersRef.current = newPlayers
       setPlayers(newPlayers)
-      if (data.quizTitle) {
-        setQuizTitle(data.quizTitle)
-      }
 
       // Animate position changes (FLIP technique - Last, Invert, Play)
       setTimeout(() => {
-        const sortedNew = [...(data.players || [])].sort((a, b) => (b.score || 0) - (a.score || 0))
+        const sortedNew = [...newPlayers].sort((a, b) => (b.score || 0) - (a.score || 0))
 
         // First pass: Set all elements to their old positions (Invert)
         sortedNew.forEach((player) => {
@@ -135,6 +142,40 @@ function LiveLeaderboard() {
           })
         }, 200) // 200ms freeze to see the highlight
       }, 10)
+    }
+
+    // Full snapshot (on join and after a resync)
+    socket.on('leaderboard-update', (data) => {
+      console.log('📊 Leaderboard snapshot:', data.players?.length, 'players, seq', data.seq)
+      lastSeqRef.current = data.seq ?? null
+      applyPlayers(data.players || [])
+      if (data.quizTitle) {
+        setQuizTitle(data.quizTitle)
+      }
+    })
+
+    // Only changed entries since the last delta
+    socket.on('leaderboard-delta', (data) => {
+      if (lastSeqRef.current === null || data.seq <= lastSeqRef.current) return
+
+      if (data.seq !== lastSeqRef.current + 1) {
+        // Missed a delta - ignore further deltas until the fresh snapshot arrives
+        console.log(`📊 Leaderboard gap (${lastSeqRef.current} → ${data.seq}) - resync`)
+        lastSeqRef.current = null
+        socket.emit('leaderboard-resync', { roomCode })
+        return
+      }
+      lastSeqRef.current = data.seq
+
+      const removed = new Set(data.removed)
+      const byId = new Map(playersRef.current.filter(p => !removed.has(p.id)).map(p => [p.id, p]))
+      data.changes.forEach((change) => {
+        const existing = byId.get(change.id)
+        byId.set(change.id, existing
+          ? { ...existing, score: change.score }
+          : { id: change.id, name: change.name, avatar: change.avatar, score: change.score })
+      })
+      applyPlayers(Array.from(byId.values()))
     })
 
     // Listen for player score updates
@@ -158,6 +199,7 @@ function LiveLeaderboard() {
       socket.off('connect')
       socket.off('disconnect')
       socket.off('leaderboard-update')
+      socket.off('leaderboard-delta')
       socket.off('player-score-updated')
       socket.off('show-results')
     }
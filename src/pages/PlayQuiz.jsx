@@ -3,7 +3,7 @@ import { useParams, useNavigate } from 'react-router-dom'
 import { Zap, Trophy, Clock, AlertCircle, RefreshCw } from 'lucide-react'
 import ConsoleButton from '../components/ConsoleButton'
 import CompactBadges from '../components/CompactBadges'
-import socket from '../socket'
+import socket, { connectToRoom } from '../socket'
 import './PlayQuiz.css'
 
 function PlayQuiz() {
@@ -18,6 +18,7 @@ function PlayQuiz() {
   const [buzzerActive, setBuzzerActive] = useState(false)
   const [buzzerPressed, setBuzzerPressed] = useState(false)
   const [buzzerLocked, setBuzzerLocked] = useState(false)
+  const [buzzerWinner, setBuzzerWinner] = useState(null)
   const [answerResult, setAnswerResult] = useState(null)
   const [errorMessage, setErrorMessage] = useState(null)
   const [questionStartTime, setQuestionStartTime] = useState(null)
@@ -26,6 +27,8 @@ function PlayQuiz() {
   const [pointsNotification, setPointsNotification] = useState(null)
   const [forceUpdate, setForceUpdate] = useState(0)
   const scoreRef = useRef(0)
+  const buzzerRoundRef = useRef(null) // Runde, die der Server für den Buzzer ausgerufen hat
+  const joinRoomRef = useRef(null) // join-room mit Sitzungs-Token, auch für "Erneut versuchen"
 
   useEffect(() => {
     // Load player info
@@ -38,19 +41,30 @@ function PlayQuiz() {
     const info = JSON.parse(stored)
     setPlayerInfo(info)
 
-    // Connect socket
-    socket.connect()
+    // Sitzungs-Token vom Server: damit übernimmt ein neuer Socket nach einem
+    // Verbindungsabbruch den eigenen Spieler (Name, Punkte, Antwort) statt neu beizutreten
+    const sessionKey = `quizer:session:${info.joinCode}`
+
+    // Join room - bei jedem (Re-)Connect, der Socket hat dann eine neue ID
+    const joinRoom = () => {
+      socket.emit('join-room', {
+        roomCode: info.joinCode,
+        playerName: info.name,
+        playerAvatar: info.avatar,
+        sessionToken: localStorage.getItem(sessionKey) || undefined
+      })
+    }
+    joinRoomRef.current = joinRoom
+    socket.on('connect', joinRoom)
 
-    // Join room
-    socket.emit('join-room', {
-      roomCode: info.joinCode,
-      playerName: info.name,
-      playerAvatar: info.avatar
-    })
+    // Connect socket
+    connectToRoom(info.joinCode)
+    if (socket.connected) joinRoom()
 
     // Socket event listeners
     socket.on('room-state', (data) => {
       console.log('Room state:', data)
+      if (data.sessionToken) localStorage.setItem(sessionKey, data.sessionToken)
 
       // Handle reconnection
       if (data.reconnected) {
@@ -74,6 +88,8 @@ function PlayQuiz() {
           setBuzzerActive(data.question.type === 'buzzer')
           setBuzzerLocked(false) // Buzzer entsperren nach Reload
           setBuzzerPressed(false)
+          setBuzzerWinner(null)
+          buzzerRoundRef.current = data.buzzerRound ?? null
           setQuestionStartTime(Date.now())
         }
       }
@@ -99,6 +115,42 @@ function PlayQuiz() {
       console.log('Player joined notification:', data)
     })
 
+    // Sitzung nach Verbindungsabbruch übernommen: kompakter Stand statt ganzer Raum
+    socket.on('session-resumed', (data) => {
+      console.log('🔁 Session resumed:', data)
+      localStorage.setItem(sessionKey, data.sessionToken)
+      setScore(data.score)
+      scoreRef.current = data.score
+      if (data.rank) {
+        setCurrentRank(data.rank)
+        setTotalPlayers(data.total)
+      }
+
+      if (data.state === 'lobby') {
+        setGameState('waiting')
+      } else if (data.state === 'final') {
+        setGameState('final')
+      } else if (data.state === 'question' && data.question) {
+        setCurrentQuestion(data.question)
+        setTimeLeft(data.question.timeLimit)
+        setBuzzerActive(data.question.type === 'buzzer')
+        setBuzzerPressed(false)
+        setBuzzerLocked(Boolean(data.buzzer?.locked))
+        setBuzzerWinner(data.buzzer?.winner || null)
+        buzzerRoundRef.current = data.buzzer?.round ?? null
+
+        if (data.answered) {
+          setAnswerResult(data.answered)
+          setGameState('answered')
+        } else {
+          setSelectedAnswer(null)
+          setAnswerResult(null)
+          setQuestionStartTime(Date.now())
+          setGameState('question')
+        }
+      }
+    })
+
     socket.on('game-started', (data) => {
       console.log('Game started:', data)
       setGameState('question')
@@ -109,6 +161,8 @@ function PlayQuiz() {
       setBuzzerActive(data.question.type === 'buzzer')
       setBuzzerPressed(false) // Reset buzzer state
       setBuzzerLocked(false) // Unlock buzzer
+      setBuzzerWinner(null)
+      buzzerRoundRef.current = data.buzzerRound ?? null
       setQuestionStartTime(Date.now()) // Track when question started
     })
 
@@ -122,6 +176,8 @@ function PlayQuiz() {
       setBuzzerActive(data.question.type === 'buzzer')
       setBuzzerPressed(false) // Reset buzzer state
       setBuzzerLocked(false) // Unlock buzzer
+      setBuzzerWinner(null)
+      buzzerRoundRef.current = data.buzzerRound ?? null
       setQuestionStartTime(Date.now()) // Track when question started
     })
 
@@ -133,24 +189,24 @@ function PlayQuiz() {
       setGameState('answered')
     })
 
+    // Ergebnisse enthalten nur die Top-Spieler plus eigenen Rang und Punkte
+    const applyResults = (data) => {
+      if (!data.rank) return
+      setCurrentRank(data.rank)
+      setTotalPlayers(data.total)
+      setScore(data.score)
+      scoreRef.current = data.score
+    }
+
     socket.on('show-results', (data) => {
       console.log('Show results:', data)
+      applyResults(data)
       setGameState('results')
     })
 
     socket.on('game-over', (data) => {
       console.log('Game over:', data)
-      // Berechne eigenen Rang aus den Spielern
-      if (data.players) {
-        const myRank = data.players.findIndex(p => p.id === socket.id) + 1
-        setCurrentRank(myRank)
-        setTotalPlayers(data.players.length)
-        const me = data.players.find(p => p.id === socket.id)
-        if (me) {
-          setScore(me.score)
-          scoreRef.current = me.score
-        }
-      }
+      applyResults(data)
       setGameState('final')
     })
 
@@ -168,35 +224,35 @@ function PlayQuiz() {
 
     socket.on('buzzer-unlocked', (data) => {
       console.log('🔓 Buzzer unlocked event received:', data)
-      console.log('Current socket.id:', socket.id)
-      console.log('Is for all?', data.playerIds === 'all')
-      console.log('Is for me?', data.playerId === socket.id)
 
-      if (data.playerIds === 'all' || data.playerId === socket.id) {
-        console.log('✅ Unlocking buzzer for this player')
+      // Eine Nachricht für den ganzen Raum: 'all' oder alle außer den gesperrten Gewinnern
+      const forMe = data.playerIds === 'all' ||
+        data.playerId === socket.id ||
+        (Array.isArray(data.lockedOut) && !data.lockedOut.includes(socket.id))
 
-        // Use functional updates to ensure latest state
-        setBuzzerLocked(prev => {
-          console.log('setBuzzerLocked: prev =', prev, '→ new = false')
-          return false
-        })
-        setBuzzerPressed(prev => {
-          console.log('setBuzzerPressed: prev =', prev, '→ new = false')
-          return false
-        })
-
-        // Force a re-render to ensure UI updates
-        setForceUpdate(prev => prev + 1)
-
-        // Verify state after update
-        setTimeout(() => {
-          console.log('🔍 State should now be updated - UI should show BUZZER button active')
-        }, 100)
+      if (forMe) {
+        console.log('✅ Unlocking buzzer for this player')
+        buzzerRoundRef.current = data.round ?? null
+        setBuzzerWinner(null)
+        setBuzzerLocked(false)
+        setBuzzerPressed(false)
       } else {
         console.log('❌ Event not for this player')
       }
     })
 
+    // Server hat entschieden: der erste Druck gewinnt, alle Buzzer sind gesperrt
+    socket.on('buzzer-locked', (data) => {
+      console.log('🔔 Buzzer locked:', data)
+      setBuzzerWinner(data)
+      setBuzzerLocked(true)
+    })
+
+    socket.on('buzzer-rejected', (data) => {
+      console.log('⏱️ Buzzer press rejected:', data)
+      setBuzzerLocked(true)
+    })
+
     socket.on('player-score-updated', (data) => {
       console.log('📊 Score updated:', data)
       if (data.playerId === socket.id) {
@@ -263,8 +319,10 @@ function PlayQuiz() {
 
     // Cleanup
     return () => {
+      socket.off('connect', joinRoom)
       socket.off('room-state')
       socket.off('player-joined')
+      socket.off('session-resumed')
       socket.off('game-started')
       socket.off('next-question')
       socket.off('answer-result')
@@ -272,6 +330,8 @@ function PlayQuiz() {
       socket.off('game-over')
       socket.off('buzzer-points-awarded')
       socket.off('buzzer-unlocked')
+      socket.off('buzzer-locked')
+      socket.off('buzzer-rejected')
       socket.off('player-score-updated')
       socket.off('leaderboard-update')
       socket.off('host-disconnected')
@@ -316,7 +376,8 @@ function PlayQuiz() {
 
     // Send buzzer press to server
     socket.emit('buzzer-press', {
-      roomCode: playerInfo.joinCode
+      roomCode: playerInfo.joinCode,
+      round: buzzerRoundRef.current ?? undefined
     })
 
     // Create buzzer effect
@@ -524,7 +585,9 @@ function PlayQuiz() {
                   <span>{buzzerLocked ? 'GESPERRT' : 'BUZZER'}</span>
                 </button>
                 <p className="buzzer-hint">
-                  {buzzerLocked ? '🔒 Gesperrt - Warte auf Freigabe vom Host' :
+                  {buzzerWinner?.playerId === socket.id ? '🏆 Du warst am schnellsten!' :
+                   buzzerWinner ? `🔒 ${buzzerWinner.playerName} war schneller` :
+                   buzzerLocked ? '🔒 Gesperrt - Warte auf Freigabe vom Host' :
                    buzzerPressed ? '✓ Du hast gebuzzert!' :
                    'Drücke den Buzzer wenn du die Antwort weißt!'}
                 </p>
@@ -669,12 +732,9 @@ function PlayQuiz() {
                 onClick={() => {
                   setGameState('waiting')
                   setErrorMessage(null)
-                  socket.connect()
-                  socket.emit('join-room', {
-                    roomCode: playerInfo.joinCode,
-                    playerName: playerInfo.name,
-                    playerAvatar: playerInfo.avatar
-                  })
+                  // Nicht verbunden: der connect-Handler tritt bei, sonst hier - beide mit Sitzungs-Token
+                  connectToRoom(playerInfo.joinCode)
+                  if (socket.connected) joinRoomRef.current?.()
                 }}
               >
                 <RefreshCw size={20} />
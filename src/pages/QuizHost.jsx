@@ -5,8 +5,10 @@ import { QRCodeSVG } from 'qrcode.react'
 import ConsoleButton from '../components/ConsoleButton'
 import CompactBadges from '../components/CompactBadges'
 import ImageReveal from '../components/ImageReveal'
-import socket from '../socket'
+import socket, { connectToRoom } from '../socket'
 import { createConfetti } from '../utils/confetti'
+import { assetUrl, prefetchAssets, uploadQuizAssets } from '../utils/assets'
+import { getQuizById } from '../utils/quizStorage'
 import './QuizHost.css'
 
 function QuizHost() {
@@ -47,11 +49,17 @@ function QuizHost() {
   const joinUrl = `${window.location.origin}/join?code=${joinCode}`
 
   useEffect(() => {
-    // Load quiz from localStorage
-    const savedQuizzes = JSON.parse(localStorage.getItem('quizzes') || '[]')
-    const foundQuiz = savedQuizzes.find(q => q.id === quizId)
+    let cancelled = false
+
+    // Load just this quiz from storage
+    getQuizById(quizId).then(foundQuiz => {
+      if (cancelled) return
+      if (!foundQuiz) {
+        alert('Quiz nicht gefunden')
+        navigate('/')
+        return
+      }
 
-    if (foundQuiz) {
       // Prüfe Passwort wenn vorhanden
       if (foundQuiz.password) {
         const inputPassword = prompt('🔒 Dieses Quiz ist passwortgeschützt.\n\nBitte Passwort eingeben um zu starten:')
@@ -63,19 +71,20 @@ function QuizHost() {
       }
 
       setQuiz(foundQuiz)
-    } else {
-      alert('Quiz nicht gefunden')
-      navigate('/')
-      return
-    }
 
-    // Connect socket
-    socket.connect()
-
-    // Create room
-    socket.emit('create-room', {
-      quizId,
-      quizData: foundQuiz
+      // Connect socket
+      connectToRoom(joinCode)
+
+      // Create room - images go to the asset store first, the socket only carries references
+      return uploadQuizAssets(foundQuiz, joinCode).then(quizData => {
+        if (cancelled) return
+        // Ab jetzt Bilder per URL (Browser-Cache) statt eingebetteter data: URLs
+        setQuiz(quizData)
+        socket.emit('create-room', {
+          quizId,
+          quizData
+        })
+      })
     })
 
       // Socket event listeners
@@ -108,6 +117,16 @@ function QuizHost() {
         })
       })
 
+      // Spieler hat nach einem Verbindungsabbruch seine Sitzung übernommen: nur die ID ist neu
+      socket.on('player-reconnected', (data) => {
+        console.log('Player reconnected:', data.previousId, '→', data.playerId)
+        const rekey = id => id === data.previousId ? data.playerId : id
+        setPlayers(prev => prev.map(p => p.id === data.previousId ? { ...p, id: data.playerId } : p))
+        setBuzzerLockedPlayers(prev => prev.map(rekey))
+        setPlayersWhoGotPoints(prev => prev.map(rekey))
+        setBuzzerPresses(prev => prev.map(bp => ({ ...bp, playerId: rekey(bp.playerId) })))
+      })
+
       socket.on('player-answered', (data) => {
         console.log('Player answered:', data.playerName, data.correct ? '✓' : '✗', data.responseTime + 's', 'Bonus:', data.bonusPoints, 'NewScore:', data.newScore)
         // Update player list with answer status AND score from server
@@ -125,10 +144,11 @@ function QuizHost() {
         ))
       })
 
-      socket.on('buzzer-pressed', (data) => {
-        console.log('Buzzer pressed by:', data.playerName)
+      // Der Server entscheidet, wer zuerst gebuzzert hat - eine Nachricht pro Runde
+      socket.on('buzzer-locked', (data) => {
+        console.log('Buzzer won by:', data.playerName, `(${data.reactionMs?.toFixed(0)} ms)`)
 
-        // Lock this player's buzzer
+        // Gewinner bleibt gesperrt, bis er freigegeben wird
         setBuzzerLockedPlayers(prev => [...prev, data.playerId])
 
         setBuzzerPresses(prev => [...prev, {
@@ -139,6 +159,11 @@ function QuizHost() {
         }])
       })
 
+      // Bilder der nächsten Frage laden, während die aktuelle läuft
+      const prefetchNext = (data) => prefetchAssets(data.nextAssets, joinCode)
+      socket.on('game-started', prefetchNext)
+      socket.on('next-question', prefetchNext)
+
       socket.on('player-score-updated', (data) => {
         console.log('Player score updated:', data.playerName, data.newScore)
         setPlayers(prev => prev.map(p =>
@@ -150,12 +175,16 @@ function QuizHost() {
 
     // Cleanup
     return () => {
+      cancelled = true
       socket.off('room-created')
       socket.off('player-joined')
       socket.off('player-left')
+      socket.off('player-reconnected')
       socket.off('player-answered')
-      socket.off('buzzer-pressed')
+      socket.off('buzzer-locked')
       socket.off('player-score-updated')
+      socket.off('game-started')
+      socket.off('next-question')
       socket.disconnect()
     }
   }, [quizId, navigate])
@@ -937,7 +966,7 @@ function QuizHost() {
             {currentQuestion.image && (
               <div style={{ textAlign: 'center', margin: '20px 0' }}>
                 <ImageReveal
-                  src={currentQuestion.image}
+                  src={assetUrl(currentQuestion.image, joinCode)}
                   alt="Question"
                   animation={currentQuestion.type === 'buzzer' ? 'none' : (currentQuestion.imageRevealAnimation || 'none')}
                   duration={currentQuestion.type === 'buzzer' ? 0 : (currentQuestion.imageRevealDuration || 5)}
@@ -1009,6 +1038,11 @@ function QuizHost() {
                                 // Remove from buzzer list
                                 setBuzzerPresses(prev => prev.filter(p => p.playerId !== press.playerId))
                                 console.log(`❌ ${press.playerName} - Keine Punkte gegeben`)
+                                // Neue Runde für alle anderen, der Spieler bleibt gesperrt
+                                socket.emit('unlock-buzzers', {
+                                  roomCode: joinCode,
+                                  playerIds: []
+                                })
                               }}
                               title="Keine Punkte geben und weitermachen"
                             >
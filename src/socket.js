@@ -1,12 +1,19 @@
 import { io } from 'socket.io-client'
 
 // Backend URL - NUR PRODUCTION (kein localhost mehr!)
-const SOCKET_URL = import.meta.env.VITE_SOCKET_URL || 'https://quizer-backend-9v9a.onrender.com'
+export const SOCKET_URL = import.meta.env.VITE_SOCKET_URL || 'https://quizer-backend-9v9a.onrender.com'
 
 // Debug: Log socket URL
 console.log('🔌 Socket URL:', SOCKET_URL)
 console.log('🔍 VITE_SOCKET_URL env:', import.meta.env.VITE_SOCKET_URL)
 
+// Wire-Format: 'msgpack' (binär, kleinere Pakete) oder 'json' (Standard).
+// Wird pro Verbindung ausgehandelt - der Server kodiert für jeden Client im
+// Format, das dieser im Handshake anfragt (siehe server/wire.js).
+// Zum Testen ohne Rebuild: localStorage.setItem('quizer:wire', 'msgpack')
+const WIRE = localStorage.getItem('quizer:wire') || import.meta.env.VITE_WIRE || 'json'
+console.log('📦 Wire-Format:', WIRE)
+
 // Socket.io Client-Instanz
 export const socket = io(SOCKET_URL, {
   autoConnect: false, // Manuell verbinden wenn benötigt
@@ -15,6 +22,32 @@ export const socket = io(SOCKET_URL, {
   reconnectionAttempts: 5
 })
 
+// Der MessagePack-Parser ist ein eigener Chunk und wird nur im msgpack-Modus
+// geladen. Bis er da ist, bleibt die Verbindung JSON: erst danach bekommen
+// Manager Encoder/Decoder (werden bei jedem Verbindungsaufbau neu abonniert)
+// und der Handshake ?wire=msgpack.
+export const wireReady = WIRE === 'msgpack'
+  ? import('socket.io-msgpack-parser')
+      .then(parser => {
+        socket.io.encoder = new parser.Encoder()
+        socket.io.decoder = new parser.Decoder()
+        socket.io.opts.query = { ...socket.io.opts.query, wire: 'msgpack' }
+      })
+      .catch(error => console.warn('⚠️ MessagePack-Parser nicht geladen, bleibe bei JSON:', error.message))
+  : Promise.resolve()
+
+// Mit Raum verbinden: der Raum-Code im Handshake entscheidet im Cluster-Modus,
+// welcher Server-Prozess die Verbindung bekommt (alle Teilnehmer eines Raums
+// landen beim selben Worker). Ohne Cluster wird der Parameter ignoriert.
+export const connectToRoom = (roomCode) => {
+  const room = String(roomCode).toUpperCase()
+  if (socket.io.opts.query?.room === room && socket.connected) return
+
+  if (socket.connected) socket.disconnect()
+  socket.io.opts.query = { ...socket.io.opts.query, room }
+  wireReady.then(() => socket.connect())
+}
+
 // Connection Events
 socket.on('connect', () => {
   console.log('✅ Verbunden mit Server:', socket.id)
@@ -28,4 +61,11 @@ socket.on('error', (error) => {
   console.error('Socket Error:', error)
 })
 
+// Eingehende Events als DOM-Event veröffentlichen (für die Wait-Engine im Test-Harness)
+const publishSocketEvent = (event) => {
+  window.dispatchEvent(new CustomEvent('quizer:socket', { detail: { event } }))
+}
+socket.on('connect', () => publishSocketEvent('connect'))
+socket.onAny((event) => publishSocketEvent(event))
+
 export default socket
@@ -0,0 +1,66 @@
+// Quiz-Bilder über den Asset-Store des Servers
+// Der Server ersetzt eingebettete Bilder (data: URLs) durch "asset:<id>" und
+// schickt über den Socket nur noch diese Referenzen. Die Bilder selbst kommen
+// per HTTP (ETag + immutable, der Browser-Cache hält sie), ?room=<Code> sorgt
+// im Cluster-Modus für den Worker des Raums.
+
+import { SOCKET_URL } from '../socket'
+
+const PREFIX = 'asset:'
+const prefetched = new Set()
+
+export const isAssetRef = (value) => typeof value === 'string' && value.startsWith(PREFIX)
+
+// Bild-Quelle für <img>: Asset-Referenz → URL, alles andere (data:, http) unverändert
+export const assetUrl = (value, roomCode) => {
+  if (!isAssetRef(value)) return value
+  const id = value.slice(PREFIX.length)
+  return `${SOCKET_URL}/assets/${id}${roomCode ? `?room=${String(roomCode).toUpperCase()}` : ''}`
+}
+
+// Bilder der nächsten Frage vorladen, während die aktuelle läuft
+export const prefetchAssets = (ids, roomCode) => {
+  for (const id of ids || []) {
+    if (prefetched.has(id)) continue
+    prefetched.add(id)
+    const image = new Image()
+    image.decoding = 'async'
+    image.src = assetUrl(PREFIX + id, roomCode)
+  }
+}
+
+// Eingebettete Bilder vor create-room hochladen, damit auch das Quiz selbst
+// ohne Bilddaten über den Socket geht. Schlägt ein Upload fehl, bleibt das
+// Bild eingebettet (der Server übernimmt es dann selbst in den Store).
+export const uploadQuizAssets = async (quiz, roomCode) => {
+  const room = String(roomCode).toUpperCase()
+  const uploaded = new Map()
+
+  const upload = async (dataUrl) => {
+    if (!uploaded.has(dataUrl)) {
+      uploaded.set(dataUrl, (async () => {
+        try {
+          const blob = await (await fetch(dataUrl)).blob()
+          const response = await fetch(`${SOCKET_URL}/assets?room=${room}`, {
+            method: 'POST',
+            headers: { 'Content-Type': blob.type },
+            body: blob
+          })
+          if (!response.ok) throw new Error(`HTTP ${response.status}`)
+          return (await response.json()).ref
+        } catch (error) {
+          console.warn('⚠️ Bild-Upload fehlgeschlagen, wird eingebettet gesendet:', error.message)
+          return dataUrl
+        }
+      })())
+    }
+    return uploaded.get(dataUrl)
+  }
+
+  const questions = await Promise.all((quiz.questions || []).map(async (question) =>
+    typeof question.image === 'string' && question.image.startsWith('data:')
+      ? { ...question, image: await upload(question.image) }
+      : question
+  ))
+  return { ...quiz, questions }
+}
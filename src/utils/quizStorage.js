@@ -1,5 +1,5 @@
 // Quiz Storage Utility
-// Automatically detects if running in Electron (uses API) or Browser (uses LocalStorage)
+// Automatically detects if running in Electron (uses API) or Browser (uses IndexedDB)
 
 const isElectron = () => {
   // Check if running in Electron environment
@@ -9,6 +9,115 @@ const isElectron = () => {
 
 const API_BASE = 'http://localhost:3000/api'
 
+// Browser storage: IndexedDB with one record per quiz ('quizzes') plus a small
+// metadata record per quiz ('quizMeta') for the Home list, so listing never
+// loads questions and images. Older versions kept every quiz in one
+// localStorage['quizzes'] JSON string - whenever that key exists (old installs,
+// test scripts injecting quizzes) it is merged into the database and removed.
+// Without IndexedDB the localStorage blob stays in use.
+const DB_NAME = 'quizer'
+const DB_VERSION = 1
+const LEGACY_KEY = 'quizzes'
+
+let dbPromise = null
+let migration = null
+
+const requestResult = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result)
+  request.onerror = () => reject(request.error)
+})
+
+const transactionDone = (tx) => new Promise((resolve, reject) => {
+  tx.oncomplete = () => resolve()
+  tx.onerror = () => reject(tx.error)
+  tx.onabort = () => reject(tx.error)
+})
+
+// What the quiz lists need - no questions, no images, no password
+export const quizMeta = (quiz) => ({
+  id: quiz.id,
+  title: quiz.title,
+  questionCount: quiz.questions?.length || 0,
+  totalPoints: (quiz.questions || []).reduce((sum, q) => sum + (q.points || 0), 0),
+  hasPassword: !!quiz.password,
+  createdAt: quiz.createdAt,
+  updatedAt: quiz.updatedAt
+})
+
+const openDb = () => {
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      if (typeof indexedDB === 'undefined') {
+        resolve(null)
+        return
+      }
+      const request = indexedDB.open(DB_NAME, DB_VERSION)
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore('quizzes', { keyPath: 'id' })
+        request.result.createObjectStore('quizMeta', { keyPath: 'id' })
+      }
+      request.onsuccess = () => resolve(request.result)
+      request.onerror = () => {
+        console.error('IndexedDB nicht verfügbar, nutze LocalStorage:', request.error)
+        resolve(null)
+      }
+    })
+  }
+  return dbPromise
+}
+
+const putQuizzes = (db, quizzes) => {
+  const tx = db.transaction(['quizzes', 'quizMeta'], 'readwrite')
+  const bodies = tx.objectStore('quizzes')
+  const meta = tx.objectStore('quizMeta')
+  for (const quiz of quizzes) {
+    bodies.put(quiz)
+    meta.put(quizMeta(quiz))
+  }
+  return transactionDone(tx)
+}
+
+const migrateLegacy = async (db) => {
+  const raw = localStorage.getItem(LEGACY_KEY)
+  try {
+    const legacy = JSON.parse(raw || '[]')
+    await putQuizzes(db, legacy)
+    localStorage.removeItem(LEGACY_KEY)
+    console.log(`📦 ${legacy.length} Quiz(ze) aus LocalStorage nach IndexedDB übernommen`)
+  } catch (error) {
+    // Unlesbarer Blob: aufheben statt bei jedem Aufruf erneut versuchen
+    console.error('Migration der Quizze fehlgeschlagen:', error)
+    localStorage.setItem(`${LEGACY_KEY}-backup`, raw)
+    localStorage.removeItem(LEGACY_KEY)
+  }
+}
+
+// Database (null = LocalStorage fallback), legacy blob merged in first
+const getDb = async () => {
+  const db = await openDb()
+  if (db && localStorage.getItem(LEGACY_KEY) !== null) {
+    migration = migration || migrateLegacy(db).finally(() => { migration = null })
+    await migration
+  }
+  return db
+}
+
+const byCreatedAt = (a, b) => String(a.createdAt || '').localeCompare(String(b.createdAt || ''))
+
+// Quiz list for Home/CreateQuiz: metadata only, full quizzes via getQuizById
+export const getQuizList = async () => {
+  if (isElectron()) {
+    return (await getQuizzes()).map(quizMeta)
+  }
+
+  const db = await getDb()
+  if (!db) {
+    return JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]').map(quizMeta)
+  }
+  const list = await requestResult(db.transaction('quizMeta').objectStore('quizMeta').getAll())
+  return list.sort(byCreatedAt)
+}
+
 // Get all quizzes
 export const getQuizzes = async () => {
   if (isElectron()) {
@@ -21,8 +130,13 @@ export const getQuizzes = async () => {
       return []
     }
   } else {
-    // Browser: use LocalStorage
-    return JSON.parse(localStorage.getItem('quizzes') || '[]')
+    // Browser: full quizzes (export), the list only needs getQuizList()
+    const db = await getDb()
+    if (!db) {
+      return JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]')
+    }
+    const quizzes = await requestResult(db.transaction('quizzes').objectStore('quizzes').getAll())
+    return quizzes.sort(byCreatedAt)
   }
 }
 
@@ -44,8 +158,14 @@ export const saveQuiz = async (quiz) => {
       throw error
     }
   } else {
-    // Browser: use LocalStorage
-    const quizzes = JSON.parse(localStorage.getItem('quizzes') || '[]')
+    // Browser: one record per quiz
+    const db = await getDb()
+    if (db) {
+      await putQuizzes(db, [quiz])
+      return { success: true, id: quiz.id }
+    }
+
+    const quizzes = JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]')
     const existingIndex = quizzes.findIndex(q => q.id === quiz.id)
 
     if (existingIndex >= 0) {
@@ -54,7 +174,7 @@ export const saveQuiz = async (quiz) => {
       quizzes.push(quiz)
     }
 
-    localStorage.setItem('quizzes', JSON.stringify(quizzes))
+    localStorage.setItem(LEGACY_KEY, JSON.stringify(quizzes))
     return { success: true, id: quiz.id }
   }
 }
@@ -77,13 +197,28 @@ export const updateQuiz = async (quizId, quiz) => {
       throw error
     }
   } else {
-    // Browser: use LocalStorage
-    const quizzes = JSON.parse(localStorage.getItem('quizzes') || '[]')
+    // Browser: read, merge and write the one record in a single transaction
+    const db = await getDb()
+    if (db) {
+      const tx = db.transaction(['quizzes', 'quizMeta'], 'readwrite')
+      const bodies = tx.objectStore('quizzes')
+      const request = bodies.get(quizId)
+      request.onsuccess = () => {
+        if (!request.result) return
+        const merged = { ...request.result, ...quiz }
+        bodies.put(merged)
+        tx.objectStore('quizMeta').put(quizMeta(merged))
+      }
+      await transactionDone(tx)
+      return { success: true, id: quizId }
+    }
+
+    const quizzes = JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]')
     const index = quizzes.findIndex(q => q.id === quizId)
 
     if (index >= 0) {
       quizzes[index] = { ...quizzes[index], ...quiz }
-      localStorage.setItem('quizzes', JSON.stringify(quizzes))
+      localStorage.setItem(LEGACY_KEY, JSON.stringify(quizzes))
     }
 
     return { success: true, id: quizId }
@@ -104,10 +239,18 @@ export const deleteQuiz = async (quizId) => {
       throw error
     }
   } else {
-    // Browser: use LocalStorage
-    const quizzes = JSON.parse(localStorage.getItem('quizzes') || '[]')
+    const db = await getDb()
+    if (db) {
+      const tx = db.transaction(['quizzes', 'quizMeta'], 'readwrite')
+      tx.objectStore('quizzes').delete(quizId)
+      tx.objectStore('quizMeta').delete(quizId)
+      await transactionDone(tx)
+      return { success: true }
+    }
+
+    const quizzes = JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]')
     const filtered = quizzes.filter(q => q.id !== quizId)
-    localStorage.setItem('quizzes', JSON.stringify(filtered))
+    localStorage.setItem(LEGACY_KEY, JSON.stringify(filtered))
     return { success: true }
   }
 }
@@ -124,8 +267,16 @@ export const deleteAllQuizzes = async () => {
       throw error
     }
   } else {
-    // Browser: use LocalStorage
-    localStorage.setItem('quizzes', JSON.stringify([]))
+    const db = await getDb()
+    if (db) {
+      const tx = db.transaction(['quizzes', 'quizMeta'], 'readwrite')
+      tx.objectStore('quizzes').clear()
+      tx.objectStore('quizMeta').clear()
+      await transactionDone(tx)
+      return { success: true }
+    }
+
+    localStorage.setItem(LEGACY_KEY, JSON.stringify([]))
     return { success: true }
   }
 }
@@ -142,8 +293,13 @@ export const getQuizById = async (quizId) => {
       return null
     }
   } else {
-    // Browser: use LocalStorage
-    const quizzes = JSON.parse(localStorage.getItem('quizzes') || '[]')
+    // Browser: only this quiz is loaded
+    const db = await getDb()
+    if (db) {
+      return (await requestResult(db.transaction('quizzes').objectStore('quizzes').get(quizId))) || null
+    }
+
+    const quizzes = JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]')
     return quizzes.find(q => q.id === quizId) || null
   }
 }
@@ -178,8 +334,15 @@ export const importQuizzes = async (quizzesToImport) => {
       throw error
     }
   } else {
-    // Browser: use LocalStorage
-    const existing = JSON.parse(localStorage.getItem('quizzes') || '[]')
+    const db = await getDb()
+    if (db) {
+      const existingIds = new Set(await requestResult(db.transaction('quizMeta').objectStore('quizMeta').getAllKeys()))
+      const updated = quizzesToImport.filter(q => existingIds.has(q.id)).length
+      await putQuizzes(db, quizzesToImport)
+      return { success: true, added: quizzesToImport.length - updated, updated, total: quizzesToImport.length }
+    }
+
+    const existing = JSON.parse(localStorage.getItem(LEGACY_KEY) || '[]')
     const existingMap = new Map(existing.map(q => [q.id, q]))
 
     let updated = 0
@@ -198,7 +361,7 @@ export const importQuizzes = async (quizzesToImport) => {
       }
     }
 
-    localStorage.setItem('quizzes', JSON.stringify(Array.from(existingMap.values())))
+    localStorage.setItem(LEGACY_KEY, JSON.stringify(Array.from(existingMap.values())))
     return { success: true, added, updated, total: quizzesToImport.length }
   }
 }
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Buzzer-Arbitrierung Test - hunderte gleichzeitige Drücker, genau ein Gewinner
+
+Pro Runde drücken alle Spieler gleichzeitig; der Server muss genau einen
+Gewinner festlegen und ihn mit einer einzigen Sperre an alle melden.
+Misst die Zeit vom Drücken bis zur Sperre und die Freigabe per Broadcast.
+
+Beispiel:
+    python3 test-buzzer-arbitration.py --server http://localhost:3001 --pressers 500 --rounds 20
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.arbitration_bench import run_arbitration
+from harness.buzzer_bench import save_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Buzzer-Arbitrierung unter gleichzeitigen Drücken prüfen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--pressers', type=int, default=300, help='Gleichzeitige Drücker')
+    parser.add_argument('--rounds', type=int, default=10, help='Buzzer-Runden')
+    parser.add_argument('--timeout', type=float, default=30, help='Timeout pro Runde (s)')
+    parser.add_argument('--output', default=f"test-screenshots/bench/buzzer-arbitration-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"🔔 BUZZER-ARBITRIERUNG: {args.pressers} Drücker × {args.rounds} Runden")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_arbitration(args.server, args.pressers, args.rounds, args.timeout))
+
+    print(f"{'Messung':<28} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for label, key in (('Drücken → Sperre (alle)', 'press_to_lock_ms'),
+                       ('Drücken → Sperre (Gewinner)', 'winner_press_to_lock_ms'),
+                       ('Freigabe-Broadcast', 'rearm_broadcast_ms')):
+        latency = report[key]
+        print(f"{label:<28} {latency.get('p50', '-'):>9} {latency.get('p95', '-'):>9} "
+              f"{latency.get('p99', '-'):>9} {latency.get('max', '-'):>9}")
+
+    ranks = report['winner_send_rank']
+    print(f"\n🏆 Gewinner war {ranks['first']}/{args.rounds}× der zuerst gesendete Druck (schlechtester Rang: {ranks['max']})")
+    if report['hottest_handler']:
+        print(f"🔥 Teuerster Handler: {report['hottest_handler']}")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    failures = report['failures']
+    if failures:
+        print(f"❌ {len(failures)} Verstöße gegen 'genau ein Gewinner'")
+        for failure in failures[:10]:
+            print(f"   {failure}")
+        sys.exit(1)
+    print(f"✅ {args.rounds} Runden mit {report['joined']} Drückern: jeweils genau ein Gewinner")
+
+
+if __name__ == '__main__':
+    main()
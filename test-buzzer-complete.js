@@ -4,6 +4,10 @@
  */
 const { chromium } = require('playwright');
 const fs = require('fs');
+const path = require('path');
+
+// Ablage für Screenshots und Logs (wie harness/paths.py: QUIZER_ARTIFACT_DIR überschreibt)
+const ARTIFACT_DIR = process.env.QUIZER_ARTIFACT_DIR || path.join(__dirname, 'test-screenshots');
 
 async function test() {
   console.log('\n' + '='.repeat(70));
@@ -142,7 +146,7 @@ async function test() {
 
     // Screenshot Lobby
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-host-lobby.png'
+      path: path.join(ARTIFACT_DIR, 'complete-host-lobby.png')
     });
     console.log('📸 Screenshot: complete-host-lobby.png');
 
@@ -165,7 +169,7 @@ async function test() {
 
     // Screenshot Join
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-user-join.png'
+      path: path.join(ARTIFACT_DIR, 'complete-user-join.png')
     });
     console.log('📸 Screenshot: complete-user-join.png');
 
@@ -175,7 +179,7 @@ async function test() {
 
     // Screenshot User in Lobby
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-user-lobby.png'
+      path: path.join(ARTIFACT_DIR, 'complete-user-lobby.png')
     });
     console.log('📸 Screenshot: complete-user-lobby.png');
 
@@ -194,7 +198,7 @@ async function test() {
 
     // Screenshot Host Lobby mit Spieler
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-host-lobby-with-player.png'
+      path: path.join(ARTIFACT_DIR, 'complete-host-lobby-with-player.png')
     });
     console.log('📸 Screenshot: complete-host-lobby-with-player.png');
 
@@ -209,12 +213,12 @@ async function test() {
 
     // 7. Screenshots nach Start
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-host-question.png'
+      path: path.join(ARTIFACT_DIR, 'complete-host-question.png')
     });
     console.log('📸 Screenshot: complete-host-question.png');
 
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-user-question.png'
+      path: path.join(ARTIFACT_DIR, 'complete-user-question.png')
     });
     console.log('📸 Screenshot: complete-user-question.png');
 
@@ -307,7 +311,7 @@ async function test() {
       timestamp: new Date().toISOString()
     };
 
-    const logPath = '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-logs.json';
+    const logPath = path.join(ARTIFACT_DIR, 'complete-logs.json');
     fs.writeFileSync(logPath, JSON.stringify(logData, null, 2));
     console.log(`\n✅ Vollständige Logs gespeichert: complete-logs.json`);
 
@@ -341,10 +345,10 @@ async function test() {
 
     try {
       await hostPage.screenshot({
-        path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-error-host.png'
+        path: path.join(ARTIFACT_DIR, 'complete-error-host.png')
       });
       await userPage.screenshot({
-        path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/complete-error-user.png'
+        path: path.join(ARTIFACT_DIR, 'complete-error-user.png')
       });
       console.log('📸 Error-Screenshots gespeichert');
     } catch (e) {
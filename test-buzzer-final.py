@@ -2,41 +2,50 @@
 """
 Finaler Buzzer Test - mit Hard Reload und Port 3000
 """
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 import time
 import json
 import sys
 
-def test_buzzer():
-    # Setup driver mit Console Logging und AGGRESSIVEN Cache-Optionen
-    options = Options()
-    options.add_argument('--incognito')  # Frische Browser-Session
-    options.add_argument('--disable-cache')
-    options.add_argument('--disable-application-cache')
-    options.add_argument('--disk-cache-size=0')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--disable-gpu-shader-disk-cache')
-    options.add_argument('--media-cache-size=0')
-    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
-
-    driver = webdriver.Chrome(options=options)
+from harness import PlayerSwarm
+from harness.console_stream import ConsoleStream
+from harness.driver_pool import DriverPool
+from harness.paths import artifact_path, run_dir
+from harness.screenshots import ScreenshotWorker
+from harness.triage import LogClassifier
+from harness.waits import StepTimeout, WaitEngine
+
+def test_buzzer(base_url='http://localhost:5173/Quiz', test_name='LOCAL', server_url='http://localhost:3001',
+                pool=None, keep_open=10):
+    # Pool-Browser haben Console Logging und AGGRESSIVE Cache-Optionen,
+    # jede Ausleihe läuft in einem frischen Browser-Context (wie Inkognito)
+    own_pool = pool is None
+    pool = pool or DriverPool(size=1, headless=False)
+    lease = pool.lease('host')
+    driver = lease.driver
+    waits = WaitEngine(driver, role='host').install()
+    swarm = PlayerSwarm(server_url)
+    console = ConsoleStream(driver, 'host', artifact_path(f'console-FINAL-{test_name}-host.ndjson')).start()
+    shots = ScreenshotWorker(run_dir(f'buzzer-final-{test_name}'))
+    camera = shots.camera(driver, 'host', console=console, waits=waits)
+    ok = False
 
     try:
         print("\n" + "="*70)
-        print("🧪 FINAL BUZZER TEST")
+        print(f"🧪 FINAL BUZZER TEST ({test_name})")
         print("="*70 + "\n")
 
         # 1. Öffne Seite mit Hard Refresh
-        print("📂 Öffne localhost:5173/Quiz...")
-        driver.get('http://localhost:5173/Quiz/')
-        time.sleep(1)
+        print(f"📂 Öffne {base_url}...")
+        with waits.step('Startseite laden'):
+            driver.get(f'{base_url}/')
+            waits.dom_ready()
 
         # HARD REFRESH mit Ctrl+Shift+R
         print("🔄 Führe Hard Refresh durch...")
-        driver.execute_script("location.reload(true);")
-        time.sleep(2)
+        with waits.step('Hard Refresh'):
+            driver.execute_cdp_cmd('Page.reload', {'ignoreCache': True})
+            waits.dom_ready()
 
         # 2. Erstelle Quiz
         print("📝 Erstelle Buzzer-Quiz...")
@@ -61,48 +70,53 @@ def test_buzzer():
 
         # 3. Navigiere zur Host-Seite
         print("🎮 Navigiere zur Host-Seite...")
-        driver.get(f'http://localhost:5173/Quiz/host/{quiz_id}')
-        time.sleep(3)
+        driver.get(f'{base_url}/host/{quiz_id}')
 
-        # 4. Prüfe Socket-Verbindung
+        # 4. Prüfe Socket-Verbindung (echtes connect + room-created statt window.io)
         print("🔌 Prüfe Socket-Verbindung...")
-        socket_check = driver.execute_script("""
-            // Prüfe ob socket.io geladen wurde
-            if (window.io) {
-                return 'socket.io library loaded';
-            }
-            return 'socket.io NOT loaded';
-        """)
-        print(f"   {socket_check}")
+        with waits.step('Socket verbunden'):
+            waits.socket_event('connect')
+        with waits.step('room-created'):
+            waits.socket_event('room-created')
+
+        # Ein virtueller Spieler, damit "Spiel starten" aktiv wird
+        with waits.step('Virtueller Spieler tritt bei'):
+            join_code = waits.element(By.CSS_SELECTOR, ".join-code").text.replace(" ", "")
+            swarm.join(join_code, 1, name_prefix='Final Spieler', autoplay=False)
+            waits.socket_event('player-joined')
 
         # 5. Klicke "Spiel starten"
         print("🚀 Klicke 'Spiel starten'...")
-        start_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Spiel starten')]")
-        start_btn.click()
-        print("✅ Button geklickt")
+        with waits.step('Spiel starten bis game-started'):
+            waits.element(By.XPATH, "//button[contains(text(), 'Spiel starten')]", clickable=True).click()
+            print("✅ Button geklickt")
+            waits.socket_event('game-started')
 
-        # 6. Warte auf Frage
-        print("⏰ Warte 5 Sekunden auf Buzzer-Frage...")
-        time.sleep(5)
+        # 6. Warte auf Frage (Ergebnis wird unten ausgewertet)
+        print("⏰ Warte auf Buzzer-Frage...")
+        try:
+            with waits.step('Buzzer-Frage gerendert'):
+                waits.text("Was ist die Hauptstadt von Deutschland?")
+        except StepTimeout:
+            pass
 
         # 7. Screenshot
-        screenshot_path = '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/FINAL-TEST.png'
-        driver.save_screenshot(screenshot_path)
-        print(f"📸 Screenshot: {screenshot_path}")
+        camera.shot('Buzzer-Frage')
+        print(f"📸 Screenshot eingereiht ({shots.directory})")
 
         # 8. Hole Console Logs
-        logs = driver.get_log('browser')
+        console.poll()
+        logs = list(console.ring)
         print(f"\n" + "="*70)
-        print(f"📋 CONSOLE LOGS ({len(logs)} Einträge)")
+        print(f"📋 CONSOLE LOGS ({console.total} Einträge, letzte {len(logs)} im Speicher)")
         print("="*70 + "\n")
 
-        errors = []
-        for log in logs:
-            if log['level'] == 'SEVERE':
-                errors.append(log)
-                print(f"❌ ERROR: {log['message'][:300]}")
-            elif 'error' in log['message'].lower() and 'React Router' not in log['message']:
-                print(f"⚠️  {log['message'][:200]}")
+        triage = LogClassifier().triage(logs)
+        errors = triage['errors']
+        for log in errors:
+            print(f"❌ ERROR: {log['message'][:300]}")
+        for log in triage['warnings']:
+            print(f"⚠️  {log['message'][:200]}")
 
         # 9. Prüfe Seiten-Inhalt
         body = driver.find_element(By.TAG_NAME, 'body').text
@@ -121,21 +135,23 @@ def test_buzzer():
         # 10. Speichere Logs
         log_data = {
             'quiz_id': quiz_id,
-            'logs_count': len(logs),
+            'logs_count': console.total,
             'errors_count': len(errors),
             'body_length': len(body),
             'has_buzzer_question': "Was ist die Hauptstadt von Deutschland?" in body,
-            'all_logs': logs,
-            'errors': errors
+            'console': console.summary(),
+            'errors': errors,
+            'steps': waits.summary(),
+            'screenshots': shots.manifest_path
         }
 
-        with open('/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/FINAL-LOGS.json', 'w') as f:
+        with open(artifact_path(f'FINAL-LOGS-{test_name}.json'), 'w') as f:
             json.dump(log_data, f, indent=2)
 
         print(f"\n" + "="*70)
         print("📊 ZUSAMMENFASSUNG")
         print("="*70)
-        print(f"Logs: {len(logs)}")
+        print(f"Logs: {console.total}")
         print(f"Errors: {len(errors)}")
         print(f"Buzzer-Frage sichtbar: {'JA ✅' if log_data['has_buzzer_question'] else 'NEIN ❌'}")
 
@@ -145,23 +161,31 @@ def test_buzzer():
                 print(f"  - {err['message'][:200]}")
 
         print(f"\n✅ Test abgeschlossen")
-        print(f"📂 Logs: FINAL-LOGS.json")
-        print(f"📸 Screenshot: FINAL-TEST.png\n")
+        print(f"📂 Logs: FINAL-LOGS-{test_name}.json")
+        print(f"📸 Screenshots: {shots.directory}\n")
+
+        ok = not errors and log_data['has_buzzer_question']
 
-        # Warte 10 Sekunden
-        print("⏰ Browser bleibt 10 Sekunden offen...")
-        time.sleep(10)
+        # Browser offen lassen zum Inspizieren
+        if keep_open:
+            print(f"⏰ Browser bleibt {keep_open} Sekunden offen...")
+            time.sleep(keep_open)
 
     except Exception as e:
         print(f"\n❌ FEHLER: {e}")
         import traceback
         traceback.print_exc()
-        try:
-            driver.save_screenshot('/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/ERROR-FINAL.png')
-        except:
-            pass
+        camera.shot('Fehler', tag='error')
     finally:
-        driver.quit()
+        summary = shots.close()
+        print(f"📸 Screenshots: {summary['written']} gespeichert, {summary['duplicates']} Duplikate → {summary['manifest']}")
+        console.stop()
+        lease.release()
+        swarm.close()
+        if own_pool:
+            pool.close()
+
+    return ok
 
 if __name__ == '__main__':
     test_buzzer()
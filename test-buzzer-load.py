@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Last-Test ohne Browser - tausende virtuelle Spieler über viele Räume
+
+Beispiel:
+    python3 test-buzzer-load.py --server http://localhost:3001 --rooms 20 --players 250
+"""
+
+import argparse
+import asyncio
+import json
+
+from harness import run_load
+from harness.metrics import MetricsScope
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Virtuelle Spieler gegen server/index.js')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--rooms', type=int, default=1, help='Anzahl paralleler Räume')
+    parser.add_argument('--players', type=int, default=100, help='Spieler pro Raum')
+    parser.add_argument('--questions', type=int, default=3, help='Fragen pro Quiz')
+    parser.add_argument('--type', choices=['multiple', 'buzzer'], default='multiple', help='Fragetyp')
+    parser.add_argument('--question-time', type=float, default=3.0, help='Sekunden pro Frage')
+    parser.add_argument('--concurrency', type=int, default=200, help='Gleichzeitige Verbindungsaufbauten')
+    parser.add_argument('--report', help='Ergebnis zusätzlich als JSON speichern')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"🧪 LAST-TEST: {args.rooms} Räume × {args.players} Spieler")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    with MetricsScope(args.server) as metrics:
+        stats = asyncio.run(run_load(
+            args.server,
+            rooms=args.rooms,
+            players_per_room=args.players,
+            question_count=args.questions,
+            question_type=args.type,
+            question_time=args.question_time,
+            connect_concurrency=args.concurrency
+        ))
+    stats['server_metrics'] = metrics.delta
+
+    print("📊 ZUSAMMENFASSUNG")
+    print(f"   Spieler beigetreten: {stats['joined']} ({stats['join_errors']} Fehler) in {stats['join_seconds']}s")
+    print(f"   Antworten beim Host: {stats['answers']}")
+    print(f"   Buzzer beim Host:    {stats['buzzer_presses']}")
+    print(f"   Räume beendet:       {stats['finished_rooms']}/{stats['rooms']}")
+
+    if metrics.delta:
+        print("\n🔥 SERVER-EVENTS (Anzahl, Handler-Zeit gesamt, p95)")
+        for name, event in list(metrics.delta['events'].items())[:8]:
+            print(f"   {name:<24} {event['count']:>8} {event['total_ms']:>10} ms  ≤ {event['p95_ms']} ms")
+        print(f"   Gesendet: {metrics.delta['emitted']['messages']} Nachrichten, "
+              f"{metrics.delta['emitted']['bytes']:,} Bytes")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(stats, f, indent=2)
+        print(f"\n✅ Report gespeichert: {args.report}")
+
+
+if __name__ == '__main__':
+    main()
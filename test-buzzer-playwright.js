@@ -6,6 +6,9 @@ const { chromium } = require('playwright');
 const fs = require('fs');
 const path = require('path');
 
+// Ablage für Screenshots und Logs (wie harness/paths.py: QUIZER_ARTIFACT_DIR überschreibt)
+const ARTIFACT_DIR = process.env.QUIZER_ARTIFACT_DIR || path.join(__dirname, 'test-screenshots');
+
 async function test() {
   console.log('\n' + '='.repeat(70));
   console.log('🧪 PLAYWRIGHT BUZZER TEST');
@@ -112,7 +115,7 @@ async function test() {
 
     // Screenshot Lobby
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-host-lobby.png'
+      path: path.join(ARTIFACT_DIR, 'playwright-host-lobby.png')
     });
 
     // 4. USER: Join Quiz
@@ -157,7 +160,7 @@ async function test() {
 
     // Screenshot User Lobby
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-user-lobby.png'
+      path: path.join(ARTIFACT_DIR, 'playwright-user-lobby.png')
     });
 
     // 5. HOST: Prüfe ob Spieler sichtbar
@@ -180,10 +183,10 @@ async function test() {
 
     // Screenshots
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-host-question.png'
+      path: path.join(ARTIFACT_DIR, 'playwright-host-question.png')
     });
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-user-question.png'
+      path: path.join(ARTIFACT_DIR, 'playwright-user-question.png')
     });
 
     // 8. Prüfe Host-Inhalt
@@ -238,7 +241,7 @@ async function test() {
     };
 
     fs.writeFileSync(
-      '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-logs.json',
+      path.join(ARTIFACT_DIR, 'playwright-logs.json'),
       JSON.stringify(testData, null, 2)
     );
 
@@ -281,10 +284,10 @@ async function test() {
 
     try {
       await hostPage.screenshot({
-        path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-error-host.png'
+        path: path.join(ARTIFACT_DIR, 'playwright-error-host.png')
       });
       await userPage.screenshot({
-        path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/playwright-error-user.png'
+        path: path.join(ARTIFACT_DIR, 'playwright-error-user.png')
       });
     } catch (e) {
       console.error('Screenshot-Fehler:', e.message);
@@ -1,38 +1,46 @@
 #!/usr/bin/env python3
 """
 Vereinfachter Buzzer Test - Testet nur die Host-Seite
+(ein virtueller Spieler sorgt dafür, dass "Spiel starten" aktiv wird)
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 import time
 import json
 
-def setup_driver():
-    options = Options()
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-cache')
-    options.add_argument('--disk-cache-size=1')
-    options.add_argument('--aggressive-cache-discard')
-    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
-    return webdriver.Chrome(options=options)
-
-def test_host_only(base_url, test_name):
-    """Teste nur Host-Seite - simuliere Spiel-Start manuell"""
+from harness import PlayerSwarm
+from harness.console_stream import ConsoleStream
+from harness.driver_pool import DriverPool
+from harness.paths import artifact_path, run_dir
+from harness.screenshots import ScreenshotWorker
+from harness.triage import LogClassifier
+from harness.waits import WaitEngine
+
+def test_host_only(base_url, test_name, server_url='http://localhost:3001', pool=None, keep_open=10):
+    """Teste nur Host-Seite - Spiel-Start mit einem virtuellen Spieler"""
     print(f"\n{'='*70}")
     print(f"🧪 TEST: {test_name}")
     print(f"🌐 URL: {base_url}")
     print(f"{'='*70}\n")
 
-    driver = setup_driver()
+    own_pool = pool is None
+    pool = pool or DriverPool(size=1, headless=False, extra_args=('--aggressive-cache-discard',))
+    lease = pool.lease('host')
+    driver = lease.driver
+    waits = WaitEngine(driver, role='host').install()
+    swarm = PlayerSwarm(server_url)
+    # Szenario im Dateinamen: run-buzzer-matrix.py startet mehrere Szenarien pro Ziel parallel
+    console = ConsoleStream(driver, 'host', artifact_path(f'console-buzzer-simple-{test_name}-host.ndjson')).start()
+    shots = ScreenshotWorker(run_dir(f'buzzer-simple-{test_name}'))
+    camera = shots.camera(driver, 'host', console=console, waits=waits)
+    ok = False
 
     try:
         # Schritt 1: Quiz erstellen
         print("📝 Erstelle Buzzer-Quiz...")
-        driver.get(base_url)
-        time.sleep(2)
+        with waits.step('Startseite laden'):
+            driver.get(base_url)
+            waits.dom_ready()
 
         quiz_js = """
         const testQuiz = {
@@ -56,74 +64,47 @@ def test_host_only(base_url, test_name):
 
         # Schritt 2: Zur Host-Seite
         print("🎮 Öffne Host-Seite...")
-        driver.get(f"{base_url}/host/{quiz_id}")
-        time.sleep(3)
+        with waits.step('Host-Seite laden bis room-created'):
+            driver.get(f"{base_url}/host/{quiz_id}")
+            waits.socket_event('room-created')
 
         # Schritt 3: Console Logs VOR Spiel-Start
-        logs_before = driver.get_log('browser')
-        errors_before = [l for l in logs_before if l['level'] == 'SEVERE']
-        print(f"📊 Logs vor Start: {len(logs_before)} ({len(errors_before)} Errors)")
-
-        # Schritt 4: Simuliere Spiel-Start durch Socket-Event
-        print("🚀 Simuliere Spiel-Start...")
-
-        # Methode 1: Klicke auf Start-Button (wenn Socket läuft)
-        try:
-            start_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Spiel starten')]")
-            start_btn.click()
+        console.poll()
+        print(f"📊 Logs vor Start: {console.total} ({console.counts['SEVERE']} Errors)")
+
+        # Schritt 4: Echter Spiel-Start über den Socket-Server
+        print("🚀 Starte Spiel...")
+        with waits.step('Join-Code sichtbar'):
+            join_code = waits.element(By.CSS_SELECTOR, ".join-code").text.replace(" ", "")
+        with waits.step('Virtueller Spieler tritt bei'):
+            swarm.join(join_code, 1, name_prefix='Debug Spieler', autoplay=False)
+            waits.socket_event('player-joined')
+        with waits.step('Spiel starten bis game-started'):
+            waits.element(By.XPATH, "//button[contains(text(), 'Spiel starten')]", clickable=True).click()
             print("✅ Start-Button geklickt")
-            time.sleep(4)
-        except:
-            print("⚠️  Kein Start-Button - Socket-Server läuft nicht")
-            print("⚙️  Simuliere game-state direkt...")
-
-            # Methode 2: Setze game-state manuell auf 'question'
-            simulate_js = """
-            // Simuliere dass das Spiel gestartet wurde
-            const event = new CustomEvent('game-started', {
-                detail: {
-                    question: {
-                        type: 'buzzer',
-                        question: 'Was ist die Hauptstadt von Deutschland?',
-                        timeLimit: 30,
-                        points: 100
-                    },
-                    questionIndex: 0,
-                    totalQuestions: 1
-                }
-            });
-            window.dispatchEvent(event);
-            return 'Game-started Event dispatched';
-            """
-            result = driver.execute_script(simulate_js)
-            print(f"⚙️  {result}")
-            time.sleep(2)
+            waits.socket_event('game-started')
+        with waits.step('Buzzer-Frage gerendert'):
+            waits.text("Was ist die Hauptstadt von Deutschland?")
 
         # Schritt 5: Screenshot NACH Start
-        screenshot_path = f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/host-after-start-{test_name}.png'
-        driver.save_screenshot(screenshot_path)
-        print(f"📸 Screenshot: {screenshot_path}")
+        camera.shot('Nach Spiel-Start')
+        print(f"📸 Screenshot eingereiht ({shots.directory})")
 
         # Schritt 6: Console Logs NACH Start
-        logs_after = driver.get_log('browser')
+        console.poll()
+        logs_after = list(console.ring)
         print(f"\n{'='*70}")
-        print(f"📋 CONSOLE LOGS NACH SPIEL-START ({len(logs_after)} Einträge)")
+        print(f"📋 CONSOLE LOGS NACH SPIEL-START ({console.total} Einträge, letzte {len(logs_after)} im Speicher)")
         print(f"{'='*70}\n")
 
-        errors = []
-        warnings = []
-
-        for log in logs_after:
-            msg = log['message']
-            level = log['level']
+        triage = LogClassifier().triage(logs_after)
+        errors = triage['errors']
+        warnings = triage['warnings']
 
-            if level == 'SEVERE' or 'error' in msg.lower():
-                errors.append(log)
-                print(f"❌ ERROR: {msg[:250]}")
-            elif level == 'WARNING' and 'React Router' not in msg:
-                warnings.append(log)
-                if 'Cannot read' in msg or 'undefined' in msg or 'null' in msg:
-                    print(f"⚠️  WARN: {msg[:250]}")
+        for log in errors:
+            print(f"❌ ERROR: {log['message'][:250]}")
+        for log in warnings:
+            print(f"⚠️  WARN: {log['message'][:250]}")
 
         # Schritt 7: Prüfe Seiten-Inhalt
         print(f"\n{'='*70}")
@@ -160,16 +141,13 @@ def test_host_only(base_url, test_name):
         print(f"\n{'='*70}")
         print("📊 ZUSAMMENFASSUNG")
         print(f"{'='*70}\n")
-        print(f"Gesamt Logs: {len(logs_after)}")
+        print(f"Gesamt Logs: {console.total}")
         print(f"Errors: {len(errors)}")
         print(f"Warnings: {len(warnings)}")
         print(f"Body Length: {len(body_text)} Zeichen")
 
         # Kritische Errors?
-        critical_errors = [e for e in errors if
-                          'Cannot read' in e['message'] or
-                          'undefined' in e['message'] or
-                          'TypeError' in e['message']]
+        critical_errors = triage['critical']
 
         if critical_errors:
             print(f"\n🔴 {len(critical_errors)} KRITISCHE FEHLER GEFUNDEN:")
@@ -177,26 +155,31 @@ def test_host_only(base_url, test_name):
                 print(f"\n   {err['message'][:400]}")
 
         # Speichere Logs
-        log_file = f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/logs-{test_name}.json'
+        log_file = artifact_path(f'logs-buzzer-simple-{test_name}.json')
         with open(log_file, 'w') as f:
             json.dump({
                 'test': test_name,
                 'url': base_url,
                 'quiz_id': quiz_id,
-                'logs_count': len(logs_after),
+                'logs_count': console.total,
                 'errors_count': len(errors),
                 'warnings_count': len(warnings),
                 'body_length': len(body_text),
                 'has_question': "Was ist die Hauptstadt von Deutschland?" in body_text,
-                'all_logs': logs_after,
+                'console': console.summary(),
                 'errors': errors,
-                'critical_errors': critical_errors
+                'critical_errors': critical_errors,
+                'steps': waits.summary(),
+                'screenshots': shots.manifest_path
             }, f, indent=2)
         print(f"\n✅ Logs gespeichert: {log_file}")
 
+        ok = not critical_errors and "Was ist die Hauptstadt von Deutschland?" in body_text
+
         # Halte Browser offen
-        print("\n⏰ Browser bleibt 10 Sekunden offen zum Inspizieren...")
-        time.sleep(10)
+        if keep_open:
+            print(f"\n⏰ Browser bleibt {keep_open} Sekunden offen zum Inspizieren...")
+            time.sleep(keep_open)
 
     except Exception as e:
         print(f"\n❌ EXCEPTION: {str(e)}")
@@ -204,19 +187,21 @@ def test_host_only(base_url, test_name):
         traceback.print_exc()
 
         # Error Screenshot
-        try:
-            driver.save_screenshot(f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/EXCEPTION-{test_name}.png')
-        except:
-            pass
+        camera.shot('Exception', tag='error')
 
     finally:
-        driver.quit()
+        summary = shots.close()
+        print(f"📸 Screenshots: {summary['written']} gespeichert, {summary['duplicates']} Duplikate → {summary['manifest']}")
+        console.stop()
+        lease.release()
+        swarm.close()
+        if own_pool:
+            pool.close()
         print("\n✅ Test abgeschlossen\n")
 
-def main():
-    import os
-    os.makedirs('/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots', exist_ok=True)
+    return ok
 
+def main():
     # Test Local
     test_host_only('http://localhost:5173/Quiz', 'LOCAL')
 
@@ -2,6 +2,10 @@
  * Test für Buzzer Freigabe/Sperren Funktion
  */
 const { chromium } = require('playwright');
+const path = require('path');
+
+// Ablage für Screenshots und Logs (wie harness/paths.py: QUIZER_ARTIFACT_DIR überschreibt)
+const ARTIFACT_DIR = process.env.QUIZER_ARTIFACT_DIR || path.join(__dirname, 'test-screenshots');
 
 async function test() {
   console.log('\n' + '='.repeat(70));
@@ -130,7 +134,7 @@ async function test() {
 
     // Screenshot nach Buzzer
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/unlock-host-after-buzz.png'
+      path: path.join(ARTIFACT_DIR, 'unlock-host-after-buzz.png')
     });
 
     // 7. Prüfe ob User1 Buzzer gesperrt ist
@@ -223,10 +227,10 @@ async function test() {
 
     // Screenshots
     await user1Page.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/unlock-user1-after-unlock.png'
+      path: path.join(ARTIFACT_DIR, 'unlock-user1-after-unlock.png')
     });
     await user2Page.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/unlock-user2-after-unlock.png'
+      path: path.join(ARTIFACT_DIR, 'unlock-user2-after-unlock.png')
     });
 
     // 11. TEST: Einzelne Freigabe
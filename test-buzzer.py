@@ -1,52 +1,49 @@
 #!/usr/bin/env python3
 """
 Buzzer Question Test Script
-Testet Host und User Seiten und sammelt Console Logs
+Testet die Host-Seite im Browser, Spieler sind virtuelle Socket.IO Clients
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 import time
 import json
 
-def setup_driver(headless=False):
-    """Erstelle einen Chrome WebDriver mit Console Logging"""
-    options = Options()
-    if headless:
-        options.add_argument('--headless')
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
+from harness import PlayerSwarm
+from harness.console_stream import ConsoleStream
+from harness.driver_pool import DriverPool
+from harness.paths import artifact_path, run_dir
+from harness.screenshots import ScreenshotWorker
+from harness.triage import LogClassifier
+from harness.waits import WaitEngine
 
-    # Enable browser logging
-    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
-
-    driver = webdriver.Chrome(options=options)
-    return driver
-
-def get_console_logs(driver):
-    """Hole alle Console Logs vom Browser"""
-    logs = driver.get_log('browser')
-    return logs
-
-def test_buzzer_question(base_url, test_name):
-    """Teste Buzzer-Frage mit Host und User"""
+def test_buzzer_question(base_url, test_name, server_url, player_count=3, pool=None, keep_open=5):
+    """Teste Buzzer-Frage: Host im Browser, Spieler über das Socket-Protokoll"""
     print(f"\n{'='*60}")
     print(f"TEST: {test_name}")
     print(f"URL: {base_url}")
+    print(f"Backend: {server_url} ({player_count} virtuelle Spieler)")
     print(f"{'='*60}\n")
 
-    # Setup drivers
-    host_driver = setup_driver(headless=False)
-    user_driver = setup_driver(headless=False)
+    # Nur der Host braucht noch einen Browser (Rendering-Check)
+    own_pool = pool is None
+    pool = pool or DriverPool(size=1, headless=False)
+    host_lease = pool.lease('host')
+    host_driver = host_lease.driver
+    swarm = PlayerSwarm(server_url)
+    waits = WaitEngine(host_driver, role='host').install()
+    # Szenario im Dateinamen: run-buzzer-matrix.py startet mehrere Szenarien pro Ziel parallel
+    artifact_name = f'buzzer-{test_name.replace(" ", "-")}'
+    console = ConsoleStream(host_driver, 'host', artifact_path(f'console-{artifact_name}-host.ndjson')).start()
+    shots = ScreenshotWorker(run_dir(f'buzzer-{test_name}'))
+    camera = shots.camera(host_driver, 'host', console=console, waits=waits)
+    ok = False
 
     try:
         # SCHRITT 1: Erstelle Quiz mit Buzzer-Frage direkt im localStorage
         print("📝 Erstelle Test-Quiz mit Buzzer-Frage...")
-        host_driver.get(base_url)
-        time.sleep(2)
+        with waits.step('Startseite laden'):
+            host_driver.get(base_url)
+            waits.dom_ready()
 
         # Injiziere Quiz direkt in localStorage
         quiz_js = """
@@ -75,46 +72,40 @@ def test_buzzer_question(base_url, test_name):
         # SCHRITT 2: Navigiere zur Host-Seite
         print("🎮 Navigiere zur Host-Seite...")
         host_url = f"{base_url}/host/{quiz_id}"
-        host_driver.get(host_url)
-        time.sleep(3)
+        with waits.step('Host-Seite laden bis room-created'):
+            host_driver.get(host_url)
+            waits.socket_event('room-created')
 
         # Prüfe Console Logs nach dem Laden
-        host_logs_initial = get_console_logs(host_driver)
-        print(f"📊 Host Logs (initial): {len(host_logs_initial)} Einträge")
+        console.poll()
+        print(f"📊 Host Logs (initial): {console.total} Einträge")
 
         # SCHRITT 3: Hole Join-Code
-        join_code_element = host_driver.find_element(By.CSS_SELECTOR, ".lobby-code, [class*='code']")
+        with waits.step('Join-Code sichtbar'):
+            join_code_element = waits.element(By.CSS_SELECTOR, ".join-code, .lobby-code")
         join_code = join_code_element.text.replace(" ", "")
         print(f"🔢 Join Code: {join_code}")
 
-        # SCHRITT 4: User tritt bei
-        print("👤 User tritt bei...")
-        user_driver.get(f"{base_url}/join?code={join_code}")
-        time.sleep(2)
-
-        # Fülle Name und Avatar aus
-        name_input = user_driver.find_element(By.CSS_SELECTOR, "input[placeholder*='Name'], input[type='text']")
-        name_input.send_keys("Test User")
-
-        # Wähle Avatar
-        avatars = user_driver.find_elements(By.CSS_SELECTOR, ".avatar-option, [class*='avatar']")
-        if avatars:
-            avatars[0].click()
+        # SCHRITT 4: Virtuelle Spieler treten bei
+        print(f"👤 {player_count} virtuelle Spieler treten bei...")
+        with waits.step('Spieler beitreten'):
+            joined = swarm.join(join_code, player_count, name_prefix='Test User', autoplay=False)
+        with waits.step('Host sieht alle Spieler'):
+            waits.socket_event('player-joined', count=joined)
 
-        # Klicke Beitreten
-        join_button = user_driver.find_element(By.XPATH, "//button[contains(text(), 'Beitreten') or contains(text(), 'Join')]")
-        join_button.click()
-        time.sleep(2)
-
-        print("✅ User beigetreten")
+        print(f"✅ {joined}/{player_count} Spieler beigetreten")
 
         # SCHRITT 5: Host startet das Spiel
         print("🚀 Host startet das Spiel...")
-        start_button = host_driver.find_element(By.XPATH, "//button[contains(text(), 'Spiel starten') or contains(text(), 'Start')]")
-        start_button.click()
-        time.sleep(3)
-
-        print("⏰ Warte 3 Sekunden auf Buzzer-Frage Rendering...")
+        players_started = swarm.expect_all('game-started')
+        with waits.step('Spiel starten bis game-started'):
+            start_button = waits.element(By.XPATH, "//button[contains(text(), 'Spiel starten') or contains(text(), 'Start')]", clickable=True)
+            start_button.click()
+            waits.socket_event('game-started')
+        with waits.step('Buzzer-Frage gerendert'):
+            waits.text("Was ist die Hauptstadt von Deutschland?")
+        with waits.step('Spieler erhalten Frage'):
+            swarm.wait_all(players_started)
 
         # SCHRITT 6: Sammle Console Logs von beiden
         print("\n" + "="*60)
@@ -122,36 +113,26 @@ def test_buzzer_question(base_url, test_name):
         print("="*60)
 
         # HOST LOGS
-        host_logs = get_console_logs(host_driver)
-        print(f"\n🎮 HOST LOGS ({len(host_logs)} Einträge):")
+        console.poll()
+        host_logs = list(console.ring)
+        print(f"\n🎮 HOST LOGS ({console.total} Einträge, letzte {len(host_logs)} im Speicher):")
         print("-" * 60)
 
-        host_errors = []
-        for log in host_logs:
-            if log['level'] == 'SEVERE' or 'error' in log['message'].lower():
-                host_errors.append(log)
-                print(f"❌ ERROR: {log['message']}")
-            elif 'warn' in log['message'].lower() and 'React Router' not in log['message']:
-                print(f"⚠️  WARN: {log['message'][:200]}")
-
-        # USER LOGS
-        user_logs = get_console_logs(user_driver)
-        print(f"\n👤 USER LOGS ({len(user_logs)} Einträge):")
-        print("-" * 60)
+        triage = LogClassifier().triage(host_logs)
+        host_errors = triage['errors']
+        for log in host_errors:
+            print(f"❌ ERROR: {log['message']}")
+        for log in triage['warnings']:
+            print(f"⚠️  WARN: {log['message'][:200]}")
 
-        user_errors = []
-        for log in user_logs:
-            if log['level'] == 'SEVERE' or 'error' in log['message'].lower():
-                user_errors.append(log)
-                print(f"❌ ERROR: {log['message']}")
-            elif 'warn' in log['message'].lower() and 'React Router' not in log['message']:
-                print(f"⚠️  WARN: {log['message'][:200]}")
+        # SPIELER: Haben alle die Buzzer-Frage über den Socket bekommen?
+        players_with_question = [p for p in swarm.players if p.question and p.question.get('type') == 'buzzer']
+        print(f"\n👤 SPIELER: {len(players_with_question)}/{len(swarm.players)} haben die Buzzer-Frage erhalten")
 
-        # SCHRITT 7: Screenshots
-        print("\n📸 Erstelle Screenshots...")
-        host_driver.save_screenshot(f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/host-{test_name.replace(" ", "-")}.png')
-        user_driver.save_screenshot(f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/user-{test_name.replace(" ", "-")}.png')
-        print("✅ Screenshots gespeichert")
+        # SCHRITT 7: Screenshot
+        print("\n📸 Erstelle Screenshot...")
+        camera.shot('Buzzer-Frage')
+        print(f"✅ Screenshot eingereiht ({shots.directory})")
 
         # SCHRITT 8: Prüfe ob Seite leer ist
         print("\n🔍 Prüfe Seiten-Inhalt...")
@@ -169,46 +150,38 @@ def test_buzzer_question(base_url, test_name):
             else:
                 print("⚠️  Buzzer-Frage nicht gefunden im Text")
 
-        user_body = user_driver.find_element(By.TAG_NAME, 'body')
-        user_text = user_body.text
-
-        if len(user_text.strip()) < 50:
-            print("❌ USER SEITE IST LEER!")
-            print(f"   Body Text: '{user_text[:100]}'")
-        else:
-            print(f"✅ User Seite hat Inhalt ({len(user_text)} Zeichen)")
-
         # ZUSAMMENFASSUNG
         print("\n" + "="*60)
         print("📊 ZUSAMMENFASSUNG")
         print("="*60)
         print(f"Host Errors: {len(host_errors)}")
-        print(f"User Errors: {len(user_errors)}")
+        print(f"Spieler mit Frage: {len(players_with_question)}/{len(swarm.players)}")
 
         if host_errors:
             print("\n🔴 KRITISCHE HOST FEHLER:")
             for err in host_errors:
                 print(f"  - {err['message'][:300]}")
 
-        if user_errors:
-            print("\n🔴 KRITISCHE USER FEHLER:")
-            for err in user_errors:
-                print(f"  - {err['message'][:300]}")
-
         # Speichere Logs in Datei
-        with open(f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/logs-{test_name.replace(" ", "-")}.json', 'w') as f:
+        with open(artifact_path(f'logs-{artifact_name}.json'), 'w') as f:
             json.dump({
-                'host_logs': host_logs,
-                'user_logs': user_logs,
+                'host_console': console.summary(),
                 'host_errors': host_errors,
-                'user_errors': user_errors
+                'players_joined': len(swarm.players),
+                'players_with_question': len(players_with_question),
+                'steps': waits.summary(),
+                'screenshots': shots.manifest_path
             }, f, indent=2)
 
-        print(f"\n✅ Logs gespeichert in logs-{test_name.replace(' ', '-')}.json")
+        print(f"\n✅ Logs gespeichert in logs-{artifact_name}.json")
 
-        # Halte Browser offen für 5 Sekunden
-        print("\n⏰ Browser bleiben für 5 Sekunden offen...")
-        time.sleep(5)
+        ok = not host_errors and "Was ist die Hauptstadt von Deutschland?" in host_text \
+            and len(players_with_question) == len(swarm.players) > 0
+
+        # Halte Browser offen zum Inspizieren
+        if keep_open:
+            print(f"\n⏰ Browser bleibt für {keep_open} Sekunden offen...")
+            time.sleep(keep_open)
 
     except Exception as e:
         print(f"\n❌ FEHLER: {str(e)}")
@@ -216,30 +189,33 @@ def test_buzzer_question(base_url, test_name):
         traceback.print_exc()
 
         # Speichere Error Screenshot
-        try:
-            host_driver.save_screenshot(f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/error-host-{test_name.replace(" ", "-")}.png')
-            user_driver.save_screenshot(f'/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/error-user-{test_name.replace(" ", "-")}.png')
-        except:
-            pass
+        camera.shot('Fehler', tag='error')
 
     finally:
-        print("\n🧹 Schließe Browser...")
-        host_driver.quit()
-        user_driver.quit()
+        print("\n🧹 Gebe Browser zurück...")
+        summary = shots.close()
+        print(f"📸 Screenshots: {summary['written']} gespeichert, {summary['duplicates']} Duplikate → {summary['manifest']}")
+        console.stop()
+        host_lease.release()
+        swarm.close()
+        if own_pool:
+            pool.close()
+
+    return ok
 
 def main():
     """Hauptfunktion"""
-    import os
-
-    # Erstelle Screenshots Ordner
-    os.makedirs('/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots', exist_ok=True)
-
-    # Test 1: Lokal
-    test_buzzer_question('http://localhost:5173/Quiz', 'LOCAL')
+    # Ein warmer Browser für beide Ziele (parallel: run-buzzer-matrix.py)
+    pool = DriverPool(size=1, headless=False)
+    try:
+        # Test 1: Lokal
+        test_buzzer_question('http://localhost:5173/Quiz', 'LOCAL', 'http://localhost:3001', pool=pool)
 
-    # Test 2: Online
-    print("\n\n")
-    test_buzzer_question('http://if0-39705173.infinityfreeapp.com/Quiz', 'ONLINE')
+        # Test 2: Online
+        print("\n\n")
+        test_buzzer_question('http://if0-39705173.infinityfreeapp.com/Quiz', 'ONLINE', 'https://quizer-backend-9v9a.onrender.com', pool=pool)
+    finally:
+        pool.close()
 
     print("\n\n✅ ALLE TESTS ABGESCHLOSSEN!")
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Journal-Recovery Test - Server mitten im Spiel abschießen und neu starten
+
+Startet server/index.js selbst mit JOURNAL_DIR, spielt zwei Fragen an
+(Antworten und Buzzer-Punkte), schießt den Prozess mit SIGKILL ab und
+startet ihn neu. Danach treten Host und Spieler wieder bei; geprüft wird,
+dass Punktestände und die aktuelle Frage überlebt haben. Gemessen werden
+die Zeit bis /health wieder antwortet und die Wiederherstellung laut Server.
+
+Beispiel:
+    python3 test-journal-recovery.py --players 50
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+
+from harness.buzzer_bench import save_report
+from harness.metrics import scrape
+from harness.players import VirtualHost, VirtualPlayer, build_quiz, gather_limited
+from harness.server import ServerProcess
+
+
+async def play_until_crash(server_url, quiz, players, seed):
+    """Zwei Fragen anspielen, erwartete Punkte pro Spielername zurückgeben"""
+    rng = random.Random(seed)
+    host = VirtualHost(server_url, quiz)
+    await host.create_room()
+
+    clients = [VirtualPlayer(server_url, host.room_code, f'Spieler {i + 1}', autoplay=False) for i in range(players)]
+    await gather_limited([p.join() for p in clients], 50)
+    await host.wait_for_players(players)
+
+    for question in range(2):
+        started = [p.client.expect('next-question' if question else 'game-started') for p in clients]
+        await (host.next_question() if question else host.start_game())
+        await asyncio.wait_for(asyncio.gather(*started), 10)
+
+        replies = [p.client.expect('answer-result') for p in clients]
+        for player in clients:
+            await player.submit_answer(0 if rng.random() < 0.7 else 1, round(rng.uniform(0.5, 5.0), 2))
+        await asyncio.wait_for(asyncio.gather(*replies), 10)
+
+    # Host vergibt zusätzlich Punkte wie bei einer Buzzer-Frage
+    awarded = [p.client.expect('buzzer-points-awarded') for p in clients[:5]]
+    for player in clients[:5]:
+        await host.award_points(player.player_id, 25)
+    await asyncio.wait_for(asyncio.gather(*awarded), 10)
+
+    expected = {p.name: p.score for p in clients}
+    return host.room_code, expected, host.question_index
+
+
+async def rejoin(server_url, quiz, room_code, names):
+    host = VirtualHost(server_url, quiz)
+    created = host.client.expect('room-created')
+    await host.create_room()
+    host_state = created.result()
+
+    clients = [VirtualPlayer(server_url, room_code, name, autoplay=False) for name in names]
+    states = await gather_limited([p.join() for p in clients], 50)
+    return host_state, dict(zip(names, states))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Spielstand nach Server-Absturz wiederherstellen')
+    parser.add_argument('--players', type=int, default=20, help='Spieler im Raum')
+    parser.add_argument('--port', type=int, default=3101, help='Port für den Test-Server')
+    parser.add_argument('--journal-dir', help='Journal-Ordner (Standard: temporärer Ordner)')
+    parser.add_argument('--seed', type=int, default=1, help='Zufalls-Seed')
+    parser.add_argument('--output', default=f"test-screenshots/bench/journal-recovery-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    journal_dir = args.journal_dir or tempfile.mkdtemp(prefix='quizer-journal-')
+    server = ServerProcess(args.port, env={'JOURNAL_DIR': journal_dir}, log_name='journal-recovery-server.log')
+    quiz = build_quiz(3, 'multiple', title='Journal Recovery')
+
+    print(f"\n{'='*70}")
+    print(f"💾 JOURNAL-RECOVERY: {args.players} Spieler, Journal in {journal_dir}")
+    print(f"{'='*70}\n")
+
+    server.start()
+    try:
+        room_code, expected, question_index = asyncio.run(play_until_crash(server.url, quiz, args.players, args.seed))
+        print(f"🎮 Raum {room_code}: Frage {question_index + 1}, {sum(expected.values())} Punkte verteilt")
+
+        # Letzten Journal-Batch abwarten, dann hart abschießen
+        time.sleep(0.5)
+        server.kill()
+        print("💥 Server mit SIGKILL beendet")
+
+        startup = server.start()
+        journal = (scrape(server.url) or {}).get('journal') or {}
+        print(f"🔄 Neustart: /health nach {startup * 1000:.0f} ms, Wiederherstellung {journal.get('recoveryMs')} ms")
+
+        host_state, states = asyncio.run(rejoin(server.url, quiz, room_code, list(expected)))
+    finally:
+        server.stop()
+
+    question = quiz['questions'][question_index]
+    failures = []
+    if not host_state.get('reconnected'):
+        failures.append('Host hat den Raum nicht wiedergefunden')
+    for name, score in expected.items():
+        state = states[name]
+        if isinstance(state, Exception):
+            failures.append(f'{name}: Beitritt fehlgeschlagen ({state!r})')
+            continue
+        restored = next((p['score'] for p in state['players'] if p['name'] == name), None)
+        if not state.get('reconnected') or restored != score:
+            failures.append(f'{name}: erwartet {score} Punkte, wiederhergestellt {restored}')
+        if (state.get('question') or {}).get('question') != question['question']:
+            failures.append(f'{name}: aktuelle Frage nicht wiederhergestellt')
+
+    report = {
+        'test': 'journal-recovery',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'players': args.players,
+        'room': room_code,
+        'question_index': question_index,
+        'restart_seconds': round(startup, 3),
+        'journal': journal,
+        'failures': failures
+    }
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if failures:
+        print(f"❌ {len(failures)} Abweichungen nach dem Neustart")
+        for failure in failures[:10]:
+            print(f"   {failure}")
+        sys.exit(1)
+    print(f"✅ Alle {len(expected)} Punktestände und die aktuelle Frage wiederhergestellt")
+
+
+if __name__ == '__main__':
+    main()
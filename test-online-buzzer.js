@@ -4,6 +4,10 @@
  */
 const { chromium } = require('playwright');
 const fs = require('fs');
+const path = require('path');
+
+// Ablage für Screenshots und Logs (wie harness/paths.py: QUIZER_ARTIFACT_DIR überschreibt)
+const ARTIFACT_DIR = process.env.QUIZER_ARTIFACT_DIR || path.join(__dirname, 'test-screenshots');
 
 async function test() {
   console.log('\n' + '='.repeat(70));
@@ -126,7 +130,7 @@ async function test() {
     console.log(`✅ Room Code: ${roomCode}`);
 
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-host-lobby.png'
+      path: path.join(ARTIFACT_DIR, 'online-host-lobby.png')
     });
 
     // 4. USER: Join Quiz
@@ -150,7 +154,7 @@ async function test() {
     await userPage.waitForTimeout(2000);
 
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-user-lobby.png'
+      path: path.join(ARTIFACT_DIR, 'online-user-lobby.png')
     });
 
     // 5. HOST: Prüfe Spieler
@@ -172,10 +176,10 @@ async function test() {
 
     // Screenshots
     await hostPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-host-question.png'
+      path: path.join(ARTIFACT_DIR, 'online-host-question.png')
     });
     await userPage.screenshot({
-      path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-user-question.png'
+      path: path.join(ARTIFACT_DIR, 'online-user-question.png')
     });
 
     // 7. Analysiere
@@ -235,7 +239,7 @@ async function test() {
     };
 
     fs.writeFileSync(
-      '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-logs.json',
+      path.join(ARTIFACT_DIR, 'online-logs.json'),
       JSON.stringify(logData, null, 2)
     );
     console.log('\n✅ Logs gespeichert: online-logs.json');
@@ -261,10 +265,10 @@ async function test() {
 
     try {
       await hostPage.screenshot({
-        path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-error-host.png'
+        path: path.join(ARTIFACT_DIR, 'online-error-host.png')
       });
       await userPage.screenshot({
-        path: '/Users/mytech/Downloads/MyTech Apps/quizer/test-screenshots/online-error-user.png'
+        path: path.join(ARTIFACT_DIR, 'online-error-user.png')
       });
     } catch (e) {
       console.error('Screenshot-Fehler:', e.message);
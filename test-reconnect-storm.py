@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Reconnect-Sturm Test - 1000 Spieler verlieren gleichzeitig das WLAN
+
+Alle Spieler trennen mitten im Spiel gleichzeitig und verbinden sich mit
+ihrem Sitzungs-Token neu. Erwartet: keine doppelten Spieler, keine
+Namens-Suffixe, Punkte erhalten, Catch-up innerhalb des Limits.
+
+Beispiel:
+    python3 test-reconnect-storm.py --server http://localhost:3001 --players 1000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.reconnect_bench import run_reconnect_storm
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gleichzeitiges Wiederverbinden aller Spieler prüfen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--players', type=int, default=1000, help='Spieler im Raum')
+    parser.add_argument('--concurrency', type=int, default=1000, help='Gleichzeitige Wiederverbindungen')
+    parser.add_argument('--outage', type=float, default=1.0, help='Dauer des Aussetzers (s)')
+    parser.add_argument('--max-resume-p99-ms', type=float, default=2000,
+                        help='Obergrenze für p99 von join-room bis Catch-up (ms)')
+    parser.add_argument('--output', default=f"test-screenshots/bench/reconnect-storm-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"📶 RECONNECT-STURM: {args.players} Spieler, {args.outage}s Aussetzer")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_reconnect_storm(args.server, args.players, args.concurrency, args.outage))
+
+    resume = report['resume_ms']
+    print(f"🔁 Antworten: {report['replies']} in {report['storm_seconds']}s")
+    print(f"⏱️  Wiederverbinden bis Catch-up: p50 {resume.get('p50', '-')} ms, p95 {resume.get('p95', '-')} ms, "
+          f"p99 {resume.get('p99', '-')} ms, max {resume.get('max', '-')} ms")
+    print(f"📦 Catch-up {report['catchup_bytes']} Bytes statt room-state {report['room_state_bytes']} Bytes")
+    print(f"👥 Spieler im Raum danach: {report['room_players_after']}, "
+          f"Host: {report['host_player_joined']} player-joined, {report['host_player_reconnected']} player-reconnected")
+
+    failures = list(report['failures'])
+    if resume.get('p99') is not None and resume['p99'] > args.max_resume_p99_ms:
+        failures.append(f"p99 {resume['p99']} ms über dem Limit von {args.max_resume_p99_ms} ms")
+    report['failures'] = failures
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if failures:
+        print(f"❌ {len(failures)} Probleme")
+        for failure in failures[:10]:
+            print(f"   {failure}")
+        sys.exit(1)
+    print(f"✅ Alle {report['joined']} Spieler genau einmal zurück, Punkte erhalten")
+
+
+if __name__ == '__main__':
+    main()
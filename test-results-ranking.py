@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Ergebnis-Rangliste Test - 5000 Spieler, Top-K plus eigener Rang
+
+Prüft, dass 'show-results' und 'game-over' aus dem Score-Index des
+Servers dieselben Ränge liefern wie eine volle Sortierung, und misst
+Broadcast-Zeit und Bytes pro Empfänger.
+
+Beispiel:
+    python3 test-results-ranking.py --server http://localhost:3001 --players 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.results_bench import run_results_bench
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ergebnis-Ränge gegen volle Sortierung prüfen')
+    parser.add_argument('--server', default='http://localhost:3001', help='Backend-URL (Socket.IO)')
+    parser.add_argument('--players', type=int, default=5000, help='Spieler im Raum')
+    parser.add_argument('--top-k', type=int, default=10, help='RESULTS_TOP_K des Servers')
+    parser.add_argument('--repeats', type=int, default=5, help='Anzahl show-results Broadcasts')
+    parser.add_argument('--adjustments', type=int, default=500, help='Punktekorrekturen durch den Host')
+    parser.add_argument('--output', default=f"test-screenshots/bench/results-ranking-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"🏆 ERGEBNIS-RANGLISTE: {args.players} Spieler, Top {args.top_k}")
+    print(f"🌐 Server: {args.server}")
+    print(f"{'='*70}\n")
+
+    report = asyncio.run(run_results_bench(args.server, args.players, args.top_k, args.repeats, args.adjustments))
+
+    broadcast = report['broadcast_ms']
+    print(f"👥 {report['joined']} Spieler, {report['distinct_scores']} verschiedene Punktestände")
+    print(f"⏱️  show-results bis zum letzten Spieler: p50 {broadcast.get('p50', '-')} ms, "
+          f"max {broadcast.get('max', '-')} ms, game-over {report['game_over_ms']} ms")
+    print(f"📦 Pro Spieler {report['player_bytes']} Bytes statt {report['full_list_bytes']:,} Bytes (volle Liste)")
+    print(f"📦 Pro Broadcast {report['broadcast_bytes']:,} Bytes statt {report['full_list_broadcast_bytes']:,} Bytes")
+
+    save_report(report, args.output)
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    failures = report['failures']
+    if failures:
+        print(f"❌ {len(failures)} Abweichungen")
+        for failure in failures[:10]:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("✅ Ränge, Punkte und Top-K stimmen mit der vollen Sortierung überein")
+
+
+if __name__ == '__main__':
+    main()
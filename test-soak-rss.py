@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Soak-Test - tausende kurze Spiele über Stunden, RSS und Raumzahl müssen stabil bleiben
+
+Startet server/index.js selbst mit kurzen TTLs (Host-Grace, Spieler,
+beendete Räume, leere Lobbys), damit die Eviction im Testzeitraum
+tausendfach greift. Mit --server läuft der Test gegen einen vorhandenen
+Server; dann müssen dessen TTLs zu --linger und --drain passen.
+
+Geprüft wird:
+  - RSS und Raumzahl wachsen nach dem Aufwärmen nicht weiter
+  - nach dem Ende sind Räume, Spieler und Zuschauer wieder bei 0
+
+Beispiel:
+    python3 test-soak-rss.py --duration 7200 --parallel 30
+    python3 test-soak-rss.py --duration 600 --server http://localhost:3001 --drain 120
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from harness.buzzer_bench import save_report
+from harness.server import ServerProcess
+from harness.soak import run_soak
+
+# TTLs für den selbst gestarteten Server (ms), kürzer als --linger
+SOAK_ENV = {
+    'HOST_GRACE_MS': '2000',
+    'PLAYER_TTL_MS': '3000',
+    'FINISHED_ROOM_TTL_MS': '3000',
+    'IDLE_LOBBY_TTL_MS': '3000',
+    'EVICTION_TICK_MS': '250'
+}
+
+
+def _mb(value):
+    return f"{value / 1024 / 1024:.1f} MB" if value else '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RSS und Raumzahl über viele kurze Spiele beobachten')
+    parser.add_argument('--server', help='Vorhandenes Backend statt eigenem Server-Prozess')
+    parser.add_argument('--port', type=int, default=3102, help='Port für den Test-Server')
+    parser.add_argument('--duration', type=float, default=7200, help='Laufzeit in Sekunden')
+    parser.add_argument('--parallel', type=int, default=20, help='Gleichzeitige Spiele')
+    parser.add_argument('--players', type=int, default=8, help='Spieler pro Spiel')
+    parser.add_argument('--questions', type=int, default=2, help='Fragen pro Spiel')
+    parser.add_argument('--linger', type=float, default=5.0, help='Sekunden, die der Host nach Spielende bleibt')
+    parser.add_argument('--sample-interval', type=float, default=10, help='Abtastintervall für /metrics (s)')
+    parser.add_argument('--drain', type=float, default=30, help='Wartezeit auf leere Zähler nach dem Ende (s)')
+    parser.add_argument('--max-rss-growth', type=float, default=1.15,
+                        help='Erlaubtes Verhältnis RSS letztes Viertel / zweites Viertel')
+    parser.add_argument('--max-room-growth', type=float, default=1.5,
+                        help='Erlaubtes Verhältnis Räume letztes Viertel / zweites Viertel')
+    parser.add_argument('--output', default=f"test-screenshots/bench/soak-rss-{time.strftime('%Y%m%d-%H%M%S')}.json",
+                        help='Ergebnis-Datei (JSON)')
+    args = parser.parse_args()
+
+    server = None if args.server else ServerProcess(args.port, env=SOAK_ENV, log_name='soak-rss-server.log')
+    server_url = args.server or server.url
+
+    print(f"\n{'='*70}")
+    print(f"🧪 SOAK-TEST: {args.duration / 3600:.1f} h, {args.parallel} parallele Spiele × {args.players} Spieler")
+    print(f"🌐 Server: {server_url}" + (' (eigener Prozess, kurze TTLs)' if server else ''))
+    print(f"{'='*70}\n")
+
+    def progress(point, games):
+        print(f"   {time.strftime('%H:%M:%S')}  Spiele {games:>6}  Räume {point['rooms']!s:>5}  "
+              f"Spieler {point['players']!s:>6}  RSS {_mb(point['rss']):>9}")
+
+    if server:
+        server.start()
+    try:
+        result = asyncio.run(run_soak(
+            server_url, args.duration, args.parallel, args.players, args.questions,
+            linger=args.linger, sample_interval=args.sample_interval, drain=args.drain,
+            pid=server.pid if server else None, progress=progress
+        ))
+    finally:
+        if server:
+            server.stop()
+
+    failures = []
+    steady = result['steady_state']
+    if steady['rss']['growth'] is None:
+        failures.append('Keine RSS-Werte (Server ohne memory in /metrics und kein lokaler Prozess)')
+    elif steady['rss']['growth'] > args.max_rss_growth:
+        failures.append(f"RSS wächst weiter: ×{steady['rss']['growth']} (erlaubt ×{args.max_rss_growth})")
+    # Kleine Raumzahlen schwanken stark, ein paar Räume Spielraum
+    rooms = steady['rooms']
+    if rooms['late_mean'] is not None and rooms['early_mean'] is not None and \
+            rooms['late_mean'] > rooms['early_mean'] * args.max_room_growth + args.parallel:
+        failures.append(f"Raumzahl wächst weiter: {rooms['early_mean']} → {rooms['late_mean']}")
+    final = result['final']
+    for key in ('rooms', 'players', 'spectators'):
+        if final[key]:
+            failures.append(f"Nach {args.drain:.0f}s noch {final[key]} {key} auf dem Server")
+
+    report = {
+        'test': 'soak-rss',
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'server': server_url,
+        'ttl_env': SOAK_ENV if server else None,
+        'parallel': args.parallel,
+        'players': args.players,
+        **result,
+        'failures': failures
+    }
+    save_report(report, args.output)
+
+    print(f"\n📊 {result['games_total']} Spiele {result['games']}, {len(result['errors'])} Fehler")
+    for key in ('rss', 'rooms', 'players'):
+        print(f"   {key:<8} zweites Viertel {steady[key]['early_mean']!s:>14}  "
+              f"letztes Viertel {steady[key]['late_mean']!s:>14}  ×{steady[key]['growth']}")
+    print(f"   Evictions: {final['evicted']}")
+    print(f"\n✅ Ergebnis gespeichert: {args.output}")
+
+    if failures:
+        print(f"❌ {len(failures)} Probleme")
+        for failure in failures:
+            print(f"   {failure}")
+        sys.exit(1)
+    print("✅ RSS und Raumzahl stabil, Server nach dem Test leer")
+
+
+if __name__ == '__main__':
+    main()
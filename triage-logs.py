@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Log-Triage über das ganze Archiv - häufigste Fehler-Signaturen pro Ziel
+
+Beispiel:
+    python3 triage-logs.py
+    python3 triage-logs.py test-screenshots/ --top 10 --warnings
+    python3 triage-logs.py --json test-screenshots/triage.json
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from harness.paths import artifact_dir
+from harness.triage import TriageReport, scan_archive
+
+
+def _format_time(millis):
+    if millis is None:
+        return '-'
+    return datetime.fromtimestamp(millis / 1000).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Console-Logs aller Läufe klassifizieren und gruppieren')
+    parser.add_argument('paths', nargs='*', help='Dateien oder Ordner (Standard: Artefakt-Ordner)')
+    parser.add_argument('--top', type=int, default=20, help='Anzahl der angezeigten Signaturen')
+    parser.add_argument('--warnings', action='store_true', help='Warnungen mit auswerten')
+    parser.add_argument('--json', help='Vollständigen Report als JSON speichern')
+    args = parser.parse_args()
+
+    include = ('critical', 'error', 'warning') if args.warnings else ('critical', 'error')
+    paths = args.paths or [artifact_dir()]
+
+    started = time.perf_counter()
+    report = scan_archive(paths, TriageReport(include=include))
+    seconds = time.perf_counter() - started
+
+    print(f"\n{'='*70}")
+    print(f"🔎 LOG-TRIAGE: {report.files} Dateien, {report.entries} Einträge, "
+          f"{len(report.groups)} Signaturen ({seconds:.2f}s)")
+    print(f"{'='*70}\n")
+
+    icons = {'critical': '🔴', 'error': '❌', 'warning': '⚠️ '}
+    for group in report.top(args.top):
+        targets = ', '.join(f"{target} {count}" for target, count in group['targets'].most_common())
+        print(f"{icons[group['category']]} {group['count']:>6}x  [{group['rule']}]  {targets}")
+        print(f"   {group['signature'][:160]}")
+        print(f"   zuerst {_format_time(group['first_seen'])}  zuletzt {_format_time(group['last_seen'])}  "
+              f"({len(group['files'])} Dateien)\n")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report.to_dict(limit=len(report.groups)), f, indent=2, ensure_ascii=False)
+        print(f"✅ Report gespeichert: {args.json}")
+
+
+if __name__ == '__main__':
+    main()